@@ -1,12 +1,16 @@
 """메이크어토스트 - Streamlit 웹 애플리케이션 (UI 복구 완료)"""
 import streamlit as st
 import database as db
+import excel_import
+import roster_optimizer
+import rotation
 from datetime import datetime
 import pandas as pd
 import tempfile
 import os
 import re
 from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
+from st_keyup import st_keyup
 
 st.set_page_config(
     page_title="Make a Toast",
@@ -19,9 +23,17 @@ st.set_page_config(
 if 'current_session_id' not in st.session_state:
     st.session_state.current_session_id = None
 
-# 캐시 버전 초기화
-if 'db_cache_version' not in st.session_state:
-    st.session_state.db_cache_version = 0
+def dash(col):
+    """표시용: 비어 있는 값 -> "-" (열 단위, category 열은 category 그대로)"""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        if '-' not in col.cat.categories:
+            col = col.cat.add_categories('-')
+        return col.fillna('-')
+    return col.mask(col.isna() | col.eq(''), '-')
+
+def memo_marks(participants, mark="📝"):
+    """메모가 있는 행만 mark (이름 뒤에 붙이는 용도)"""
+    return participants['has_memo'].map({True: mark, False: ""})
 
 def main():
     """메인 애플리케이션"""
@@ -42,6 +54,19 @@ def main():
 # ---------------------------------------------------------
 # 1. 회차 관리 탭
 # ---------------------------------------------------------
+def turn_page(cursors_key, next_cursor=None, reset_key=None):
+    """keyset 페이지 이동 (next_cursor 가 있으면 다음, 없으면 이전) - 버튼 on_click 용
+
+    reset_key: 페이지가 바뀌면 선택을 처음으로 돌릴 위젯 key
+    """
+    cursors = st.session_state[cursors_key]
+    if next_cursor:
+        cursors.append(next_cursor)
+    elif len(cursors) > 1:
+        cursors.pop()
+    if reset_key:
+        st.session_state.pop(reset_key, None)
+
 def render_session_tab():
     # 🎨 [CSS] 이제 복잡한 테이블 CSS는 다 버리고, 기본 여백만 조절합니다.
     st.markdown("""
@@ -59,11 +84,15 @@ def render_session_tab():
     </style>
     """, unsafe_allow_html=True)
 
-    sessions = db.get_all_sessions()
+    # 회차는 최근 것부터 한 페이지씩 (keyset, 페이지별 시작 커서를 쌓아 두고 이전으로 돌아감)
+    if 'session_page_cursors' not in st.session_state:
+        st.session_state.session_page_cursors = [None]
+    cursors = st.session_state.session_page_cursors
+    sessions, next_cursor = db.get_sessions_page(cursors[-1], db.SESSION_PAGE_SIZE)
     session_options = [f"📅 {s['session_date']} {s['session_time']} | 주제: {s['theme']} | {s['host']}" for s in sessions]
 
     # 회차 선택 레이아웃
-    col_sel, col_add, col_del, col_imp = st.columns([7.2, 1.2, 1.2, 1.2])
+    col_sel, col_add, col_del, col_plan, col_imp, col_exp = st.columns([6, 1.2, 1.2, 1.2, 1.2, 1.2])
 
     with col_sel:
         if session_options:
@@ -72,11 +101,20 @@ def render_session_tab():
                 format_func=lambda x: session_options[x],
                 key="session_select", label_visibility="collapsed",
             )
-            if selected_idx is not None:
+            if selected_idx is not None and selected_idx < len(sessions):
                 st.session_state.current_session_id = sessions[selected_idx]['session_id']
         else:
             st.selectbox("회차 선택", ["회차가 없습니다"], disabled=True, label_visibility="collapsed")
             st.session_state.current_session_id = None
+
+        if len(cursors) > 1 or next_cursor:
+            nc1, nc2, nc3 = st.columns([1, 4, 1])
+            nc1.button("◀ 최근", disabled=len(cursors) == 1, use_container_width=True, key="session_page_prev",
+                       on_click=turn_page, args=('session_page_cursors', None, 'session_select'))
+            start = (len(cursors) - 1) * db.SESSION_PAGE_SIZE
+            nc2.caption(f"전체 {db.count_sessions()}회차 중 {start + 1}~{start + len(sessions)}번째")
+            nc3.button("이전 ▶", disabled=next_cursor is None, use_container_width=True, key="session_page_next",
+                       on_click=turn_page, args=('session_page_cursors', next_cursor, 'session_select'))
     
     with col_add:
         if st.button("회차 추가", use_container_width=True):
@@ -87,9 +125,15 @@ def render_session_tab():
                 delete_session_dialog(st.session_state.current_session_id, sessions)
             else:
                 st.warning("선택무")
+    with col_plan:
+        if st.button("회차 편성", use_container_width=True):
+            plan_rosters_dialog()
     with col_imp:
         if st.button("엑셀 넣기", use_container_width=True):
             import_excel_dialog()
+    with col_exp:
+        if st.button("내보내기", use_container_width=True):
+            export_dialog()
 
     if st.session_state.current_session_id:
         render_current_session_info(sessions)
@@ -136,6 +180,61 @@ def delete_session_dialog(session_id, sessions):
             st.session_state.current_session_id = None
             st.rerun()
 
+@st.dialog("회차 편성", width="large")
+def plan_rosters_dialog():
+    """'준비중' 회차 여러 개의 빈자리를 한 번에 채우는 편성 안 (이미 만난 쌍 / 나이 차이 최소)"""
+    sessions = db.get_planning_sessions()
+    if not sessions:
+        st.info("편성할 회차가 없습니다. (오늘 이후의 '준비중' 회차)")
+        return
+    labels = {s['session_id']: f"📅 {s['session_date']} {s['session_time']} | {s['theme']} (남 {s['men']} / 여 {s['women']})"
+              for s in sessions}
+    chosen = st.multiselect("편성할 회차", list(labels), default=list(labels), format_func=labels.get)
+    c1, c2 = st.columns(2)
+    per_gender = c1.number_input("회차당 성별 인원", min_value=1, max_value=30, value=roster_optimizer.PER_GENDER)
+    pool_days = c2.number_input("참가 가능 인원: 최근 방문 (일)", min_value=7, max_value=3650,
+                                value=db.PLANNING_POOL_DAYS, step=30)
+
+    # 조건이 바뀌면 이전 편성 안은 버림
+    request = (tuple(chosen), per_gender, pool_days)
+    if st.button("편성 안 만들기", type="primary", disabled=not chosen):
+        with st.spinner("편성 중..."):
+            st.session_state.roster_plan = (request, db.plan_session_rosters(list(chosen), per_gender, pool_days))
+    saved = st.session_state.get('roster_plan')
+    if not saved or saved[0] != request:
+        return
+    plan = saved[1]
+
+    metrics, baseline = plan['metrics'], plan['baseline']
+    m1, m2, m3 = st.columns(3)
+    m1.metric("이미 만난 쌍", metrics['repeat_pairs'], delta=metrics['repeat_pairs'] - baseline['repeat_pairs'],
+              delta_color="inverse", help="기존 명단에 있던 쌍 대비")
+    m2.metric("정원 채운 회차", f"{metrics['full']} / {len(plan['sessions'])}")
+    m3.metric("평균 나이 차 (최고-최저)", f"{metrics['age_range']:.1f}년")
+    if plan['unassigned']:
+        st.caption(f"배정되지 않은 참가 가능 인원 {len(plan['unassigned'])}명")
+
+    for s in plan['sessions']:
+        members = pd.DataFrame.from_records(s['members'], columns=['name', 'birth_date', 'gender', 'job', 'mbti'])
+        added = {p['participant_id'] for p in s['added']}
+        with st.expander(f"{labels[s['session_id']]} → 남 {s['men']} / 여 {s['women']}, "
+                         f"이미 만난 쌍 {s['repeat_pairs']}, 나이 차 {s['age_range']}년"):
+            st.dataframe(pd.DataFrame({
+                '이름': members['name'],
+                '출생년도': members['birth_date'].str[:4],
+                '성별': members['gender'].map({'M': '남', 'F': '여'}),
+                '직업': members['job'],
+                'MBTI': members['mbti'],
+                '': ["🆕" if p['participant_id'] in added else "" for p in s['members']],
+            }), hide_index=True, use_container_width=True)
+
+    total = sum(len(s['added']) for s in plan['sessions'])
+    if st.button(f"명단에 반영 ({total}명)", disabled=total == 0, use_container_width=True):
+        db.apply_roster_plan(plan)
+        st.session_state.pop('roster_plan', None)
+        st.success("편성이 반영되었습니다.")
+        st.rerun()
+
 @st.dialog("엑셀 임포트")
 def import_excel_dialog():
     uploaded_file = st.file_uploader("엑셀 파일 선택", type=['xlsx', 'xls'])
@@ -145,12 +244,51 @@ def import_excel_dialog():
                 tmp.write(uploaded_file.read())
                 tmp_path = tmp.name
             
-            with st.spinner("엑셀 데이터 분석 중..."):
-                db.import_excel_file(tmp_path)
-            
-            os.unlink(tmp_path)
-            st.success("완료되었습니다!")
+            bar = st.progress(0.0, text="엑셀 데이터 분석 중...")
+
+            def on_progress(event):
+                bar.progress(excel_import.progress_fraction(event), text=excel_import.describe_progress(event))
+
+            try:
+                summary = db.import_excel_file(tmp_path, progress=on_progress)
+            finally:
+                os.unlink(tmp_path)
+            st.success(f"완료되었습니다! 새 회차 {summary['new']}개, 변경 {summary['synced']}개, 그대로 {summary['skipped']}개")
             st.rerun()
+        except db.ImportFailed as e:
+            bar.empty()
+            st.error(f"임포트 실패: {e.error}")
+            if e.last_sheet:
+                st.warning(f"'{e.last_sheet}' 시트까지 {e.sheets_done}개는 반영되었습니다. "
+                           "같은 파일을 다시 임포트하면 그다음 시트부터 이어서 합니다.")
+        except Exception as e:
+            st.error(f"오류: {e}")
+
+@st.dialog("내보내기")
+def export_dialog():
+    kind = st.radio("내보낼 데이터", list(db.EXPORT_KINDS), format_func=lambda k: db.EXPORT_KINDS[k])
+    fmt = st.radio("형식", ["xlsx", "csv"], horizontal=True,
+                   format_func=lambda f: "엑셀 (.xlsx)" if f == "xlsx" else "CSV")
+    if kind == 'sessions' and fmt == 'xlsx':
+        st.caption("회차마다 시트 한 장 ('엑셀 넣기' 양식) - 그대로 다시 임포트할 수 있습니다.")
+
+    if st.button("파일 만들기", type="primary"):
+        try:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                tmp_path = os.path.join(tmp_dir, f"export.{fmt}")
+                with st.spinner("내보내는 중..."):
+                    if fmt == "csv":
+                        with open(tmp_path, "w", newline="", encoding="utf-8-sig") as f:
+                            db.export_data(kind, f, "csv")
+                    else:
+                        db.export_data(kind, tmp_path)
+                with open(tmp_path, "rb") as f:
+                    data = f.read()
+            st.download_button(
+                "⬇️ 다운로드", data, type="primary", use_container_width=True,
+                file_name=f"maketoast_{kind}_{datetime.now():%Y%m%d}.{fmt}",
+                mime="text/csv" if fmt == "csv" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            )
         except Exception as e:
             st.error(f"오류: {e}")
 
@@ -201,17 +339,17 @@ def render_current_session_info(sessions):
     curr = next((s for s in sessions if s['session_id'] == st.session_state.current_session_id), None)
     if not curr: return
 
-    participants = db.get_session_participants(curr['session_id'])
+    # 🔥 성별 고정 정렬: 남자(M) 우선, 그 다음 이름순 (SQL 에서 정렬, 열 단위 DataFrame 으로 받음)
+    participants = db.get_session_participants_frame(curr['session_id'])
 
-    # 🔥 [추가] 성별 고정 정렬: 남자(M) 우선, 그 다음 이름순
-    if participants:
-        participants.sort(key=lambda x: (0 if x['gender'] == 'M' else 1, x['name']))
-
-    act_c1, _, act_c2, _, act_c3 = st.columns([7.7, 0.1, 2, 0.1, 2])
+    act_c1, act_c0, _, act_c2, _, act_c3 = st.columns([5.6, 2, 0.1, 2, 0.1, 2])
     
     with act_c1:
         if st.button("🔍 중복 만남 체크", type="primary", use_container_width=True):
             check_duplicates(curr['session_id'])
+    with act_c0:
+        if st.button("📋 전체 회차 점검", use_container_width=True):
+            audit_meetings_dialog()
     with act_c2:
         if st.button("➕ 남자 참가자 추가", use_container_width=True):
             add_participant_dialog('M', curr['session_id'])
@@ -222,35 +360,28 @@ def render_current_session_info(sessions):
     # ---------------------------------------------------------
     # 1. AgGrid (행 클릭이 가능한 엑셀 같은 표)
     # ---------------------------------------------------------
-    if not participants:
+    if participants.empty:
         st.info("아직 등록된 참가자가 없습니다.")
     else:
         # 통계 표시
-        m_count = len([p for p in participants if p['gender'] == 'M'])
-        f_count = len([p for p in participants if p['gender'] == 'F'])
+        m_count = int(participants['gender'].eq('M').sum())
+        f_count = len(participants) - m_count
         st.caption(f"총 {len(participants)}명 (남 {m_count} / 여 {f_count})")
 
-        # 데이터프레임 변환
-        data = []
-        for p in participants:
-            memo_txt = str(p.get('memo', '')).strip()
-            memo_mark = "📝" if memo_txt and memo_txt != 'None' else ""
-            
-            data.append({
-                '성별': "남" if p['gender'] == 'M' else "여",
-                '이름': f"{p['name']} {memo_mark}",
-                '출생년도': p['birth_date'][:4],
-                '전화번호': p['phone'] if p['phone'] else "-",
-                '사는곳': p['location'] if p['location'] else "-",
-                '직업': p['job'] if p['job'] else "-",
-                'MBTI': p['mbti'] if p['mbti'] else "-",
-                '방문': f"{p.get('visit_count', 0)}회",
-                '경로': p['signup_route'] if p['signup_route'] else "-",
-                '_full_name': p['name'],       
-                '_full_birth': p['birth_date'] 
-            })
-        
-        df = pd.DataFrame(data)
+        # 화면용 표 (열 단위로 한 번에 변환)
+        df = pd.DataFrame({
+            '성별': participants['gender'].cat.rename_categories(["남", "여"]),
+            '이름': participants['name'] + " " + memo_marks(participants),
+            '출생년도': participants['birth_year'],
+            '전화번호': dash(participants['phone']),
+            '사는곳': dash(participants['location']),
+            '직업': dash(participants['job']),
+            'MBTI': dash(participants['mbti']),
+            '방문': participants['visit_label'],
+            '경로': dash(participants['signup_route']),
+            '_full_name': participants['name'],
+            '_full_birth': participants['birth_date'],
+        })
 
         # AgGrid 옵션 설정
         gb = GridOptionsBuilder.from_dataframe(df)
@@ -284,7 +415,8 @@ def render_current_session_info(sessions):
             t_name = sel_row.get('_full_name') or sel_row.get('이름').split(' ')[0]
             t_birth = sel_row.get('_full_birth')
 
-            target_p = next((p for p in participants if p['name'] == t_name and p['birth_date'] == t_birth), None)
+            match = participants[participants['name'].eq(t_name) & participants['birth_date'].eq(t_birth)]
+            target_p = match.iloc[0].to_dict() if not match.empty else None
             
             if target_p:
                 with st.container(border=True):
@@ -298,6 +430,38 @@ def render_current_session_info(sessions):
                         if st.button("🗑️ 명단 제외", type="primary", use_container_width=True):
                             remove_participant_dialog(target_p, st.session_state.current_session_id)
 
+        render_rotation(curr['session_id'], participants)
+
+def render_rotation(session_id, participants):
+    """라운드별 자리표 - 누가 빠지면 진행한 라운드는 두고 남은 라운드만 다시 편성"""
+    with st.expander("🔄 로테이션 (라운드별 자리)"):
+        plans = st.session_state.setdefault('rotations', {})
+        plan = plans.get(session_id)
+        c1, c2, c3 = st.columns([2, 2, 6])
+        played = c1.number_input("진행한 라운드", min_value=0, step=1, key=f"rotation_played_{session_id}")
+        c2.write("")
+        if c2.button("🔄 다시 만들기", use_container_width=True, key=f"rotation_redo_{session_id}") or plan is None:
+            plan = plans[session_id] = db.get_session_rotation(session_id, plan, played)
+
+        roster = set(zip(participants['name'], participants['birth_date']))
+        if roster != set(plan['hosts']) | set(plan['guests']):
+            c3.warning("명단이 바뀌었습니다. 진행한 라운드를 입력하고 '다시 만들기'를 눌러주세요.")
+        if not plan['rounds']:
+            st.info("남녀가 모두 있어야 로테이션을 만들 수 있습니다.")
+            return
+
+        rows = rotation.table_rows(plan, name=lambda key: key[0])
+        columns = [f"{i}R{' ✓' if i <= plan['played'] else ''}" for i in range(1, len(plan['rounds']) + 1)]
+        st.caption(f"테이블 {len(plan['hosts'])}개 · {len(plan['rounds'])}라운드 "
+                   f"({'여자' if plan['host_gender'] == 'F' else '남자'}는 자리 고정, ✓ 진행한 라운드)")
+        st.dataframe(pd.DataFrame([cells for _, cells in rows], index=[label for label, _ in rows], columns=columns),
+                     use_container_width=True)
+        if plan['skipped']:
+            st.caption("이미 만난 쌍 (같은 테이블에 앉히지 않음): "
+                       + ", ".join(f"{a[0]} ↔ {b[0]}" for a, b in plan['skipped']))
+        if plan['missing']:
+            st.warning("자리를 만들지 못한 쌍: " + ", ".join(f"{a[0]} ↔ {b[0]}" for a, b in plan['missing']))
+
 @st.dialog("참가자 추가")
 def add_participant_dialog(gender, session_id):
     st.write(f"**{'남자' if gender=='M' else '여자'} 참가자 추가**")
@@ -315,10 +479,19 @@ def add_participant_dialog(gender, session_id):
                 st.error("이름과 출생년도(4자리)는 필수입니다.")
             else:
                 b_date = f"{birth_year}-01-01"
-                db.add_participant(name, b_date, gender, job, mbti, phone, location, route)
-                db.add_attendance(session_id, name, b_date)
-                st.success("추가되었습니다!")
-                st.rerun()
+                # 이미 만난 사람이 명단에 있으면 한 번 알려 주고, 같은 사람으로 다시 누르면 그대로 추가
+                met = db.met_in_session(session_id, name, b_date)
+                if met and st.session_state.get('add_p_confirmed') != (session_id, name, b_date):
+                    st.session_state.add_p_confirmed = (session_id, name, b_date)
+                    st.warning("이미 만난 사람이 명단에 있습니다: "
+                               + ", ".join(f"{m['name']}({m['birth_date'][:4]})" for m in met))
+                    st.caption("그래도 추가하려면 '추가하기' 를 한 번 더 누르세요.")
+                else:
+                    st.session_state.pop('add_p_confirmed', None)
+                    db.add_participant(name, b_date, gender, job, mbti, phone, location, route)
+                    db.add_attendance(session_id, name, b_date)
+                    st.success("추가되었습니다!")
+                    st.rerun()
 
 @st.dialog("참가자 제거")
 def remove_participant_dialog(p, session_id):
@@ -381,6 +554,40 @@ def check_duplicates(session_id):
         for d in dups:
             st.warning(f"{d['person1']} ↔ {d['person2']} ({', '.join(d['session_dates'])})")
 
+@st.dialog("전체 회차 중복 만남 점검", width="large")
+def audit_meetings_dialog():
+    """모든 회차를 시간 순으로 한 번에 점검 - 앞선 회차에서 이미 만난 쌍이 다시 만난 회차 목록"""
+    with st.spinner("전체 출석 기록 점검 중..."):
+        result = db.audit_repeat_meetings()
+    flagged = result['sessions']
+
+    m1, m2, m3 = st.columns(3)
+    m1.metric("점검한 회차", f"{result['session_count']}회차", help=f"출석 {result['row_count']}건")
+    m2.metric("중복 만남이 있는 회차", f"{len(flagged)}회차")
+    m3.metric("중복 만남", f"{result['repeat_count']}쌍")
+    if not flagged:
+        st.success("✅ 중복 만남이 없습니다!")
+        return
+
+    st.caption("최근 회차부터 · 행을 누르면 쌍별 이전 만남 날짜를 보여줍니다")
+    event = st.dataframe(pd.DataFrame({
+        '날짜': [s['session_date'] for s in flagged],
+        '시간': [s['session_time'] for s in flagged],
+        '주제': [s['theme'] for s in flagged],
+        '인원': [s['size'] for s in flagged],
+        '중복 쌍': [s['repeat_count'] for s in flagged],
+    }), hide_index=True, use_container_width=True, height=300,
+        selection_mode="single-row", on_select="rerun", key="audit_table")
+
+    if event.selection.rows:
+        s = flagged[event.selection.rows[0]]
+        st.markdown(f"##### {s['session_date']} {s['theme']}")
+        st.dataframe(pd.DataFrame({
+            '참가자 1': [f"{p['person1']} ({p['person1_birth'][:4]})" for p in s['pairs']],
+            '참가자 2': [f"{p['person2']} ({p['person2_birth'][:4]})" for p in s['pairs']],
+            '이전에 만난 날짜': [", ".join(p['previous_dates']) for p in s['pairs']],
+        }), hide_index=True, use_container_width=True)
+
 # ---------------------------------------------------------
 # 2. 참가자 DB 탭
 # ---------------------------------------------------------
@@ -390,16 +597,59 @@ def render_participant_tab():
     if 'db_search_term' not in st.session_state:
         st.session_state.db_search_term = ""
 
-    # 검색 입력창
-    search = st.text_input("검색 (이름, 직업)", value=st.session_state.db_search_term, placeholder="엔터키를 누르면 검색됩니다.")
+    if 'db_search_page' not in st.session_state:
+        st.session_state.db_search_page = 0
+
+    if 'db_list_cursors' not in st.session_state:
+        st.session_state.db_list_cursors = [None]  # 전체 목록: 페이지별 시작 커서 (이전 페이지로 돌아가기용)
+
+    # 검색 입력창 (DB 에서 관련도순으로 찾고 한 페이지씩만 가져옴, 초성 검색 가능)
+    # st.text_input 은 엔터를 쳐야 다시 실행되므로 st_keyup 으로 입력이 멈추면(300ms) 바로 검색
+    search = st_keyup("검색 (이름/초성, 닉네임, 직업, 전화번호)", value=st.session_state.db_search_term,
+                      debounce=300, key="db_search_box", placeholder="입력하면 바로 검색됩니다. (예: ㄱㅁㅅ, 5678)")
+    search = search or ""
+    if search != st.session_state.db_search_term:
+        st.session_state.db_search_page = 0  # 검색어가 바뀌면 첫 페이지부터
     st.session_state.db_search_term = search # 입력값 유지
-    
-    all_p = db.get_all_participants()
-    if search:
-        all_p = [p for p in all_p if search in p['name'] or (p['job'] and search in p['job'])]
 
-    males = [p for p in all_p if p['gender'] == 'M']
-    females = [p for p in all_p if p['gender'] == 'F']
+    page_size = db.SEARCH_PAGE_SIZE
+    if search.strip():
+        page = st.session_state.db_search_page
+        found = db.search_participants(search, limit=page_size, offset=page * page_size)
+        total = found[0]['total_count'] if found else 0
+        all_p = db.participants_frame(found)
+        start = page * page_size
+        has_prev, has_next = page > 0, start + len(all_p) < total
+    else:
+        # 전체 목록은 keyset 페이지 (몇 번째 페이지든 한 페이지 분량만 조회)
+        cursors = st.session_state.db_list_cursors
+        all_p, next_cursor = db.get_participants_page_frame(cursors[-1], db.LIST_PAGE_SIZE)
+        total = db.count_participants()
+        start = (len(cursors) - 1) * db.LIST_PAGE_SIZE
+        has_prev, has_next = len(cursors) > 1, next_cursor is not None
+
+    if all_p.empty:
+        males = females = all_p
+    else:
+        males = all_p[all_p['gender'].eq('M')]
+        females = all_p[all_p['gender'].eq('F')]
+
+    if has_prev or has_next:
+        pc1, pc2, pc3 = st.columns([1, 6, 1])
+        if pc1.button("◀ 이전", disabled=not has_prev, use_container_width=True):
+            if search.strip():
+                st.session_state.db_search_page -= 1
+            else:
+                turn_page('db_list_cursors')
+            st.rerun()
+        pc2.caption(f"{'검색 결과' if search.strip() else '전체'} {total}명 중 "
+                    f"{start + 1}~{start + len(all_p)}번째")
+        if pc3.button("다음 ▶", disabled=not has_next, use_container_width=True):
+            if search.strip():
+                st.session_state.db_search_page += 1
+            else:
+                turn_page('db_list_cursors', next_cursor)
+            st.rerun()
 
     col1, col2 = st.columns(2)
 
@@ -413,27 +663,21 @@ def render_participant_tab():
 
 # 1. render_db_table 중복 정의 제거 및 통합 (메모 아이콘 기능 포함)
 def render_db_table(participants, key_suffix):
-    if not participants:
+    """participants: db.participants_frame 형태의 DataFrame"""
+    if participants.empty:
         st.info("데이터가 없습니다.")
         return
 
-    data = []
-    for p in participants:
-        # 📝 메모 아이콘 표시 기능 복구
-        memo_mark = "📝" if p.get('memo') and str(p['memo']).strip() else ""
-        
-        data.append({
-            '이름': f"{p['name']}{memo_mark}",
-            '출생년도': p['birth_date'][:4],
-            '직업': p['job'],
-            'MBTI': p['mbti'],
-            '지역': p['location'],
-            '_full': p
-        })
-    
-    df = pd.DataFrame(data)
+    # 📝 메모 아이콘 표시 (열 단위로 한 번에)
+    df = pd.DataFrame({
+        '이름': participants['name'] + memo_marks(participants),
+        '출생년도': participants['birth_year'],
+        '직업': participants['job'],
+        'MBTI': participants['mbti'],
+        '지역': participants['location'],
+    })
     event = st.dataframe(
-        df.drop(columns=['_full']), 
+        df, 
         use_container_width=True, 
         height=600, 
         hide_index=True, # 5. 참가자 테이블 컬럼 정리
@@ -443,7 +687,7 @@ def render_db_table(participants, key_suffix):
     )
 
     if event.selection.rows:
-        sel = df.iloc[event.selection.rows[0]]['_full']
+        sel = participants.iloc[event.selection.rows[0]].to_dict()
         c1, c2 = st.columns(2)
         if c1.button("상세 정보", key=f"d_det_{key_suffix}"):
             show_detail_dialog(sel['name'], sel['birth_date'])
@@ -486,7 +730,7 @@ def render_recommend_tab():
     birth_max = f2.text_input("최대 출생년도 (예: 1990)")
     mbti_filter = f3.text_input("MBTI 검색 (예: E, I, N)")
 
-    sort_option = st.radio("정렬 기준", ["최근 방문일 순", "방문 횟수 순"], horizontal=True)
+    sort_option = st.radio("정렬 기준", ["최근 방문일 순", "방문 횟수 순", "추천 점수 순"], horizontal=True)
     
     # 2. 버튼 누르면 -> 결과를 session_state에 저장
     if st.button("추천 검색 실행", type="primary", use_container_width=True):
@@ -497,44 +741,44 @@ def render_recommend_tab():
         if birth_min: age_max = curr_year - int(birth_min)
 
         # DB 조회 (최적화된 쿼리 사용)
-        st.session_state.recommend_results = db.get_recommendations(sid, gender, age_min, age_max, mbti_filter)
+        st.session_state.recommend_query = (sid, gender, age_min, age_max, mbti_filter)
+        st.session_state.recommend_results = db.get_recommendations_frame(sid, gender, age_min, age_max, mbti_filter)
         
-        if not st.session_state.recommend_results:
+        if st.session_state.recommend_results.empty:
             st.info("조건에 맞는 추천 대상이 없습니다.")
 
     # 3. 결과가 저장되어 있으면 표 그리기
-    if st.session_state.recommend_results:
-        recs = st.session_state.recommend_results 
-        
-        # 정렬 적용
-        if sort_option == "최근 방문일 순":
-            recs.sort(key=lambda x: x['last_visit'] or '', reverse=True)
+    recs = st.session_state.recommend_results
+    if recs is not None and not recs.empty:
+        # 정렬 적용 (방문 기록이 없는 사람은 뒤로)
+        if sort_option == "추천 점수 순":
+            # 이번 회차 명단과의 궁합 점수 상위 N명 (점수 계산은 recommend_score)
+            total = len(recs)
+            recs = db.get_recommendation_ranking(*st.session_state.recommend_query)
+            st.caption(f"후보 {total}명 중 점수 상위 {len(recs)}명 (나이 / MBTI / 최근 방문 / 방문 횟수 / 사는곳 / 등록경로)")
+        elif sort_option == "최근 방문일 순":
+            recs = recs.sort_values('last_visit', ascending=False, na_position='last', kind='stable')
         else:
-            recs.sort(key=lambda x: x['visit_count'], reverse=True)
+            recs = recs.sort_values('visit_count', ascending=False, kind='stable')
         
-        data = []
-        for r in recs:
-            memo_mark = " 📝" if r.get('memo') and str(r['memo']).strip() else ""
-            
-            # 🔥 [수정] 전화번호, 사는곳, 등록경로 컬럼 추가
-            data.append({
-                '이름': f"{r['name']}{memo_mark}",
-                '출생년도': r['birth_date'][:4],
-                '전화번호': r['phone'] if r['phone'] else "-",         # 추가됨
-                '사는곳': r['location'] if r['location'] else "-",    # 추가됨
-                '직업': r['job'],
-                'MBTI': r['mbti'],
-                '방문 횟수': f"{r['visit_count']}회",
-                '최근 방문일': r['last_visit'],
-                '등록경로': r['signup_route'] if r['signup_route'] else "-", # 추가됨
-                '_full': r
-            })
-        
-        df = pd.DataFrame(data)
+        # 🔥 [수정] 전화번호, 사는곳, 등록경로 컬럼 추가 (열 단위로 한 번에)
+        df = pd.DataFrame({
+            '이름': recs['name'] + memo_marks(recs, " 📝"),
+            '출생년도': recs['birth_year'],
+            '전화번호': dash(recs['phone']),
+            '사는곳': dash(recs['location']),
+            '직업': recs['job'],
+            'MBTI': recs['mbti'],
+            '방문 횟수': recs['visit_label'],
+            '최근 방문일': recs['last_visit'],
+            '등록경로': dash(recs['signup_route']),
+        })
+        if 'score' in recs:
+            df.insert(0, '점수', recs['score'])
         
         # 4. 표 그리기
         event = st.dataframe(
-            df.drop(columns=['_full']), 
+            df, 
             use_container_width=True, 
             hide_index=True,
             on_select="rerun", 
@@ -542,7 +786,7 @@ def render_recommend_tab():
         )
         
         if event.selection.rows:
-            sel = df.iloc[event.selection.rows[0]]['_full']
+            sel = recs.iloc[event.selection.rows[0]].to_dict()
             # 버튼이 표 바로 아래에 생김
             if st.button("ℹ️ 상세 정보 보기", use_container_width=True):
                 show_detail_dialog(sel['name'], sel['birth_date'])
@@ -0,0 +1,98 @@
+"""
+중복 만남 체크 벤치마크: 5년치 합성 이력 (이틀에 한 번, 회차당 14명)
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_duplicate_meetings
+
+legacy  : 명단 전원의 이력을 OR 조건으로 전부 가져와 파이썬 이중 루프로 짝 찾기
+current : database.check_duplicate_meetings (출석 self-join + array_agg)
+"""
+from benchmarks.common import (connect_database, fake_people, seed_history,
+                               timed, QueryCounter, print_table)
+
+SESSIONS = 5 * 365 // 2
+ROSTER_SIZE = 14
+POPULATION = [300, 1000, 3000]
+
+
+def legacy_duplicate_meetings(db, session_id):
+    """기존 구현 (비교용)"""
+    with db.get_connection() as conn, db.get_cursor(conn) as cursor:
+        cursor.execute("""
+            SELECT p.name, p.birth_date
+            FROM attendance a JOIN participants p ON p.participant_id = a.participant_id
+            WHERE a.session_id = %s
+        """, (session_id,))
+        current_participants = cursor.fetchall()
+        if len(current_participants) < 2: return []
+        targets = [(p['name'], p['birth_date']) for p in current_participants]
+
+        conditions = ["(p.name = %s AND p.birth_date = %s)"] * len(targets)
+        where_clause = " OR ".join(conditions)
+        params = [val for t in targets for val in t]
+        params.append(session_id)
+        cursor.execute(f"""
+            SELECT p.name AS participant_name, p.birth_date AS participant_birth, s.session_date
+            FROM attendance a
+            JOIN participants p ON p.participant_id = a.participant_id
+            JOIN sessions s ON a.session_id = s.session_id
+            WHERE ({where_clause}) AND a.session_id != %s
+        """, tuple(params))
+        history = cursor.fetchall()
+
+    history_map = {}
+    for row in history:
+        history_map.setdefault(row['session_date'], []).append((row['participant_name'], row['participant_birth']))
+
+    duplicates = []
+    for date, people in history_map.items():
+        for i in range(len(people)):
+            for j in range(i + 1, len(people)):
+                p1, p2 = people[i], people[j]
+                if p1 in targets and p2 in targets:
+                    if p1 > p2: p1, p2 = p2, p1
+                    found = False
+                    for d in duplicates:
+                        if d['person1'] == p1[0] and d['person2'] == p2[0]:
+                            if date not in d['session_dates']:
+                                d['session_dates'].append(date)
+                            found = True
+                            break
+                    if not found:
+                        duplicates.append({'person1': p1[0], 'person1_birth': p1[1],
+                                           'person2': p2[0], 'person2_birth': p2[1],
+                                           'session_dates': [date]})
+    for d in duplicates: d['session_dates'].sort()
+    return duplicates
+
+
+def pair_set(duplicates):
+    return {(frozenset([(d['person1'], d['person1_birth']), (d['person2'], d['person2_birth'])]),
+             tuple(str(x) for x in d['session_dates'])) for d in duplicates}
+
+
+def main():
+    rows = []
+    for population in POPULATION:
+        db = connect_database()
+        sessions = seed_history(db, fake_people(population), session_count=SESSIONS,
+                                roster_size=ROSTER_SIZE, interval_days=2)
+        session_id = sessions[-1][0]
+
+        def current():
+            db.clear_cache()
+            return db.check_duplicate_meetings(session_id)
+
+        with QueryCounter(db) as legacy_q:
+            legacy_ms, legacy = timed(lambda: legacy_duplicate_meetings(db, session_id))
+        with QueryCounter(db) as current_q:
+            current_ms, result = timed(current)
+
+        assert pair_set(legacy) == pair_set(result), "결과 불일치"
+        rows.append((population, SESSIONS, len(result), legacy_q.count // 5, f"{legacy_ms:.1f}",
+                     current_q.count // 5, f"{current_ms:.1f}", f"{legacy_ms / current_ms:.1f}x"))
+
+    print_table(["참가자", "회차", "중복쌍", "legacy 쿼리", "legacy ms", "current 쿼리", "current ms", "속도"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+엑셀 임포트 벤치마크: 200시트 합성 통합 문서
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_excel_import
+
+legacy  : load_workbook 전체 로드 + 사람마다 INSERT 2회 (행 수에 비례하는 왕복)
+current : database.import_excel_file (read_only 스트리밍 + COPY 스테이징 + 집합 upsert)
+re-run  : 같은 파일 재임포트 (import_ledger 로 내용이 같은 시트는 건너뜀, 회차/출석 수 그대로)
+"""
+import os
+import re
+import tempfile
+
+import openpyxl
+
+from benchmarks.common import (connect_database, fake_people, make_workbook,
+                               timed, QueryCounter, print_table)
+
+SHEETS = 200
+ROSTER_SIZE = 16
+POPULATION = 1200
+
+
+def legacy_import_excel_file(db, file_path):
+    """기존 구현 (비교용, 현재 스키마에 맞춰 출석만 participant_id 로)"""
+    wb = openpyxl.load_workbook(file_path, data_only=True)
+    total = 0
+    imported_sessions = []
+    with db.get_connection() as conn, db.get_cursor(conn) as cursor:
+        for sheet_name in wb.sheetnames:
+            sheet = wb[sheet_name]
+            s_name_clean = sheet_name.replace("의 사본", "").strip()
+            match = re.search(r'(\d{4})(\d{2})(\d{2})', s_name_clean)
+            if not match: continue
+            s_date = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+
+            a1 = str(sheet['A1'].value).strip() if sheet['A1'].value else ""
+            host = str(sheet['N2'].value).strip() if sheet['N2'].value else "미정"
+            s_time = "미정"
+            t_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)', a1, re.IGNORECASE)
+            if t_match:
+                h, m, mer = int(t_match.group(1)), int(t_match.group(2)), t_match.group(3).upper()
+                if mer == 'PM' and h != 12: h += 12
+                elif mer == 'AM' and h == 12: h = 0
+                s_time = f"{h:02d}:{m:02d}"
+            theme_match = re.search(r'-\s*(.+)$', a1)
+            theme = theme_match.group(1).strip() if theme_match else a1
+
+            cursor.execute("INSERT INTO sessions (session_date, session_time, theme, host) VALUES (%s, %s, %s, %s) RETURNING session_id",
+                           (s_date, s_time, theme, host))
+            sid = cursor.fetchone()['session_id']
+            imported_sessions.append(sid)
+
+            for row in sheet.iter_rows(min_row=2, values_only=True):
+                vals = [str(c).strip() if c else "" for c in row]
+                if len(vals) < 12: continue
+                gender, nick, name, phone, _, _, loc, birth, job, mbti, intro, route = vals[:12]
+                if not name or not birth or birth == "-": continue
+                g_code = 'M' if gender.upper() in ['M', '남', '남자', '男'] else 'F'
+                b_clean = re.sub(r'\D', '', birth)
+                if len(b_clean) != 4: continue
+                b_date = f"{b_clean}-01-01"
+                p_clean = re.sub(r'\D', '', phone)
+                cursor.execute("""
+                    INSERT INTO participants (name, birth_date, gender, nickname, phone, location, job, mbti, intro, signup_route, first_visit_date)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (name, birth_date) DO NOTHING
+                """, (name, b_date, g_code, nick, p_clean, loc, job, mbti, intro, route, s_date))
+                cursor.execute("""
+                    INSERT INTO attendance (session_id, participant_id)
+                    SELECT %s, participant_id FROM participants WHERE name = %s AND birth_date = %s
+                    ON CONFLICT DO NOTHING
+                """, (sid, name, b_date))
+                total += 1
+        db._increment_met_pairs(cursor, imported_sessions)
+        conn.commit()
+    return total
+
+
+def snapshot(db):
+    """임포트 결과 비교용 (회차 / 참가자 / 출석 / 만남 인덱스)"""
+    with db.get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT session_date, session_time, theme, host FROM sessions ORDER BY 1, 2, 3, 4")
+        sessions = cursor.fetchall()
+        cursor.execute("SELECT name, birth_date, gender, phone, first_visit_date FROM participants ORDER BY 1, 2")
+        participants = cursor.fetchall()
+        cursor.execute("""
+            SELECT s.session_date, p.name FROM attendance a
+            JOIN sessions s ON s.session_id = a.session_id
+            JOIN participants p ON p.participant_id = a.participant_id ORDER BY 1, 2
+        """)
+        attendance = cursor.fetchall()
+        cursor.execute("""
+            SELECT p1.name, p2.name, m.meet_count FROM met_pairs m
+            JOIN participants p1 ON p1.participant_id = m.p1_id
+            JOIN participants p2 ON p2.participant_id = m.p2_id ORDER BY 1, 2
+        """)
+        pairs = cursor.fetchall()
+    return sessions, participants, attendance, [tuple(sorted(p[:2])) + (p[2],) for p in pairs]
+
+
+def main():
+    path = os.path.join(tempfile.mkdtemp(), "bench_import.xlsx")
+    rows = make_workbook(path, fake_people(POPULATION), SHEETS, roster_size=ROSTER_SIZE)
+    print(f"{SHEETS}시트 / {rows}행 / {os.path.getsize(path) // 1024}KB")
+
+    results = []
+    for label, run in [("legacy", lambda db: legacy_import_excel_file(db, path)),
+                       ("current", lambda db: db.import_excel_file(path))]:
+        db = connect_database()
+        with QueryCounter(db) as q:
+            ms, _ = timed(lambda: run(db), repeat=1)
+        results.append((label, q.count, f"{ms:.0f}", snapshot(db)))
+
+    # 방금 임포트한 DB에 같은 파일을 다시 임포트
+    with QueryCounter(db) as q:
+        ms, summary = timed(lambda: db.import_excel_file(path), repeat=1)
+    assert summary['skipped'] == SHEETS and snapshot(db) == results[-1][3], "재임포트로 데이터가 바뀜"
+    results.append(("re-run", q.count, f"{ms:.0f}", None))
+
+    (_, _, _, legacy), (_, _, _, current) = results[:2]
+    assert [sorted(x) for x in legacy] == [sorted(x) for x in current], "결과 불일치"
+    print_table(["구현", "왕복", "ms"], [r[:3] for r in results])
+
+
+if __name__ == "__main__":
+    main()
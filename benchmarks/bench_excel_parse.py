@@ -0,0 +1,37 @@
+"""
+엑셀 시트 파싱 벤치마크: 워커 프로세스 수별 (DB 없이 파싱만)
+
+    python -m benchmarks.bench_excel_parse [시트 수]
+
+결과는 워커 수와 상관없이 시트 순서까지 같아야 합니다.
+CPU 코어가 하나뿐인 환경에서는 프로세스 생성 비용만큼 오히려 느려집니다.
+"""
+import os
+import sys
+import tempfile
+
+import excel_import
+from benchmarks.common import fake_people, make_workbook, timed, print_table
+
+WORKERS = [1, 2, 4, 8]
+
+
+def main():
+    sheets = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    path = os.path.join(tempfile.mkdtemp(), "bench_parse.xlsx")
+    rows = make_workbook(path, fake_people(2000), sheets, roster_size=20)
+    print(f"{sheets}시트 / {rows}행 / CPU {os.cpu_count()}개")
+
+    baseline, results = None, []
+    for workers in WORKERS:
+        ms, parsed = timed(lambda: list(excel_import.iter_workbook(path, workers)), repeat=3)
+        if baseline is None:
+            baseline = (ms, parsed)
+        assert parsed == baseline[1], "결과 불일치"
+        results.append((workers, f"{ms:.0f}", f"{baseline[0] / ms:.1f}x"))
+
+    print_table(["워커", "ms", "속도"], results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+표 렌더 준비 벤치마크: 조회부터 st.dataframe 에 넘길 표가 만들어질 때까지의 시간 / 최대 메모리
+
+    BENCH_DATABASE_URL=... python -m benchmarks.bench_frames
+
+legacy : RealDictCursor -> dict 목록 -> 화면용 dict 목록 (행마다 문자열 포맷) -> DataFrame
+frame  : database.*_frame (튜플 커서 -> 열 단위 DataFrame, category 열) -> 화면용 열을 한 번에 계산
+추천 결과(참가자 수의 절반 가까이)와 참가자 한 페이지를 비교합니다.
+
+cold : 캐시 없이 조회 + 표 만들기
+rerun: 캐시된 조회 + 표 만들기 + st.dataframe 이 하는 Arrow 직렬화 (화면을 다시 그릴 때마다 드는 비용)
+"""
+import tracemalloc
+
+import pandas as pd
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+from benchmarks.common import connect_database, fake_people, seed_history, timed, print_table
+
+POPULATION = [1000, 10000, 50000]
+
+
+def legacy_recommend_table(db, session_id):
+    """기존 render_recommend_tab 의 표 만들기 (비교용)"""
+    recs = db.get_recommendations(session_id, 'M')
+    recs.sort(key=lambda x: x['last_visit'] or '', reverse=True)
+    data = []
+    for r in recs:
+        memo_mark = " 📝" if r.get('memo') and str(r['memo']).strip() else ""
+        data.append({
+            '이름': f"{r['name']}{memo_mark}",
+            '출생년도': r['birth_date'][:4],
+            '전화번호': r['phone'] if r['phone'] else "-",
+            '사는곳': r['location'] if r['location'] else "-",
+            '직업': r['job'],
+            'MBTI': r['mbti'],
+            '방문 횟수': f"{r['visit_count']}회",
+            '최근 방문일': r['last_visit'],
+            '등록경로': r['signup_route'] if r['signup_route'] else "-",
+            '_full': r
+        })
+    return pd.DataFrame(data).drop(columns=['_full'])
+
+
+def frame_recommend_table(db, session_id):
+    recs = db.get_recommendations_frame(session_id, 'M')
+    recs = recs.sort_values('last_visit', ascending=False, na_position='last', kind='stable')
+    marks = recs['has_memo'].map({True: " 📝", False: ""})
+    return pd.DataFrame({
+        '이름': recs['name'] + marks,
+        '출생년도': recs['birth_year'],
+        '전화번호': recs['phone'].mask(recs['phone'].isna() | recs['phone'].eq(''), "-"),
+        '사는곳': recs['location'].mask(recs['location'].isna() | recs['location'].eq(''), "-"),
+        '직업': recs['job'],
+        'MBTI': recs['mbti'],
+        '방문 횟수': recs['visit_label'],
+        '최근 방문일': recs['last_visit'],
+        '등록경로': recs['signup_route'].mask(recs['signup_route'].isna() | recs['signup_route'].eq(''), "-"),
+    })
+
+
+def legacy_page_table(db):
+    """기존 render_db_table 의 표 만들기 (비교용)"""
+    rows, _ = db.get_participants_page(None, db.LIST_PAGE_SIZE)
+    data = [{'이름': f"{p['name']}{'📝' if p.get('memo') and str(p['memo']).strip() else ''}",
+             '출생년도': p['birth_date'][:4], '직업': p['job'], 'MBTI': p['mbti'], '지역': p['location'],
+             '_full': p} for p in rows]
+    return pd.DataFrame(data).drop(columns=['_full'])
+
+
+def frame_page_table(db):
+    page, _ = db.get_participants_page_frame(None, db.LIST_PAGE_SIZE)
+    return pd.DataFrame({'이름': page['name'] + page['has_memo'].map({True: "📝", False: ""}),
+                         '출생년도': page['birth_year'], '직업': page['job'], 'MBTI': page['mbti'],
+                         '지역': page['location']})
+
+
+def measure(db, build):
+    """(cold ms, rerun ms, 최대 메모리 MB, 결과 행 수)"""
+    def cold():
+        db.clear_cache()
+        return build()
+    cold_ms, table = timed(cold, repeat=3)
+    rerun_ms, _ = timed(lambda: convert_pandas_df_to_arrow_bytes(build()))
+    db.clear_cache()
+    tracemalloc.start()
+    build()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return cold_ms, rerun_ms, peak, len(table)
+
+
+def main():
+    rows = []
+    for population in POPULATION:
+        db = connect_database()
+        sessions = seed_history(db, fake_people(population), session_count=100, roster_size=12)
+        with db.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("UPDATE participants SET memo = '메모' WHERE participant_id % 7 = 0")
+            conn.commit()
+        session_id = sessions[-1][0]
+
+        cases = [("추천", lambda: legacy_recommend_table(db, session_id), lambda: frame_recommend_table(db, session_id)),
+                 ("참가자 페이지", lambda: legacy_page_table(db), lambda: frame_page_table(db))]
+        for label, legacy, frame in cases:
+            legacy_cold, legacy_rerun, legacy_mb, count = measure(db, legacy)
+            frame_cold, frame_rerun, frame_mb, frame_count = measure(db, frame)
+            assert count == frame_count
+            rows.append((population, label, count, f"{legacy_cold:.1f}", f"{frame_cold:.1f}",
+                         f"{legacy_rerun:.1f}", f"{frame_rerun:.1f}", f"{legacy_mb:.1f}", f"{frame_mb:.1f}"))
+
+    print_table(["참가자", "표", "행", "legacy cold ms", "frame cold ms", "legacy rerun ms", "frame rerun ms",
+                 "legacy MB", "frame MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
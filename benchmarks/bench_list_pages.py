@@ -0,0 +1,79 @@
+"""
+목록 페이지 벤치마크: 참가자 / 회차 수별로 한 화면 분량을 가져오는 시간과 전송 행 수
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_list_pages
+
+full   : 기존 전체 조회 (get_participant_roster / get_all_sessions) - 화면은 전체를 받아 그림
+offset : LIMIT/OFFSET 로 마지막 페이지 (앞 페이지를 모두 읽고 버림)
+keyset : database.get_participants_page / get_sessions_page 의 첫 페이지와 마지막 페이지
+"""
+from benchmarks.common import connect_database, fake_people, seed_history, timed, print_table
+
+POPULATION = [1000, 10000, 50000]
+
+
+def offset_page(db, sql, offset, limit):
+    """OFFSET 방식 (비교용)"""
+    with db.get_connection() as conn, db.get_cursor(conn) as cursor:
+        cursor.execute(sql + " LIMIT %s OFFSET %s", (limit, offset))
+        return cursor.fetchall()
+
+
+def last_cursor(fetch_page):
+    """마지막 페이지의 시작 커서 (페이지를 끝까지 넘겨서 구함)"""
+    cursor = None
+    while True:
+        _, next_cursor = fetch_page(cursor)
+        if next_cursor is None:
+            return cursor
+        cursor = next_cursor
+
+
+def uncached(db, fn):
+    def run():
+        db.clear_cache()  # 캐시를 거치지 않고 매번 DB 조회
+        return fn()
+    return run
+
+
+def main():
+    rows = []
+    for population in POPULATION:
+        db = connect_database()
+        seed_history(db, fake_people(population), session_count=20, roster_size=12)
+        with db.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO sessions (session_date, session_time, theme, host, status)
+                SELECT date '2000-01-01' + g, '19:30', '벤치마크', 'bench', '완료'
+                FROM generate_series(1, %s) g
+            """, (population // 5,))
+            conn.commit()
+        db.clear_cache()
+
+        cases = [
+            ("참가자", population, db.LIST_PAGE_SIZE,
+             db.get_participant_roster,
+             "SELECT name, birth_date FROM participants ORDER BY name, birth_date",
+             lambda c: db.get_participants_page(c, db.LIST_PAGE_SIZE)),
+            ("회차", db.count_sessions(), db.SESSION_PAGE_SIZE,
+             db.get_all_sessions,
+             f"SELECT session_id FROM sessions ORDER BY {db._SESSION_ORDER}",
+             lambda c: db.get_sessions_page(c, db.SESSION_PAGE_SIZE)),
+        ]
+        for label, total, limit, fetch_all, offset_sql, fetch_page in cases:
+            deep = last_cursor(fetch_page)
+            last_offset = (total - 1) // limit * limit
+            full_ms, everything = timed(uncached(db, fetch_all), repeat=3)
+            offset_ms, _ = timed(uncached(db, lambda: offset_page(db, offset_sql, last_offset, limit)))
+            first_ms, (first, _) = timed(uncached(db, lambda: fetch_page(None)))
+            deep_ms, (tail, next_cursor) = timed(uncached(db, lambda: fetch_page(deep)))
+            assert next_cursor is None and len(everything) == total
+            rows.append((label, total, len(everything), f"{full_ms:.1f}", f"{offset_ms:.1f}",
+                         len(first), f"{first_ms:.1f}", len(tail), f"{deep_ms:.1f}"))
+
+    print_table(["목록", "전체", "full 행", "full ms", "offset(끝) ms",
+                 "keyset 행", "keyset(처음) ms", "keyset(끝) 행", "keyset(끝) ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
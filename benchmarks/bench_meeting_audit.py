@@ -0,0 +1,63 @@
+"""
+전체 회차 중복 만남 점검 벤치마크: 회차 수별 전체 이력 점검 시간
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_meeting_audit
+
+per-session : 회차마다 check_duplicate_meetings (지금처럼 회차를 하나씩 눌러 보는 방식)
+              회차가 많으면 SAMPLE 개만 재서 전체 회차 수로 환산 (표에 '~' 표시)
+audit       : database.audit_repeat_meetings (출석을 회차 순으로 한 번 읽어 쌍 해시로 점검, 캐시 없이)
+pass        : 그중 meeting_audit.audit (메모리 점검만)
+"""
+import time
+
+import meeting_audit
+from benchmarks.common import connect_database, fake_people, seed_history, timed, print_table
+
+# (참가자 수, 회차 수)
+HISTORY = [(2000, 500), (10000, 2000), (30000, 5000)]
+ROSTER_SIZE = 16
+SAMPLE = 200
+
+
+def per_session_ms(db, session_ids):
+    """회차마다 check_duplicate_meetings (캐시 없이) - 전체 회차 수로 환산한 ms, 환산 여부"""
+    sample = session_ids[::max(1, len(session_ids) // SAMPLE)]
+    db.clear_cache()
+    start = time.perf_counter()
+    for session_id in sample:
+        db.check_duplicate_meetings(session_id)
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed * len(session_ids) / len(sample), len(sample) < len(session_ids)
+
+
+def main():
+    rows = []
+    for population, session_count in HISTORY:
+        db = connect_database()
+        sessions = seed_history(db, fake_people(population), session_count=session_count,
+                                roster_size=ROSTER_SIZE, interval_days=1)
+        session_ids = [sid for sid, _ in sessions]
+
+        def audit():
+            db.clear_cache()
+            return db.audit_repeat_meetings()
+        audit_ms, result = timed(audit, repeat=3)
+        with db.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT a.session_id, a.participant_id FROM attendance a
+                JOIN sessions s ON s.session_id = a.session_id
+                ORDER BY s.session_date, COALESCE(s.session_time, ''), a.session_id
+            """)
+            attendance = cursor.fetchall()
+        pass_ms, _ = timed(lambda: meeting_audit.audit(attendance), repeat=3)
+        loop_ms, estimated = per_session_ms(db, session_ids)
+
+        rows.append((session_count, result['row_count'], result['pair_count'], result['repeat_count'],
+                     len(result['sessions']), f"{'~' if estimated else ''}{loop_ms:.0f}",
+                     f"{audit_ms:.0f}", f"{pass_ms:.0f}"))
+
+    print_table(["회차", "출석", "쌍", "중복 쌍", "중복 회차", "per-session ms", "audit ms", "pass ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+만남 그래프 벤치마크: 참가자를 회차에 넣을 때 '이미 만난 사람' 확인 시간 (DB 조회 vs 메모리 그래프)
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_met_graph
+
+sql 확인   : 확인할 때마다 met_pairs 를 조회 (명단 중 이 사람이 만난 사람)
+graph 확인 : database.met_in_session (프로세스 공유 그래프, 만들어 둔 뒤)
+sql 후보   : 후보 CANDIDATES 명 중 명단과 안 만난 사람을 met_pairs 로 거름
+graph 후보 : database.clean_candidates
+구성 ms    : 그래프를 처음 만드는 시간 (attendance 전체 조회 포함)
+추가 ms    : add_attendance 뒤 그래프 증분 반영만 (MetGraph.attend)
+"""
+import random
+import sys
+
+import met_graph
+from benchmarks.common import connect_database, fake_people, seed_history, timed, print_table
+
+# (참가자 수, 회차 수)
+HISTORY = [(2000, 500), (10000, 2000), (30000, 5000)]
+ROSTER_SIZE = 16
+CHECKS = 200
+CANDIDATES = 500
+
+_MET_IN_ROSTER_SQL = """
+    SELECT p.name, p.birth_date
+    FROM attendance r
+    JOIN participants p ON p.participant_id = r.participant_id
+    JOIN participants x ON x.name = %s AND x.birth_date = %s
+    JOIN met_pairs m ON m.p1_id = LEAST(x.participant_id, r.participant_id)
+                    AND m.p2_id = GREATEST(x.participant_id, r.participant_id)
+    WHERE r.session_id = %s
+"""
+
+_CLEAN_SQL = """
+    SELECT k.name, k.birth_date
+    FROM unnest(%s::text[], %s::text[]) WITH ORDINALITY AS k(name, birth_date, n)
+    LEFT JOIN participants x ON x.name = k.name AND x.birth_date = k.birth_date
+    WHERE x.participant_id IS NULL OR NOT EXISTS (
+        SELECT 1 FROM attendance r
+        LEFT JOIN met_pairs m ON m.p1_id = LEAST(x.participant_id, r.participant_id)
+                             AND m.p2_id = GREATEST(x.participant_id, r.participant_id)
+        WHERE r.session_id = %s AND (r.participant_id = x.participant_id OR m.p1_id IS NOT NULL)
+    )
+    ORDER BY k.n
+"""
+
+
+def main():
+    rng = random.Random(0)
+    rows = []
+    for population, session_count in HISTORY:
+        db = connect_database()
+        people = fake_people(population)
+        sessions = seed_history(db, people, session_count=session_count, roster_size=ROSTER_SIZE, interval_days=1)
+        checks = [(rng.choice(sessions)[0], *rng.choice(people)[:2]) for _ in range(CHECKS)]
+        session_id = sessions[-1][0]
+        candidates = [p[:2] for p in rng.sample(people, CANDIDATES)]
+
+        def sql_checks():
+            with db.get_connection() as conn, conn.cursor() as cursor:
+                for sid, name, birth in checks:
+                    cursor.execute(_MET_IN_ROSTER_SQL, (name, birth, sid))
+                    cursor.fetchall()
+        sql_ms, _ = timed(sql_checks, repeat=3)
+
+        def build():
+            state = db._met_graph_state()
+            state['graph'] = None
+            with state['lock']:
+                return db._met_graph(state)
+        build_ms, graph = timed(build, repeat=3)
+        graph_ms, _ = timed(lambda: [db.met_in_session(*check) for check in checks])
+        for sid, name, birth in checks[:20]:  # 두 방식 결과가 같은지
+            with db.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_MET_IN_ROSTER_SQL, (name, birth, sid))
+                assert sorted(cursor.fetchall()) == [(m['name'], m['birth_date']) for m in db.met_in_session(sid, name, birth)]
+
+        def sql_clean():
+            with db.get_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(_CLEAN_SQL, ([n for n, _ in candidates], [b for _, b in candidates], session_id))
+                return [tuple(r) for r in cursor.fetchall()]
+        sql_clean_ms, expected = timed(sql_clean, repeat=3)
+        clean_ms, clean = timed(lambda: db.clean_candidates(session_id, candidates))
+        assert clean == expected, "후보 결과가 다름"
+
+        copy = met_graph.MetGraph((sid, person) for sid, roster in sessions for person in roster)
+        newcomers = [(sessions[i][0], people[i][:2]) for i in range(CHECKS)]
+        attend_ms, _ = timed(lambda: [copy.attend(sid, person) for sid, person in newcomers], repeat=1)
+        memory_mb = (sum(map(sys.getsizeof, graph.met)) + sum(map(sys.getsizeof, graph.masks.values()))) / 2 ** 20
+
+        rows.append((session_count, len(graph), f"{sql_ms / CHECKS:.3f}", f"{graph_ms / CHECKS:.3f}",
+                     f"{sql_clean_ms:.1f}", f"{clean_ms:.2f}", f"{build_ms:.0f}",
+                     f"{attend_ms / CHECKS:.3f}", f"{memory_mb:.1f}"))
+
+    print_table(["회차", "사람", "sql 확인 ms", "graph 확인 ms", "sql 후보 ms", "graph 후보 ms",
+                 "구성 ms", "추가 ms", "비트셋 MB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+참가자 상세 조회 벤치마크: 방문 횟수별 DB 왕복 수 / 지연 시간
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_participant_detail
+
+legacy  : 참가자 1회 + 방문 이력 1회 + 방문마다 만난 사람 1회 (N+2 왕복)
+current : database.get_participant_detail (JSON 집계 단일 쿼리)
+"""
+from benchmarks.common import (connect_database, fake_people, seed_history,
+                               timed, QueryCounter, print_table)
+
+VISIT_COUNTS = [1, 5, 10, 30, 60]
+
+
+def legacy_participant_detail(db, name, birth_date):
+    """기존 구현 (비교용)"""
+    with db.get_connection() as conn, db.get_cursor(conn) as cursor:
+        cursor.execute("SELECT * FROM participants WHERE name = %s AND birth_date = %s", (name, birth_date))
+        row = cursor.fetchone()
+        if not row: return {}
+        participant = dict(row)
+
+        cursor.execute("""
+            SELECT s.session_id, s.session_date, s.session_time, s.theme
+            FROM attendance a
+            JOIN sessions s ON a.session_id = s.session_id
+            WHERE a.participant_id = %s
+            ORDER BY s.session_date DESC
+        """, (participant['participant_id'],))
+        participant['visit_history'] = [dict(r) for r in cursor.fetchall()]
+        participant['visit_count'] = len(participant['visit_history'])
+
+        for visit in participant['visit_history']:
+            cursor.execute("""
+                SELECT p.name, p.gender
+                FROM attendance a
+                JOIN participants p ON a.participant_id = p.participant_id
+                WHERE a.session_id = %s AND p.participant_id <> %s
+            """, (visit['session_id'], participant['participant_id']))
+            visit['met_people'] = [dict(r) for r in cursor.fetchall()]
+    return participant
+
+
+def main():
+    db = connect_database()
+    people = fake_people(400)
+    sessions = seed_history(db, people, session_count=max(VISIT_COUNTS), roster_size=12)
+
+    # 방문 횟수가 정해진 대상자들을 앞쪽 회차부터 출석시킴
+    targets = []
+    with db.get_connection() as conn, conn.cursor() as cursor:
+        for visits in VISIT_COUNTS:
+            name, birth = f"대상자{visits}", "1990-01-01"
+            cursor.execute("INSERT INTO participants (name, birth_date, gender) VALUES (%s, %s, 'M') RETURNING participant_id",
+                           (name, birth))
+            participant_id = cursor.fetchone()[0]
+            cursor.executemany("INSERT INTO attendance (session_id, participant_id) VALUES (%s, %s)",
+                               [(sid, participant_id) for sid, _ in sessions[:visits]])
+            targets.append((visits, name, birth))
+        conn.commit()
+
+    def current(name, birth):
+        db.clear_cache()  # 캐시를 거치지 않고 매번 DB 조회
+        return db.get_participant_detail(name, birth)
+
+    rows = []
+    for visits, name, birth in targets:
+        with QueryCounter(db) as legacy_q:
+            legacy_ms, legacy = timed(lambda: legacy_participant_detail(db, name, birth))
+        with QueryCounter(db) as current_q:
+            current_ms, result = timed(lambda: current(name, birth))
+
+        assert result['visit_count'] == legacy['visit_count'] == visits
+        assert sorted(len(v['met_people']) for v in result['visit_history']) == \
+               sorted(len(v['met_people']) for v in legacy['visit_history'])
+
+        rows.append((visits, legacy_q.count // 5, f"{legacy_ms:.1f}", current_q.count // 5, f"{current_ms:.1f}",
+                     f"{legacy_ms / current_ms:.1f}x"))
+
+    print_table(["방문", "legacy 왕복", "legacy ms", "current 왕복", "current ms", "속도"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+초성 검색 인덱스 벤치마크: 참가자 수별 검색 지연 (DB 없이 메모리만)
+
+    python -m benchmarks.bench_participant_index
+
+linear  : 검색할 때마다 전체 목록을 훑음 (같은 초성/자모 규칙으로 한 명씩 비교)
+index   : participant_index.ParticipantIndex (n-gram 역색인으로 후보를 좁힌 뒤 확인)
+결과 집합이 같은지 확인하고, 구성 시간 / 메모리 / 한 명 추가·삭제 시간도 함께 출력합니다.
+"""
+import random
+import time
+import tracemalloc
+
+import participant_index as pi
+from benchmarks.common import fake_people, print_table, timed
+
+POPULATION = [1000, 10000, 50000]
+QUERIES = ["ㄱㅁㅅ", "김민", "김ㅁ", "이서ㅈ", "5678", "010-12", "개발", "ㅈ"]
+
+
+def with_contacts(people, seed=0):
+    rng = random.Random(seed)
+    return [dict(name=n, birth_date=b, gender=g, job=j, mbti=m, location=loc,
+                 nickname=f"닉{n[1:3]}", phone=f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}", memo=None)
+            for n, b, g, j, m, loc in people]
+
+
+def linear_search(records, query):
+    """인덱스 없이 전체를 훑는 같은 규칙의 검색 (비교용)"""
+    q = pi.normalize(query)
+    digits = pi.digits_of(q)
+    if digits and len(digits) == len(q.replace("-", "")):
+        return {(p['name'], p['birth_date']) for p in records if digits in pi.digits_of(p['phone'])}
+    q_cho = pi.choseong(q)
+    found = set()
+    for p in records:
+        for field in (p['name'], p['nickname'], p['job']):
+            text = pi.normalize(field)
+            if pi.find(text, pi.choseong(text), q, q_cho) >= 0:
+                found.add((p['name'], p['birth_date']))
+                break
+    return found
+
+
+def per_call_us(fn, min_seconds=0.2):
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls * 1e6
+
+
+def main():
+    rows, stats = [], []
+    for population in POPULATION:
+        records = with_contacts(fake_people(population))
+
+        build_ms, index = timed(lambda: pi.ParticipantIndex(records), repeat=1)
+        tracemalloc.start()  # 추적 중에는 느려지므로 시간과 따로 잼
+        traced = pi.ParticipantIndex(records)
+        memory_mb = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+        del traced
+
+        extra = dict(records[0], name="추가테스트", birth_date="1999-01-01")
+        add_us = per_call_us(lambda: (index.add(extra), index.remove("추가테스트", "1999-01-01")))
+        stats.append((population, f"{build_ms:.0f}", f"{memory_mb:.1f}", f"{add_us:.0f}"))
+
+        for query in QUERIES:
+            expected = linear_search(records, query)
+            hits = {(p['name'], p['birth_date']) for p in index.search(query)}
+            assert hits == expected, f"결과 불일치: {query}"
+            linear_us = per_call_us(lambda: linear_search(records, query), 0.3)
+            index_us = per_call_us(lambda: index.page(query, 100, 0))
+            rows.append((population, query, len(hits), f"{linear_us:.0f}", f"{index_us:.0f}",
+                         f"{linear_us / index_us:.0f}x"))
+
+    print_table(["참가자", "구성 ms", "메모리 MB", "추가+삭제 us"], stats)
+    print()
+    print_table(["참가자", "검색어", "결과", "linear us", "index us", "속도"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+참가자 검색 벤치마크: 참가자 수별 검색 한 번의 지연 시간 / 가져오는 행 수
+
+    BENCH_DATABASE_URL=... [BENCH_RTT_MS=30] python -m benchmarks.bench_participant_search
+
+legacy  : 전체 참가자를 가져와 파이썬에서 이름/직업 부분 일치로 거름 (검색할 때마다 전체 전송)
+current : database.search_participants (search_text LIKE + 관련도 정렬, 첫 페이지만 전송)
+pg_trgm 이 설치된 서버에서는 트라이그램 인덱스를 타고, 없으면 search_text 순차 탐색입니다.
+"""
+from benchmarks.common import (connect_database, fake_people, seed_history,
+                               timed, QueryCounter, print_table)
+
+POPULATION = [1000, 5000, 20000]
+QUERIES = ["김민", "연구", "지현1"]
+
+
+def legacy_search(db, term):
+    """기존 구현 (비교용)"""
+    with db.get_connection() as conn, db.get_cursor(conn) as cursor:
+        cursor.execute("""
+            SELECT name, birth_date, gender, job, mbti, phone, location, signup_route, first_visit_date, memo
+            FROM participants ORDER BY name
+        """)
+        rows = [dict(row) for row in cursor.fetchall()]
+    return [p for p in rows if term in p['name'] or (p['job'] and term in p['job'])], len(rows)
+
+
+def main():
+    rows = []
+    for population in POPULATION:
+        db = connect_database()
+        seed_history(db, fake_people(population), session_count=50, roster_size=12)
+        with db.get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("SELECT to_regclass('participants_search_trgm_idx') IS NOT NULL")
+            trgm = cursor.fetchone()[0]
+
+        def current(term):
+            db.clear_cache()  # 캐시를 거치지 않고 매번 DB 조회
+            return db.search_participants(term)
+
+        for term in QUERIES:
+            with QueryCounter(db):
+                legacy_ms, (legacy, fetched) = timed(lambda: legacy_search(db, term))
+                current_ms, result = timed(lambda: current(term))
+            total = result[0]['total_count'] if result else 0
+            assert {(p['name'], p['birth_date']) for p in legacy} <= \
+                   {(p['name'], p['birth_date']) for p in db.search_participants(term, limit=population)}
+            rows.append((population, term, "trgm" if trgm else "seq", fetched, f"{legacy_ms:.1f}",
+                         len(result), total, f"{current_ms:.1f}", f"{legacy_ms / current_ms:.1f}x"))
+
+    print_table(["참가자", "검색어", "인덱스", "legacy 행", "legacy ms", "current 행", "전체 결과", "current ms", "속도"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+추천 점수 벤치마크: 후보 수별 점수 계산 + 상위 k 명 시간 (DB 없이 합성 후보로 측정)
+
+    python -m benchmarks.bench_recommend_score
+
+loop   : 후보마다 파이썬으로 같은 점수 공식 계산 후 전체 정렬 (비교용)
+vector : recommend_score.score (고유값만 해석 + NumPy 한 번에) + top_k (argpartition)
+두 방식의 점수가 같은지 확인합니다.
+"""
+import math
+import random
+from collections import Counter
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+import recommend_score as rs
+from benchmarks.common import MBTIS, LOCATIONS, fake_people, timed, print_table
+
+CANDIDATES = [1000, 10000, 50000]
+TOP_K = 50
+TODAY = date(2026, 1, 1)
+ROUTES = ["인스타그램", "지인 소개", "블로그", "당근", ""]
+
+
+def candidate_frame(count, seed=0):
+    """get_recommendations_frame 과 같은 열의 합성 후보"""
+    rng = random.Random(seed)
+    rows = []
+    for name, birth, gender, job, mbti, location in fake_people(count, seed):
+        visits = rng.choice([0, 0, 1, 1, 2, 3, 5, 8])
+        last = (TODAY - timedelta(days=rng.randint(1, 900))).isoformat() if visits else None
+        rows.append({'name': name, 'birth_date': birth, 'mbti': rng.choice(MBTIS + [None]),
+                     'visit_count': visits, 'last_visit': last,
+                     'location': rng.choice(LOCATIONS + [None]), 'signup_route': rng.choice(ROUTES)})
+    df = pd.DataFrame.from_records(rows)
+    df['mbti'] = df['mbti'].astype('category')
+    return df
+
+
+def roster_frame(seed=1):
+    rng = random.Random(seed)
+    return pd.DataFrame.from_records([
+        {'gender': 'F' if i % 2 else 'M', 'birth_date': f"{rng.randint(1985, 1995)}-01-01",
+         'mbti': rng.choice(MBTIS), 'location': rng.choice(LOCATIONS), 'signup_route': rng.choice(ROUTES)}
+        for i in range(16)])
+
+
+def loop_score(candidates, roster, gender):
+    """같은 공식을 행마다 계산 (비교용)"""
+    partners = [r for r in roster.to_dict('records') if r['gender'] != gender] or roster.to_dict('records')
+    years = sorted(int(r['birth_date'][:4]) for r in partners)
+    mid = len(years) // 2
+    median = years[mid] if len(years) % 2 else (years[mid - 1] + years[mid]) / 2
+    axes = [[1 if p in str(r['mbti']).upper() else -1 if m in str(r['mbti']).upper() else 0
+             for p, m in rs.MBTI_AXES] for r in partners]
+    mean_axes = [sum(col) / len(axes) for col in zip(*axes)]
+    members = roster.to_dict('records')
+    loc = Counter(r['location'] for r in members if r['location'])
+    route = Counter(r['signup_route'] for r in members if r['signup_route'])
+    top = max(math.log1p(v) for v in candidates['visit_count'])
+    w = rs.WEIGHTS
+    scores = []
+    for c in candidates.to_dict('records'):
+        gap = (int(c['birth_date'][:4]) - median) / rs.AGE_SPREAD
+        mbti = str(c['mbti']).upper() if isinstance(c['mbti'], str) else ""
+        a = [1 if p in mbti else -1 if m in mbti else 0 for p, m in rs.MBTI_AXES]
+        parts = {
+            'age': math.exp(-gap * gap),
+            'mbti': 0.5 + sum(x * y for x, y in zip(a, mean_axes)) / 8.0,
+            'recency': math.exp(-(TODAY - date.fromisoformat(c['last_visit'])).days / rs.RECENCY_DAYS)
+                       if isinstance(c['last_visit'], str) else 0.0,
+            'visits': math.log1p(c['visit_count']) / top if top else 0.0,
+            'location': loc.get(c['location'], 0) / sum(loc.values()) if isinstance(c['location'], str) else 0.0,
+            'route': route.get(c['signup_route'], 0) / sum(route.values()) if c['signup_route'] else 0.0,
+        }
+        scores.append(sum(w[k] * parts[k] for k in w) / sum(w.values()) * 100.0)
+    order = sorted(range(len(scores)), key=lambda i: -scores[i])[:TOP_K]
+    return np.array(scores), order
+
+
+def vector_score(candidates, roster, gender):
+    scores = rs.score(candidates, roster, gender, today=TODAY)
+    return scores, rs.top_k(scores, TOP_K)
+
+
+def main():
+    roster = roster_frame()
+    rows = []
+    for count in CANDIDATES:
+        candidates = candidate_frame(count)
+        loop_ms, (loop_scores, _) = timed(lambda: loop_score(candidates, roster, 'M'), repeat=3)
+        vector_ms, (scores, top) = timed(lambda: vector_score(candidates, roster, 'M'))
+        sort_ms, _ = timed(lambda: np.argsort(-scores, kind='stable')[:TOP_K])
+        topk_ms, _ = timed(lambda: rs.top_k(scores, TOP_K))
+        assert np.allclose(loop_scores, scores), "점수 불일치"
+        assert np.allclose(np.sort(scores)[::-1][:TOP_K], scores[top])
+        rows.append((count, f"{loop_ms:.1f}", f"{vector_ms:.1f}", f"{loop_ms / vector_ms:.0f}x",
+                     f"{sort_ms:.2f}", f"{topk_ms:.2f}"))
+
+    print_table(["후보", "loop ms", "vector ms", "속도", "전체 정렬 ms", f"top-{TOP_K} ms"], rows)
+
+
+if __name__ == "__main__":
+    main()
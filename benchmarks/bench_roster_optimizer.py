@@ -0,0 +1,68 @@
+"""
+회차 편성 벤치마크: 참가 가능 인원 x 회차 수별 편성 시간과 품질 (DB 없이 합성 이력으로 측정)
+
+    python -m benchmarks.bench_roster_optimizer
+
+manual : 신청 순서대로 남녀 정원까지 채움 (지금처럼 손으로 편성, 비교용)
+greedy : roster_optimizer 탐욕 배정만
+search : 탐욕 배정 + 지역 탐색/흔들기 (time_limit 초)
+
+품질: 이미 만난 쌍 수 (작을수록 좋음), 정원/남녀 균형을 채운 회차 수, 회차 평균 나이 표준편차
+"""
+import random
+import time
+
+import roster_optimizer as ro
+from benchmarks.common import print_table
+
+# (참가 가능 인원, 회차 수, 회차당 성별 인원, 과거 회차 수)
+SCENARIOS = [(200, 10, 8, 100), (200, 10, 8, 300), (200, 10, 6, 600), (500, 25, 8, 600)]
+TIME_LIMIT = 3.0
+PAST_ROSTER = 12
+
+
+def scenario(pool_size, past_sessions, seed=0):
+    """(사람 목록, 과거 회차에서 함께 참석한 쌍)"""
+    rng = random.Random(seed)
+    people = [{'participant_id': i, 'gender': 'M' if i % 2 == 0 else 'F',
+               'birth_date': f"{rng.randint(1985, 2000)}-01-01"} for i in range(pool_size)]
+    met = set()
+    for _ in range(past_sessions):
+        roster = sorted(rng.sample(range(pool_size), PAST_ROSTER))
+        met.update((a, b) for k, a in enumerate(roster) for b in roster[k + 1:])
+    return people, met
+
+
+def manual(people, session_ids, per_gender):
+    """신청 순서대로 채움 (비교용)"""
+    queues = {g: [p['participant_id'] for p in people if p['gender'] == g] for g in ro.GENDERS}
+    return {sid: [queues[g].pop(0) for g in ro.GENDERS for _ in range(per_gender) if queues[g]]
+            for sid in session_ids}
+
+
+def main():
+    rows = []
+    for pool_size, session_count, per_gender, past in SCENARIOS:
+        people, met = scenario(pool_size, past)
+        sessions = [{'session_id': sid, 'members': []} for sid in range(session_count)]
+        density = len(met) / (pool_size * (pool_size - 1) / 2)
+
+        results = [("manual", 0.0, manual(people, range(session_count), per_gender), 0)]
+        for label, local_search in (("greedy", False), ("search", True)):
+            start = time.perf_counter()
+            plan = ro.plan_rosters(people, sessions, met, per_gender, time_limit=TIME_LIMIT, local_search=local_search)
+            results.append((label, time.perf_counter() - start, plan['rosters'], plan['moves']))
+
+        for label, seconds, rosters, moves in results:
+            placed = [i for ids in rosters.values() for i in ids]
+            assert len(placed) == len(set(placed)), "한 사람이 두 회차에 배정됨"
+            quality = ro.evaluate(rosters, people, met, per_gender)
+            rows.append((f"{pool_size}x{session_count}", f"{density:.0%}", label, f"{seconds:.2f}", moves,
+                         quality['repeat_pairs'], f"{quality['full']}/{session_count}",
+                         f"{quality['balanced']}/{session_count}", f"{quality['age_std']:.2f}"))
+
+    print_table(["인원x회차", "만난 쌍 밀도", "방식", "초", "맞바꾸기", "이미 만난 쌍", "정원", "남녀 균형", "나이 표준편차"], rows)
+
+
+if __name__ == "__main__":
+    main()
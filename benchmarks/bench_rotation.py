@@ -0,0 +1,56 @@
+"""
+로테이션 벤치마크: 명단 크기 / 이미 만난 쌍 비율별 편성 시간과 품질 (DB 없이)
+
+    python -m benchmarks.bench_rotation
+
+편성 ms   : rotation.schedule 한 번
+다시 ms   : 2라운드 진행 뒤 한 명이 빠졌을 때 rotation.reschedule 한 번
+라운드    : 만든 라운드 수 / 하한 (lower_bound)
+테이블 차 : 한 라운드 안 테이블 인원의 최대 차이
+"""
+import random
+
+import rotation
+from benchmarks.common import timed, print_table
+
+ROSTERS = [(6, 6), (7, 5), (10, 10), (12, 9), (20, 20), (30, 28)]
+MET_RATIOS = [0.0, 0.2]
+
+
+def lower_bound(plan):
+    """필요한 라운드 수 하한: 옮기는 사람은 라운드마다 한 테이블, 테이블은 라운드마다 많아야 ceil(옮기는 사람 / 테이블) 명"""
+    guests, hosts = {}, {}
+    for round_ in plan['rounds']:
+        for host, table in round_['tables']:
+            hosts[host] = hosts.get(host, 0) + len(table)
+            for guest in table:
+                guests[guest] = guests.get(guest, 0) + 1
+    seats = -(-len(plan['guests']) // max(1, len(plan['hosts'])))
+    return max([*guests.values(), *(-(-count // seats) for count in hosts.values())], default=0)
+
+
+def main():
+    rng = random.Random(0)
+    rows = []
+    for men_count, women_count in ROSTERS:
+        for ratio in MET_RATIOS:
+            men = [f"m{i}" for i in range(men_count)]
+            women = [f"w{i}" for i in range(women_count)]
+            met = [(m, w) for m in men for w in women if rng.random() < ratio]
+            ms, plan = timed(lambda: rotation.schedule(men, women, met))
+            redo_ms, redo = timed(lambda: rotation.reschedule(plan, 2, men[1:], women, met))
+
+            seated = [frozenset((host, guest)) for r in plan['rounds'] for host, table in r['tables'] for guest in table]
+            assert len(seated) == len(set(seated)), "같은 쌍이 두 번 앉음"
+            assert not set(seated) & {frozenset(pair) for pair in met}, "이미 만난 쌍이 앉음"
+            spread = max(max(len(t) for _, t in r['tables']) - min(len(t) for _, t in r['tables'])
+                         for r in plan['rounds'])
+            rows.append((f"{men_count}/{women_count}", f"{ratio:.0%}", f"{ms:.2f}", f"{redo_ms:.2f}",
+                         f"{len(plan['rounds'])}/{lower_bound(plan)}", spread, len(plan['missing']),
+                         len(redo['rounds'])))
+
+    print_table(["남/여", "만난 쌍", "편성 ms", "다시 ms", "라운드/하한", "테이블 차", "못 만난 쌍", "다시 라운드"], rows)
+
+
+if __name__ == "__main__":
+    main()
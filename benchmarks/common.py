@@ -0,0 +1,179 @@
+"""
+벤치마크 공용 헬퍼
+
+BENCH_DATABASE_URL 환경 변수에 *벤치마크 전용* PostgreSQL 을 지정해서 실행합니다.
+public 스키마를 통째로 비우고 합성 데이터를 넣으므로 운영 DB(Supabase)는 절대 넣지 마세요.
+
+    BENCH_DATABASE_URL=postgresql://localhost/maketoast_bench python -m benchmarks.bench_participant_detail
+
+로컬 DB는 왕복 지연이 거의 없으므로, BENCH_RTT_MS=30 처럼 주면 QueryCounter 가
+쿼리마다 그만큼 쉬어서 Supabase 같은 원격 DB의 왕복 비용을 흉내 냅니다.
+"""
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+import warnings
+
+# streamlit 을 `streamlit run` 없이 import 할 때 나오는 경고 숨김
+warnings.filterwarnings("ignore")
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민서지현수영준우하은도윤예린성진태희유나"
+JOBS = ["개발자", "교사", "간호사", "디자이너", "회계사", "공무원", "마케터", "연구원", "약사", "자영업"]
+MBTIS = ["ENFP", "ENTP", "INFJ", "INTJ", "ESFJ", "ISFJ", "ESTP", "ISTP", "ENFJ", "INFP"]
+LOCATIONS = ["서울", "경기", "인천", "부산", "대전"]
+
+SIMULATED_RTT_MS = float(os.environ.get("BENCH_RTT_MS", "0"))
+
+
+def connect_database():
+    """벤치마크 DB를 비우고 스키마를 만든 뒤 database 모듈을 돌려줌"""
+    dsn = os.environ.get("BENCH_DATABASE_URL")
+    if not dsn:
+        sys.exit("BENCH_DATABASE_URL 환경 변수를 설정해주세요. (벤치마크 전용 DB)")
+    os.environ["DATABASE_URL"] = dsn
+
+    import psycopg2
+    conn = psycopg2.connect(dsn)
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute("DROP SCHEMA public CASCADE")
+        cursor.execute("CREATE SCHEMA public")
+    conn.close()
+
+    import database as db
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("streamlit"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+    db.init_db(force=True)  # 같은 프로세스에서 스키마를 비운 뒤 다시 만듦
+    db.clear_cache()
+    return db
+
+
+def fake_people(count: int, seed: int = 0):
+    """(name, birth_date, gender, job, mbti, location) 합성 참가자"""
+    rng = random.Random(seed)
+    people = []
+    for i in range(count):
+        name = rng.choice(SURNAMES) + rng.choice(GIVEN) + rng.choice(GIVEN) + str(i)
+        birth = f"{rng.randint(1980, 2000)}-01-01"
+        gender = 'M' if i % 2 == 0 else 'F'
+        people.append((name, birth, gender, rng.choice(JOBS), rng.choice(MBTIS), rng.choice(LOCATIONS)))
+    return people
+
+
+def seed_history(db, people, session_count: int, roster_size: int = 12, seed: int = 0,
+                 start_date: str = "2020-01-04", interval_days: int = 7):
+    """interval_days 간격 회차 session_count개에 people 중 roster_size명씩 무작위 배정
+
+    반환: [(session_id, [(name, birth), ...]), ...]
+    """
+    from datetime import date, timedelta
+    rng = random.Random(seed)
+    start = date.fromisoformat(start_date)
+    sessions = []
+    with db.get_connection() as conn, conn.cursor() as cursor:
+        cursor.executemany("""
+            INSERT INTO participants (name, birth_date, gender, job, mbti, location, first_visit_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s) ON CONFLICT (name, birth_date) DO NOTHING
+        """, [p + (start_date,) for p in people])
+        for i in range(session_count):
+            s_date = (start + timedelta(days=i * interval_days)).isoformat()
+            cursor.execute("""
+                INSERT INTO sessions (session_date, session_time, theme, host, status)
+                VALUES (%s, '19:30', '벤치마크', 'bench', '완료') RETURNING session_id
+            """, (s_date,))
+            sid = cursor.fetchone()[0]
+            roster = [(p[0], p[1]) for p in rng.sample(people, min(roster_size, len(people)))]
+            cursor.executemany("""
+                INSERT INTO attendance (session_id, participant_id)
+                SELECT %s, participant_id FROM participants WHERE name = %s AND birth_date = %s
+            """, [(sid, n, b) for n, b in roster])
+            sessions.append((sid, roster))
+        conn.commit()
+    db.rebuild_met_pairs()  # 출석을 직접 넣었으므로 만남 인덱스를 한 번에 채움
+    return sessions
+
+
+def make_workbook(path, people, sheet_count: int, roster_size: int = 16, seed: int = 0,
+                  start_date: str = "2020-01-04", interval_days: int = 7):
+    """임포터 양식(시트 = 회차)의 엑셀 파일 생성
+
+    시트 이름 YYYYMMDD, A1 "YYYY.MM.DD 7:30 PM - 테마", N2 진행자, 2행부터 참가자.
+    반환: 참가자 행 수 합계
+    """
+    from datetime import date, timedelta
+    import openpyxl
+    rng = random.Random(seed)
+    start = date.fromisoformat(start_date)
+    wb = openpyxl.Workbook(write_only=True)
+    rows = 0
+    for i in range(sheet_count):
+        day = start + timedelta(days=i * interval_days)
+        ws = wb.create_sheet(day.strftime("%Y%m%d"))
+        ws.append([f"{day:%Y.%m.%d} 7:30 PM - 벤치마크 테마 {i % 12}"])
+        for j, (name, birth, gender, job, mbti, location) in enumerate(rng.sample(people, min(roster_size, len(people)))):
+            row = ["남" if gender == 'M' else "여", f"닉{name}", name, f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+                   "", "", location, birth[:4], job, mbti, "안녕하세요", "인스타그램"]
+            if j == 0:
+                row += ["", f"진행자{i % 3}"]  # N2
+            ws.append(row)
+            rows += 1
+    wb.save(path)
+    return rows
+
+
+def timed(fn, repeat: int = 5):
+    """fn 을 repeat 번 실행해 (중앙값 ms, 마지막 결과) 반환"""
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+class QueryCounter:
+    """database.get_cursor 를 감싸서 실행된 쿼리(=왕복) 수를 셈 (+ BENCH_RTT_MS 지연 주입)"""
+
+    def __init__(self, db):
+        self.db = db
+        self.count = 0
+        self._original = db.get_cursor
+
+    def __enter__(self):
+        counter = self
+        original = self._original
+
+        def counting_cursor(conn):
+            cursor = original(conn)
+            for method in ("execute", "copy_expert"):
+                setattr(cursor, method, counter._wrap(getattr(cursor, method)))
+            return cursor
+
+        self.db.get_cursor = counting_cursor
+        return self
+
+    def __exit__(self, *exc):
+        self.db.get_cursor = self._original
+        return False
+
+    def _wrap(self, method):
+        def wrapped(*args, **kwargs):
+            self.count += 1
+            if SIMULATED_RTT_MS:
+                time.sleep(SIMULATED_RTT_MS / 1000)
+            return method(*args, **kwargs)
+        return wrapped
+
+
+def print_table(headers, rows):
+    widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+    line = "  ".join(str(h).rjust(w) for h, w in zip(headers, widths))
+    print(line)
+    print("-" * len(line))
+    for r in rows:
+        print("  ".join(str(v).rjust(w) for v, w in zip(r, widths)))
@@ -2,298 +2,647 @@
 데이터베이스 연결 및 CRUD 함수
 PostgreSQL (Supabase) 전용 - 최적화 버전
 """
+import base64
+import csv
+import io
+import json
 import os
-import re
+import threading
 import streamlit as st
+import pandas as pd
 import psycopg2
-import openpyxl
-from psycopg2.extras import RealDictCursor
+from contextlib import contextmanager
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime
 from typing import List, Dict
 
+import db_migrate
+import excel_export
+import excel_import
+import meeting_audit
+import met_graph
+import recommend_score
+import roster_optimizer
+import rotation
+from db_pool import ConnectionPool
+from participant_index import ParticipantIndex, has_jamo
+
 # ---------------------------------------------------------
-# 1. DB 연결 및 설정 (캐싱 적용)
+# 1. DB 연결 및 설정 (커넥션 풀 + 캐싱)
 # ---------------------------------------------------------
 
-def validate_connection(conn):
-    """연결 유효성 검사"""
+# secrets.toml 의 [db_pool] 섹션으로 덮어쓸 수 있는 기본값
+POOL_DEFAULTS = {
+    'min_size': 1,        # 항상 열어둘 커넥션 수
+    'max_size': 10,       # 동시에 열 수 있는 최대 커넥션 수
+    'max_idle': 300,      # 이 시간(초) 이상 놀고 있으면 정리 (min_size 초과분)
+    'max_lifetime': 3600, # 이 시간(초)이 지난 커넥션은 새로 교체
+    'timeout': 10,        # 풀이 꽉 찼을 때 대기 시간(초)
+    'ping_after': 30,     # 이 시간(초) 넘게 놀던 커넥션만 체크아웃 때 살아 있는지 확인
+    'reap_interval': 60,  # 이 시간(초)마다 오래 놀고 있는 커넥션 정리
+}
+
+def _get_secret(key, default=None):
+    """secrets.toml 조회 (파일이 없으면 default)"""
     try:
-        return conn.closed == 0
-    except:
-        return False
+        return st.secrets.get(key, default)
+    except Exception:
+        return default
 
-def clear_cache():
-    """데이터 변경(CUD) 시 캐시 무효화"""
-    st.cache_data.clear()
+def _resolve_dsn() -> str:
+    # 1. secrets.toml의 DATABASE_URL 우선 사용
+    db_url = _get_secret("DATABASE_URL")
+    if db_url:
+        return db_url
 
-@st.cache_resource(ttl=3600, validate=validate_connection)
-def get_connection():
-    """DB 연결 (Supabase)"""
+    # 2. [supabase] 섹션 사용 (Legacy)
+    supabase = _get_secret("supabase")
+    if supabase and supabase.get("db_url"):
+        return supabase["db_url"]
+
+    # 3. 환경 변수 (데스크톱 앱 / 스크립트용)
+    if os.environ.get("DATABASE_URL"):
+        return os.environ["DATABASE_URL"]
+
+    raise Exception("secrets.toml에 DATABASE_URL이 없습니다.")
+
+# DATE 컬럼은 'YYYY-MM-DD' 문자열로 돌려줌 (session_date 가 TEXT 이던 시절과 같은 형태 유지)
+DATE_AS_TEXT = psycopg2.extensions.new_type((1082,), "DATE_AS_TEXT", lambda value, cursor: value)
+DATEARRAY_AS_TEXT = psycopg2.extensions.new_array_type((1182,), "DATEARRAY_AS_TEXT", DATE_AS_TEXT)
+
+def _configure_connection(conn):
+    psycopg2.extensions.register_type(DATE_AS_TEXT, conn)
+    psycopg2.extensions.register_type(DATEARRAY_AS_TEXT, conn)
+
+@st.cache_resource
+def get_pool() -> ConnectionPool:
+    """DB 커넥션 풀 (Supabase) - 프로세스당 1개, 모든 세션이 공유"""
     try:
-        # 1. secrets.toml의 DATABASE_URL 우선 사용
-        db_url = st.secrets.get("DATABASE_URL")
-        if db_url:
-            return psycopg2.connect(db_url)
-        
-        # 2. [supabase] 섹션 사용 (Legacy)
-        if "supabase" in st.secrets:
-            return psycopg2.connect(st.secrets["supabase"]["db_url"])
-            
-        raise Exception("secrets.toml에 DATABASE_URL이 없습니다.")
+        options = dict(POOL_DEFAULTS)
+        options.update(_get_secret("db_pool") or {})
+        return ConnectionPool(_resolve_dsn(), configure=_configure_connection, **options)
     except Exception as e:
         st.error(f"DB 연결 실패: {e}")
         raise e
 
+@contextmanager
+def get_connection():
+    """풀에서 커넥션을 빌려오고 블록이 끝나면 반납
+
+    with get_connection() as conn:
+        ...
+    예외가 나면 롤백되고, 커밋하지 않은 트랜잭션은 반납 시 롤백됩니다.
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
 def get_cursor(conn):
     return conn.cursor(cursor_factory=RealDictCursor)
 
-@st.cache_resource 
-def init_db():
-    """DB 테이블 초기화 (최초 1회만 실행)"""
-    conn = get_connection()
-    with conn.cursor() as cursor:
-        queries = [
-            """
-            CREATE TABLE IF NOT EXISTS participants (
-                name TEXT NOT NULL,
-                birth_date TEXT NOT NULL,
-                gender TEXT NOT NULL,
-                nickname TEXT, phone TEXT, location TEXT, job TEXT, mbti TEXT, 
-                intro TEXT, signup_route TEXT, first_visit_date TEXT, memo TEXT,
-                PRIMARY KEY (name, birth_date)
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS sessions (
-                session_id SERIAL PRIMARY KEY,
-                session_date TEXT NOT NULL, session_time TEXT, 
-                theme TEXT, host TEXT, status TEXT DEFAULT '준비중'
-            )
-            """,
-            """
-            CREATE TABLE IF NOT EXISTS attendance (
-                attendance_id SERIAL PRIMARY KEY,
-                participant_name TEXT NOT NULL, participant_birth TEXT NOT NULL,
-                session_id INTEGER NOT NULL, attended BOOLEAN DEFAULT TRUE, payment_status TEXT,
-                FOREIGN KEY (participant_name, participant_birth) REFERENCES participants(name, birth_date),
-                FOREIGN KEY (session_id) REFERENCES sessions(session_id)
-            )
-            """
-        ]
-        for query in queries:
-            cursor.execute(query)
-        conn.commit()
-    print("✅ DB 초기화 완료! (최초 1회 실행됨)")
+# ---------------------------------------------------------
+# 캐시 버전 관리 (엔티티 단위 무효화)
+# ---------------------------------------------------------
+# 조회 함수는 자신이 의존하는 범위(scope)의 버전을 캐시 키에 포함합니다.
+# 쓰기 함수는 바뀐 범위의 버전만 올리므로, 나머지 캐시는 그대로 재사용됩니다.
+#
+#   'participants'               : 참가자 목록 (메모 표시 포함)
+#   'sessions'                   : 회차 목록
+#   'visits'                     : 참가자별 방문 횟수 / 최근 방문일 (출석 변경 시)
+#   ('session', session_id)      : 회차 명단 / 중복 체크 / 추천
+#   ('participant', name, birth) : 참가자 상세 (방문 이력, 만난 사람)
+
+@st.cache_resource
+def _cache_versions() -> Dict:
+    """프로세스 전체(모든 Streamlit 세션)가 공유하는 버전 테이블"""
+    return {'lock': threading.Lock(), 'epoch': 0, 'scopes': {}}
+
+def cache_version(*scopes) -> tuple:
+    """주어진 범위들의 현재 버전 (캐시 키로 사용)"""
+    versions = _cache_versions()
+    with versions['lock']:
+        return (versions['epoch'],) + tuple(versions['scopes'].get(s, 0) for s in scopes)
+
+def invalidate(*scopes):
+    """주어진 범위의 캐시만 무효화"""
+    versions = _cache_versions()
+    with versions['lock']:
+        for scope in scopes:
+            versions['scopes'][scope] = versions['scopes'].get(scope, 0) + 1
+
+def clear_cache():
+    """전체 캐시 무효화 (엑셀 임포트 등 대량 변경 시)"""
+    versions = _cache_versions()
+    with versions['lock']:
+        versions['epoch'] += 1
+        versions['scopes'].clear()
+    st.cache_data.clear()
+
+def _participant_scopes(cursor, name: str, birth_date: str) -> set:
+    """참가자 한 명의 정보가 바뀔 때 함께 무효화할 범위
+
+    본인 상세 + 본인이 참석한 회차(명단/중복/추천)
+    """
+    cursor.execute("""
+        SELECT DISTINCT a.session_id
+        FROM attendance a
+        JOIN participants p ON p.participant_id = a.participant_id
+        WHERE p.name = %s AND p.birth_date = %s
+    """, (name, birth_date))
+    scopes = {('session', row['session_id']) for row in cursor.fetchall()}
+    scopes.add(('participant', name, birth_date))
+    return scopes
+
+def _roster_scopes(cursor, session_id: int) -> set:
+    """회차 명단이 바뀔 때 함께 무효화할 범위 (명단 변경 전/후 명단 기준으로 호출)
+
+    명단에 있는 사람들의 상세(만난 사람) + 그 사람들이 참석한 모든 회차.
+    누군가 이 회차에 들어오거나 빠지면 그 회차들의 방문 횟수, 중복 만남,
+    추천 제외 대상이 바뀌기 때문입니다.
+    """
+    cursor.execute("""
+        SELECT DISTINCT p.name, p.birth_date, h.session_id
+        FROM attendance r
+        JOIN attendance h ON h.participant_id = r.participant_id
+        JOIN participants p ON p.participant_id = r.participant_id
+        WHERE r.session_id = %s
+    """, (session_id,))
+    scopes = {('session', session_id), 'visits'}
+    for row in cursor.fetchall():
+        scopes.add(('participant', row['name'], row['birth_date']))
+        scopes.add(('session', row['session_id']))
+    return scopes
+
+def _participant_id(cursor, name: str, birth_date: str):
+    """(이름, 생년월일) -> participant_id (공개 함수는 이름/생년월일을 받고 내부 조인은 id 로)"""
+    cursor.execute("SELECT participant_id FROM participants WHERE name = %s AND birth_date = %s",
+                   (name, birth_date))
+    row = cursor.fetchone()
+    return row['participant_id'] if row else None
+
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+def init_db(force: bool = False):
+    """DB 스키마를 최신 마이그레이션까지 올림 (앱 시작 시 호출)
+
+    이미 최신이면 schema_migrations 조회 한 번으로 끝나고,
+    같은 프로세스에서는 두 번째 호출부터 아무것도 하지 않습니다.
+    """
+    global _schema_ready
+    with _schema_lock:
+        if _schema_ready and not force:
+            return
+        with get_connection() as conn:
+            applied = db_migrate.migrate(conn)
+        if applied:
+            clear_cache()
+        _schema_ready = True
+    print("✅ DB 초기화 완료!")
 
 # ---------------------------------------------------------
-# 2. 데이터 생성 (INSERT) - 실행 후 clear_cache()
+# 2. 데이터 생성 (INSERT) - 실행 후 invalidate()
 # ---------------------------------------------------------
 
 def add_participant(name: str, birth_date: str, gender: str, 
                    job: str = "", mbti: str = "", phone: str = "", 
                    location: str = "", signup_route: str = "", memo: str = ""):
     """참가자 추가"""
-    conn = get_connection()
-    try:
-        with get_cursor(conn) as cursor:
-            cursor.execute("""
-                INSERT INTO participants 
-                (name, birth_date, gender, job, mbti, phone, location, signup_route, first_visit_date, memo)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (name, birth_date) DO NOTHING
-            """, (name, birth_date, gender, job, mbti, phone, location, signup_route, 
-                  datetime.now().strftime("%Y-%m-%d"), memo))
-            conn.commit()
-            clear_cache()
-            print(f"✅ {name} 추가 완료!")
-            return True
-    except Exception as e:
-        conn.rollback()
-        print(f"❌ 추가 실패: {e}")
-        return False
+    before = cache_version('participants')
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                cursor.execute("""
+                    INSERT INTO participants 
+                    (name, birth_date, gender, job, mbti, phone, location, signup_route, first_visit_date, memo)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (name, birth_date) DO NOTHING
+                    RETURNING name, birth_date, gender, job, mbti, phone, location, signup_route, first_visit_date, memo, nickname
+                """, (name, birth_date, gender, job, mbti, phone, location, signup_route, 
+                      datetime.now().strftime("%Y-%m-%d"), memo))
+                added = cursor.fetchone()
+                conn.commit()
+                invalidate('participants', ('participant', name, birth_date))
+                if added:
+                    _sync_search_index(before, lambda index: index.add(dict(added)))
+                print(f"✅ {name} 추가 완료!")
+                return True
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ 추가 실패: {e}")
+            return False
 
 def create_session(session_date, session_time, theme, host=""):
     """회차 생성"""
-    conn = get_connection()
-    try:
-        with get_cursor(conn) as cursor:
-            cursor.execute("""
-                INSERT INTO sessions (session_date, session_time, theme, host)
-                VALUES (%s, %s, %s, %s)
-                RETURNING session_id
-            """, (session_date, session_time, theme, host))
-            session_id = cursor.fetchone()['session_id']
-            conn.commit()
-            clear_cache()
-            print(f"✅ 회차 생성 완료! ID: {session_id}")
-            return session_id
-    except Exception as e:
-        conn.rollback()
-        raise e
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                cursor.execute("""
+                    INSERT INTO sessions (session_date, session_time, theme, host)
+                    VALUES (%s, %s, %s, %s)
+                    RETURNING session_id
+                """, (session_date, session_time, theme, host))
+                session_id = cursor.fetchone()['session_id']
+                conn.commit()
+                invalidate('sessions', ('session', session_id))
+                print(f"✅ 회차 생성 완료! ID: {session_id}")
+                return session_id
+        except Exception as e:
+            conn.rollback()
+            raise e
 
 def add_attendance(session_id: int, participant_name: str, participant_birth: str):
     """회차에 참가자 추가"""
-    conn = get_connection()
-    try:
-        with get_cursor(conn) as cursor:
-            cursor.execute("""
-                INSERT INTO attendance (session_id, participant_name, participant_birth)
-                VALUES (%s, %s, %s)
-                ON CONFLICT DO NOTHING
-            """, (session_id, participant_name, participant_birth))
-            conn.commit()
-            clear_cache()
-            print(f"✅ 출석 추가 완료: {participant_name}")
-    except Exception as e:
-        conn.rollback()
-        raise e
+    before = cache_version('visits')
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                participant_id = _participant_id(cursor, participant_name, participant_birth)
+                if participant_id is None:
+                    raise ValueError(f"등록되지 않은 참가자입니다: {participant_name} ({participant_birth})")
+                cursor.execute("""
+                    INSERT INTO attendance (session_id, participant_id)
+                    VALUES (%s, %s)
+                    ON CONFLICT (session_id, participant_id) DO NOTHING
+                """, (session_id, participant_id))
+                if cursor.rowcount:
+                    _increment_met_pairs(cursor, [session_id], participant_id)
+                scopes = _roster_scopes(cursor, session_id)
+                conn.commit()
+                invalidate(*scopes)
+                _sync_met_graph(before, lambda graph: graph.attend(session_id, (participant_name, participant_birth)))
+                print(f"✅ 출석 추가 완료: {participant_name}")
+        except Exception as e:
+            conn.rollback()
+            raise e
 
 # ---------------------------------------------------------
 # 3. 데이터 조회 (SELECT) - @st.cache_data 적용
 # ---------------------------------------------------------
 
-# 💡 _cache_version=0 을 파라미터에 추가해서 app.py와의 충돌을 방지합니다.
+# 💡 공개 함수는 cache_version()으로 현재 버전을 구해 내부 _fetch 함수에 넘깁니다.
+#    (st.cache_data는 '_'로 시작하는 인자를 캐시 키에서 빼므로 version 인자는 '_' 없이 둡니다.)
 
-@st.cache_data(ttl=600)
-def get_all_participants(_cache_version=0) -> List[Dict]:
+def get_all_participants() -> List[Dict]:
     """모든 참가자 조회"""
-    conn = get_connection()
-    with get_cursor(conn) as cursor:
-        cursor.execute("""
-            SELECT name, birth_date, gender, job, mbti, phone, location, signup_route, first_visit_date, memo
-            FROM participants ORDER BY name
-        """)
+    return _fetch_all_participants(cache_version('participants'))
+
+@st.cache_data(ttl=600, max_entries=8)
+def _fetch_all_participants(version) -> List[Dict]:
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            cursor.execute("""
+                SELECT name, birth_date, gender, job, mbti, phone, location, signup_route, first_visit_date, memo, nickname
+                FROM participants ORDER BY name
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+
+def get_participant_roster(keys: List[tuple] = None) -> List[Dict]:
+    """참가자 목록 + 화면 표시용 필드 (메모 여부, 방문 횟수, 최근 방문일) 일괄 조회
+
+    keys 를 주면 [(name, birth_date), ...] 에 해당하는 참가자만, 없으면 전체.
+    한 번의 쿼리로 가져오므로 행마다 get_participant_detail 을 부를 필요가 없습니다.
+    """
+    keys = tuple(sorted(set(keys))) if keys is not None else None
+    return _fetch_participant_roster(keys, cache_version('participants', 'visits'))
+
+@st.cache_data(ttl=600, max_entries=64)
+def _fetch_participant_roster(keys, version) -> List[Dict]:
+    if keys is not None and not keys: return []
+
+    params = []
+    target_join = ""
+    if keys is not None:
+        # 대상자만 집계하도록 키 목록을 unnest 로 펼쳐서 조인
+        target_join = """
+            JOIN unnest(%s::text[], %s::text[]) AS k(name, birth_date)
+              ON k.name = p.name AND k.birth_date = p.birth_date
+        """
+        params = [[k[0] for k in keys], [k[1] for k in keys]]
+
+    sql = _ROSTER_SQL.format(target=f"SELECT p.* FROM participants p {target_join}")
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(sql, tuple(params))
         return [dict(row) for row in cursor.fetchall()]
 
-@st.cache_data(ttl=600)
-def get_all_sessions(_cache_version=0) -> List[Dict]:
+# 명단 공통 SELECT ({target}: 대상 참가자를 고르는 SELECT, 방문 집계는 대상자만)
+_ROSTER_SQL = """
+    WITH target AS ({target})
+    SELECT p.name, p.birth_date, p.gender, p.job, p.mbti, p.phone, p.location,
+           p.signup_route, p.first_visit_date, p.memo,
+           COALESCE(TRIM(p.memo), '') <> '' AS has_memo,
+           COALESCE(v.visit_count, 0) AS visit_count,
+           v.last_visit
+    FROM target p
+    LEFT JOIN (
+        SELECT a.participant_id, COUNT(*) AS visit_count, MAX(s.session_date) AS last_visit
+        FROM attendance a
+        JOIN sessions s ON a.session_id = s.session_id
+        WHERE a.participant_id IN (SELECT participant_id FROM target)
+        GROUP BY a.participant_id
+    ) v ON v.participant_id = p.participant_id
+    ORDER BY p.name, p.birth_date
+"""
+
+def get_all_sessions() -> List[Dict]:
     """모든 회차 조회"""
-    conn = get_connection()
-    with get_cursor(conn) as cursor:
-        cursor.execute("""
+    return _fetch_all_sessions(cache_version('sessions'))
+
+@st.cache_data(ttl=600, max_entries=8)
+def _fetch_all_sessions(version) -> List[Dict]:
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            cursor.execute(f"""
+                SELECT session_id, session_date, session_time, theme, host, status
+                FROM sessions ORDER BY {_SESSION_ORDER}
+            """)
+            return [dict(row) for row in cursor.fetchall()]
+
+# ---------------------------------------------------------
+# 3-2. 페이지 조회 (keyset) - 마지막 행 다음부터 LIMIT 만큼
+# ---------------------------------------------------------
+# OFFSET 은 앞 페이지를 모두 읽고 버리지만, keyset 은 정렬 인덱스에서 커서 위치부터 읽으므로
+# 몇 번째 페이지든 (테이블이 커져도) 한 페이지 분량만 읽습니다.
+# 커서는 마지막 행의 정렬 키를 JSON -> base64 로 감싼 문자열 (화면은 그대로 들고 있다가 돌려주기만 함)
+#
+#   참가자: (name, birth_date) 오름차순   - participants_name_birth_key
+#   회차:   (session_date, 시간, session_id) 내림차순 - sessions_keyset_idx (0009)
+
+LIST_PAGE_SIZE = 100
+SESSION_PAGE_SIZE = 30
+
+# 회차 정렬 (시간이 비어 있는 회차도 keyset 비교에서 빠지지 않도록 COALESCE, 같은 시각은 session_id 로)
+_SESSION_ORDER = "session_date DESC, COALESCE(session_time, '') DESC, session_id DESC"
+
+def _encode_cursor(values) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(values), ensure_ascii=False).encode()).decode()
+
+def _decode_cursor(token: str, size: int) -> list:
+    """커서 문자열 -> 정렬 키 (형식이 맞지 않으면 ValueError)"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 페이지 커서: {token!r}") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError(f"잘못된 페이지 커서: {token!r}")
+    return values
+
+def get_participants_page(after: str = None, limit: int = LIST_PAGE_SIZE) -> tuple:
+    """참가자 명단 한 페이지 (이름순) -> (rows, next_cursor)
+
+    rows 는 get_participant_roster 와 같은 필드, after 에는 이전 페이지의 next_cursor 를 넘김
+    next_cursor 가 None 이면 마지막 페이지
+    """
+    key = tuple(_decode_cursor(after, 2)) if after else None
+    return _fetch_participants_page(key, limit, cache_version('participants', 'visits'))
+
+@st.cache_data(ttl=600, max_entries=64)
+def _fetch_participants_page(key, limit: int, version) -> tuple:
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(*_participants_page_query(key, limit))
+        rows = [dict(row) for row in cursor.fetchall()]
+    # 한 행 더 읽어서 다음 페이지가 있는지 판단
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_cursor((rows[-1]['name'], rows[-1]['birth_date']))
+
+def _participants_page_query(key, limit: int) -> tuple:
+    """참가자 keyset 페이지 쿼리 (sql, params) - 다음 페이지 유무를 알 수 있게 한 행 더"""
+    where = "WHERE (p.name, p.birth_date) > (%s, %s)" if key else ""
+    target = f"SELECT p.* FROM participants p {where} ORDER BY p.name, p.birth_date LIMIT %s"
+    return _ROSTER_SQL.format(target=target), (*(key or ()), limit + 1)
+
+def get_sessions_page(after: str = None, limit: int = SESSION_PAGE_SIZE) -> tuple:
+    """회차 목록 한 페이지 (최근 날짜순) -> (rows, next_cursor), 필드는 get_all_sessions 와 같음"""
+    key = tuple(_decode_cursor(after, 3)) if after else None
+    return _fetch_sessions_page(key, limit, cache_version('sessions'))
+
+@st.cache_data(ttl=600, max_entries=64)
+def _fetch_sessions_page(key, limit: int, version) -> tuple:
+    where = "WHERE (session_date, COALESCE(session_time, ''), session_id) < (%s::date, %s, %s)" if key else ""
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(f"""
             SELECT session_id, session_date, session_time, theme, host, status
-            FROM sessions ORDER BY session_date DESC, session_time DESC
-        """)
-        return [dict(row) for row in cursor.fetchall()]
+            FROM sessions {where}
+            ORDER BY {_SESSION_ORDER}
+            LIMIT %s
+        """, (*(key or ()), limit + 1))
+        rows = [dict(row) for row in cursor.fetchall()]
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, _encode_cursor((last['session_date'], last['session_time'] or '', last['session_id']))
 
-@st.cache_data(ttl=600)
-def get_session_participants(session_id: int, _cache_version=0) -> List[Dict]:
+def count_participants() -> int:
+    """전체 참가자 수 (페이지 표시용)"""
+    return _fetch_table_count('participants', cache_version('participants'))
+
+def count_sessions() -> int:
+    """전체 회차 수 (페이지 표시용)"""
+    return _fetch_table_count('sessions', cache_version('sessions'))
+
+@st.cache_data(ttl=600, max_entries=16)
+def _fetch_table_count(table: str, version) -> int:
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(f"SELECT COUNT(*) AS n FROM {table}")
+        return cursor.fetchone()['n']
+
+def get_session_participants(session_id: int) -> List[Dict]:
     """특정 회차의 참가자 목록 (방문 횟수 + 메모 포함)"""
-    conn = get_connection()
-    with get_cursor(conn) as cursor:
-        cursor.execute("""
-            SELECT p.name, p.birth_date, p.gender, p.job, p.mbti, p.phone,
-                   p.location, p.signup_route, p.memo,  -- 🔥 [수정] 메모 컬럼 추가!
-                   a.attendance_id, a.payment_status,
-                   (SELECT COUNT(*) FROM attendance a2 
-                    WHERE a2.participant_name = p.name 
-                    AND a2.participant_birth = p.birth_date) as visit_count
-            FROM attendance a
-            JOIN participants p ON a.participant_name = p.name 
-                                AND a.participant_birth = p.birth_date
-            WHERE a.session_id = %s
-        """, (session_id,))
-        return [dict(row) for row in cursor.fetchall()]
+    return _fetch_session_participants(session_id, cache_version(('session', session_id)))
+
+_SESSION_PARTICIPANTS_SQL = """
+    SELECT p.name, p.birth_date, p.gender, p.job, p.mbti, p.phone,
+           p.location, p.signup_route, p.memo,  -- 🔥 [수정] 메모 컬럼 추가!
+           a.attendance_id, a.payment_status,
+           (SELECT COUNT(*) FROM attendance a2 
+            WHERE a2.participant_id = p.participant_id) as visit_count
+    FROM attendance a
+    JOIN participants p ON a.participant_id = p.participant_id
+    WHERE a.session_id = %s
+"""
+
+@st.cache_data(ttl=600, max_entries=256)
+def _fetch_session_participants(session_id: int, version) -> List[Dict]:
+    with get_connection() as conn:
+        with get_cursor(conn) as cursor:
+            cursor.execute(_SESSION_PARTICIPANTS_SQL, (session_id,))
+            return [dict(row) for row in cursor.fetchall()]
 
 # ---------------------------------------------------------
 # 4. 고급 로직 (Logic) - N+1 문제 해결 및 최적화
 # ---------------------------------------------------------
 
-@st.cache_data(ttl=600)
-def check_duplicate_meetings(session_id: int, _cache_version=0) -> List[Dict]:
-    """중복 만남 확인 (Bulk Fetching 최적화)"""
-    conn = get_connection()
-    current_participants = get_session_participants(session_id) # 여기서는 내부 호출이라 인자 없음
-    
-    if len(current_participants) < 2: return []
+def check_duplicate_meetings(session_id: int) -> List[Dict]:
+    """중복 만남 확인"""
+    return _fetch_duplicate_meetings(session_id, cache_version(('session', session_id)))
 
-    targets = [(p['name'], p['birth_date']) for p in current_participants]
-    
-    with get_cursor(conn) as cursor:
-        conditions = ["(participant_name = %s AND participant_birth = %s)"] * len(targets)
-        where_clause = " OR ".join(conditions)
-        params = [val for t in targets for val in t]
-        params.append(session_id)
-
-        query = f"""
-            SELECT participant_name, participant_birth, s.session_date
-            FROM attendance a
-            JOIN sessions s ON a.session_id = s.session_id
-            WHERE ({where_clause}) AND a.session_id != %s
-        """
-        cursor.execute(query, tuple(params))
-        history = cursor.fetchall()
-
-    history_map = {}
-    for row in history:
-        date = row['session_date']
-        person = (row['participant_name'], row['participant_birth'])
-        if date not in history_map: history_map[date] = []
-        history_map[date].append(person)
-    
-    duplicates = []
-    for date, people in history_map.items():
-        if len(people) < 2: continue
-        for i in range(len(people)):
-            for j in range(i + 1, len(people)):
-                p1, p2 = people[i], people[j]
-                if p1 in targets and p2 in targets:
-                    if p1 > p2: p1, p2 = p2, p1
-                    
-                    found = False
-                    for d in duplicates:
-                        if d['person1'] == p1[0] and d['person2'] == p2[0]:
-                            if date not in d['session_dates']:
-                                d['session_dates'].append(date)
-                            found = True
-                            break
-                    
-                    if not found:
-                        duplicates.append({
-                            'person1': p1[0], 'person1_birth': p1[1],
-                            'person2': p2[0], 'person2_birth': p2[1],
-                            'session_dates': [date]
-                        })
-    
-    for d in duplicates: d['session_dates'].sort()
-    return duplicates
+@st.cache_data(ttl=600, max_entries=256)
+def _fetch_duplicate_meetings(session_id: int, version) -> List[Dict]:
+    """중복 만남 확인 (만남 인덱스 met_pairs 조회)
 
-@st.cache_data(ttl=600)
-def get_participant_detail(name: str, birth_date: str, _cache_version=0) -> Dict:
-    """참가자 상세 정보 (이력 포함)"""
-    conn = get_connection()
-    with get_cursor(conn) as cursor:
-        cursor.execute("SELECT * FROM participants WHERE name = %s AND birth_date = %s", (name, birth_date))
-        row = cursor.fetchone()
-        if not row: return {}
-        participant = dict(row)
-        
+    명단 안의 쌍을 met_pairs 기본 키로 찾아 meet_count > 1 (이번 회차 말고도 함께한 적 있음) 인 쌍만 고르고,
+    그 쌍들에 대해서만 출석/회차를 조인해 함께한 날짜를 모읍니다.
+    비용은 명단 크기의 제곱(쌍 수)과 다시 만난 쌍의 이력에만 비례합니다.
+    """
+    with get_connection() as conn, get_cursor(conn) as cursor:
         cursor.execute("""
-            SELECT s.session_id, s.session_date, s.session_time, s.theme
-            FROM attendance a
-            JOIN sessions s ON a.session_id = s.session_id
-            WHERE a.participant_name = %s AND a.participant_birth = %s
-            ORDER BY s.session_date DESC
-        """, (name, birth_date))
-        participant['visit_history'] = [dict(r) for r in cursor.fetchall()]
-        participant['visit_count'] = len(participant['visit_history'])
-        
-        for visit in participant['visit_history']:
+            WITH roster AS (
+                SELECT participant_id FROM attendance WHERE session_id = %(sid)s
+            ),
+            -- MATERIALIZED: 바깥 조인과 한데 묶으면 조인 순서 탐색(계획 시간)이 실행보다 10배 넘게 걸림
+            repeated AS MATERIALIZED (
+                SELECT m.p1_id, m.p2_id
+                FROM roster r1
+                JOIN roster r2 ON r1.participant_id < r2.participant_id
+                JOIN met_pairs m ON m.p1_id = r1.participant_id AND m.p2_id = r2.participant_id
+                WHERE m.meet_count > 1
+            )
+            SELECT q1.name AS name1, q1.birth_date AS birth1, q2.name AS name2, q2.birth_date AS birth2,
+                   d.session_dates
+            FROM repeated m
+            JOIN participants q1 ON q1.participant_id = m.p1_id
+            JOIN participants q2 ON q2.participant_id = m.p2_id
+            CROSS JOIN LATERAL (
+                SELECT array_agg(s.session_date ORDER BY s.session_date) AS session_dates
+                FROM attendance a1
+                JOIN attendance a2 ON a2.session_id = a1.session_id AND a2.participant_id = m.p2_id
+                JOIN sessions s ON s.session_id = a1.session_id
+                WHERE a1.participant_id = m.p1_id AND a1.session_id <> %(sid)s
+            ) d
+        """, {'sid': session_id})
+        # 화면 표시 순서: (이름, 생년월일) 이 작은 쪽이 person1
+        duplicates = []
+        for row in cursor.fetchall():
+            first, second = sorted([(row['name1'], row['birth1']), (row['name2'], row['birth2'])])
+            duplicates.append({'person1': first[0], 'person1_birth': first[1],
+                               'person2': second[0], 'person2_birth': second[1],
+                               'session_dates': row['session_dates']})
+        duplicates.sort(key=lambda d: (d['person1'], d['person2']))
+        return duplicates
+
+def get_session_rotation(session_id: int, previous: Dict = None, played: int = 0) -> Dict:
+    """회차 로테이션 (라운드별 자리) - 사람은 (이름, 생년월일), 다른 회차에서 만난 쌍은 같은 테이블에 앉히지 않음
+
+    previous 를 주면 played 라운드까지는 그대로 두고 지금 명단으로 남은 라운드만 다시 편성 (누가 빠졌을 때)
+    명단 / 중복 만남은 캐시된 조회를 쓰므로 다시 편성해도 DB 왕복이 거의 없습니다.
+    """
+    participants = get_session_participants(session_id)
+    men = [(p['name'], p['birth_date']) for p in participants if p['gender'] == 'M']
+    women = [(p['name'], p['birth_date']) for p in participants if p['gender'] == 'F']
+    met = [((d['person1'], d['person1_birth']), (d['person2'], d['person2_birth']))
+           for d in check_duplicate_meetings(session_id)]
+    if previous:
+        return rotation.reschedule(previous, played, men, women, met)
+    return rotation.schedule(men, women, met)
+
+def audit_repeat_meetings() -> Dict:
+    """전체 회차 중복 만남 점검 (manage.py audit-meetings / 회차 탭 '전체 중복 점검')
+
+    출석 기록을 회차 시간 순으로 한 번 읽어 meeting_audit 로 점검하고,
+    앞선 회차에서 이미 만난 쌍이 있는 회차만 최근 회차부터 돌려줍니다.
+    반환: {'sessions': [{'session_id', 'session_date', 'session_time', 'theme', 'host', 'size', 'repeat_count',
+                         'pairs': [{'person1', 'person1_birth', 'person2', 'person2_birth', 'previous_dates'}, ...]}, ...],
+           'session_count', 'row_count', 'pair_count', 'repeat_count'}
+    """
+    return _fetch_repeat_meeting_audit(cache_version('sessions', 'visits', 'participants'))
+
+@st.cache_data(ttl=600, max_entries=4)
+def _fetch_repeat_meeting_audit(version) -> Dict:
+    with get_connection() as conn:
+        with conn.cursor() as cursor:  # 튜플 커서 (행마다 dict 를 만들지 않음)
             cursor.execute("""
-                SELECT p.name, p.gender
+                SELECT a.session_id, a.participant_id
                 FROM attendance a
-                JOIN participants p ON a.participant_name = p.name AND a.participant_birth = p.birth_date
-                WHERE a.session_id = %s AND NOT (p.name = %s AND p.birth_date = %s)
-            """, (visit['session_id'], name, birth_date))
-            visit['met_people'] = [dict(r) for r in cursor.fetchall()]
-            
+                JOIN sessions s ON s.session_id = a.session_id
+                ORDER BY s.session_date, COALESCE(s.session_time, ''), a.session_id
+            """)
+            result = meeting_audit.audit(cursor)
+
+        # 보고서에 필요한 회차 / 사람만 조회
+        session_ids, people = set(), set()
+        for flagged in result['sessions']:
+            session_ids.add(flagged['session_id'])
+            for a, b, previous in flagged['pairs']:
+                people.update((a, b))
+                session_ids.update(previous)
+        with get_cursor(conn) as cursor:
+            cursor.execute("""
+                SELECT session_id, session_date, session_time, theme, host FROM sessions
+                WHERE session_id = ANY(%s)
+            """, (list(session_ids),))
+            sessions = {row['session_id']: dict(row) for row in cursor.fetchall()}
+            cursor.execute("SELECT participant_id, name, birth_date FROM participants WHERE participant_id = ANY(%s)",
+                           (list(people),))
+            names = {row['participant_id']: (row['name'], row['birth_date']) for row in cursor.fetchall()}
+
+    report = []
+    for flagged in reversed(result['sessions']):
+        pairs = []
+        for a, b, previous in flagged['pairs']:
+            (name1, birth1), (name2, birth2) = sorted((names[a], names[b]))
+            pairs.append({'person1': name1, 'person1_birth': birth1, 'person2': name2, 'person2_birth': birth2,
+                          'previous_dates': [sessions[sid]['session_date'] for sid in previous]})
+        pairs.sort(key=lambda p: (p['person1'], p['person2']))
+        report.append({**sessions[flagged['session_id']], 'size': flagged['size'],
+                       'repeat_count': len(pairs), 'pairs': pairs})
+    return {'sessions': report, 'session_count': result['session_count'], 'row_count': result['row_count'],
+            'pair_count': result['pair_count'], 'repeat_count': sum(s['repeat_count'] for s in report)}
+
+def get_participant_detail(name: str, birth_date: str) -> Dict:
+    """참가자 상세 정보 (이력 포함)"""
+    return _fetch_participant_detail(name, birth_date, cache_version(('participant', name, birth_date)))
+
+@st.cache_data(ttl=600, max_entries=1024)
+def _fetch_participant_detail(name: str, birth_date: str, version) -> Dict:
+    """참가자 상세 (단일 쿼리: 방문 이력 + 회차별 만난 사람을 JSON으로 집계)"""
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute("""
+            SELECT p.*,
+                   COALESCE((
+                       SELECT json_agg(v ORDER BY v.session_date DESC)
+                       FROM (
+                           SELECT s.session_id, s.session_date, s.session_time, s.theme,
+                                  COALESCE((
+                                      SELECT json_agg(json_build_object('name', mp.name, 'gender', mp.gender))
+                                      FROM attendance ma
+                                      JOIN participants mp ON ma.participant_id = mp.participant_id
+                                      WHERE ma.session_id = s.session_id
+                                        AND ma.participant_id <> p.participant_id
+                                  ), '[]'::json) AS met_people
+                           FROM attendance a
+                           JOIN sessions s ON a.session_id = s.session_id
+                           WHERE a.participant_id = p.participant_id
+                       ) v
+                   ), '[]'::json) AS visit_history
+            FROM participants p
+            WHERE p.name = %s AND p.birth_date = %s
+        """, (name, birth_date))
+        row = cursor.fetchone()
+
+    if not row: return {}
+    participant = dict(row)
+    participant['visit_count'] = len(participant['visit_history'])
     return participant
 
-@st.cache_data(ttl=600)
 def get_recommendations(session_id: int, gender: str, age_min: int = None, age_max: int = None, mbti: str = None) -> List[Dict]:
+    """추천 시스템 (회차 명단 + 참가자 목록 + 방문 기록 버전에 의존 - 후보의 방문 횟수/최근 방문일은 다른 회차 출석으로도 바뀜)"""
+    version = cache_version(('session', session_id), 'participants', 'visits')
+    return _fetch_recommendations(session_id, gender, age_min, age_max, mbti, version)
+
+@st.cache_data(ttl=600, max_entries=256)
+def _fetch_recommendations(session_id: int, gender: str, age_min: int, age_max: int, mbti: str, version) -> List[Dict]:
     """추천 시스템 (SQL 최적화: 단일 쿼리로 N+1 문제 해결)"""
-    conn = get_connection()
+    sql, params = _recommendations_query(session_id, gender, age_min, age_max, mbti)
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(sql, params)
+        recommendations = [dict(row) for row in cursor.fetchall()]
     
+    return recommendations
+
+def _recommendations_query(session_id: int, gender: str, age_min: int, age_max: int, mbti: str) -> tuple:
+    """추천 쿼리 (sql, params) - 목록 / DataFrame 조회가 같이 씀"""
     # 1. 기본 쿼리 틀 (참가자 정보 + 방문 통계)
     # LEFT JOIN을 써서 방문 기록이 없는 사람(0회)도 조회되도록 함
     sql = """
@@ -302,22 +651,22 @@ def get_recommendations(session_id: int, gender: str, age_min: int = None, age_m
             COUNT(a.session_id) as visit_count,
             MAX(s.session_date) as last_visit
         FROM participants p
-        LEFT JOIN attendance a ON p.name = a.participant_name AND p.birth_date = a.participant_birth
+        LEFT JOIN attendance a ON a.participant_id = p.participant_id
         LEFT JOIN sessions s ON a.session_id = s.session_id
         WHERE p.gender = %s
     """
     params = [gender]
 
-    # 2. 동적 필터 조건 추가 (나이, MBTI)
+    # 2. 동적 필터 조건 추가 (나이, MBTI) - birth_year 는 (gender, birth_year) 인덱스 사용
     if age_min or age_max:
         curr_year = datetime.now().year
         if age_min:
             params.append(curr_year - age_min)
-            sql += " AND CAST(SUBSTRING(p.birth_date, 1, 4) AS INTEGER) <= %s"
+            sql += " AND p.birth_year <= %s"
         if age_max:
             params.append(curr_year - age_max)
-            sql += " AND CAST(SUBSTRING(p.birth_date, 1, 4) AS INTEGER) >= %s"
-    
+            sql += " AND p.birth_year >= %s"
+
     if mbti:
         params.append(f"%{mbti}%")
         sql += " AND p.mbti LIKE %s"
@@ -325,41 +674,505 @@ def get_recommendations(session_id: int, gender: str, age_min: int = None, age_m
     # 3. [핵심] 제외 로직 (NOT EXISTS 서브쿼리 활용)
     # (1) 현재 세션에 이미 있는 사람 제외
     # (2) 현재 세션 멤버들과 '과거에 만난 적 있는' 사람 제외
-    
-    # 쿼리에 session_id가 3번 들어갑니다. (현재 멤버 조회용 2번 + 자기 자신 세션 제외용 1번)
+
+    # 쿼리에 session_id가 3번 들어갑니다. (현재 멤버 조회용 1번 + 만남 인덱스 양방향 2번)
     params.extend([session_id, session_id, session_id])
-    
+
     sql += """
         AND NOT EXISTS (
             -- 1. 이미 이번 회차에 등록된 사람 제외
             SELECT 1 FROM attendance curr
             WHERE curr.session_id = %s
-            AND curr.participant_name = p.name 
-            AND curr.participant_birth = p.birth_date
+            AND curr.participant_id = p.participant_id
+        )
+        -- 2. 이번 회차 멤버들과 '만난 적 있는' 사람 제외 (만남 인덱스, 쌍은 p1_id < p2_id 로 저장)
+        AND NOT EXISTS (
+            SELECT 1 FROM met_pairs mp
+            JOIN attendance m ON m.participant_id = mp.p2_id
+            WHERE mp.p1_id = p.participant_id
+              AND m.session_id = %s
         )
         AND NOT EXISTS (
-            -- 2. 이번 회차 멤버들과 '만난 적 있는' 사람 제외 (겹지인 필터링)
-            SELECT 1
-            FROM attendance my_history               -- 후보자의 과거 기록
-            JOIN attendance met_history              -- 같은 회차였던 사람들 기록
-              ON my_history.session_id = met_history.session_id
-            JOIN attendance current_session_members  -- 그 사람이 이번 회차 멤버인지 확인
-              ON met_history.participant_name = current_session_members.participant_name
-              AND met_history.participant_birth = current_session_members.participant_birth
-            WHERE my_history.participant_name = p.name
-              AND my_history.participant_birth = p.birth_date
-              AND current_session_members.session_id = %s  -- 기준: 이번 회차 멤버들
-              AND my_history.session_id != %s              -- (혹시 모를 현재 회차 중복 계산 방지)
+            SELECT 1 FROM met_pairs mp
+            JOIN attendance m ON m.participant_id = mp.p1_id
+            WHERE mp.p2_id = p.participant_id
+              AND m.session_id = %s
         )
-        GROUP BY p.name, p.birth_date, p.gender, p.job, p.mbti, p.phone, p.location, p.signup_route, p.memo
+        GROUP BY p.participant_id
     """
+    return sql, tuple(params)
 
-    # 4. 실행 및 결과 반환
-    with get_cursor(conn) as cursor:
-        cursor.execute(sql, tuple(params))
-        recommendations = [dict(row) for row in cursor.fetchall()]
-        
-    return recommendations
+SEARCH_PAGE_SIZE = 100
+
+def _like_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def search_participants(query: str, limit: int = SEARCH_PAGE_SIZE, offset: int = 0) -> List[Dict]:
+    """참가자 검색 (이름 / 닉네임 / 직업 / 전화번호 부분 일치, 관련도순 + 페이지)
+
+    전화번호는 숫자만 비교하므로 "010-1234" 나 뒷자리 "5678" 로도 찾습니다.
+    각 행에 rank (0 이 가장 관련 높음) 와 total_count (전체 결과 수) 가 붙습니다.
+    검색어가 비어 있으면 전체를 이름순으로 돌려줍니다.
+    초성 ("ㄱㅁㅅ", "김ㅁ") 은 DB 인덱스로 찾을 수 없으므로 메모리 인덱스(quick_search_participants)로 찾습니다.
+    """
+    if has_jamo(query or ""):
+        return quick_search_participants(query, limit, offset)
+    term = " ".join((query or "").lower().split())
+    return _fetch_search_participants(term, limit, offset, cache_version('participants', 'visits'))
+
+@st.cache_data(ttl=600, max_entries=256)
+def _fetch_search_participants(term: str, limit: int, offset: int, version) -> List[Dict]:
+    # 숫자/하이픈/공백만 입력하면 전화번호 검색 (search_text 에는 숫자만 들어 있음)
+    digits = term.replace("-", "").replace(" ", "")
+    needle = digits if digits.isdigit() else term
+    params = {
+        'term': term,
+        'prefix': _like_escape(term) + '%',
+        'contains': '%' + _like_escape(needle) + '%',
+        'digits_prefix': _like_escape(digits) + '%' if digits.isdigit() else None,
+        'digits_suffix': '%' + _like_escape(digits) if digits.isdigit() else None,
+        'limit': limit, 'offset': offset,
+    }
+
+    # 관련도: 이름 일치 > 이름 접두어 > 닉네임 접두어 > 전화번호 앞/뒷자리 > 직업 접두어 > 그 밖의 부분 일치
+    sql = """
+        WITH page AS (
+            SELECT p.participant_id, p.name, p.birth_date, p.gender, p.job, p.mbti, p.phone,
+                   p.location, p.signup_route, p.first_visit_date, p.memo,
+                   CASE
+                       WHEN lower(p.name) = %(term)s THEN 0
+                       WHEN lower(p.name) LIKE %(prefix)s THEN 1
+                       WHEN lower(p.nickname) LIKE %(prefix)s THEN 2
+                       WHEN p.phone_digits LIKE %(digits_prefix)s OR p.phone_digits LIKE %(digits_suffix)s THEN 3
+                       WHEN lower(p.job) LIKE %(prefix)s THEN 4
+                       ELSE 5
+                   END AS rank,
+                   COUNT(*) OVER () AS total_count
+            FROM participants p
+            WHERE p.search_text LIKE %(contains)s
+            ORDER BY rank, p.name, p.birth_date
+            LIMIT %(limit)s OFFSET %(offset)s
+        )
+        SELECT p.name, p.birth_date, p.gender, p.job, p.mbti, p.phone, p.location,
+               p.signup_route, p.first_visit_date, p.memo, p.rank, p.total_count,
+               COALESCE(TRIM(p.memo), '') <> '' AS has_memo,
+               COALESCE(v.visit_count, 0) AS visit_count,
+               v.last_visit
+        FROM page p
+        LEFT JOIN (
+            SELECT a.participant_id, COUNT(*) AS visit_count, MAX(s.session_date) AS last_visit
+            FROM attendance a
+            JOIN sessions s ON a.session_id = s.session_id
+            WHERE a.participant_id IN (SELECT participant_id FROM page)
+            GROUP BY a.participant_id
+        ) v ON v.participant_id = p.participant_id
+        ORDER BY p.rank, p.name, p.birth_date
+    """
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(sql, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+# ---------------------------------------------------------
+# 3-1. 빠른 검색 인덱스 (메모리) - 초성 / 입력 중 글자 / 전화번호 부분
+# ---------------------------------------------------------
+# get_all_participants 로 한 번 만들어 프로세스 전체가 공유합니다.
+# 참가자 추가/삭제/메모 수정은 _sync_search_index 로 그 자리에서 반영하고,
+# 그 밖의 변경(엑셀 임포트 등)으로 'participants' 버전이 바뀌면 다음 검색 때 다시 만듭니다.
+
+@st.cache_resource
+def _search_index_state() -> Dict:
+    return {'lock': threading.Lock(), 'index': None, 'version': None}
+
+def _search_index(state: Dict) -> ParticipantIndex:
+    """최신 인덱스 (state['lock'] 안에서 호출)"""
+    version = cache_version('participants')
+    if state['index'] is None or state['version'] != version:
+        state['index'] = ParticipantIndex(get_all_participants())
+        state['version'] = version
+    return state['index']
+
+def _sync_search_index(before: tuple, apply):
+    """쓰기 직후 인덱스에 증분 반영 (before: 쓰기 전 cache_version('participants'))
+
+    인덱스가 없거나, 만든 뒤 반영되지 않은 다른 변경이 있었으면 건드리지 않음 (다음 검색 때 재구성)
+    """
+    state = _search_index_state()
+    with state['lock']:
+        if state['index'] is not None and state['version'] == before:
+            apply(state['index'])
+            state['version'] = cache_version('participants')
+
+def quick_search_participants(query: str, limit: int = SEARCH_PAGE_SIZE, offset: int = 0) -> List[Dict]:
+    """메모리 인덱스로 참가자 검색 ("ㄱㅁㅅ", "김미", 전화번호 뒷자리 등)
+
+    결과 모양은 search_participants 와 같음 (rank / total_count + 방문 횟수 등 명단 필드)
+    검색어가 비어 있으면 search_participants 로 전체를 이름순으로.
+    """
+    if not (query or "").strip():
+        return search_participants(query, limit, offset)
+
+    state = _search_index_state()
+    with state['lock']:
+        total, hits = _search_index(state).page(query, limit, offset)
+    if not hits:
+        return []
+
+    # 방문 횟수 / 최근 방문일은 이 페이지 사람만 한 번에
+    keys = [(p['name'], p['birth_date']) for p in hits]
+    roster = {(r['name'], r['birth_date']): r for r in get_participant_roster(keys)}
+    return [dict(roster[key], rank=p['rank'], total_count=total)
+            for key, p in zip(keys, hits) if key in roster]
+
+# ---------------------------------------------------------
+# 3-3. 표 조회 (DataFrame) - Streamlit 화면용 열 단위 조회
+# ---------------------------------------------------------
+# 행마다 dict 를 만들고 -> 화면용 dict 를 또 만들고 -> DataFrame 으로 바꾸는 대신,
+# 튜플 커서 결과를 바로 열 단위 DataFrame 으로 만들고 화면용 열은 한 번에 계산합니다.
+#   gender / mbti : category (값 종류가 몇 개뿐이라 문자열 객체를 행마다 들고 있지 않음)
+#   birth_year    : birth_date 앞 4자리
+#   has_memo      : 메모가 공백이 아니면 True
+#   visit_label   : "N회"
+
+def _read_frame(sql: str, params=()) -> pd.DataFrame:
+    """쿼리 결과 -> DataFrame (RealDictCursor 를 거치지 않고 튜플 그대로)"""
+    with get_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(sql, params)
+        columns = [col.name for col in cursor.description]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+
+def participants_frame(rows) -> pd.DataFrame:
+    """참가자 행 (DataFrame 또는 dict 목록, 예: 빠른 검색 결과) -> 화면용 열을 더한 DataFrame"""
+    df = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame.from_records(rows)
+    if df.empty:
+        return df
+    df['gender'] = pd.Categorical(df['gender'], categories=['M', 'F'])
+    if 'mbti' in df:
+        df['mbti'] = df['mbti'].replace('', None).astype('category')
+    df['birth_year'] = df['birth_date'].str.slice(0, 4)
+    if 'has_memo' not in df:
+        df['has_memo'] = df['memo'].fillna('').str.strip().ne('')
+    if 'visit_count' in df:
+        df['visit_count'] = df['visit_count'].astype('int64')
+        df['visit_label'] = df['visit_count'].astype(str) + '회'
+    return df
+
+def get_session_participants_frame(session_id: int) -> pd.DataFrame:
+    """회차 명단 DataFrame (남자 먼저, 이름순)"""
+    return _fetch_session_participants_frame(session_id, cache_version(('session', session_id)))
+
+@st.cache_data(ttl=600, max_entries=256)
+def _fetch_session_participants_frame(session_id: int, version) -> pd.DataFrame:
+    sql = _SESSION_PARTICIPANTS_SQL + " ORDER BY (p.gender <> 'M'), p.name, p.birth_date"
+    return participants_frame(_read_frame(sql, (session_id,)))
+
+def get_participants_page_frame(after: str = None, limit: int = LIST_PAGE_SIZE) -> tuple:
+    """get_participants_page 의 DataFrame 판 -> (DataFrame, next_cursor)"""
+    key = tuple(_decode_cursor(after, 2)) if after else None
+    return _fetch_participants_page_frame(key, limit, cache_version('participants', 'visits'))
+
+@st.cache_data(ttl=600, max_entries=64)
+def _fetch_participants_page_frame(key, limit: int, version) -> tuple:
+    df = _read_frame(*_participants_page_query(key, limit))
+    if len(df) <= limit:
+        return participants_frame(df), None
+    df = df.iloc[:limit].copy()
+    return participants_frame(df), _encode_cursor((df['name'].iat[-1], df['birth_date'].iat[-1]))
+
+def get_recommendations_frame(session_id: int, gender: str, age_min: int = None, age_max: int = None,
+                              mbti: str = None) -> pd.DataFrame:
+    """get_recommendations 의 DataFrame 판"""
+    version = cache_version(('session', session_id), 'participants', 'visits')
+    return _fetch_recommendations_frame(session_id, gender, age_min, age_max, mbti, version)
+
+@st.cache_data(ttl=600, max_entries=256)
+def _fetch_recommendations_frame(session_id: int, gender: str, age_min: int, age_max: int, mbti: str,
+                                 version) -> pd.DataFrame:
+    return participants_frame(_read_frame(*_recommendations_query(session_id, gender, age_min, age_max, mbti)))
+
+RECOMMEND_TOP_K = 50
+
+def get_recommendation_ranking(session_id: int, gender: str, age_min: int = None, age_max: int = None,
+                               mbti: str = None, k: int = RECOMMEND_TOP_K) -> pd.DataFrame:
+    """추천 후보를 이번 회차 명단과의 궁합 점수순으로 상위 k 명 (get_recommendations_frame + 'score' 열, 0~100)
+
+    점수 항목 / 가중치는 recommend_score 참고
+    """
+    version = cache_version(('session', session_id), 'participants', 'visits')
+    return _fetch_recommendation_ranking(session_id, gender, age_min, age_max, mbti, k, version)
+
+@st.cache_data(ttl=600, max_entries=64)
+def _fetch_recommendation_ranking(session_id: int, gender: str, age_min: int, age_max: int, mbti: str,
+                                  k: int, version) -> pd.DataFrame:
+    candidates = get_recommendations_frame(session_id, gender, age_min, age_max, mbti)
+    roster = get_session_participants_frame(session_id)
+    scores = recommend_score.score(candidates, roster, gender)
+    order = recommend_score.top_k(scores, k)
+    return candidates.iloc[order].assign(score=scores[order].round(1)).reset_index(drop=True)
+
+def frame_records(df: pd.DataFrame) -> List[Dict]:
+    """DataFrame -> dict 목록 (NaN -> None, Tk 화면처럼 dict 행을 쓰는 곳용)"""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+# ---------------------------------------------------------
+# 4-1. 만남 인덱스 (met_pairs) - 출석 변경 시 증분 갱신
+# ---------------------------------------------------------
+# 같은 회차에 참석한 두 사람을 (p1_id < p2_id) 한 행으로 저장합니다.
+# 중복 체크/추천 제외가 매번 attendance 를 3중 조인하지 않고 인덱스 조회로 끝납니다.
+
+# 출석 기록에서 쌍을 집계하는 공통 SELECT ({where} 로 범위 제한)
+_PAIR_AGGREGATE_SQL = """
+    SELECT a1.participant_id, a2.participant_id,
+           MIN(s.session_date), MAX(s.session_date), COUNT(DISTINCT s.session_id)
+    FROM attendance a1
+    JOIN attendance a2 ON a2.session_id = a1.session_id AND a1.participant_id < a2.participant_id
+    JOIN sessions s ON s.session_id = a1.session_id
+    WHERE {where}
+    GROUP BY a1.participant_id, a2.participant_id
+"""
+
+_PAIR_PERSON_FILTER = "(a1.participant_id = %(pid)s OR a2.participant_id = %(pid)s)"
+
+def _increment_met_pairs(cursor, session_ids: List[int], participant_id: int = None):
+    """새로 생긴 출석(session_ids 회차, participant_id 가 주어지면 그 사람이 낀 쌍만)을 인덱스에 더함"""
+    where = "a1.session_id = ANY(%(sids)s)"
+    if participant_id is not None:
+        where += " AND " + _PAIR_PERSON_FILTER
+    cursor.execute(f"""
+        INSERT INTO met_pairs (p1_id, p2_id, first_met, last_met, meet_count)
+        {_PAIR_AGGREGATE_SQL.format(where=where)}
+        ON CONFLICT (p1_id, p2_id) DO UPDATE SET
+            first_met = LEAST(met_pairs.first_met, EXCLUDED.first_met),
+            last_met = GREATEST(met_pairs.last_met, EXCLUDED.last_met),
+            meet_count = met_pairs.meet_count + EXCLUDED.meet_count
+    """, {'sids': list(session_ids), 'pid': participant_id})
+
+def _recount_met_pairs(cursor, participant_ids: List[int], participant_id: int = None):
+    """participant_ids 사이의 쌍(participant_id 가 주어지면 그 사람이 낀 쌍만)을 출석 기록에서 다시 계산
+
+    출석이 삭제된 뒤, 삭제 전 명단을 participant_ids 로 넘겨 호출합니다.
+    """
+    if len(participant_ids) < 2: return
+    params = {'ids': list(participant_ids), 'pid': participant_id}
+
+    delete_where = "p1_id = ANY(%(ids)s) AND p2_id = ANY(%(ids)s)"
+    if participant_id is not None:
+        delete_where += " AND (p1_id = %(pid)s OR p2_id = %(pid)s)"
+    cursor.execute(f"DELETE FROM met_pairs WHERE {delete_where}", params)
+
+    where = "a1.participant_id = ANY(%(ids)s) AND a2.participant_id = ANY(%(ids)s)"
+    if participant_id is not None:
+        where += " AND " + _PAIR_PERSON_FILTER
+    cursor.execute(f"""
+        INSERT INTO met_pairs (p1_id, p2_id, first_met, last_met, meet_count)
+        {_PAIR_AGGREGATE_SQL.format(where=where)}
+    """, params)
+
+def _rebuild_met_pairs(cursor) -> int:
+    cursor.execute("TRUNCATE met_pairs")
+    cursor.execute(f"""
+        INSERT INTO met_pairs (p1_id, p2_id, first_met, last_met, meet_count)
+        {_PAIR_AGGREGATE_SQL.format(where="TRUE")}
+    """)
+    return cursor.rowcount
+
+def rebuild_met_pairs() -> int:
+    """만남 인덱스 전체 재구성 (manage.py rebuild-met-pairs)"""
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                count = _rebuild_met_pairs(cursor)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+    clear_cache()
+    print(f"✅ 만남 인덱스 재구성 완료! {count}쌍")
+    return count
+
+def _roster_ids(cursor, session_id: int) -> List[int]:
+    cursor.execute("SELECT participant_id FROM attendance WHERE session_id = %s", (session_id,))
+    return [r['participant_id'] for r in cursor.fetchall()]
+
+# ---------------------------------------------------------
+# 4-2. 회차 편성 (roster_optimizer) - '준비중' 회차 여러 개를 한 번에 채움
+# ---------------------------------------------------------
+# 편성 대상: status '준비중' 이고 오늘 이후인 회차 (지난 회차는 상태와 관계없이 제외)
+# 참가 가능 인원: 최근 PLANNING_POOL_DAYS 일 안에 왔거나 새로 등록한 사람 중
+#                 아직 다가오는 회차에 잡히지 않은 사람
+# 이미 만난 쌍: 편성 대상 회차를 뺀 출석 기록에서 함께 참석한 쌍
+
+PLANNING_STATUS = '준비중'
+PLANNING_POOL_DAYS = 180
+
+_UPCOMING_SQL = f"status = '{PLANNING_STATUS}' AND session_date >= CURRENT_DATE"
+
+def get_planning_sessions() -> List[Dict]:
+    """편성 대상 회차 (날짜순) + 현재 남/여 인원"""
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        cursor.execute(f"""
+            SELECT s.session_id, s.session_date, s.session_time, s.theme, s.host,
+                   COUNT(*) FILTER (WHERE p.gender = 'M') AS men,
+                   COUNT(*) FILTER (WHERE p.gender = 'F') AS women
+            FROM sessions s
+            LEFT JOIN attendance a ON a.session_id = s.session_id
+            LEFT JOIN participants p ON p.participant_id = a.participant_id
+            WHERE {_UPCOMING_SQL}
+            GROUP BY s.session_id
+            ORDER BY s.session_date, COALESCE(s.session_time, ''), s.session_id
+        """)
+        return [dict(row) for row in cursor.fetchall()]
+
+_PLANNING_PERSON_COLUMNS = "p.participant_id, p.name, p.birth_date, p.birth_year, p.gender, p.job, p.mbti"
+
+def _planning_pool(cursor, days: int) -> List[Dict]:
+    cursor.execute(f"""
+        SELECT {_PLANNING_PERSON_COLUMNS}
+        FROM participants p
+        WHERE (p.first_visit_date >= to_char(CURRENT_DATE - %(days)s, 'YYYY-MM-DD')
+               OR EXISTS (SELECT 1 FROM attendance a JOIN sessions s ON s.session_id = a.session_id
+                          WHERE a.participant_id = p.participant_id
+                            AND s.session_date >= CURRENT_DATE - %(days)s AND s.session_date < CURRENT_DATE))
+          AND NOT EXISTS (SELECT 1 FROM attendance a JOIN sessions s ON s.session_id = a.session_id
+                          WHERE a.participant_id = p.participant_id AND {_UPCOMING_SQL})
+        ORDER BY p.participant_id
+    """, {'days': days})
+    return [dict(row) for row in cursor.fetchall()]
+
+def _planning_members(cursor, session_ids: List[int]) -> Dict[int, List[Dict]]:
+    cursor.execute(f"""
+        SELECT a.session_id, {_PLANNING_PERSON_COLUMNS}
+        FROM attendance a
+        JOIN participants p ON p.participant_id = a.participant_id
+        WHERE a.session_id = ANY(%s)
+        ORDER BY a.session_id, p.gender DESC, p.name
+    """, (list(session_ids),))
+    members = {sid: [] for sid in session_ids}
+    for row in cursor.fetchall():
+        row = dict(row)
+        members[row.pop('session_id')].append(row)
+    return members
+
+def _planning_met_pairs(cursor, participant_ids: List[int], session_ids: List[int]) -> List[tuple]:
+    """participant_ids 사이에서 (편성 대상 회차 말고) 함께 참석한 적 있는 쌍"""
+    cursor.execute("""
+        SELECT DISTINCT a1.participant_id AS p1, a2.participant_id AS p2
+        FROM attendance a1
+        JOIN attendance a2 ON a2.session_id = a1.session_id AND a1.participant_id < a2.participant_id
+        WHERE a1.participant_id = ANY(%(ids)s) AND a2.participant_id = ANY(%(ids)s)
+          AND a1.session_id <> ALL(%(sids)s)
+    """, {'ids': list(participant_ids), 'sids': list(session_ids)})
+    return [(row['p1'], row['p2']) for row in cursor.fetchall()]
+
+def plan_session_rosters(session_ids: List[int], per_gender: int = roster_optimizer.PER_GENDER,
+                         pool_days: int = PLANNING_POOL_DAYS,
+                         time_limit: float = roster_optimizer.TIME_LIMIT) -> Dict:
+    """편성 대상 회차들의 빈자리를 참가 가능 인원으로 채운 안 (DB는 바꾸지 않음 - apply_roster_plan 으로 반영)
+
+    반환: {'sessions': [{'session_id', 'members': [...], 'added': [...], 'men', 'women',
+                         'repeat_pairs', 'age_range', 'age_std'}, ...],
+           'unassigned': [...], 'metrics': 전체 지표, 'baseline': 기존 명단만의 지표, 'moves': n}
+    """
+    with get_connection() as conn, get_cursor(conn) as cursor:
+        members = _planning_members(cursor, session_ids)
+        pool = _planning_pool(cursor, pool_days)
+        people = {p['participant_id']: p for p in pool}
+        for rows in members.values():
+            people.update((p['participant_id'], p) for p in rows)
+        met_pairs = _planning_met_pairs(cursor, list(people), session_ids)
+
+    plan = roster_optimizer.plan_rosters(
+        pool, [{'session_id': sid, 'members': members[sid]} for sid in session_ids], met_pairs,
+        per_gender=per_gender, time_limit=time_limit)
+    everyone = list(people.values())
+    metrics = roster_optimizer.evaluate(plan['rosters'], everyone, met_pairs, per_gender)
+    baseline = roster_optimizer.evaluate(
+        {sid: [p['participant_id'] for p in rows] for sid, rows in members.items()}, everyone, met_pairs, per_gender)
+    sessions = []
+    for sid in session_ids:
+        added = set(plan['added'][sid])
+        sessions.append({'session_id': sid,
+                         'members': [people[i] for i in plan['rosters'][sid]],
+                         'added': [people[i] for i in plan['rosters'][sid] if i in added],
+                         **metrics['sessions'][sid]})
+    return {'sessions': sessions, 'unassigned': [people[i] for i in plan['unassigned']],
+            'metrics': metrics, 'baseline': baseline, 'moves': plan['moves']}
+
+def apply_roster_plan(plan: Dict) -> int:
+    """plan_session_rosters 결과의 새 배정을 출석으로 한 번에 추가, 추가한 수 반환"""
+    rows = [(s['session_id'], p['participant_id']) for s in plan['sessions'] for p in s['added']]
+    if not rows:
+        return 0
+    session_ids = [s['session_id'] for s in plan['sessions']]
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                execute_values(cursor, """
+                    INSERT INTO attendance (session_id, participant_id) VALUES %s
+                    ON CONFLICT (session_id, participant_id) DO NOTHING
+                """, rows)
+                # 새로 생긴 쌍끼리도 서로 만나므로 회차별 증분 대신 편성된 명단 전체의 쌍을 다시 계산
+                _recount_met_pairs(cursor, _roster_ids_of(cursor, session_ids))
+                scopes = set()
+                for session_id in session_ids:
+                    scopes |= _roster_scopes(cursor, session_id)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+    invalidate(*scopes)
+    print(f"✅ 회차 편성 반영 완료! {len(session_ids)}회차 {len(rows)}명")
+    return len(rows)
+
+# ---------------------------------------------------------
+# 4-3. 만남 그래프 (메모리) - 참가자 추가 중 '이미 만난 사람' 바로 확인
+# ---------------------------------------------------------
+# attendance 전체로 한 번 만들어 프로세스 전체가 공유합니다 (사람 키: (이름, 생년월일)).
+# 출석 추가/제거, 회차/참가자 삭제는 _sync_met_graph 로 그 자리에서 반영하고,
+# 그 밖의 변경(회차 편성 반영, 엑셀 임포트 등)으로 'visits' 버전이 바뀌면 다음 조회 때 다시 만듭니다.
+
+@st.cache_resource
+def _met_graph_state() -> Dict:
+    return {'lock': threading.Lock(), 'graph': None, 'version': None}
+
+def _met_graph(state: Dict) -> met_graph.MetGraph:
+    """최신 그래프 (state['lock'] 안에서 호출)"""
+    version = cache_version('visits')
+    if state['graph'] is None or state['version'] != version:
+        with get_connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                SELECT a.session_id, p.name, p.birth_date
+                FROM attendance a
+                JOIN participants p ON p.participant_id = a.participant_id
+            """)
+            state['graph'] = met_graph.MetGraph((sid, (name, birth)) for sid, name, birth in cursor)
+        state['version'] = version
+    return state['graph']
+
+def _sync_met_graph(before: tuple, apply):
+    """쓰기 직후 그래프에 증분 반영 (before: 쓰기 전 cache_version('visits'))
+
+    그래프가 없거나, 만든 뒤 반영되지 않은 다른 변경이 있었으면 건드리지 않음 (다음 조회 때 재구성)
+    """
+    state = _met_graph_state()
+    with state['lock']:
+        if state['graph'] is not None and state['version'] == before:
+            apply(state['graph'])
+            state['version'] = cache_version('visits')
+
+def met_in_session(session_id: int, name: str, birth_date: str) -> List[Dict]:
+    """회차 명단 중 이 사람이 이미 만난 사람 [{'name', 'birth_date'}, ...] (DB 조회 없이 메모리 그래프로)"""
+    state = _met_graph_state()
+    with state['lock']:
+        graph = _met_graph(state)
+        met = graph.met_among((name, birth_date), graph.roster(session_id))
+    return [{'name': n, 'birth_date': b} for n, b in sorted(met)]
+
+def clean_candidates(session_id: int, people: List[tuple]) -> List[tuple]:
+    """people [(이름, 생년월일), ...] 중 회차 명단의 누구와도 만난 적 없는 사람 (순서 유지)"""
+    state = _met_graph_state()
+    with state['lock']:
+        graph = _met_graph(state)
+        return graph.clean(people, graph.roster(session_id))
 
 # ---------------------------------------------------------
 # 5. 수정/삭제/엑셀 (Utility)
@@ -367,151 +1180,568 @@ def get_recommendations(session_id: int, gender: str, age_min: int = None, age_m
 
 def update_participant_memo(name: str, birth_date: str, memo: str):
     """메모 수정"""
-    conn = get_connection()
-    try:
-        with get_cursor(conn) as cursor:
-            cursor.execute("UPDATE participants SET memo = %s WHERE name = %s AND birth_date = %s", (memo, name, birth_date))
-            conn.commit()
-            clear_cache()
-    except Exception as e:
-        conn.rollback()
-        st.error(f"메모 수정 실패: {e}")
+    before = cache_version('participants')
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                cursor.execute("UPDATE participants SET memo = %s WHERE name = %s AND birth_date = %s", (memo, name, birth_date))
+                scopes = _participant_scopes(cursor, name, birth_date)
+                conn.commit()
+                invalidate('participants', *scopes)
+                _sync_search_index(before, lambda index: index.update(name, birth_date, memo=memo))
+        except Exception as e:
+            conn.rollback()
+            st.error(f"메모 수정 실패: {e}")
 
 def delete_session(session_id: int):
     """회차 삭제 (관련 기록 전체 삭제)"""
-    conn = get_connection()
-    try:
-        with get_cursor(conn) as cursor:
-            cursor.execute("SELECT DISTINCT participant_name, participant_birth FROM attendance WHERE session_id = %s", (session_id,))
-            participants_in_session = cursor.fetchall()
+    before = cache_version('participants')
+    before_visits = cache_version('visits')
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                scopes = _roster_scopes(cursor, session_id)
+                roster = _roster_ids(cursor, session_id)
             
-            cursor.execute("DELETE FROM attendance WHERE session_id = %s", (session_id,))
-            cursor.execute("DELETE FROM sessions WHERE session_id = %s", (session_id,))
+                cursor.execute("DELETE FROM attendance WHERE session_id = %s", (session_id,))
+                cursor.execute("DELETE FROM sessions WHERE session_id = %s", (session_id,))
+                _recount_met_pairs(cursor, roster)
             
-            # 고아 참가자 삭제
-            for p in participants_in_session:
-                cursor.execute("SELECT 1 FROM attendance WHERE participant_name = %s AND participant_birth = %s LIMIT 1", 
-                               (p['participant_name'], p['participant_birth']))
-                if not cursor.fetchone():
-                    cursor.execute("DELETE FROM participants WHERE name = %s AND birth_date = %s", 
-                                   (p['participant_name'], p['participant_birth']))
+                # 고아 참가자 삭제
+                cursor.execute("""
+                    DELETE FROM participants p
+                    WHERE p.participant_id = ANY(%s)
+                      AND NOT EXISTS (SELECT 1 FROM attendance a WHERE a.participant_id = p.participant_id)
+                    RETURNING p.name, p.birth_date
+                """, (roster,))
+                orphans = [(r['name'], r['birth_date']) for r in cursor.fetchall()]
             
-            conn.commit()
-            clear_cache()
-            print(f"✅ {session_id}회차 삭제 완료!")
-    except Exception as e:
-        conn.rollback()
-        raise e
+                conn.commit()
+                invalidate('sessions', 'participants', *scopes)
+                _sync_search_index(before, lambda index: [index.remove(*key) for key in orphans])
+                _sync_met_graph(before_visits, lambda graph: graph.drop_session(session_id))
+                print(f"✅ {session_id}회차 삭제 완료!")
+        except Exception as e:
+            conn.rollback()
+            raise e
 
 def remove_participant_from_session(session_id: int, participant_name: str, participant_birth: str):
     """특정 회차에서 참가자 제거 + 방문 이력 없으면 DB에서 완전 삭제 (고아 제거)"""
-    conn = get_connection()
-    try:
-        with get_cursor(conn) as cursor:
-            # 1. 이번 회차 출석 기록 삭제
-            cursor.execute("""
-                DELETE FROM attendance 
-                WHERE session_id = %s AND participant_name = %s AND participant_birth = %s
-            """, (session_id, participant_name, participant_birth))
+    before = cache_version('participants')
+    before_visits = cache_version('visits')
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                # 삭제 전 명단 기준으로 무효화 범위 / 만남 인덱스 갱신 대상 계산
+                participant_id = _participant_id(cursor, participant_name, participant_birth)
+                if participant_id is None: return
+                scopes = _roster_scopes(cursor, session_id)
+                roster = _roster_ids(cursor, session_id)
+
+                # 1. 이번 회차 출석 기록 삭제
+                cursor.execute("""
+                    DELETE FROM attendance 
+                    WHERE session_id = %s AND participant_id = %s
+                """, (session_id, participant_id))
+                _recount_met_pairs(cursor, roster, participant_id)
             
-            # 2. [핵심] 남은 방문 이력이 있는지 확인
-            cursor.execute("""
-                SELECT 1 FROM attendance 
-                WHERE participant_name = %s AND participant_birth = %s 
-                LIMIT 1
-            """, (participant_name, participant_birth))
+                # 2. [핵심] 남은 방문 이력이 있는지 확인
+                cursor.execute("SELECT 1 FROM attendance WHERE participant_id = %s LIMIT 1", (participant_id,))
             
-            # 3. 이력이 하나도 없으면 -> 참가자 DB에서도 완전 삭제
-            if not cursor.fetchone():
-                cursor.execute("""
-                    DELETE FROM participants 
-                    WHERE name = %s AND birth_date = %s
-                """, (participant_name, participant_birth))
-                print(f"🧹 {participant_name}님 방문 기록 0회 -> DB에서 자동 삭제됨")
+                # 3. 이력이 하나도 없으면 -> 참가자 DB에서도 완전 삭제
+                if not cursor.fetchone():
+                    cursor.execute("DELETE FROM participants WHERE participant_id = %s", (participant_id,))
+                    print(f"🧹 {participant_name}님 방문 기록 0회 -> DB에서 자동 삭제됨")
+                    scopes.add('participants')
 
-            conn.commit()
-            clear_cache()
-            print(f"✅ {participant_name} 제거 완료!")
-    except Exception as e:
-        conn.rollback()
-        raise e
+                conn.commit()
+                invalidate(*scopes)
+                if 'participants' in scopes:
+                    _sync_search_index(before, lambda index: index.remove(participant_name, participant_birth))
+                _sync_met_graph(before_visits, lambda graph: graph.leave(session_id, (participant_name, participant_birth)))
+                print(f"✅ {participant_name} 제거 완료!")
+        except Exception as e:
+            conn.rollback()
+            raise e
 
 def delete_participant(participant_name: str, participant_birth: str):
     """참가자 완전 삭제"""
-    conn = get_connection()
+    before = cache_version('participants')
+    before_visits = cache_version('visits')
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                participant_id = _participant_id(cursor, participant_name, participant_birth)
+                if participant_id is None: return
+
+                # 만났던 사람들의 상세(만난 사람 목록)도 바뀜
+                cursor.execute("""
+                    SELECT DISTINCT p.name, p.birth_date
+                    FROM attendance a
+                    JOIN attendance m ON m.session_id = a.session_id
+                    JOIN participants p ON p.participant_id = m.participant_id
+                    WHERE a.participant_id = %s
+                """, (participant_id,))
+                scopes = {('participant', r['name'], r['birth_date']) for r in cursor.fetchall()}
+                scopes |= _participant_scopes(cursor, participant_name, participant_birth)
+
+                cursor.execute("DELETE FROM attendance WHERE participant_id = %s", (participant_id,))
+                cursor.execute("DELETE FROM met_pairs WHERE p1_id = %(pid)s OR p2_id = %(pid)s", {'pid': participant_id})
+                cursor.execute("DELETE FROM participants WHERE participant_id = %s", (participant_id,))
+                conn.commit()
+                # 출석 기록도 함께 지워지므로 방문 횟수 / 회차 목록(참석 인원)도 무효화
+                invalidate('participants', 'visits', 'sessions', *scopes)
+                _sync_search_index(before, lambda index: index.remove(participant_name, participant_birth))
+                _sync_met_graph(before_visits, lambda graph: graph.drop_person((participant_name, participant_birth)))
+                print(f"✅ {participant_name} 삭제 완료!")
+        except Exception as e:
+            conn.rollback()
+            raise e
+
+# 한 번에 스테이징 테이블로 보내는 참가자 행 수 (이만큼 모이면 COPY + upsert)
+IMPORT_BATCH_ROWS = 5000
+# 이 시트 수마다 커밋 + 체크포인트 (실패해도 앞 청크는 남고 다음 실행에서 이어서 함)
+IMPORT_CHUNK_SHEETS = 25
+# 진행 중인 임포트가 잡고 있는 advisory lock 첫 번째 키 (두 번째 키는 run_id, 파일 확인 중에는 파일 해시)
+IMPORT_LOCK_KEY = 7301
+
+class ImportFailed(Exception):
+    """임포트 중간 실패 - 앞 청크는 커밋되어 남아 있음 (같은 파일을 다시 임포트하면 이어서 함)"""
+
+    def __init__(self, error: Exception, sheets_done: int, last_sheet: str = None):
+        self.error = error
+        self.sheets_done = sheets_done  # 커밋된 시트 수
+        self.last_sheet = last_sheet    # 마지막으로 커밋된 시트 이름 (없으면 None)
+        done = f"'{last_sheet}' 시트까지 {sheets_done}개 반영됨" if last_sheet else "반영된 시트 없음"
+        super().__init__(f"{error}\n({done} - 같은 파일을 다시 임포트하면 이어서 합니다)")
+
+def _create_import_staging(cursor):
+    """임포트용 임시 테이블 (트랜잭션이 끝나면 사라짐)"""
+    cursor.execute("""
+        CREATE TEMP TABLE import_people (
+            seq INTEGER NOT NULL, session_id INTEGER NOT NULL, session_date DATE NOT NULL,
+            name TEXT NOT NULL, birth_date TEXT NOT NULL, gender TEXT NOT NULL,
+            nickname TEXT, phone TEXT, location TEXT, job TEXT, mbti TEXT,
+            intro TEXT, signup_route TEXT
+        ) ON COMMIT DROP
+    """)
+
+def _copy_rows(cursor, table: str, columns: tuple, rows, force_not_null: tuple = ()):
+    """rows 를 CSV 로 만들어 COPY ... FROM STDIN 으로 한 번에 적재
+
+    CSV COPY 는 빈 칸을 NULL 로 읽으므로, 빈 문자열 그대로 저장해야 하는 열은 force_not_null 로 넘깁니다.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    options = "FORMAT csv"
+    if force_not_null:
+        options += f", FORCE_NOT_NULL ({', '.join(force_not_null)})"
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH ({options})", buffer)
+
+def _ledger_key(sheet: Dict) -> str:
+    """장부 키: 시트 이름 + 회차 머리글 (날짜 / 시간 / 진행자)
+
+    시트 이름은 날짜(YYYYMMDD)뿐이라 다른 파일의 같은 날짜 시트와 겹치므로, 머리글까지 같아야 같은 회차로 봅니다.
+    (테마 / 참가자가 바뀐 시트는 같은 회차의 수정본 -> 'sync', 날짜 / 시간 / 진행자가 다르면 다른 회차 -> 'new')
+    """
+    return "|".join((sheet['sheet'], str(sheet['session_date']), sheet['session_time'] or "", sheet['host'] or ""))
+
+def _load_import_ledger(cursor) -> Dict:
+    """{장부 키: 장부 행} + 장부에 없는 기존 회차 {(날짜, 시간, 테마, 진행자): [session_id, ...]}
+
+    장부가 생기기 전에 임포트된 회차는 같은 내용의 시트가 들어오면 새로 만들지 않고 이어받습니다.
+    """
+    cursor.execute("SELECT sheet_key, session_id, content_hash FROM import_ledger")
+    ledger = {row['sheet_key']: dict(row) for row in cursor.fetchall()}
+    cursor.execute("""
+        SELECT s.session_id, s.session_date, s.session_time, s.theme, s.host
+        FROM sessions s
+        WHERE NOT EXISTS (SELECT 1 FROM import_ledger l WHERE l.session_id = s.session_id)
+        ORDER BY s.session_id
+    """)
+    unledgered = {}
+    for row in cursor.fetchall():
+        key = (row['session_date'], row['session_time'], row['theme'], row['host'])
+        unledgered.setdefault(key, []).append(row['session_id'])
+    return {'sheets': ledger, 'unledgered': unledgered}
+
+def _plan_import_sheet(state: Dict, sheet: Dict) -> str:
+    """시트 처리 방법 결정: 'skip' (내용 그대로) / 'sync' (기존 회차와 차이만 반영) / 'new'
+
+    'sync' 면 sheet['session_id'] 에 대상 회차를 채웁니다.
+    """
+    entry = state['sheets'].get(_ledger_key(sheet))
+    if entry:
+        if entry['content_hash'] == sheet['content_hash']:
+            return 'skip'  # 앱에서 지운 회차(session_id NULL)도 내용이 그대로면 되살리지 않음
+        if entry['session_id'] is not None:
+            sheet['session_id'] = entry['session_id']
+            return 'sync'
+        return 'new'
+
+    key = (sheet['session_date'], sheet['session_time'], sheet['theme'], sheet['host'])
+    candidates = state['unledgered'].get(key)
+    if candidates:
+        sheet['session_id'] = candidates.pop(0)
+        return 'sync'
+    return 'new'
+
+def _load_import_batch(cursor, sheets: List[Dict]) -> Dict:
+    """파싱된 시트 묶음을 적재 ('new' 는 회차 생성, 'sync' 는 기존 회차와 차이만 반영)
+
+    회차는 시퀀스에서 id 를 먼저 받아 multi-row INSERT, 참가자/출석은 COPY 로 스테이징한 뒤
+    집합 연산으로 upsert / 삭제합니다. 행 수와 상관없이 왕복 횟수는 일정합니다.
+    반환: {'new': [새 session_id], 'affected': {만남 인덱스를 다시 계산할 participant_id},
+           'removed': [출석이 빠진 participant_id]}
+    """
+    new_sheets = [s for s in sheets if s.get('session_id') is None]
+    synced_ids = [s['session_id'] for s in sheets if s.get('session_id') is not None]
+    affected = set()
+
+    if new_sheets:
+        cursor.execute("""
+            SELECT nextval(pg_get_serial_sequence('sessions', 'session_id')) AS session_id
+            FROM generate_series(1, %s)
+        """, (len(new_sheets),))
+        for sheet, row in zip(new_sheets, cursor.fetchall()):
+            sheet['session_id'] = row['session_id']
+        execute_values(cursor, """
+            INSERT INTO sessions (session_id, session_date, session_time, theme, host) VALUES %s
+        """, [(s['session_id'], s['session_date'], s['session_time'], s['theme'], s['host']) for s in new_sheets])
+
+    if synced_ids:
+        execute_values(cursor, """
+            UPDATE sessions s
+            SET session_date = v.session_date::date, session_time = v.session_time, theme = v.theme, host = v.host
+            FROM (VALUES %s) AS v(session_id, session_date, session_time, theme, host)
+            WHERE s.session_id = v.session_id
+        """, [(s['session_id'], s['session_date'], s['session_time'], s['theme'], s['host'])
+              for s in sheets if s['session_id'] in synced_ids])
+        affected.update(_roster_ids_of(cursor, synced_ids))
+
+    cursor.execute("TRUNCATE import_people")
+    rows, seq = [], 0
+    for sheet in sheets:
+        for person in sheet['people']:
+            rows.append((seq, sheet['session_id'], sheet['session_date']) + person)
+            seq += 1
+    # 선택 항목은 행 단위 INSERT 로 넣던 때처럼 빈 문자열로 (NULL 이 아니라)
+    _copy_rows(cursor, "import_people", ('seq', 'session_id', 'session_date') + excel_import.PERSON_FIELDS, rows,
+               force_not_null=excel_import.PERSON_FIELDS[3:])
+
+    # 처음 나온 행 기준으로 새 참가자만 추가 (기존 참가자는 그대로)
+    cursor.execute("""
+        INSERT INTO participants (name, birth_date, gender, nickname, phone, location, job, mbti, intro,
+                                  signup_route, first_visit_date)
+        SELECT DISTINCT ON (name, birth_date)
+               name, birth_date, gender, nickname, phone, location, job, mbti, intro,
+               signup_route, to_char(session_date, 'YYYY-MM-DD')
+        FROM import_people
+        ORDER BY name, birth_date, seq
+        ON CONFLICT (name, birth_date) DO NOTHING
+    """)
+
+    removed = []
+    if synced_ids:
+        # 시트에서 빠진 사람의 출석 삭제
+        cursor.execute("""
+            DELETE FROM attendance a
+            WHERE a.session_id = ANY(%s)
+              AND NOT EXISTS (
+                  SELECT 1 FROM import_people i
+                  JOIN participants p ON p.name = i.name AND p.birth_date = i.birth_date
+                  WHERE i.session_id = a.session_id AND p.participant_id = a.participant_id
+              )
+            RETURNING a.participant_id
+        """, (synced_ids,))
+        removed = [row['participant_id'] for row in cursor.fetchall()]
+
+    cursor.execute("""
+        INSERT INTO attendance (session_id, participant_id)
+        SELECT i.session_id, p.participant_id
+        FROM import_people i
+        JOIN participants p ON p.name = i.name AND p.birth_date = i.birth_date
+        ORDER BY i.session_id, p.participant_id
+        ON CONFLICT DO NOTHING
+    """)
+    if synced_ids:
+        affected.update(_roster_ids_of(cursor, synced_ids))
+
+    execute_values(cursor, """
+        INSERT INTO import_ledger (sheet_key, session_id, content_hash, session_date, session_time, theme, host, row_count)
+        VALUES %s
+        ON CONFLICT (sheet_key) DO UPDATE SET
+            session_id = EXCLUDED.session_id, content_hash = EXCLUDED.content_hash,
+            session_date = EXCLUDED.session_date, session_time = EXCLUDED.session_time,
+            theme = EXCLUDED.theme, host = EXCLUDED.host, row_count = EXCLUDED.row_count,
+            imported_at = now()
+    """, [(_ledger_key(s), s['session_id'], s['content_hash'], s['session_date'], s['session_time'],
+           s['theme'], s['host'], len(s['people'])) for s in sheets])
+
+    return {'new': [s['session_id'] for s in new_sheets], 'affected': affected, 'removed': removed}
+
+def _roster_ids_of(cursor, session_ids: List[int]) -> List[int]:
+    cursor.execute("SELECT DISTINCT participant_id FROM attendance WHERE session_id = ANY(%s)", (list(session_ids),))
+    return [r['participant_id'] for r in cursor.fetchall()]
+
+def _row_batches(sheets: List[Dict]):
+    """시트들을 참가자 행이 IMPORT_BATCH_ROWS 정도씩 되도록 묶음"""
+    batch, rows = [], 0
+    for sheet in sheets:
+        batch.append(sheet)
+        rows += len(sheet['people'])
+        if rows >= IMPORT_BATCH_ROWS:
+            yield batch
+            batch, rows = [], 0
+    if batch:
+        yield batch
+
+def _start_import_run(cursor, file_path, file_digest: str, resume: bool) -> Dict:
+    """체크포인트 행 시작 (같은 파일의 끝나지 않은 임포트가 있으면 그 행을 이어받음)
+
+    진행 중인 임포트는 자기 run_id 로 세션 advisory lock 을 잡고 있습니다 (끝나거나 프로세스가 죽으면 풀림).
+    잠금을 잡을 수 있는 행은 실패했거나 중단된 임포트라 이어받고, 못 잡는 행이 있으면 같은 파일을
+    지금 다른 곳에서 임포트하는 중이므로 오류를 냅니다. 반환한 행의 잠금은 호출한 쪽이 풉니다.
+    """
+    # 같은 파일을 동시에 시작해도 한쪽씩 확인하도록 (트랜잭션 잠금, 시작 커밋 때 풀림)
+    cursor.execute("SELECT pg_advisory_xact_lock(%s, hashtext(%s))", (IMPORT_LOCK_KEY, file_digest))
+    cursor.execute("""
+        SELECT run_id, sheets_done, last_sheet, pending_orphans FROM import_runs
+        WHERE file_hash = %s AND status <> 'done'
+        ORDER BY run_id DESC
+    """, (file_digest,))
+    resumed = None
+    for row in cursor.fetchall():
+        cursor.execute("SELECT pg_try_advisory_lock(%s, %s) AS locked", (IMPORT_LOCK_KEY, row['run_id']))
+        if not cursor.fetchone()['locked']:
+            if resumed:
+                _unlock_import_run(cursor, resumed['run_id'])
+            raise RuntimeError("같은 파일을 다른 곳에서 임포트하는 중입니다. 끝난 뒤 다시 시도해주세요.")
+        if resume and resumed is None:
+            resumed = dict(row)
+        else:
+            _unlock_import_run(cursor, row['run_id'])
+
+    if resumed:
+        cursor.execute("""
+            UPDATE import_runs SET status = 'running', error = NULL, updated_at = now() WHERE run_id = %s
+        """, (resumed['run_id'],))
+        print(f"↪️ 중단된 임포트를 {resumed['sheets_done'] + 1}번째 시트부터 이어서 합니다.")
+        return resumed
+    cursor.execute("""
+        INSERT INTO import_runs (file_name, file_hash) VALUES (%s, %s)
+        RETURNING run_id, sheets_done, last_sheet, pending_orphans
+    """, (os.path.basename(file_path), file_digest))
+    run = dict(cursor.fetchone())
+    cursor.execute("SELECT pg_advisory_lock(%s, %s)", (IMPORT_LOCK_KEY, run['run_id']))
+    return run
+
+def _unlock_import_run(cursor, run_id: int):
+    cursor.execute("SELECT pg_advisory_unlock(%s, %s)", (IMPORT_LOCK_KEY, run_id))
+
+def _commit_import_chunk(conn, cursor, run: Dict, sheets: List[Dict], last: Dict):
+    """청크 하나 적재 + 만남 인덱스 갱신 + 체크포인트 기록을 한 트랜잭션으로 커밋"""
+    new_sessions, affected, removed = [], set(), set()
+    if sheets:
+        _create_import_staging(cursor)
+        for batch in _row_batches(sheets):
+            result = _load_import_batch(cursor, batch)
+            new_sessions.extend(result['new'])
+            affected.update(result['affected'])
+            removed.update(result['removed'])
+        # 새 회차는 쌍을 더하고, 명단이 바뀐 회차의 사람들 사이 쌍은 출석 기록으로 다시 계산
+        # (재계산이 새 회차 몫까지 정확히 세므로 반드시 증분 다음에)
+        _increment_met_pairs(cursor, new_sessions)
+        _recount_met_pairs(cursor, sorted(affected))
+
+    run['pending_orphans'] = sorted(set(run['pending_orphans']) | removed)
+    run['sheets_done'] = last['index'] + 1
+    run['last_sheet'] = last['sheet']
+    cursor.execute("""
+        UPDATE import_runs
+        SET sheets_done = %s, sheets_total = %s, last_sheet = %s, pending_orphans = %s, updated_at = now()
+        WHERE run_id = %s
+    """, (run['sheets_done'], last['total'], last['sheet'], run['pending_orphans'], run['run_id']))
+    conn.commit()
+
+def import_excel_file(file_path, workers: int = None, chunk_sheets: int = None,
+                      progress=None, resume: bool = True) -> Dict:
+    """엑셀 파일 임포트 (read_only 스트리밍 파싱 + 배치 COPY 적재)
+
+    - 시트 파싱은 workers 개 프로세스로 나눠 하고 (기본: CPU 수, 최대 8), DB 쓰기는 이 프로세스 하나가 합니다.
+    - chunk_sheets 시트마다 커밋하고 import_runs 에 체크포인트를 남깁니다. 실패하거나 중단된 뒤
+      같은 파일을 다시 임포트하면 (resume=True) 마지막으로 커밋된 시트 다음부터 이어서 합니다.
+    - 같은 파일을 다시 임포트해도 안전합니다 (import_ledger): 내용이 같은 시트는 건너뛰고,
+      바뀐 시트는 기존 회차와 차이만 반영하고, 새 시트만 회차를 만듭니다.
+    - progress 콜백은 시트마다 진행률 이벤트(dict)를 받습니다 (excel_import.ImportProgress 참고).
+    - 중간에 실패하면 ImportFailed (원인 + 마지막으로 커밋된 시트), 같은 파일을 다른 곳에서
+      임포트하는 중이면 RuntimeError 를 냅니다.
+
+    반환: {'new', 'synced', 'skipped', 'people', 'resumed_from'}
+    """
+    chunk_sheets = chunk_sheets or IMPORT_CHUNK_SHEETS
+    file_digest = excel_import.file_hash(file_path)
+    run, tracker, changed = None, excel_import.ImportProgress(progress), False
+    with get_connection() as conn:
+        try:
+            with get_cursor(conn) as cursor:
+                run = _start_import_run(cursor, file_path, file_digest, resume)
+                state = _load_import_ledger(cursor)
+                conn.commit()
+                tracker = excel_import.ImportProgress(progress, start=run['sheets_done'])
+
+                chunk, chunk_size, last = [], 0, None
+                for sheet in excel_import.iter_workbook(file_path, workers, start=run['sheets_done']):
+                    action = _plan_import_sheet(state, sheet)
+                    tracker.sheet(sheet, action)
+                    if action != 'skip':
+                        print(f" -> {sheet['session_date']}: {len(sheet['people'])}명 ({'변경' if action == 'sync' else '새 회차'})")
+                        chunk.append(sheet)
+                    chunk_size, last = chunk_size + 1, sheet
+                    if chunk_size >= chunk_sheets:
+                        _commit_import_chunk(conn, cursor, run, chunk, last)
+                        changed = changed or bool(chunk)
+                        tracker.committed(run['sheets_done'])
+                        chunk, chunk_size = [], 0
+                if chunk_size:
+                    _commit_import_chunk(conn, cursor, run, chunk, last)
+                    changed = changed or bool(chunk)
+                    tracker.committed(run['sheets_done'])
+
+                # 시트에서 빠져 방문 기록이 0회가 된 참가자 삭제 (회차에서 제거와 동일)
+                # 다른 시트로 옮겨진 사람이 먼저 지워지지 않도록 모든 청크가 끝난 뒤에 합니다.
+                if run['pending_orphans']:
+                    cursor.execute("""
+                        DELETE FROM participants p
+                        WHERE p.participant_id = ANY(%s)
+                          AND NOT EXISTS (SELECT 1 FROM attendance a WHERE a.participant_id = p.participant_id)
+                    """, (run['pending_orphans'],))
+                    changed = changed or cursor.rowcount > 0
+                cursor.execute("""
+                    UPDATE import_runs SET status = 'done', pending_orphans = '{}', updated_at = now()
+                    WHERE run_id = %s
+                """, (run['run_id'],))
+                conn.commit()
+                tracker.finish()
+        except Exception as e:
+            conn.rollback()
+            if not run:
+                raise e
+            _fail_import_run(conn, run['run_id'], e)
+            raise ImportFailed(e, run['sheets_done'], run['last_sheet']) from e
+        finally:
+            if run:
+                _release_import_run(conn, run['run_id'])
+            # 실패해도 이미 커밋된 청크가 있으면 캐시를 비워야 함
+            if changed:
+                clear_cache()
+
+    event = tracker.event
+    print(f"🎉 임포트 완료! 새 회차 {event['new']}개, 변경 {event['synced']}개, 그대로 {event['skipped']}개")
+    return {'new': event['new'], 'synced': event['synced'], 'skipped': event['skipped'],
+            'people': event['rows'], 'resumed_from': tracker.start}
+
+def _release_import_run(conn, run_id: int):
+    """실행 잠금 해제 (세션 잠금이라 커넥션을 풀에 돌려주기 전에 꼭 풀어야 함)"""
     try:
         with get_cursor(conn) as cursor:
-            cursor.execute("DELETE FROM attendance WHERE participant_name = %s AND participant_birth = %s", (participant_name, participant_birth))
-            cursor.execute("DELETE FROM participants WHERE name = %s AND birth_date = %s", (participant_name, participant_birth))
-            conn.commit()
-            clear_cache()
-            print(f"✅ {participant_name} 삭제 완료!")
-    except Exception as e:
+            _unlock_import_run(cursor, run_id)
+        conn.commit()
+    except Exception:
         conn.rollback()
-        raise e
 
-def import_excel_file(file_path):
-    """엑셀 파일 임포트 (최적화)"""
-    wb = openpyxl.load_workbook(file_path, data_only=True)
-    conn = get_connection()
-    total = 0
+def _fail_import_run(conn, run_id: int, error: Exception):
     try:
         with get_cursor(conn) as cursor:
-            for sheet_name in wb.sheetnames:
-                sheet = wb[sheet_name]
-                s_name_clean = sheet_name.replace("의 사본", "").strip()
-                print(f"Processing: {s_name_clean}")
-                
-                match = re.search(r'(\d{4})(\d{2})(\d{2})', s_name_clean)
-                if not match: continue
-                s_date = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-                
-                a1 = str(sheet['A1'].value).strip() if sheet['A1'].value else ""
-                host = str(sheet['N2'].value).strip() if sheet['N2'].value else "미정"
-                
-                s_time = "미정"
-                t_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM)', a1, re.IGNORECASE)
-                if t_match:
-                    h, m, mer = int(t_match.group(1)), int(t_match.group(2)), t_match.group(3).upper()
-                    if mer == 'PM' and h != 12: h += 12
-                    elif mer == 'AM' and h == 12: h = 0
-                    s_time = f"{h:02d}:{m:02d}"
-                
-                theme_match = re.search(r'-\s*(.+)$', a1)
-                theme = theme_match.group(1).strip() if theme_match else a1
-                
-                cursor.execute("INSERT INTO sessions (session_date, session_time, theme, host) VALUES (%s, %s, %s, %s) RETURNING session_id", 
-                               (s_date, s_time, theme, host))
-                sid = cursor.fetchone()['session_id']
-                
-                cnt = 0
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    try:
-                        vals = [str(c).strip() if c else "" for c in row]
-                        if len(vals) < 12: continue
-                        gender, nick, name, phone, _, _, loc, birth, job, mbti, intro, route = vals[:12]
-                        if not name or not birth or birth == "-": continue
-                        
-                        g_code = 'M' if gender.upper() in ['M', '남', '남자', '男'] else 'F'
-                        b_clean = re.sub(r'\D', '', birth)
-                        if len(b_clean) != 4: continue
-                        b_date = f"{b_clean}-01-01"
-                        p_clean = re.sub(r'\D', '', phone)
-                        
-                        cursor.execute("""
-                            INSERT INTO participants (name, birth_date, gender, nickname, phone, location, job, mbti, intro, signup_route, first_visit_date)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) ON CONFLICT (name, birth_date) DO NOTHING
-                        """, (name, b_date, g_code, nick, p_clean, loc, job, mbti, intro, route, s_date))
-                        
-                        cursor.execute("INSERT INTO attendance (session_id, participant_name, participant_birth) VALUES (%s, %s, %s) ON CONFLICT DO NOTHING", 
-                                       (sid, name, b_date))
-                        cnt += 1
-                    except: continue
-                total += cnt
-                print(f" -> {s_date}: {cnt}명")
-            conn.commit()
-    except Exception as e:
+            cursor.execute("""
+                UPDATE import_runs SET status = 'failed', error = %s, updated_at = now() WHERE run_id = %s
+            """, (str(error), run_id))
+        conn.commit()
+    except Exception:
         conn.rollback()
-        st.error(f"엑셀 임포트 오류: {e}")
-    clear_cache()
-    print(f"🎉 임포트 완료! 총 {total}명")
\ No newline at end of file
+
+# ---------------------------------------------------------
+# 6. 내보내기 (Export) - 서버 측 커서로 스트리밍
+# ---------------------------------------------------------
+
+# 서버 측 커서에서 한 번에 받아오는 행 수 (테이블 크기와 상관없이 메모리 사용량 일정)
+EXPORT_FETCH_SIZE = 2000
+
+EXPORT_KINDS = {
+    'participants': "참가자 목록",
+    'sessions': "회차 + 명단",
+    'visits': "참가자별 방문 이력",
+}
+
+_EXPORT_QUERIES = {
+    'participants': (
+        ["이름", "생년월일", "성별", "닉네임", "전화번호", "사는곳", "직업", "MBTI", "자기소개",
+         "등록경로", "첫 방문일", "메모", "방문 횟수", "최근 방문일"],
+        """
+        SELECT p.name, p.birth_date, p.gender, p.nickname, p.phone, p.location, p.job, p.mbti, p.intro,
+               p.signup_route, p.first_visit_date, p.memo,
+               COALESCE(v.visit_count, 0), v.last_visit
+        FROM participants p
+        LEFT JOIN (
+            SELECT a.participant_id, COUNT(*) AS visit_count, MAX(s.session_date) AS last_visit
+            FROM attendance a JOIN sessions s ON s.session_id = a.session_id
+            GROUP BY a.participant_id
+        ) v ON v.participant_id = p.participant_id
+        ORDER BY p.name, p.birth_date
+        """),
+    'sessions': (
+        ["회차ID", "날짜", "시간", "주제", "진행자", "상태", "이름", "생년월일", "성별", "닉네임",
+         "전화번호", "사는곳", "직업", "MBTI", "자기소개", "등록경로", "결제 상태"],
+        """
+        SELECT s.session_id, s.session_date, s.session_time, s.theme, s.host, s.status,
+               p.name, p.birth_date, p.gender, p.nickname, p.phone, p.location, p.job, p.mbti,
+               p.intro, p.signup_route, a.payment_status
+        FROM sessions s
+        LEFT JOIN attendance a ON a.session_id = s.session_id
+        LEFT JOIN participants p ON p.participant_id = a.participant_id
+        ORDER BY s.session_date, s.session_id, a.attendance_id
+        """),
+    'visits': (
+        ["이름", "생년월일", "성별", "방문일", "시간", "주제", "진행자"],
+        """
+        SELECT p.name, p.birth_date, p.gender, s.session_date, s.session_time, s.theme, s.host
+        FROM attendance a
+        JOIN participants p ON p.participant_id = a.participant_id
+        JOIN sessions s ON s.session_id = a.session_id
+        ORDER BY p.name, p.birth_date, s.session_date, s.session_id
+        """),
+}
+
+def _stream_rows(sql: str, as_dict: bool = False):
+    """서버 측 커서(named cursor)로 EXPORT_FETCH_SIZE 행씩 받아오며 한 행씩 내보냄"""
+    with get_connection() as conn:
+        try:
+            with conn.cursor(name="export_stream", cursor_factory=RealDictCursor if as_dict else None) as cursor:
+                cursor.itersize = EXPORT_FETCH_SIZE
+                cursor.execute(sql)
+                yield from cursor
+        finally:
+            conn.rollback()  # 읽기 전용 트랜잭션 종료 (서버 측 커서 정리)
+
+def export_data(kind: str, file, fmt: str = "xlsx") -> int:
+    """kind ('participants' / 'sessions' / 'visits') 를 file 로 내보냄
+
+    fmt='xlsx': file 은 경로 또는 바이너리 파일. 'sessions' 는 회차마다 시트 한 장 (임포트 양식)
+    fmt='csv' : file 은 newline='' 로 연 텍스트 파일 (엑셀에서 열려면 encoding='utf-8-sig')
+    반환: 내보낸 행 수 ('sessions' 엑셀은 시트 수)
+    """
+    if kind not in _EXPORT_QUERIES:
+        raise ValueError(f"알 수 없는 내보내기 종류: {kind}")
+    headers, sql = _EXPORT_QUERIES[kind]
+
+    if fmt == "csv":
+        count = excel_export.write_csv(headers, _stream_rows(sql), file)
+    elif fmt == "xlsx" and kind == 'sessions':
+        count = excel_export.write_sessions_workbook(_stream_rows(sql, as_dict=True), file)
+    elif fmt == "xlsx":
+        count = excel_export.write_table_workbook(EXPORT_KINDS[kind], headers, _stream_rows(sql), file)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt}")
+    print(f"📤 {EXPORT_KINDS[kind]} 내보내기 완료! {count}{'개 시트' if fmt == 'xlsx' and kind == 'sessions' else '행'}")
+    return count
@@ -0,0 +1,102 @@
+"""
+스키마 마이그레이션
+- migrations/ 폴더의 NNNN_이름.sql 파일을 번호 순서대로 적용
+- 적용 이력은 schema_migrations 테이블에 기록
+- advisory lock 으로 여러 프로세스가 동시에 시작해도 한 번만 적용
+"""
+import os
+import re
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# 다른 잠금과 겹치지 않도록 고정된 임의의 키
+_LOCK_KEY = 7_243_001
+
+_FILE_PATTERN = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+
+def available_migrations() -> list:
+    """[(version, name, path), ...] 버전 순"""
+    found = []
+    for filename in os.listdir(MIGRATIONS_DIR):
+        match = _FILE_PATTERN.match(filename)
+        if match:
+            found.append((int(match.group(1)), match.group(2), os.path.join(MIGRATIONS_DIR, filename)))
+    found.sort()
+    versions = [v for v, _, _ in found]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError(f"마이그레이션 번호가 중복되었습니다: {versions}")
+    return found
+
+
+def _ensure_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+        )
+    """)
+
+
+def applied_versions(conn) -> set:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            conn.rollback()
+            return set()
+        cursor.execute("SELECT version FROM schema_migrations")
+        versions = {row[0] for row in cursor.fetchall()}
+    conn.rollback()
+    return versions
+
+
+def pending_migrations(conn) -> list:
+    done = applied_versions(conn)
+    return [m for m in available_migrations() if m[0] not in done]
+
+
+def migrate(conn) -> list:
+    """적용 안 된 마이그레이션을 순서대로 적용하고 적용한 목록을 반환
+
+    마이그레이션마다 별도 트랜잭션이라, 중간에 실패하면 그 이전까지는 남고
+    실패한 파일은 통째로 롤백됩니다.
+    """
+    # 대부분의 시작은 이미 최신 상태이므로 잠금 없이 먼저 확인
+    if not pending_migrations(conn):
+        return []
+
+    applied = []
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(%s)", (_LOCK_KEY,))
+    try:
+        with conn.cursor() as cursor:
+            _ensure_table(cursor)
+        conn.commit()
+
+        # 잠금을 기다리는 동안 다른 프로세스가 적용했을 수 있으므로 다시 확인
+        for version, name, path in pending_migrations(conn):
+            with open(path, encoding="utf-8") as f:
+                sql = f.read()
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql)
+                    cursor.execute("INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                                   (version, name))
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise RuntimeError(f"마이그레이션 {version:04d}_{name} 실패: {e}") from e
+            print(f"✅ 마이그레이션 적용: {version:04d}_{name}")
+            applied.append((version, name))
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", (_LOCK_KEY,))
+        conn.commit()
+    return applied
+
+
+def status(conn) -> list:
+    """[(version, name, 적용 여부), ...]"""
+    done = applied_versions(conn)
+    return [(version, name, version in done) for version, name, _ in available_migrations()]
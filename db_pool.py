@@ -0,0 +1,261 @@
+"""
+PostgreSQL 커넥션 풀
+- 최소/최대 커넥션 수 유지
+- 체크아웃 시 pre-ping 으로 죽은 커넥션 교체 (ping_after 초 넘게 놀던 커넥션만 - 방금 쓴 커넥션은 왕복 없이 바로)
+- 오래 놀고 있는 커넥션 정리 (idle reaping: 체크아웃 때 + reap_interval 초마다 백그라운드 스레드)
+- 최대 수명(max lifetime)이 지난 커넥션은 반납 시 폐기
+"""
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class PoolTimeout(Exception):
+    """풀에서 제한 시간 안에 커넥션을 받지 못함"""
+
+
+class _PooledConn:
+    """풀이 관리하는 커넥션 + 메타데이터"""
+    __slots__ = ('conn', 'created_at', 'last_used')
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """스레드 안전한 psycopg2 커넥션 풀"""
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10,
+                 max_idle: float = 300, max_lifetime: float = 3600,
+                 timeout: float = 10, pre_ping: bool = True, ping_after: float = 30,
+                 reap_interval: float = 60, configure=None):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"잘못된 풀 크기: min={min_size}, max={max_size}")
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.pre_ping = pre_ping
+        self.ping_after = ping_after  # 마지막 사용 후 이 시간(초)이 지나야 pre-ping
+        self.configure = configure  # 새 커넥션마다 한 번 호출 (타입 등록 등)
+
+        self._cond = threading.Condition()
+        self._idle = deque()   # 반납된 커넥션 (오른쪽이 가장 최근)
+        self._in_use = {}      # id(conn) -> _PooledConn
+        self._size = 0         # 열려 있는 전체 커넥션 수 (idle + in_use + 생성 중)
+        self._closed = False
+
+        for _ in range(min_size):
+            self._idle.append(self._open())
+            self._size += 1
+
+        # 한가한 동안에도 min_size 초과분이 닫히도록 주기적으로 reap (None/0 이면 체크아웃 때만)
+        self._stop = threading.Event()
+        if reap_interval:
+            threading.Thread(target=ConnectionPool._reap_loop, args=(weakref.ref(self), self._stop, reap_interval),
+                             name="db-pool-reaper", daemon=True).start()
+
+    # -----------------------------------------------------
+    # 내부 헬퍼
+    # -----------------------------------------------------
+
+    def _open(self) -> _PooledConn:
+        conn = psycopg2.connect(self.dsn)
+        if self.configure:
+            try:
+                self.configure(conn)
+            except Exception:
+                conn.close()
+                raise
+        return _PooledConn(conn)
+
+    def _expired(self, pc: _PooledConn, now: float) -> bool:
+        return self.max_lifetime is not None and now - pc.created_at > self.max_lifetime
+
+    def _discard(self, pc: _PooledConn):
+        """커넥션 폐기 (락 밖에서 호출)"""
+        try:
+            pc.conn.close()
+        except Exception:
+            pass
+
+    def _reap_locked(self, now: float) -> list:
+        """min_size 를 넘는 오래된 idle 커넥션을 골라냄 (락 안에서 호출)"""
+        reaped = []
+        # 왼쪽이 가장 오래 놀고 있던 커넥션
+        while self._idle and self._size > self.min_size:
+            pc = self._idle[0]
+            if now - pc.last_used <= self.max_idle and not self._expired(pc, now):
+                break
+            self._idle.popleft()
+            self._size -= 1
+            reaped.append(pc)
+        return reaped
+
+    @staticmethod
+    def _reap_loop(ref, stop: threading.Event, interval: float):
+        """백그라운드 reap (풀을 약한 참조로 들고 있어서 풀이 버려지면 스레드도 끝남)"""
+        while not stop.wait(interval):
+            pool = ref()
+            if pool is None:
+                return
+            try:
+                pool.reap()
+            except Exception:
+                pass
+            del pool
+
+    def _needs_ping(self, pc: _PooledConn, now: float) -> bool:
+        return self.pre_ping and now - pc.last_used > self.ping_after
+
+    def _ping(self, pc: _PooledConn) -> bool:
+        """커넥션이 살아 있는지 확인"""
+        conn = pc.conn
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    # -----------------------------------------------------
+    # 체크아웃 / 반납
+    # -----------------------------------------------------
+
+    def getconn(self):
+        """커넥션 체크아웃 (없으면 생성, 최대치면 대기)"""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            pc, create, reaped = None, False, []
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolTimeout("커넥션 풀이 닫혔습니다.")
+                    now = time.monotonic()
+                    reaped = self._reap_locked(now)
+                    if self._idle:
+                        pc = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise PoolTimeout(f"{self.timeout}초 안에 DB 커넥션을 받지 못했습니다. (max_size={self.max_size})")
+                    self._cond.wait(remaining)
+
+            for old in reaped:
+                self._discard(old)
+
+            if create:
+                try:
+                    pc = self._open()
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+            elif pc.conn.closed or self._expired(pc, time.monotonic()) or \
+                    (self._needs_ping(pc, time.monotonic()) and not self._ping(pc)):
+                # 수명 초과 또는 죽은 커넥션 -> 버리고 다시 시도
+                self._discard(pc)
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                continue
+
+            with self._cond:
+                self._in_use[id(pc.conn)] = pc
+            return pc.conn
+
+    def putconn(self, conn, discard: bool = False):
+        """커넥션 반납 (진행 중인 트랜잭션은 롤백)"""
+        with self._cond:
+            pc = self._in_use.pop(id(conn), None)
+        if pc is None:
+            raise ValueError("이 풀에서 빌려간 커넥션이 아닙니다.")
+
+        if not discard and not conn.closed:
+            try:
+                status = conn.info.transaction_status
+                if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                    discard = True
+                elif status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        now = time.monotonic()
+        if discard or conn.closed or self._closed or self._expired(pc, now):
+            self._discard(pc)
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            return
+
+        pc.last_used = now
+        with self._cond:
+            self._idle.append(pc)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """`with pool.connection() as conn:` 형태의 체크아웃/반납"""
+        conn = self.getconn()
+        broken = False
+        try:
+            yield conn
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+            raise
+        finally:
+            self.putconn(conn, discard=broken)
+
+    # -----------------------------------------------------
+    # 관리
+    # -----------------------------------------------------
+
+    def reap(self):
+        """오래 놀고 있는 커넥션 정리 (체크아웃 때와 reap_interval 마다 자동으로 수행됨)"""
+        with self._cond:
+            reaped = self._reap_locked(time.monotonic())
+        for pc in reaped:
+            self._discard(pc)
+        return len(reaped)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': len(self._in_use),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+            }
+
+    def close(self):
+        """풀 종료 (대여 중인 커넥션은 반납 시 닫힘)"""
+        self._stop.set()
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for pc in idle:
+            self._discard(pc)
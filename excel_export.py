@@ -0,0 +1,98 @@
+"""
+엑셀/CSV 내보내기 - 파일 쓰기 (DB 접근 없음)
+- 행은 이터레이터로 받아서 바로 씀 (openpyxl write_only / csv.writer) -> 메모리 사용량 일정
+- 회차 명단 엑셀은 임포트 양식과 같음 (시트 = 회차, A1 시간/테마, N2 진행자, 2행부터 참가자)
+  그래서 내보낸 파일을 그대로 다시 임포트할 수 있습니다.
+"""
+import csv
+import re
+from itertools import chain, groupby
+from typing import Iterable
+
+import openpyxl
+
+_TIME_24H = re.compile(r'^(\d{1,2}):(\d{2})$')
+
+
+def format_a1(session_date: str, session_time: str, theme: str) -> str:
+    """회차 정보 -> A1 셀 ("2024.01.06 7:30 PM - 테마", 임포터가 시간/테마를 다시 읽을 수 있는 형태)"""
+    text = session_date.replace("-", ".")
+    match = _TIME_24H.match(session_time or "")
+    if match:
+        h, m = int(match.group(1)), int(match.group(2))
+        mer = 'PM' if h >= 12 else 'AM'
+        text += f" {h % 12 or 12}:{m:02d} {mer}"
+    return f"{text} - {theme or ''}"
+
+
+def sheet_title(session_date: str, used: set) -> str:
+    """시트 이름 YYYYMMDD (같은 날 회차가 여러 개면 "YYYYMMDD (2)" ...)"""
+    base = session_date.replace("-", "")
+    title, n = base, 1
+    while title in used:
+        n += 1
+        title = f"{base} ({n})"
+    used.add(title)
+    return title
+
+
+def roster_row(person: dict) -> list:
+    """참가자 -> 임포트 양식 행 (excel_import.parse_person 의 열 순서)"""
+    return ["남" if person['gender'] == 'M' else "여", person['nickname'] or "", person['name'],
+            person['phone'] or "", "", "", person['location'] or "", person['birth_date'][:4],
+            person['job'] or "", person['mbti'] or "", person['intro'] or "", person['signup_route'] or ""]
+
+
+def write_sessions_workbook(rows: Iterable[dict], file) -> int:
+    """회차 + 명단 -> 회차마다 시트 한 장 (임포트 양식)
+
+    rows: 회차 순으로 정렬된 (회차 컬럼 + 참가자 컬럼) dict, 명단이 빈 회차는 참가자 컬럼이 None
+    반환: 시트 수
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    used, count = set(), 0
+    for _, session_rows in groupby(rows, key=lambda r: r['session_id']):
+        first = next(session_rows)
+        ws = wb.create_sheet(sheet_title(first['session_date'], used))
+        ws.append([format_a1(first['session_date'], first['session_time'], first['theme'])])
+        host = first['host'] or ""
+        people = (r for r in chain([first], session_rows) if r['name'] is not None)
+        wrote = False
+        for index, person in enumerate(people):
+            row = roster_row(person)
+            if index == 0:
+                row += ["", host]  # N2
+            ws.append(row)
+            wrote = True
+        if not wrote:
+            ws.append([""] * 13 + [host])  # 빈 명단이라도 진행자는 남김
+        count += 1
+    if count == 0:
+        wb.create_sheet("회차 없음")
+    wb.save(file)
+    return count
+
+
+def write_table_workbook(title: str, headers: list, rows: Iterable[tuple], file) -> int:
+    """표 하나 -> 시트 한 장 (1행 머리글)"""
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+    ws.append(headers)
+    count = 0
+    for row in rows:
+        ws.append(list(row))
+        count += 1
+    wb.save(file)
+    return count
+
+
+def write_csv(headers: list, rows: Iterable[tuple], out) -> int:
+    """표 하나 -> CSV (out 은 newline='' 로 연 텍스트 파일)"""
+    writer = csv.writer(out)
+    writer.writerow(headers)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
@@ -0,0 +1,251 @@
+"""
+엑셀 임포트 - 시트 파싱 (DB 접근 없음)
+- 시트 한 장 = 회차 한 개 (시트 이름의 YYYYMMDD 가 회차 날짜)
+- A1: "... 7:30 PM - 테마",  N2: 진행자
+- 2행부터: 성별, 닉네임, 이름, 전화번호, -, -, 지역, 출생년도, 직업, MBTI, 자기소개, 가입경로
+- read_only 모드로 행을 스트리밍하므로 큰 통합 문서도 메모리에 한 번에 올리지 않습니다.
+- 파싱은 순수 함수라 여러 프로세스에 시트를 나눠 맡길 수 있습니다 (iter_workbook).
+"""
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Iterator
+
+import openpyxl
+
+# 참가자 한 명의 필드 순서 (people 리스트의 튜플 순서)
+PERSON_FIELDS = ('name', 'birth_date', 'gender', 'nickname', 'phone',
+                 'location', 'job', 'mbti', 'intro', 'signup_route')
+
+_DATE_PATTERN = re.compile(r'(\d{4})(\d{2})(\d{2})')
+_TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM)', re.IGNORECASE)
+_THEME_PATTERN = re.compile(r'-\s*(.+)$')
+_NON_DIGIT = re.compile(r'\D')
+
+_MALE = ['M', '남', '남자', '男']
+_HOST_COLUMN = 13  # N열
+_MAX_COLUMN = 14   # A~N 열만 읽음
+
+# 시트가 이보다 적으면 프로세스를 띄우는 비용이 더 커서 한 프로세스에서 파싱
+PARALLEL_MIN_SHEETS = 16
+MAX_WORKERS = 8
+
+
+def parse_session_date(sheet_name: str):
+    """시트 이름 -> 'YYYY-MM-DD' (날짜가 없으면 None: 회차 시트가 아님)"""
+    match = _DATE_PATTERN.search(sheet_name.replace("의 사본", "").strip())
+    if not match: return None
+    s_date = f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+    try:
+        date.fromisoformat(s_date)
+    except ValueError:
+        return None
+    return s_date
+
+
+def parse_header(a1, n2) -> Dict:
+    """A1 (시간/테마), N2 (진행자) -> {'session_time', 'theme', 'host'}"""
+    a1 = str(a1).strip() if a1 else ""
+    host = str(n2).strip() if n2 else "미정"
+
+    s_time = "미정"
+    t_match = _TIME_PATTERN.search(a1)
+    if t_match:
+        h, m, mer = int(t_match.group(1)), int(t_match.group(2)), t_match.group(3).upper()
+        if mer == 'PM' and h != 12: h += 12
+        elif mer == 'AM' and h == 12: h = 0
+        s_time = f"{h:02d}:{m:02d}"
+
+    theme_match = _THEME_PATTERN.search(a1)
+    theme = theme_match.group(1).strip() if theme_match else a1
+    return {'session_time': s_time, 'theme': theme, 'host': host}
+
+
+def parse_person(row) -> tuple:
+    """참가자 행 -> PERSON_FIELDS 순서 튜플 (이름/출생년도가 없거나 이상하면 None)"""
+    try:
+        vals = [str(c).strip() if c else "" for c in row]
+        if len(vals) < 12: return None
+        gender, nick, name, phone, _, _, loc, birth, job, mbti, intro, route = vals[:12]
+        if not name or not birth or birth == "-": return None
+
+        g_code = 'M' if gender.upper() in _MALE else 'F'
+        b_clean = _NON_DIGIT.sub('', birth)
+        if len(b_clean) != 4: return None
+        return (name, f"{b_clean}-01-01", g_code, nick, _NON_DIGIT.sub('', phone),
+                loc, job, mbti, intro, route)
+    except Exception:
+        return None
+
+
+def parse_sheet(sheet) -> Dict:
+    """워크시트 한 장 -> {'sheet', 'session_date', 'session_time', 'theme', 'host', 'people', 'content_hash'}
+
+    회차 시트가 아니면 None. 행은 한 번만 순회합니다 (A1 은 1행, N2 는 첫 참가자 행).
+    """
+    s_date = parse_session_date(sheet.title)
+    if not s_date: return None
+
+    a1 = n2 = None
+    people = []
+    for index, row in enumerate(sheet.iter_rows(max_col=_MAX_COLUMN, values_only=True)):
+        if index == 0:
+            a1 = row[0] if row else None
+            continue
+        if index == 1 and len(row) > _HOST_COLUMN:
+            n2 = row[_HOST_COLUMN]
+        person = parse_person(row)
+        if person:
+            people.append(person)
+
+    parsed = {'sheet': sheet.title, 'session_date': s_date, 'people': people}
+    parsed.update(parse_header(a1, n2))
+    parsed['content_hash'] = content_hash(parsed)
+    return parsed
+
+
+def content_hash(parsed: Dict) -> str:
+    """파싱 결과의 지문 (회차 정보 + 참가자 행 순서까지) - 재임포트 시 변경 여부 판단"""
+    payload = [parsed['session_date'], parsed['session_time'], parsed['theme'], parsed['host'],
+               [list(p) for p in parsed['people']]]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _open(file_path):
+    return openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+
+
+def _parse_open_workbook(wb, names, offset: int, total: int) -> list:
+    parsed_sheets = []
+    for index, name in enumerate(names, offset):
+        sheet = wb[name]
+        if not hasattr(sheet, 'iter_rows'): continue  # 차트 시트
+        sheet.reset_dimensions()  # 잘못 저장된 dimension 때문에 행이 잘리지 않도록
+        parsed = parse_sheet(sheet)
+        if parsed:
+            parsed.update(index=index, total=total)  # 통합 문서 안에서의 위치 (진행률 / 체크포인트)
+            parsed_sheets.append(parsed)
+    return parsed_sheets
+
+
+def parse_sheets(file_path, names, offset: int = 0, total: int = None) -> list:
+    """names 시트들만 파싱 (프로세스 풀 작업 단위: 워커마다 파일을 read_only 로 따로 엶)"""
+    wb = _open(file_path)
+    try:
+        return _parse_open_workbook(wb, names, offset, total if total is not None else len(names))
+    finally:
+        wb.close()
+
+
+def default_workers() -> int:
+    return min(os.cpu_count() or 1, MAX_WORKERS)
+
+
+def iter_workbook(file_path, workers: int = None, start: int = 0) -> Iterator[Dict]:
+    """통합 문서의 회차 시트를 시트 순서대로 파싱 (start 번째 시트부터)
+
+    결과 dict 에는 'index' (통합 문서 안의 시트 위치) 와 'total' (전체 시트 수) 가 붙습니다.
+    시트가 PARALLEL_MIN_SHEETS 장 이상이고 workers > 1 이면 연속된 시트 묶음을
+    ProcessPoolExecutor 로 나눠 파싱하고, 결과는 완료 순서와 상관없이 원래 시트 순서로 내보냅니다.
+    (첫 방문일 등 '먼저 나온 시트 기준' 규칙이 순서에 의존하기 때문)
+    """
+    wb = _open(file_path)
+    try:
+        total = len(wb.sheetnames)
+        names = wb.sheetnames[start:]
+        workers = default_workers() if workers is None else workers
+        if workers <= 1 or len(names) < PARALLEL_MIN_SHEETS:
+            for index, name in enumerate(names, start):
+                yield from _parse_open_workbook(wb, [name], index, total)
+            return
+    finally:
+        wb.close()
+
+    # 워커마다 파일을 새로 열고 공유 문자열 표를 읽는 비용이 있으므로 워커당 연속된 묶음 하나
+    chunk_size = -(-len(names) // workers)
+    chunks = [(names[i:i + chunk_size], start + i) for i in range(0, len(names), chunk_size)]
+    # spawn: 워커는 이 모듈만 import (Streamlit 서버 스레드를 fork 하지 않음, Windows 와 동작 동일)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        futures = [pool.submit(parse_sheets, file_path, chunk, offset, total) for chunk, offset in chunks]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def file_hash(file_path) -> str:
+    """파일 내용 해시 (중단된 임포트를 같은 파일로 이어서 할 때 식별용)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ImportProgress:
+    """임포트 진행 상황 -> 진행률 이벤트 (dict)
+
+    이벤트: {'sheet', 'sheets_done', 'sheets_total', 'rows', 'rows_per_sec', 'eta_seconds',
+             'new', 'synced', 'skipped', 'committed', 'done'}
+    속도/남은 시간은 이번 실행에서 처리한 시트 기준 (이어서 할 때 이미 끝난 시트는 제외)
+    """
+
+    def __init__(self, callback=None, start: int = 0):
+        self.callback = callback
+        self.start = start
+        self.started_at = time.monotonic()
+        self.event = {'sheet': None, 'sheets_done': start, 'sheets_total': 0, 'rows': 0,
+                      'rows_per_sec': 0.0, 'eta_seconds': None,
+                      'new': 0, 'synced': 0, 'skipped': 0, 'committed': start, 'done': False}
+
+    def sheet(self, parsed: Dict, action: str):
+        """시트 하나 처리 (action: 'new' / 'sync' / 'skip')"""
+        event = self.event
+        event['sheet'] = parsed['sheet']
+        event['sheets_done'] = parsed['index'] + 1
+        event['sheets_total'] = parsed['total']
+        event['rows'] += len(parsed['people'])
+        event[{'new': 'new', 'sync': 'synced', 'skip': 'skipped'}[action]] += 1
+        self._emit()
+
+    def committed(self, sheets_done: int):
+        self.event['committed'] = sheets_done
+        self._emit()
+
+    def finish(self):
+        self.event['sheets_done'] = self.event['sheets_total'] = max(self.event['sheets_total'], self.event['sheets_done'])
+        self.event['eta_seconds'] = 0
+        self.event['done'] = True
+        self._emit()
+
+    def _emit(self):
+        event = self.event
+        elapsed = max(time.monotonic() - self.started_at, 1e-6)
+        event['rows_per_sec'] = event['rows'] / elapsed
+        processed = event['sheets_done'] - self.start
+        if processed > 0 and not event['done']:
+            event['eta_seconds'] = elapsed / processed * (event['sheets_total'] - event['sheets_done'])
+        if self.callback:
+            self.callback(dict(event))
+
+
+def describe_progress(event: Dict) -> str:
+    """진행률 이벤트 -> 화면 표시 문구"""
+    text = f"{event['sheets_done']}/{event['sheets_total']} 시트 · {event['rows_per_sec']:.0f}행/초"
+    if event['done']:
+        return text + f" · 완료 (새 회차 {event['new']}, 변경 {event['synced']}, 그대로 {event['skipped']})"
+    if event['eta_seconds'] is not None:
+        text += f" · 남은 시간 약 {event['eta_seconds']:.0f}초"
+    return text
+
+
+def progress_fraction(event: Dict) -> float:
+    if not event['sheets_total']: return 0.0
+    return min(1.0, event['sheets_done'] / event['sheets_total'])
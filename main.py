@@ -1,4 +1,5 @@
 """메이크어토스트 - 메인 진입점"""
+import multiprocessing
 import ttkbootstrap as ttk
 from ui import MakeToastApp
 import database as db
@@ -15,4 +16,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # exe 에서 엑셀 파싱 워커 프로세스 실행용
     main()
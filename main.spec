@@ -5,7 +5,7 @@ a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('ui', 'ui'), ('database.py', '.'), ('maketoast.db', '.')],
+    datas=[('ui', 'ui'), ('database.py', '.'), ('db_pool.py', '.'), ('db_migrate.py', '.'), ('excel_import.py', '.'), ('excel_export.py', '.'), ('meeting_audit.py', '.'), ('met_graph.py', '.'), ('participant_index.py', '.'), ('recommend_score.py', '.'), ('roster_optimizer.py', '.'), ('rotation.py', '.'), ('migrations', 'migrations'), ('maketoast.db', '.')],
     hiddenimports=['ttkbootstrap', 'openpyxl', 'pandas'],
     hookspath=[],
     hooksconfig={},
@@ -0,0 +1,81 @@
+"""메이크어토스트 - 관리용 명령어
+
+    python manage.py migrate             # 적용 안 된 스키마 마이그레이션 적용
+    python manage.py migrate --status    # 마이그레이션 적용 현황
+    python manage.py rebuild-met-pairs   # 만남 인덱스(met_pairs) 전체 재구성
+    python manage.py audit-meetings      # 전체 회차 중복 만남 점검 (--csv 파일로 전체 목록 저장)
+
+DB 접속 정보는 앱과 같이 .streamlit/secrets.toml 의 DATABASE_URL
+(또는 DATABASE_URL 환경 변수)을 사용합니다.
+"""
+import argparse
+import csv
+import time
+import database as db
+import db_migrate
+
+
+def cmd_migrate(args):
+    if args.status:
+        with db.get_connection() as conn:
+            for version, name, done in db_migrate.status(conn):
+                print(f"{'✅' if done else '⏳'} {version:04d}_{name}")
+        return
+    db.init_db()
+
+
+def cmd_rebuild_met_pairs(args):
+    db.init_db()
+    db.rebuild_met_pairs()
+
+
+def cmd_audit_meetings(args):
+    db.init_db()
+    start = time.perf_counter()
+    result = db.audit_repeat_meetings()
+    elapsed = time.perf_counter() - start
+
+    for s in result['sessions'][:args.limit]:
+        print(f"⚠️ {s['session_date']} {s['session_time'] or ''} {s['theme']} - {s['repeat_count']}쌍 / {s['size']}명")
+        for p in s['pairs']:
+            print(f"    {p['person1']}({p['person1_birth'][:4]}) ↔ {p['person2']}({p['person2_birth'][:4]}): "
+                  f"{', '.join(p['previous_dates'])}")
+    if len(result['sessions']) > args.limit:
+        print(f"... 외 {len(result['sessions']) - args.limit}개 회차 (--limit / --csv)")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(["회차 날짜", "시간", "주제", "이름1", "생년월일1", "이름2", "생년월일2", "이전에 만난 날짜"])
+            for s in result['sessions']:
+                for p in s['pairs']:
+                    writer.writerow([s['session_date'], s['session_time'], s['theme'], p['person1'], p['person1_birth'],
+                                     p['person2'], p['person2_birth'], " ".join(p['previous_dates'])])
+        print(f"📤 {args.csv} 저장")
+
+    print(f"{'✅' if not result['sessions'] else '⚠️'} {result['session_count']}회차 / 출석 {result['row_count']}건 점검: "
+          f"중복 만남 {result['repeat_count']}쌍, {len(result['sessions'])}개 회차 ({elapsed:.2f}초)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Make a Toast 관리 명령어")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("migrate", help="스키마 마이그레이션 적용")
+    p.add_argument("--status", action="store_true", help="적용하지 않고 현황만 출력")
+    p.set_defaults(func=cmd_migrate)
+
+    p = sub.add_parser("rebuild-met-pairs", help="출석 기록으로 만남 인덱스를 처음부터 다시 만듭니다")
+    p.set_defaults(func=cmd_rebuild_met_pairs)
+
+    p = sub.add_parser("audit-meetings", help="전체 회차에서 이미 만난 쌍이 다시 만난 회차를 찾습니다")
+    p.add_argument("--limit", type=int, default=20, help="화면에 보여줄 회차 수 (최근 회차부터, 기본 20)")
+    p.add_argument("--csv", help="전체 목록을 저장할 CSV 파일")
+    p.set_defaults(func=cmd_audit_meetings)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
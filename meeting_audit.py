@@ -0,0 +1,44 @@
+"""
+전체 이력 중복 만남 점검 (메모리, DB 접근 없음)
+- 출석 기록을 회차 시간 순으로 한 번 훑으며, 회차마다 명단의 모든 쌍을 '이전에 함께한 회차' 와 대조
+- 쌍은 (작은 번호 << 32 | 큰 번호) 정수 키 하나로 해시 (사람마다 비트셋을 두면 참가자 수의 제곱에
+  비례하는 메모리가 들지만, 쌍 해시는 실제로 함께한 쌍 수에만 비례)
+- 다시 만난 쌍만 함께한 회차 목록을 따로 들고 있어서 '언제 만났는지' 를 바로 보고
+
+check_duplicate_meetings (한 회차) 와 달리 '그 회차보다 앞선 회차' 에서 만난 쌍만 셉니다.
+같은 쌍이 세 번 만났으면 두 번째, 세 번째 회차에 각각 한 번씩 잡힙니다.
+"""
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Iterable
+
+
+def audit(rows: Iterable[tuple]) -> Dict:
+    """rows: (session_id, participant_id) - 회차 시간 순, 같은 회차 행은 붙어서
+
+    반환: {'sessions': [{'session_id', 'size', 'pairs': [(p1, p2, [이전에 함께한 session_id, ...]), ...]}, ...],
+           'session_count', 'row_count', 'pair_count'}
+    sessions 에는 이미 만난 쌍이 있는 회차만 (회차 순)
+    """
+    last = {}     # 쌍 키 -> 마지막으로 함께한 회차
+    history = {}  # 다시 만난 쌍 키 -> 함께한 회차 목록 (처음 만난 회차부터)
+    flagged = []
+    session_count = row_count = 0
+    for session_id, members in groupby(rows, key=itemgetter(0)):
+        ids = sorted({participant_id for _, participant_id in members})
+        session_count += 1
+        row_count += len(ids)
+        pairs = []
+        for k, a in enumerate(ids):
+            base = a << 32
+            for b in ids[k + 1:]:
+                key = base | b
+                previous = last.get(key)
+                if previous is not None:
+                    met = history.setdefault(key, [previous])
+                    pairs.append((a, b, list(met)))
+                    met.append(session_id)
+                last[key] = session_id
+        if pairs:
+            flagged.append({'session_id': session_id, 'size': len(ids), 'pairs': pairs})
+    return {'sessions': flagged, 'session_count': session_count, 'row_count': row_count, 'pair_count': len(last)}
@@ -0,0 +1,153 @@
+"""
+만남 그래프 (메모리, DB 접근 없음) - '누가 누구를 만났는지' 비트셋
+- 출석 기록의 사람마다 0부터 촘촘한 번호를 붙이고, 사람마다 만난 사람 번호를 파이썬 int 비트셋으로 들고 있음
+- 회차마다 명단 비트셋도 들고 있어서, 사람의 만난 사람 = 참석한 회차 명단 비트셋을 모두 OR (본인 제외)
+- "X 가 명단 R 의 누군가를 만났나" 는 AND 한 번, "후보 중 명단 R 과 아무도 안 만난 사람" 은
+  R 의 만난 사람 비트셋을 OR 로 모은 뒤 후보마다 비트 하나씩 확인
+- 출석 추가/제거, 회차/참가자 삭제는 그 자리에서 반영 (제거는 관련된 사람만 다시 OR)
+
+비트셋 크기는 그 사람이 만난 사람 중 가장 큰 번호에 비례하므로 메모리는 최대 (사람 수)² / 8 바이트
+(출석한 사람 1만 명이면 약 12MB). 사람은 (이름, 생년월일) 처럼 해시 가능한 값이면 무엇이든 됩니다.
+"""
+from typing import Dict, Hashable, Iterable, List
+
+
+def _bits(indices: Iterable[int]) -> int:
+    """번호 목록 -> 비트셋 (큰 int 를 OR 로 키우지 않고 바이트 배열에서 한 번에)"""
+    indices = list(indices)
+    if not indices:
+        return 0
+    buf = bytearray((max(indices) >> 3) + 1)
+    for i in indices:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, 'little')
+
+
+class MetGraph:
+    def __init__(self, rows: Iterable[tuple] = ()):
+        """rows: (session_id, 사람) 출석 기록"""
+        self.index: Dict[Hashable, int] = {}  # 사람 -> 번호
+        self.people: List[Hashable] = []      # 번호 -> 사람 (삭제된 사람 자리는 None)
+        self.met: List[int] = []              # 번호 -> 만난 사람 비트셋
+        self.attended: List[set] = []         # 번호 -> 참석한 session_id
+        self.sessions: Dict[int, set] = {}    # session_id -> 명단 번호
+        self.masks: Dict[int, int] = {}       # session_id -> 명단 비트셋
+
+        for session_id, person in rows:
+            i = self._slot(person)
+            self.sessions.setdefault(session_id, set()).add(i)
+            self.attended[i].add(session_id)
+        self.masks = {session_id: _bits(members) for session_id, members in self.sessions.items()}
+        for i in range(len(self.people)):
+            self._recount(i)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _slot(self, person) -> int:
+        i = self.index.get(person)
+        if i is None:
+            i = self.index[person] = len(self.people)
+            self.people.append(person)
+            self.met.append(0)
+            self.attended.append(set())
+        return i
+
+    def _recount(self, i: int):
+        """참석한 회차 명단을 다시 OR (출석이 빠진 뒤, 다른 회차에서 또 만난 쌍은 남도록)"""
+        met = 0
+        for session_id in self.attended[i]:
+            met |= self.masks[session_id]
+        self.met[i] = met & ~(1 << i)
+
+    def _mask(self, people: Iterable) -> int:
+        return _bits(self.index[p] for p in people if p in self.index)
+
+    # -----------------------------------------------------
+    # 증분 반영
+    # -----------------------------------------------------
+    def attend(self, session_id: int, person):
+        """출석 추가: 새 사람 <-> 기존 명단 비트만 켬"""
+        i = self._slot(person)
+        members = self.sessions.setdefault(session_id, set())
+        if i in members:
+            return
+        mask = self.masks.get(session_id, 0)
+        bit = 1 << i
+        for j in members:
+            self.met[j] |= bit
+        self.met[i] |= mask
+        members.add(i)
+        self.masks[session_id] = mask | bit
+        self.attended[i].add(session_id)
+
+    def leave(self, session_id: int, person):
+        """출석 제거: 본인과 그 회차 남은 명단만 다시 계산"""
+        i = self.index.get(person)
+        members = self.sessions.get(session_id)
+        if i is None or not members or i not in members:
+            return
+        members.discard(i)
+        self.masks[session_id] ^= 1 << i
+        self.attended[i].discard(session_id)
+        for j in (i, *members):
+            self._recount(j)
+
+    def drop_session(self, session_id: int):
+        """회차 삭제"""
+        members = self.sessions.pop(session_id, set())
+        self.masks.pop(session_id, None)
+        for j in members:
+            self.attended[j].discard(session_id)
+        for j in members:
+            self._recount(j)
+
+    def drop_person(self, person):
+        """참가자 삭제 (번호는 비워 두고 다시 쓰지 않음)"""
+        i = self.index.get(person)
+        if i is None:
+            return
+        for session_id in list(self.attended[i]):
+            self.leave(session_id, person)
+        del self.index[person]
+        self.people[i] = None
+
+    # -----------------------------------------------------
+    # 조회
+    # -----------------------------------------------------
+    def roster(self, session_id: int) -> List:
+        return [self.people[i] for i in sorted(self.sessions.get(session_id, ()))]
+
+    def has_met_any(self, person, people: Iterable) -> bool:
+        """person 이 people 중 한 명이라도 만났는지"""
+        i = self.index.get(person)
+        return i is not None and self.met[i] & self._mask(people) != 0
+
+    def met_among(self, person, people: Iterable) -> List:
+        """people 중 person 이 이미 만난 사람 (people 순서대로)"""
+        i = self.index.get(person)
+        if i is None:
+            return []
+        met = self.met[i]
+        return [p for p in people if p in self.index and met >> self.index[p] & 1]
+
+    def clean(self, candidates: Iterable, roster: Iterable) -> List:
+        """candidates 중 roster 의 누구와도 만난 적 없고 roster 에도 없는 사람 (candidates 순서대로)
+
+        출석 기록이 없는 후보는 아무도 만나지 않았으므로 그대로 남습니다.
+        """
+        roster = set(roster)
+        reach = self._mask(roster)
+        for p in roster:
+            if p in self.index:
+                reach |= self.met[self.index[p]]
+        seen = reach.to_bytes((reach.bit_length() + 7) >> 3, 'little')
+        clean = []
+        for p in candidates:
+            i = self.index.get(p)
+            if i is None:
+                if p not in roster:  # 출석 기록이 없어도 명단에 있는 사람은 뺌
+                    clean.append(p)
+            elif (i >> 3) >= len(seen) or not seen[i >> 3] >> (i & 7) & 1:
+                clean.append(p)
+        return clean
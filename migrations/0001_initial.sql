@@ -0,0 +1,23 @@
+-- 기본 테이블 (기존 init_db 와 동일, 이미 있는 DB에서는 건너뜀)
+CREATE TABLE IF NOT EXISTS participants (
+    name TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    nickname TEXT, phone TEXT, location TEXT, job TEXT, mbti TEXT,
+    intro TEXT, signup_route TEXT, first_visit_date TEXT, memo TEXT,
+    PRIMARY KEY (name, birth_date)
+);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id SERIAL PRIMARY KEY,
+    session_date TEXT NOT NULL, session_time TEXT,
+    theme TEXT, host TEXT, status TEXT DEFAULT '준비중'
+);
+
+CREATE TABLE IF NOT EXISTS attendance (
+    attendance_id SERIAL PRIMARY KEY,
+    participant_name TEXT NOT NULL, participant_birth TEXT NOT NULL,
+    session_id INTEGER NOT NULL, attended BOOLEAN DEFAULT TRUE, payment_status TEXT,
+    FOREIGN KEY (participant_name, participant_birth) REFERENCES participants(name, birth_date),
+    FOREIGN KEY (session_id) REFERENCES sessions(session_id)
+);
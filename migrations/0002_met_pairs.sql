@@ -0,0 +1,21 @@
+-- 만남 인덱스: 함께 참석한 두 사람 (p1 < p2 로 한 번만 저장)
+CREATE TABLE IF NOT EXISTS met_pairs (
+    p1_name TEXT NOT NULL, p1_birth TEXT NOT NULL,
+    p2_name TEXT NOT NULL, p2_birth TEXT NOT NULL,
+    first_met TEXT NOT NULL, last_met TEXT NOT NULL,
+    meet_count INTEGER NOT NULL,
+    PRIMARY KEY (p1_name, p1_birth, p2_name, p2_birth)
+);
+
+CREATE INDEX IF NOT EXISTS met_pairs_p2_idx ON met_pairs (p2_name, p2_birth);
+
+-- 기존 출석 기록으로 채움
+TRUNCATE met_pairs;
+INSERT INTO met_pairs (p1_name, p1_birth, p2_name, p2_birth, first_met, last_met, meet_count)
+SELECT a1.participant_name, a1.participant_birth, a2.participant_name, a2.participant_birth,
+       MIN(s.session_date), MAX(s.session_date), COUNT(DISTINCT s.session_id)
+FROM attendance a1
+JOIN attendance a2 ON a2.session_id = a1.session_id
+                  AND (a1.participant_name, a1.participant_birth) < (a2.participant_name, a2.participant_birth)
+JOIN sessions s ON s.session_id = a1.session_id
+GROUP BY a1.participant_name, a1.participant_birth, a2.participant_name, a2.participant_birth;
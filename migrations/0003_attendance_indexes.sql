@@ -0,0 +1,17 @@
+-- 1. 같은 회차에 같은 사람이 두 번 들어간 출석 기록 정리 (가장 먼저 들어간 행만 남김)
+DELETE FROM attendance dup
+USING attendance keep
+WHERE dup.session_id = keep.session_id
+  AND dup.participant_name = keep.participant_name
+  AND dup.participant_birth = keep.participant_birth
+  AND dup.attendance_id > keep.attendance_id;
+
+-- 2. 회차당 한 사람은 한 번만 (add_attendance 의 ON CONFLICT 대상)
+--    session_id 가 선두 컬럼이라 회차 명단 조회 인덱스 역할도 합니다.
+ALTER TABLE attendance
+    ADD CONSTRAINT attendance_session_participant_key
+    UNIQUE (session_id, participant_name, participant_birth);
+
+-- 3. 참가자별 방문 이력 조회 (방문 횟수, 상세, 고아 체크, 만남 인덱스 갱신)
+CREATE INDEX IF NOT EXISTS attendance_participant_idx
+    ON attendance (participant_name, participant_birth);
@@ -0,0 +1,16 @@
+-- 1. 출생년도: birth_date('YYYY-01-01') 앞 4자리를 정수 생성 컬럼으로
+--    추천 나이 필터가 SUBSTRING/CAST 없이 (gender, birth_year) 인덱스를 탐
+ALTER TABLE participants
+    ADD COLUMN birth_year INTEGER GENERATED ALWAYS AS (
+        CASE WHEN birth_date ~ '^[0-9]{4}' THEN substring(birth_date FROM 1 FOR 4)::integer END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS participants_gender_birth_year_idx ON participants (gender, birth_year);
+
+-- 2. 회차 날짜 TEXT -> DATE (앱은 커넥션에서 DATE 를 'YYYY-MM-DD' 문자열로 받음)
+ALTER TABLE sessions ALTER COLUMN session_date TYPE DATE USING session_date::date;
+
+-- 3. 만남 인덱스의 날짜도 같은 타입으로
+ALTER TABLE met_pairs
+    ALTER COLUMN first_met TYPE DATE USING first_met::date,
+    ALTER COLUMN last_met TYPE DATE USING last_met::date;
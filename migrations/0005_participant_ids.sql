@@ -0,0 +1,67 @@
+-- 참가자 정수 대리 키 (participant_id)
+-- 출석/만남 인덱스가 (이름, 생년월일) 텍스트 두 개 대신 정수 하나로 조인합니다.
+-- (name, birth_date) 는 UNIQUE 로 남아 기존 조회/ON CONFLICT 가 그대로 동작합니다.
+
+-- 1. 참가자 번호 부여 (기존 행은 이름순으로 채번)
+ALTER TABLE participants ADD COLUMN participant_id INTEGER;
+CREATE SEQUENCE participants_participant_id_seq OWNED BY participants.participant_id;
+UPDATE participants p SET participant_id = n.id
+FROM (SELECT name, birth_date, nextval('participants_participant_id_seq') AS id
+      FROM (SELECT name, birth_date FROM participants ORDER BY name, birth_date) ordered) n
+WHERE n.name = p.name AND n.birth_date = p.birth_date;
+ALTER TABLE participants
+    ALTER COLUMN participant_id SET DEFAULT nextval('participants_participant_id_seq'),
+    ALTER COLUMN participant_id SET NOT NULL;
+
+-- 2. 출석 기록을 participant_id 로 옮겨 담음 (attendance_id 는 유지)
+CREATE TEMP TABLE attendance_old ON COMMIT DROP AS
+SELECT a.attendance_id, a.session_id, p.participant_id, a.attended, a.payment_status
+FROM attendance a
+JOIN participants p ON p.name = a.participant_name AND p.birth_date = a.participant_birth;
+
+DROP TABLE attendance;
+DROP TABLE met_pairs;
+
+-- 3. 기본 키 교체 (기존 텍스트 키는 UNIQUE 제약으로)
+ALTER TABLE participants DROP CONSTRAINT participants_pkey;
+ALTER TABLE participants ADD PRIMARY KEY (participant_id);
+ALTER TABLE participants ADD CONSTRAINT participants_name_birth_key UNIQUE (name, birth_date);
+
+-- 4. 새 출석 테이블 (회차 순으로 다시 적재해서 회차 명단이 물리적으로 모이도록)
+CREATE TABLE attendance (
+    attendance_id SERIAL PRIMARY KEY,
+    session_id INTEGER NOT NULL REFERENCES sessions (session_id),
+    participant_id INTEGER NOT NULL REFERENCES participants (participant_id),
+    attended BOOLEAN DEFAULT TRUE, payment_status TEXT,
+    CONSTRAINT attendance_session_participant_key UNIQUE (session_id, participant_id)
+);
+
+INSERT INTO attendance (attendance_id, session_id, participant_id, attended, payment_status)
+SELECT attendance_id, session_id, participant_id, attended, payment_status
+FROM attendance_old
+ORDER BY session_id, participant_id;
+
+SELECT setval(pg_get_serial_sequence('attendance', 'attendance_id'), COALESCE(MAX(attendance_id), 0) + 1, false)
+FROM attendance;
+
+-- 참가자별 방문 이력 (session_id 까지 포함해 만남 계산 시 테이블을 읽지 않음)
+CREATE INDEX attendance_participant_idx ON attendance (participant_id, session_id);
+
+-- 5. 만남 인덱스도 정수 쌍으로 (p1_id < p2_id)
+CREATE TABLE met_pairs (
+    p1_id INTEGER NOT NULL,
+    p2_id INTEGER NOT NULL,
+    first_met DATE NOT NULL, last_met DATE NOT NULL,
+    meet_count INTEGER NOT NULL,
+    PRIMARY KEY (p1_id, p2_id)
+);
+
+CREATE INDEX met_pairs_p2_idx ON met_pairs (p2_id);
+
+INSERT INTO met_pairs (p1_id, p2_id, first_met, last_met, meet_count)
+SELECT a1.participant_id, a2.participant_id,
+       MIN(s.session_date), MAX(s.session_date), COUNT(DISTINCT s.session_id)
+FROM attendance a1
+JOIN attendance a2 ON a2.session_id = a1.session_id AND a1.participant_id < a2.participant_id
+JOIN sessions s ON s.session_id = a1.session_id
+GROUP BY a1.participant_id, a2.participant_id;
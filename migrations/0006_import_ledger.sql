@@ -0,0 +1,14 @@
+-- 엑셀 임포트 장부: 시트마다 어떤 회차로 들어갔고 내용이 무엇이었는지 기록
+-- 같은 통합 문서를 다시 임포트하면 내용이 같은 시트는 건너뛰고, 바뀐 시트만 동기화합니다.
+-- 다른 파일의 같은 이름 시트는 회차 머리글(날짜/시간/진행자)까지 같을 때만 같은 회차로 봅니다.
+CREATE TABLE IF NOT EXISTS import_ledger (
+    sheet_key TEXT PRIMARY KEY,                 -- 시트 이름|날짜|시간|진행자 (database._ledger_key)
+    session_id INTEGER REFERENCES sessions (session_id) ON DELETE SET NULL,  -- 앱에서 지운 회차는 NULL
+    content_hash TEXT NOT NULL,                 -- 파싱 결과(회차 정보 + 참가자 행) 해시
+    session_date DATE NOT NULL,
+    session_time TEXT, theme TEXT, host TEXT,
+    row_count INTEGER NOT NULL,
+    imported_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS import_ledger_session_idx ON import_ledger (session_id);
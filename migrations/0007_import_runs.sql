@@ -0,0 +1,17 @@
+-- 엑셀 임포트 체크포인트: 청크 단위로 커밋하면서 어디까지 끝났는지 기록
+-- 실패/중단된 임포트를 같은 파일로 다시 실행하면 sheets_done 번째 시트부터 이어서 합니다.
+CREATE TABLE IF NOT EXISTS import_runs (
+    run_id SERIAL PRIMARY KEY,
+    file_name TEXT NOT NULL,
+    file_hash TEXT NOT NULL,                             -- 파일 내용 해시 (같은 파일인지 확인)
+    status TEXT NOT NULL DEFAULT 'running',              -- running / done / failed
+    sheets_total INTEGER NOT NULL DEFAULT 0,
+    sheets_done INTEGER NOT NULL DEFAULT 0,              -- 이 위치 앞의 시트는 모두 커밋됨
+    last_sheet TEXT,
+    pending_orphans INTEGER[] NOT NULL DEFAULT '{}',     -- 임포트가 끝나면 고아 여부를 확인할 참가자
+    error TEXT,
+    started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS import_runs_file_idx ON import_runs (file_hash, run_id DESC);
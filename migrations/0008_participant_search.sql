@@ -0,0 +1,22 @@
+-- 참가자 검색: 이름 / 닉네임 / 직업 / 전화번호(숫자만)를 소문자로 이어 붙인 생성 컬럼
+-- database.search_participants 가 search_text LIKE '%검색어%' 로 거름
+ALTER TABLE participants
+    ADD COLUMN phone_digits TEXT GENERATED ALWAYS AS (
+        regexp_replace(COALESCE(phone, ''), '[^0-9]', '', 'g')
+    ) STORED,
+    ADD COLUMN search_text TEXT GENERATED ALWAYS AS (
+        lower(name || ' ' || COALESCE(nickname, '') || ' ' || COALESCE(job, ''))
+        || ' ' || regexp_replace(COALESCE(phone, ''), '[^0-9]', '', 'g')
+    ) STORED;
+
+-- pg_trgm 이 있으면 (Supabase 등) 트라이그램 GIN 인덱스 -> 부분 일치 LIKE 도 인덱스로 찾음
+-- 확장을 설치할 수 없는 서버에서는 건너뛰고, 같은 쿼리가 search_text 순차 탐색으로 동작
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS participants_search_trgm_idx ON participants USING gin (search_text gin_trgm_ops);
+EXCEPTION WHEN OTHERS THEN
+    RAISE NOTICE 'pg_trgm 을 사용할 수 없어 트라이그램 인덱스를 건너뜁니다: %', SQLERRM;
+END
+$$;
+
@@ -0,0 +1,4 @@
+-- 회차 목록 keyset 페이지용 정렬 인덱스 (database.get_sessions_page 의 ORDER BY 와 같은 식)
+-- 시간이 비어 있어도 비교에서 빠지지 않도록 COALESCE, 같은 날짜/시간은 session_id 로 구분
+CREATE INDEX IF NOT EXISTS sessions_keyset_idx
+    ON sessions (session_date DESC, (COALESCE(session_time, '')) DESC, session_id DESC);
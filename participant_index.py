@@ -0,0 +1,363 @@
+"""
+참가자 빠른 검색 인덱스 (메모리, DB 접근 없음)
+- 한글을 자모로 분해해서 초성 검색 ("ㄱㅁㅅ" -> 김민수), 섞어 쓰기 ("김ㅁㅅ"),
+  입력 중인 마지막 글자 ("김미" -> 김민수, "안ㅈ"/"앉" -> 안지현) 까지 찾음
+- 전화번호는 숫자 n-gram 으로 앞자리/뒷자리/가운데 부분 검색
+- 역색인(n-gram -> 참가자 비트셋)으로 후보를 좁힌 뒤 실제 일치 여부를 확인
+- add / remove / update 로 한 명씩 증분 반영 (전체 재구성 불필요)
+"""
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+_SYLLABLE_BASE, _SYLLABLE_LAST = 0xAC00, 0xD7A3
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+_CHOSEONG_SET = frozenset(CHOSEONG)
+# str.translate 용 완성형 글자 -> 초성 표 (글자마다 파이썬 루프를 돌지 않도록)
+_CHOSEONG_TABLE = {code: CHOSEONG[(code - _SYLLABLE_BASE) // 588]
+                   for code in range(_SYLLABLE_BASE, _SYLLABLE_LAST + 1)}
+_NOT_DIGIT = re.compile(r'\D+')
+_JAMO = re.compile('[\u3131-\u318e]')  # 호환용 한글 자모 (ㄱ ~ ㆎ)
+# 받침이 다음 글자 초성으로 넘어갈 수 있는 경우 (입력 중 "앉" = "안" + "ㅈ...")
+_JONG_SPLIT = {"ㄳ": ("ㄱ", "ㅅ"), "ㄵ": ("ㄴ", "ㅈ"), "ㄶ": ("ㄴ", "ㅎ"), "ㄺ": ("ㄹ", "ㄱ"),
+               "ㄻ": ("ㄹ", "ㅁ"), "ㄼ": ("ㄹ", "ㅂ"), "ㄽ": ("ㄹ", "ㅅ"), "ㄾ": ("ㄹ", "ㅌ"),
+               "ㄿ": ("ㄹ", "ㅍ"), "ㅀ": ("ㄹ", "ㅎ"), "ㅄ": ("ㅂ", "ㅅ")}
+
+TEXT_GRAMS = (1, 2)
+PHONE_GRAMS = (1, 2, 3)
+
+# 관련도 (작을수록 위): 이름 일치 > 이름 앞부분 / 전화 앞뒷자리 > 닉네임 앞부분 > 이름 중간 / 전화 가운데 > 닉네임 중간 > 직업
+RANK_NAME_EXACT, RANK_NAME_PREFIX, RANK_NICK_PREFIX, RANK_NAME_PART, RANK_NICK_PART, RANK_JOB = range(6)
+
+
+# -----------------------------------------------------
+# 한글 자모
+# -----------------------------------------------------
+
+def decompose(ch: str) -> tuple:
+    """완성형 한 글자 -> (초성, 중성, 받침) / 한글이 아니면 (ch,)"""
+    code = ord(ch) - _SYLLABLE_BASE
+    if not 0 <= code <= _SYLLABLE_LAST - _SYLLABLE_BASE:
+        return (ch,)
+    return (CHOSEONG[code // 588], JUNGSEONG[code // 28 % 21], JONGSEONG[code % 28])
+
+
+def choseong(text: str) -> str:
+    """글자마다 초성으로 (한글이 아닌 글자는 그대로) - 길이가 원문과 같음"""
+    return text.translate(_CHOSEONG_TABLE)
+
+
+def has_jamo(text: str) -> bool:
+    """낱자모 (초성만 입력 등) 가 들어 있는지"""
+    return _JAMO.search(text) is not None
+
+
+def normalize(text) -> str:
+    """소문자 + 공백 제거"""
+    return "".join(str(text or "").lower().split())
+
+
+def digits_of(text) -> str:
+    return _NOT_DIGIT.sub("", str(text or ""))
+
+
+def _same(q: str, t: str) -> bool:
+    """검색어 글자 q 가 본문 글자 t 와 맞음 (초성만 입력한 경우 포함)"""
+    return q == t or (q in _CHOSEONG_SET and choseong(t) == q)
+
+
+def _last_matches(q: str, text: str, j: int) -> bool:
+    """검색어의 마지막 글자 (입력 중일 수 있음) 가 text[j] 에서 맞음"""
+    t = text[j]
+    if _same(q, t):
+        return True
+    qd, td = decompose(q), decompose(t)
+    if len(qd) < 3 or len(td) < 3:
+        return False
+    # "미" -> "민": 받침 없이 입력 중
+    if not qd[2] and qd[:2] == td[:2]:
+        return True
+    # "앉" -> "안지": 받침이 다음 글자의 초성일 수 있음
+    if qd[2] and j + 1 < len(text):
+        first, carry = _JONG_SPLIT.get(qd[2], ("", qd[2]))
+        if td == (qd[0], qd[1], first) and choseong(text[j + 1]) == carry:
+            return True
+    return False
+
+
+def match_at(text: str, query: str, i: int) -> bool:
+    """text[i:] 가 query 로 시작함 (초성 / 입력 중인 마지막 글자 허용)"""
+    n = len(query)
+    if i + n > len(text):
+        return False
+    for k in range(n - 1):
+        if not _same(query[k], text[i + k]):
+            return False
+    return _last_matches(query[-1], text, i + n - 1)
+
+
+def find(text: str, text_cho: str, query: str, query_cho: str) -> int:
+    """query 가 처음 맞는 위치 (없으면 -1)
+
+    text_cho / query_cho 는 미리 구한 초성 문자열 (초성이 안 맞으면 바로 탈락 - C 수준 검사)
+    """
+    start = text_cho.find(query_cho)
+    if start < 0:
+        return -1
+    exact = text.find(query)
+    if exact == 0:
+        return 0
+    # 그대로 일치하는 위치보다 앞에서 초성/입력 중 글자로 맞는 곳이 있는지
+    while start >= 0 and (exact < 0 or start < exact):
+        if match_at(text, query, start):
+            return start
+        start = text_cho.find(query_cho, start + 1)
+    return exact
+
+
+def _grams(text: str, sizes) -> set:
+    return {text[i:i + n] for n in sizes for i in range(len(text) - n + 1)}
+
+
+def _is_syllable(ch: str) -> bool:
+    return _SYLLABLE_BASE <= ord(ch) <= _SYLLABLE_LAST
+
+
+def _onset_vowel(ch: str) -> str:
+    """완성형 글자의 초성+중성 (예: "민" -> "ㅁㅣ") - 받침을 아직 안 쳤거나 다음 글자로 넘어가도 그대로인 부분
+
+    중성 자모가 섞여 있으므로 초성 n-gram 키와 겹치지 않음
+    """
+    code = ord(ch) - _SYLLABLE_BASE
+    return CHOSEONG[code // 588] + JUNGSEONG[code // 28 % 21]
+
+
+def _bitset(slots) -> int:
+    """슬롯 번호 목록 -> 비트셋 (int)"""
+    bits = bytearray((max(slots) >> 3) + 1)
+    for slot in slots:
+        bits[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _iter_bits(bits: int):
+    """비트셋에서 켜진 슬롯 번호 (bin 문자열을 C 수준 find 로 훑음)"""
+    text = bin(bits)
+    top = len(text) - 1
+    pos = text.find('1', 2)
+    while pos >= 0:
+        yield top - pos
+        pos = text.find('1', pos + 1)
+
+
+# -----------------------------------------------------
+# 인덱스
+# -----------------------------------------------------
+
+class _Entry:
+    """검색용으로 미리 정규화한 참가자 한 명"""
+    __slots__ = ('record', 'name', 'name_cho', 'nick', 'nick_cho', 'job', 'job_cho', 'phone')
+
+    def __init__(self, record: Dict):
+        self.record = record
+        self.name = normalize(record['name'])
+        self.nick = normalize(record.get('nickname'))
+        self.job = normalize(record.get('job'))
+        self.name_cho, self.nick_cho, self.job_cho = choseong(self.name), choseong(self.nick), choseong(self.job)
+        self.phone = digits_of(record.get('phone'))
+
+    def text_keys(self) -> set:
+        """초성 1~2-gram + 완성 글자 + 글자별 초성+중성 (이름 / 닉네임 / 직업)"""
+        keys = set()
+        for text, cho in ((self.name, self.name_cho), (self.nick, self.nick_cho), (self.job, self.job_cho)):
+            keys |= _grams(cho, TEXT_GRAMS)
+            for ch in text:
+                if _is_syllable(ch):
+                    keys.add(ch)
+                    keys.add(_onset_vowel(ch))
+        return keys
+
+    def phone_keys(self) -> set:
+        return _grams(self.phone, PHONE_GRAMS)
+
+
+class ParticipantIndex:
+    """참가자 검색 인덱스 (키: (name, birth_date), 값: 넘겨받은 dict 그대로)
+
+    역색인은 n-gram -> 비트셋(int, 비트 번호 = 슬롯) 이라 교집합이 & 한 번이고,
+    사람마다 집합 원소를 들고 있지 않아 수만 명도 메모리가 작습니다.
+    """
+
+    def __init__(self, participants: Iterable[Dict] = ()):
+        self._entries = []   # 슬롯 번호 -> _Entry (삭제된 슬롯은 None)
+        self._free = []      # 재사용할 빈 슬롯
+        self._slots = {}     # (name, birth_date) -> 슬롯 번호
+        self._text = {}      # 초성 1~2-gram / 완성 글자 -> 비트셋
+        self._phone = {}     # 전화번호 숫자 1~3-gram -> 비트셋
+
+        # 처음 만들 때는 n-gram 별 슬롯 목록을 모아서 비트셋을 한 번에 만듦
+        text, phone = defaultdict(list), defaultdict(list)
+        for record in participants:
+            key = (record['name'], record['birth_date'])
+            if key in self._slots:
+                continue
+            entry = _Entry(record)
+            slot = len(self._entries)
+            self._entries.append(entry)
+            self._slots[key] = slot
+            for gram in entry.text_keys():
+                text[gram].append(slot)
+            for gram in entry.phone_keys():
+                phone[gram].append(slot)
+        self._text = {gram: _bitset(slots) for gram, slots in text.items()}
+        self._phone = {gram: _bitset(slots) for gram, slots in phone.items()}
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    # -----------------------------------------------------
+    # 증분 갱신
+    # -----------------------------------------------------
+
+    def add(self, record: Dict):
+        """참가자 추가 (이미 있으면 교체)"""
+        key = (record['name'], record['birth_date'])
+        if key in self._slots:
+            self.remove(*key)
+        entry = _Entry(record)
+        slot = self._free.pop() if self._free else len(self._entries)
+        if slot == len(self._entries):
+            self._entries.append(entry)
+        else:
+            self._entries[slot] = entry
+        self._slots[key] = slot
+        bit = 1 << slot
+        for index, grams in ((self._text, entry.text_keys()), (self._phone, entry.phone_keys())):
+            for gram in grams:
+                index[gram] = index.get(gram, 0) | bit
+
+    def remove(self, name: str, birth_date: str):
+        """참가자 삭제 (없으면 무시)"""
+        slot = self._slots.pop((name, birth_date), None)
+        if slot is None:
+            return
+        entry = self._entries[slot]
+        mask = ~(1 << slot)
+        for index, grams in ((self._text, entry.text_keys()), (self._phone, entry.phone_keys())):
+            for gram in grams:
+                bits = index[gram] & mask
+                if bits:
+                    index[gram] = bits
+                else:
+                    del index[gram]
+        self._entries[slot] = None
+        self._free.append(slot)
+
+    def update(self, name: str, birth_date: str, **fields):
+        """참가자 필드 변경 (메모처럼 검색 키가 아닌 필드는 dict 만 바꿈)"""
+        slot = self._slots.get((name, birth_date))
+        if slot is None:
+            return
+        record = dict(self._entries[slot].record, **fields)
+        if any(f in fields for f in ('name', 'birth_date', 'nickname', 'job', 'phone')):
+            self.remove(name, birth_date)
+            self.add(record)
+        else:
+            self._entries[slot].record = record
+
+    def get(self, name: str, birth_date: str):
+        slot = self._slots.get((name, birth_date))
+        return None if slot is None else self._entries[slot].record
+
+    # -----------------------------------------------------
+    # 검색
+    # -----------------------------------------------------
+
+    def search(self, query: str, limit: int = None) -> List[Dict]:
+        """관련도순 검색 결과 (각 dict 에 'rank' 추가한 사본), 검색어가 비면 []"""
+        ranked = self._ranked(query)
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [dict(record, rank=rank) for rank, record in ranked]
+
+    def page(self, query: str, limit: int, offset: int = 0) -> tuple:
+        """(전체 결과 수, offset 부터 limit 개) - 한 번만 검색"""
+        ranked = self._ranked(query)
+        return len(ranked), [dict(record, rank=rank) for rank, record in ranked[offset:offset + limit]]
+
+    def _ranked(self, query: str) -> list:
+        q = normalize(query)
+        if not q:
+            return []
+        digits = digits_of(q)
+        if digits and len(digits) == len(q.replace("-", "")):  # 숫자와 하이픈만 -> 전화번호
+            hits = self._phone_hits(digits)
+        else:
+            hits = self._text_hits(q)
+        hits.sort(key=lambda h: (h[0], h[1]['name'], h[1]['birth_date']))
+        return hits
+
+    @staticmethod
+    def _candidates(index, grams) -> int:
+        """n-gram 비트셋의 교집합 (작은 것부터)"""
+        postings = []
+        for gram in grams:
+            bits = index.get(gram)
+            if not bits:
+                return 0
+            postings.append(bits)
+        postings.sort(key=int.bit_count)
+        result = postings[0]
+        for bits in postings[1:]:
+            result &= bits
+            if not result:
+                break
+        return result
+
+    def _phone_hits(self, digits: str) -> list:
+        n = min(len(digits), max(PHONE_GRAMS))
+        hits = []
+        for slot in _iter_bits(self._candidates(self._phone, _grams(digits, (n,)))):
+            entry = self._entries[slot]
+            pos = entry.phone.find(digits)
+            if pos < 0:
+                continue
+            edge = pos == 0 or pos + len(digits) == len(entry.phone)  # 앞자리 / 뒷자리
+            hits.append((RANK_NAME_PREFIX if edge else RANK_NAME_PART, entry.record))
+        return hits
+
+    def _text_hits(self, q: str) -> list:
+        q_cho = choseong(q)
+        # 초성은 입력 중이어도 확정 -> 초성 n-gram, 마지막 글자를 뺀 완성 글자,
+        # 마지막 글자는 입력 중일 수 있으므로 초성+중성으로만 좁힘
+        grams = _grams(q_cho, (min(len(q_cho), max(TEXT_GRAMS)),))
+        grams.update(ch for ch in q[:-1] if _is_syllable(ch))
+        if _is_syllable(q[-1]):
+            grams.add(_onset_vowel(q[-1]))
+
+        hits = []
+        for slot in _iter_bits(self._candidates(self._text, grams)):
+            entry = self._entries[slot]
+            pos = find(entry.name, entry.name_cho, q, q_cho)
+            if pos == 0:
+                rank = RANK_NAME_EXACT if q == entry.name else RANK_NAME_PREFIX
+            elif pos > 0:
+                rank = RANK_NAME_PART
+            else:
+                pos = find(entry.nick, entry.nick_cho, q, q_cho)
+                if pos == 0:
+                    rank = RANK_NICK_PREFIX
+                elif pos > 0:
+                    rank = RANK_NICK_PART
+                elif find(entry.job, entry.job_cho, q, q_cho) >= 0:
+                    rank = RANK_JOB
+                else:
+                    continue
+            hits.append((rank, entry.record))
+        return hits
@@ -0,0 +1,132 @@
+"""
+추천 점수 계산 (NumPy, DB 접근 없음)
+- 후보의 특징(출생년도, MBTI 4축, 방문 횟수, 최근 방문, 사는곳, 등록경로)을 배열로 한 번 읽고
+  이번 회차 명단과의 궁합 점수를 한 번에 계산 (후보마다 파이썬 루프를 돌지 않음)
+- 상위 k 명은 argpartition 으로 부분 정렬 (k 명만 정렬)
+
+점수 (0~100) = 항목별 점수(0~1)의 가중 평균
+  age      : 명단 이성의 출생년도 중앙값과 가까울수록 (AGE_SPREAD 년 차이면 약 0.37)
+  mbti     : 명단 이성의 MBTI 축 평균과 같은 쪽일수록 (모르면 0.5)
+  recency  : 최근에 왔을수록 (RECENCY_DAYS 일 전이면 약 0.37, 방문 기록 없으면 0)
+  visits   : 방문 횟수 (로그 스케일, 후보 중 최다 방문자가 1)
+  location : 명단 중 사는곳이 같은 사람 비율
+  route    : 명단 중 등록경로가 같은 사람 비율
+"""
+from collections import Counter
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+WEIGHTS = {'age': 0.30, 'mbti': 0.20, 'recency': 0.20, 'visits': 0.10, 'location': 0.15, 'route': 0.05}
+AGE_SPREAD = 4.0
+RECENCY_DAYS = 180.0
+
+# MBTI 축: 첫 글자면 +1, 두 번째 글자면 -1, 모르면 0
+MBTI_AXES = ("EI", "SN", "TF", "JP")
+
+
+def _per_unique(values, parse, missing) -> np.ndarray:
+    """고유값만 parse 해서 코드로 펼침 (날짜 / MBTI / 지역처럼 값 종류가 적은 열은 행마다 해석하지 않음)"""
+    codes, uniques = pd.factorize(pd.Series(values))
+    table = np.array([parse(u) for u in uniques] + [missing], dtype=float)
+    return table[codes]  # 코드 -1 (빈 값) -> 마지막 행
+
+
+def _mbti_row(text) -> list:
+    text = str(text).upper()
+    return [1.0 if plus in text else -1.0 if minus in text else 0.0 for plus, minus in MBTI_AXES]
+
+
+def mbti_axes(values) -> np.ndarray:
+    """MBTI 열 -> (n, 4) 배열"""
+    return _per_unique(values, _mbti_row, [0.0] * len(MBTI_AXES))
+
+
+def _year(text) -> float:
+    head = str(text)[:4]
+    return float(head) if head.isdigit() else np.nan
+
+
+def birth_years(birth_dates) -> np.ndarray:
+    """'YYYY-MM-DD' 열 -> 출생년도 float 배열 (알 수 없으면 NaN)"""
+    return _per_unique(birth_dates, _year, np.nan)
+
+
+def days_since(dates, today: date) -> np.ndarray:
+    """'YYYY-MM-DD' 열 -> 오늘까지 일수 (없으면 NaN)"""
+    def days(text):
+        try:
+            return (today - date.fromisoformat(str(text))).days
+        except ValueError:
+            return np.nan
+    return _per_unique(dates, days, np.nan)
+
+
+def shares(values, roster_values) -> np.ndarray:
+    """후보마다 명단 중 같은 값을 가진 사람 비율 (빈 값은 0)"""
+    roster = [v for v in roster_values if isinstance(v, str) and v]
+    if not roster:
+        return np.zeros(len(values))
+    ratio = {value: count / len(roster) for value, count in Counter(roster).items()}
+    return _per_unique(values, lambda u: ratio.get(u, 0.0), 0.0)
+
+
+def score(candidates: pd.DataFrame, roster: pd.DataFrame, gender: str,
+          weights: dict = None, today: date = None) -> np.ndarray:
+    """후보별 궁합 점수 (0~100) 배열 - candidates 의 행 순서와 같음
+
+    candidates: birth_date, mbti, visit_count, last_visit, location, signup_route 열
+    roster    : 이번 회차 명단 (gender, birth_date, mbti, location, signup_route 열)
+    gender    : 후보의 성별 (나이 / MBTI 는 명단의 이성과 비교, 이성이 없으면 명단 전체)
+    """
+    weights = weights or WEIGHTS
+    today = today or date.today()
+    n = len(candidates)
+    if n == 0:
+        return np.zeros(0)
+
+    partners = roster[roster['gender'].astype(object) != gender] if len(roster) else roster
+    if partners.empty:
+        partners = roster
+    parts = {}
+
+    # 나이: 이성 출생년도 중앙값과의 차이
+    years = birth_years(candidates['birth_date'])
+    partner_years = birth_years(partners['birth_date']) if len(partners) else np.empty(0)
+    if np.isfinite(partner_years).any():
+        gap = (years - np.nanmedian(partner_years)) / AGE_SPREAD
+        parts['age'] = np.where(np.isnan(gap), 0.5, np.exp(-gap * gap))
+    else:
+        parts['age'] = np.full(n, 0.5)
+
+    # MBTI: 이성의 축 평균과 내적 (-4~4 -> 0~1)
+    if len(partners):
+        parts['mbti'] = 0.5 + mbti_axes(candidates['mbti']) @ mbti_axes(partners['mbti']).mean(axis=0) / 8.0
+    else:
+        parts['mbti'] = np.full(n, 0.5)
+
+    # 방문: 최근성 / 횟수
+    days = days_since(candidates['last_visit'], today)
+    parts['recency'] = np.where(np.isnan(days), 0.0, np.exp(-np.clip(days, 0, None) / RECENCY_DAYS))
+    visits = np.log1p(candidates['visit_count'].to_numpy(float))
+    top = visits.max()
+    parts['visits'] = visits / top if top > 0 else np.zeros(n)
+
+    # 사는곳 / 등록경로: 명단 전체와 같은 비율
+    parts['location'] = shares(candidates['location'], roster['location'] if len(roster) else [])
+    parts['route'] = shares(candidates['signup_route'], roster['signup_route'] if len(roster) else [])
+
+    total = sum(weights.values())
+    return sum(weights[name] * parts[name] for name in weights) / total * 100.0
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """점수 높은 순 상위 k 개의 위치 (k 개만 정렬, 나머지는 argpartition 으로 걸러냄)"""
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.zeros(0, dtype=int)
+    if k >= n:
+        return np.argsort(-scores, kind='stable')
+    head = np.argpartition(-scores, k - 1)[:k]
+    return head[np.argsort(-scores[head], kind='stable')]
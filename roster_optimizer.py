@@ -0,0 +1,293 @@
+"""
+회차 편성 (메모리, DB 접근 없음)
+- 참가 가능한 사람(pool)을 '준비중' 회차 여러 개에 나눠 배정
+- 회차마다 남녀 각 per_gender 명 (이미 명단에 있는 사람은 그대로 두고 빈자리만 채움)
+- 이미 만난 적 있는 쌍이 같은 회차에 들어가지 않도록, 회차 안 나이 차이는 작게
+
+1) 탐욕 배정: 회차를 돌아가며 남녀 한 자리씩, 비용이 가장 적게 느는 사람으로 채움
+2) 지역 탐색: 같은 성별끼리 회차 간 맞바꾸기 / 대기 인원과 맞바꾸기 중 비용이 주는 것을
+   더 이상 없을 때까지 반영
+3) 더 나아지지 않으면 몇 명을 무작위로 맞바꿔 흔든 뒤 2) 를 다시 - 가장 좋았던 배정을 유지
+   (time_limit 까지, 또는 KICK_PATIENCE 번 연속으로 나아지지 않으면 끝)
+
+비용 = MET_WEIGHT x (회차 안 이미 만난 쌍 수) + AGE_WEIGHT x (회차 안 출생년도 분산)
+만남 여부는 참가자 번호를 0..n-1 로 다시 매겨 사람마다 '만난 사람 비트셋(int)'으로 들고,
+회차 명단도 비트셋이라 한 사람이 회차에서 몇 명과 만났는지가 popcount 한 번입니다.
+"""
+import random
+import time
+from typing import Dict, Iterable, List
+
+PER_GENDER = 6
+MET_WEIGHT = 20.0
+AGE_WEIGHT = 1.0
+TIME_LIMIT = 5.0  # 지역 탐색 최대 시간 (초)
+KICK_SWAPS = 3      # 한 번 흔들 때 무작위 맞바꾸기 수
+KICK_PATIENCE = 30  # 연속으로 나아지지 않으면 탐색 종료
+GENDERS = ('M', 'F')
+
+
+def _birth_year(person: Dict):
+    year = person.get('birth_year')
+    if year is None:
+        head = str(person.get('birth_date') or "")[:4]
+        year = int(head) if head.isdigit() else None
+    return year
+
+
+class _Plan:
+    """탐색 중인 배정 상태 (사람 = 0..n-1 번호, 회차 = 0..m-1 번호)"""
+
+    def __init__(self, people: List[Dict], sessions: List[Dict], met_pairs: Iterable, per_gender: int):
+        fixed = [[p for p in s.get('members', [])] for s in sessions]
+        fixed_ids = {p['participant_id'] for members in fixed for p in members}
+        pool = [p for p in people if p['participant_id'] not in fixed_ids]
+
+        self.people = [p for members in fixed for p in members] + pool
+        self.index = {p['participant_id']: i for i, p in enumerate(self.people)}
+        self.gender = [p['gender'] for p in self.people]
+        years = [_birth_year(p) for p in self.people]
+        known = sorted(y for y in years if y is not None)
+        middle = known[len(known) // 2] if known else 0
+        self.year = [float(middle if y is None else y) for y in years]
+
+        self.met = [0] * len(self.people)
+        for a, b in met_pairs:
+            i, j = self.index.get(a), self.index.get(b)
+            if i is not None and j is not None and i != j:
+                self.met[i] |= 1 << j
+                self.met[j] |= 1 << i
+
+        self.session_ids = [s['session_id'] for s in sessions]
+        self.mask = [0] * len(sessions)           # 회차 명단 비트셋
+        self.members = [[] for _ in sessions]     # 회차 명단 (번호)
+        self.movable = [[] for _ in sessions]     # 이번에 배정한 사람 (맞바꾸기 대상)
+        self.total = [0.0] * len(sessions)        # 출생년도 합
+        self.square = [0.0] * len(sessions)       # 출생년도 제곱 합
+        self.where = [None] * len(self.people)    # 사람 -> 회차 번호 (대기는 None)
+        self.open = [{g: per_gender for g in GENDERS} for _ in sessions]
+
+        for s, members in enumerate(fixed):
+            for p in members:
+                i = self.index[p['participant_id']]
+                self._place(s, i)
+                if self.gender[i] in self.open[s]:
+                    self.open[s][self.gender[i]] = max(0, self.open[s][self.gender[i]] - 1)
+        self.bench = {g: [i for i in range(len(fixed_ids), len(self.people)) if self.gender[i] == g]
+                      for g in GENDERS}
+
+    # -----------------------------------------------------
+    # 명단 변경
+    # -----------------------------------------------------
+
+    def _place(self, s: int, i: int):
+        self.mask[s] |= 1 << i
+        self.members[s].append(i)
+        self.total[s] += self.year[i]
+        self.square[s] += self.year[i] ** 2
+        self.where[i] = s
+
+    def assign(self, s: int, i: int):
+        self._place(s, i)
+        self.movable[s].append(i)
+        self.bench[self.gender[i]].remove(i)
+
+    def _replace(self, s: int, old: int, new: int):
+        self.mask[s] = self.mask[s] & ~(1 << old) | 1 << new
+        self.members[s][self.members[s].index(old)] = new
+        self.movable[s][self.movable[s].index(old)] = new
+        self.total[s] += self.year[new] - self.year[old]
+        self.square[s] += self.year[new] ** 2 - self.year[old] ** 2
+        self.where[new], self.where[old] = s, None
+
+    # -----------------------------------------------------
+    # 비용
+    # -----------------------------------------------------
+
+    def _age_cost(self, s: int, total: float, square: float, size: int) -> float:
+        return (square - total * total / size) / size if size else 0.0
+
+    def session_cost(self, s: int) -> float:
+        met = sum((self.met[i] & self.mask[s]).bit_count() for i in self.members[s]) // 2
+        return MET_WEIGHT * met + AGE_WEIGHT * self._age_cost(s, self.total[s], self.square[s], len(self.members[s]))
+
+    def add_delta(self, s: int, i: int) -> float:
+        """회차 s 에 i 를 더할 때 비용 변화"""
+        size = len(self.members[s])
+        before = self._age_cost(s, self.total[s], self.square[s], size)
+        after = self._age_cost(s, self.total[s] + self.year[i], self.square[s] + self.year[i] ** 2, size + 1)
+        return MET_WEIGHT * (self.met[i] & self.mask[s]).bit_count() + AGE_WEIGHT * (after - before)
+
+    def replace_delta(self, s: int, old: int, new: int) -> float:
+        """회차 s 에서 old 를 new 로 바꿀 때 비용 변화"""
+        others = self.mask[s] & ~(1 << old)
+        met = (self.met[new] & others).bit_count() - (self.met[old] & others).bit_count()
+        size = len(self.members[s])
+        total = self.total[s] + self.year[new] - self.year[old]
+        square = self.square[s] + self.year[new] ** 2 - self.year[old] ** 2
+        age = self._age_cost(s, total, square, size) - self._age_cost(s, self.total[s], self.square[s], size)
+        return MET_WEIGHT * met + AGE_WEIGHT * age
+
+    # -----------------------------------------------------
+    # 1) 탐욕 배정 / 2) 지역 탐색 / 3) 흔들기
+    # -----------------------------------------------------
+
+    def greedy(self):
+        while True:
+            placed = False
+            for s in range(len(self.session_ids)):
+                for g in GENDERS:
+                    if self.open[s][g] and self.bench[g]:
+                        self.assign(s, min(self.bench[g], key=lambda i: self.add_delta(s, i)))
+                        self.open[s][g] -= 1
+                        placed = True
+            if not placed:
+                return
+
+    def _swap(self, s: int, i: int, t, j: int):
+        """회차 s 의 i 와 (t 가 None 이면 대기 인원, 아니면 회차 t 의) j 를 맞바꿈"""
+        if t is None:
+            bench = self.bench[self.gender[i]]
+            bench[bench.index(j)] = i
+            self._replace(s, i, j)
+        else:
+            self._replace(s, i, j)
+            self._replace(t, j, i)
+            self.where[i], self.where[j] = t, s
+
+    def _swap_delta(self, s: int, i: int, t, j: int) -> float:
+        delta = self.replace_delta(s, i, j)
+        return delta if t is None else delta + self.replace_delta(t, j, i)
+
+    def _partners(self, s: int, i: int):
+        """i 와 맞바꿀 수 있는 (회차 또는 None, 사람) - 같은 성별의 대기 인원 / 다른 회차의 배정 인원"""
+        for j in self.bench[self.gender[i]]:
+            yield None, j
+        for t in range(len(self.session_ids)):
+            if t != s:
+                for j in self.movable[t]:
+                    if self.gender[j] == self.gender[i]:
+                        yield t, j
+
+    def climb(self, rng: random.Random, deadline: float) -> int:
+        """비용이 주는 맞바꾸기를 더 이상 없을 때까지 반영, 반영한 횟수 반환"""
+        moves = 0
+        improved = True
+        while improved and time.perf_counter() < deadline:
+            improved = False
+            slots = [(s, i) for s in range(len(self.session_ids)) for i in self.movable[s]]
+            rng.shuffle(slots)
+            for s, i in slots:
+                if self.where[i] != s:
+                    continue  # 이번 패스에서 이미 옮겨진 사람
+                best, best_delta = None, -1e-9
+                for t, j in self._partners(s, i):
+                    delta = self._swap_delta(s, i, t, j)
+                    if delta < best_delta:
+                        best, best_delta = (t, j), delta
+                if best is not None:
+                    self._swap(s, i, *best)
+                    moves += 1
+                    improved = True
+        return moves
+
+    def kick(self, rng: random.Random):
+        """무작위 맞바꾸기 KICK_SWAPS 번 (지역 최적해에서 벗어나기)"""
+        slots = [(s, i) for s in range(len(self.session_ids)) for i in self.movable[s]]
+        for s, i in rng.sample(slots, min(KICK_SWAPS, len(slots))):
+            if self.where[i] == s:
+                partners = list(self._partners(s, i))
+                if partners:
+                    self._swap(s, i, *rng.choice(partners))
+
+    def cost(self) -> float:
+        return sum(self.session_cost(s) for s in range(len(self.session_ids)))
+
+    def snapshot(self) -> tuple:
+        return (list(self.mask), [list(m) for m in self.members], [list(m) for m in self.movable],
+                list(self.total), list(self.square), list(self.where), {g: list(b) for g, b in self.bench.items()})
+
+    def restore(self, state: tuple):
+        (self.mask, self.members, self.movable, self.total, self.square, self.where, self.bench) = state
+
+    def search(self, rng: random.Random, deadline: float) -> int:
+        """지역 탐색 + 흔들기 반복, 가장 좋았던 배정으로 끝냄 / 반영한 맞바꾸기 횟수 반환"""
+        moves = self.climb(rng, deadline)
+        best, best_cost = self.snapshot(), self.cost()
+        stale = 0
+        while stale < KICK_PATIENCE and time.perf_counter() < deadline:
+            self.kick(rng)
+            moves += self.climb(rng, deadline)
+            cost = self.cost()
+            if cost < best_cost - 1e-9:
+                best, best_cost, stale = self.snapshot(), cost, 0
+            else:
+                self.restore(best)
+                best = self.snapshot()
+                stale += 1
+        self.restore(best)
+        return moves
+
+    def rosters(self) -> Dict[int, List[int]]:
+        return {sid: [self.people[i]['participant_id'] for i in self.members[s]]
+                for s, sid in enumerate(self.session_ids)}
+
+
+def plan_rosters(people: List[Dict], sessions: List[Dict], met_pairs: Iterable,
+                 per_gender: int = PER_GENDER, seed: int = 0, time_limit: float = TIME_LIMIT,
+                 local_search: bool = True) -> Dict:
+    """참가 가능한 사람들을 회차에 배정
+
+    people    : 배정할 사람 [{'participant_id', 'gender', 'birth_date' 또는 'birth_year'}, ...]
+    sessions  : [{'session_id', 'members': [이미 명단에 있는 사람, ...]}, ...] (members 는 그대로 유지)
+    met_pairs : 이미 만난 (participant_id, participant_id) 쌍
+    반환      : {'rosters': {session_id: [participant_id, ...]}, 'added': {session_id: [...]},
+                 'unassigned': [...], 'moves': 지역 탐색 반영 횟수}
+    """
+    plan = _Plan(people, sessions, met_pairs, per_gender)
+    plan.greedy()
+    moves = 0
+    if local_search:
+        moves = plan.search(random.Random(seed), time.perf_counter() + time_limit)
+    return {
+        'rosters': plan.rosters(),
+        'added': {sid: [plan.people[i]['participant_id'] for i in plan.movable[s]]
+                  for s, sid in enumerate(plan.session_ids)},
+        'unassigned': [plan.people[i]['participant_id'] for g in GENDERS for i in plan.bench[g]],
+        'moves': moves,
+    }
+
+
+def evaluate(rosters: Dict[int, List[int]], people: List[Dict], met_pairs: Iterable,
+             per_gender: int = PER_GENDER) -> Dict:
+    """편성 품질 지표
+
+    회차별 {'men', 'women', 'repeat_pairs', 'age_range', 'age_std'} 와 전체 합계/평균
+    (repeat_pairs: 같은 회차에 이미 만난 쌍 수, full: 남녀 모두 정원을 채운 회차 수)
+    """
+    by_id = {p['participant_id']: p for p in people}
+    met = set()
+    for a, b in met_pairs:
+        met.add((a, b) if a < b else (b, a))
+    sessions = {}
+    for sid, ids in rosters.items():
+        genders = [by_id[i]['gender'] for i in ids]
+        years = [y for y in (_birth_year(by_id[i]) for i in ids) if y is not None]
+        mean = sum(years) / len(years) if years else 0.0
+        ordered = sorted(ids)
+        sessions[sid] = {
+            'men': genders.count('M'),
+            'women': genders.count('F'),
+            'repeat_pairs': sum((a, b) in met for k, a in enumerate(ordered) for b in ordered[k + 1:]),
+            'age_range': max(years) - min(years) if years else 0,
+            'age_std': (sum((y - mean) ** 2 for y in years) / len(years)) ** 0.5 if years else 0.0,
+        }
+    count = len(sessions) or 1
+    return {
+        'sessions': sessions,
+        'repeat_pairs': sum(s['repeat_pairs'] for s in sessions.values()),
+        'full': sum(s['men'] >= per_gender and s['women'] >= per_gender for s in sessions.values()),
+        'balanced': sum(s['men'] == s['women'] for s in sessions.values()),
+        'age_range': sum(s['age_range'] for s in sessions.values()) / count,
+        'age_std': sum(s['age_std'] for s in sessions.values()) / count,
+    }
@@ -0,0 +1,153 @@
+"""
+로테이션 (라운드별 자리) 편성 (메모리, DB 접근 없음)
+- 인원이 적은 성별이 테이블에 앉아 있고 (같으면 여자), 많은 쪽이 라운드마다 자리를 옮김
+- 남녀 모든 쌍이 한 번씩 같은 테이블에 앉도록 (이미 다른 회차에서 만난 쌍은 같은 테이블에 앉히지 않음)
+- 테이블마다 옮겨 오는 사람 수는 많아야 1명 차이 (예: 남 7 / 여 5 -> 2, 2, 1, 1, 1)
+- 라운드마다 '옮기는 사람 -> 테이블' 을 자리 수가 있는 이분 매칭(증가 경로)으로 정함
+  아직 만날 사람이 많이 남은 사람 / 테이블부터 채워서 라운드 수를 앉아 있는 쪽 인원 수에 맞춤
+- 진행 중에 누가 빠지면 진행한 라운드는 그대로 두고 남은 라운드만 다시 만듦 (reschedule)
+
+사람은 (이름, 생년월일) 처럼 해시 가능한 값이면 무엇이든 됩니다.
+"""
+from typing import Dict, Iterable, List
+
+
+def _pair_set(met_pairs: Iterable) -> set:
+    return {frozenset(pair) for pair in met_pairs}
+
+
+def _seat_round(needs: List[set], hosts: int) -> List[List[int]]:
+    """한 라운드 배정: needs[g] = 손님 g 가 아직 앉아야 하는 테이블 번호들 -> 테이블별 손님 번호 목록"""
+    active = [g for g, need in enumerate(needs) if need]
+    if not active:
+        return [[] for _ in range(hosts)]
+
+    # 테이블 자리: 모두 floor, 남는 자리는 아직 만날 사람이 많이 남은 테이블에 (많아야 1명 차이)
+    demand = [0] * hosts
+    for g in active:
+        for t in needs[g]:
+            demand[t] += 1
+    base, extra = divmod(len(active), hosts)
+    capacity = [base] * hosts
+    for t in sorted(range(hosts), key=lambda t: -demand[t])[:extra]:
+        capacity[t] += 1
+
+    seated = [[] for _ in range(hosts)]
+    table_of = {}
+
+    def augment(g, seen):
+        # 테이블 후보도 만날 사람이 많이 남은 곳부터
+        for t in sorted(needs[g], key=lambda t: -demand[t]):
+            if t in seen:
+                continue
+            seen.add(t)
+            if len(seated[t]) < capacity[t]:
+                seated[t].append(g)
+                table_of[g] = t
+                return True
+            for other in seated[t]:
+                if augment(other, seen):
+                    seated[t].remove(other)
+                    seated[t].append(g)
+                    table_of[g] = t
+                    return True
+        return False
+
+    # 남은 만남이 많은 사람부터 (마지막 라운드까지 밀리지 않도록)
+    for g in sorted(active, key=lambda g: -len(needs[g])):
+        augment(g, set())
+    # 자리가 남은 테이블이 있으면 쉬는 사람 중 앉을 수 있는 사람을 더 앉힘 (자리 수 제한만 풀고 한 번 더)
+    resting = [g for g in active if g not in table_of]
+    if resting:
+        capacity = [max(c, base + 1) for c in capacity]
+        for g in resting:
+            augment(g, set())
+    return seated
+
+
+def _plan(hosts: List, guests: List, met: set, played: List[Dict] = ()) -> Dict:
+    needs = [{t for t, host in enumerate(hosts) if frozenset((guest, host)) not in met} for guest in guests]
+    rounds = []
+    # 안전장치: 한 라운드에 한 쌍도 못 앉히면 멈춤 (라운드 수는 보통 len(hosts))
+    while any(needs):
+        seated = _seat_round(needs, len(hosts))
+        if not any(seated):
+            break
+        for t, table in enumerate(seated):
+            for g in table:
+                needs[g].discard(t)
+        busy = {g for table in seated for g in table}
+        rounds.append({'tables': [(hosts[t], [guests[g] for g in table]) for t, table in enumerate(seated)],
+                       'resting': [guest for g, guest in enumerate(guests) if g not in busy]})
+    return {
+        'hosts': list(hosts),
+        'guests': list(guests),
+        'rounds': list(played) + rounds,
+        'played': len(played),
+        'missing': [(guest, hosts[t]) for guest, need in zip(guests, needs) for t in sorted(need)],
+        'skipped': [(guest, host) for guest in guests for host in hosts if frozenset((guest, host)) in met],
+    }
+
+
+def _sides(men: List, women: List) -> tuple:
+    """(앉아 있는 쪽, 옮기는 쪽, 앉아 있는 쪽 성별) - 인원이 적은 쪽이 앉음 (같으면 여자)"""
+    return (men, women, 'M') if len(men) < len(women) else (women, men, 'F')
+
+
+def schedule(men: List, women: List, met_pairs: Iterable = ()) -> Dict:
+    """라운드별 자리 편성
+
+    met_pairs: 이미 만난 (사람, 사람) 쌍 - 같은 테이블에 앉히지 않음
+    반환: {'hosts': 앉아 있는 사람 (테이블 순), 'guests': 옮기는 사람, 'host_gender': 앉아 있는 쪽 ('M'/'F'),
+           'rounds': [{'tables': [(앉아 있는 사람, [옮겨 온 사람, ...]), ...], 'resting': [쉬는 사람, ...]}, ...],
+           'played': 진행한 라운드 수, 'missing': 못 만나게 된 쌍, 'skipped': 이미 만나서 뺀 쌍}
+    """
+    hosts, guests, host_gender = _sides(list(men), list(women))
+    if not hosts or not guests:
+        return {'hosts': hosts, 'guests': guests, 'host_gender': host_gender,
+                'rounds': [], 'played': 0, 'missing': [], 'skipped': []}
+    return dict(_plan(hosts, guests, _pair_set(met_pairs)), host_gender=host_gender)
+
+
+def reschedule(previous: Dict, played: int, men: List, women: List, met_pairs: Iterable = ()) -> Dict:
+    """진행한 played 라운드는 그대로 두고 지금 명단(누가 빠졌거나 들어옴)으로 남은 라운드를 다시 편성
+
+    진행한 라운드에서 이미 만난 쌍은 다시 앉히지 않고, 남아 있는 테이블은 번호(순서)를 유지합니다.
+    """
+    done = previous['rounds'][:max(0, played)]
+    met = _pair_set(met_pairs)
+    for round_ in done:
+        for host, table in round_['tables']:
+            met.update(frozenset((host, guest)) for guest in table)
+    hosts, guests, host_gender = _sides(list(men), list(women))
+    if not hosts or not guests:
+        return {'hosts': hosts, 'guests': guests, 'host_gender': host_gender,
+                'rounds': done, 'played': len(done), 'missing': [], 'skipped': []}
+    # 기존 테이블 순서 유지, 새로 앉는 사람은 뒤에
+    present = set(hosts)
+    ordered = [h for h in previous['hosts'] if h in present]
+    hosts = ordered + [h for h in hosts if h not in set(ordered)]
+    plan = _plan(hosts, guests, met, done)
+    history = _pair_set(met_pairs)  # 진행한 라운드에서 만난 쌍은 '이미 만난 쌍' 목록에서 뺌
+    plan['skipped'] = [(g, h) for g, h in plan['skipped'] if frozenset((g, h)) in history]
+    return dict(plan, host_gender=host_gender)
+
+
+def table_rows(plan: Dict, name=str) -> List[tuple]:
+    """화면 표시용: [(행 이름, [라운드별 칸, ...]), ...] - 테이블(앉아 있는 사람)마다 한 행 + 마지막에 '휴식' 행
+
+    name: 사람 -> 표시 이름 (예: lambda key: key[0])
+    """
+    hosts = list(plan['hosts'])
+    for round_ in plan['rounds']:  # 진행한 라운드에만 있던 테이블 (그 뒤에 빠진 사람)
+        hosts += [host for host, _ in round_['tables'] if host not in hosts]
+    rows = []
+    for number, host in enumerate(hosts, 1):
+        cells = []
+        for round_ in plan['rounds']:
+            table = dict(round_['tables']).get(host)
+            cells.append("-" if table is None else ", ".join(name(guest) for guest in table))
+        rows.append((f"{number}번 {name(host)}", cells))
+    if any(round_['resting'] for round_ in plan['rounds']):
+        rows.append(("휴식", [", ".join(name(guest) for guest in round_['resting']) for round_ in plan['rounds']]))
+    return rows
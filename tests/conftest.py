@@ -0,0 +1,8 @@
+"""
+테스트 공용 설정 - 저장소 루트의 모듈(db_pool, database 등)을 바로 import
+DB 서버 없이 돌아가도록 커넥션 / 커서가 필요한 곳은 테스트마다 가짜 객체를 씁니다.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,124 @@
+"""
+database 캐시 버전 테스트 - 범위(scope)를 무효화하면 그 범위를 키에 넣은 조회만 바뀌는지
+"""
+from contextlib import contextmanager
+
+import database as db
+
+
+class ScriptedCursor:
+    """SELECT 마다 준비해 둔 결과를 차례로 돌려주는 가짜 커서"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.current = None
+        self.executed = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+        if sql.lstrip().startswith("SELECT"):
+            self.current = self.results.pop(0)
+
+    def fetchone(self):
+        return self.current[0] if self.current else None
+
+    def fetchall(self):
+        return self.current
+
+
+class ScriptedConn:
+    def __init__(self, results):
+        self.cursor_obj = ScriptedCursor(results)
+        self.commits = 0
+
+    def cursor(self, cursor_factory=None):
+        return self.cursor_obj
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def use_connection(monkeypatch, conn):
+    @contextmanager
+    def get_connection():
+        yield conn
+    monkeypatch.setattr(db, "get_connection", get_connection)
+
+
+def test_version_has_epoch_and_one_entry_per_scope():
+    version = db.cache_version('participants', ('session', 1))
+    assert len(version) == 3
+
+
+def test_invalidate_bumps_only_that_scope():
+    before = {scope: db.cache_version(scope) for scope in ('participants', 'sessions', 'visits')}
+    db.invalidate('sessions')
+    after = {scope: db.cache_version(scope) for scope in before}
+    assert after['sessions'] != before['sessions']
+    assert after['participants'] == before['participants']
+    assert after['visits'] == before['visits']
+
+
+def test_entity_scopes_are_independent():
+    session_1, session_2 = db.cache_version(('session', 1)), db.cache_version(('session', 2))
+    person = db.cache_version(('participant', "김민수", "1990"))
+    db.invalidate(('session', 1))
+    assert db.cache_version(('session', 1)) != session_1
+    assert db.cache_version(('session', 2)) == session_2
+    assert db.cache_version(('participant', "김민수", "1990")) == person
+
+
+def test_combined_key_changes_when_any_scope_changes():
+    key = db.cache_version('participants', ('session', 5))
+    db.invalidate(('session', 5))
+    assert db.cache_version('participants', ('session', 5)) != key
+    key = db.cache_version('participants', ('session', 5))
+    db.invalidate('participants')
+    assert db.cache_version('participants', ('session', 5)) != key
+
+
+def test_repeated_invalidation_never_reuses_a_version():
+    seen = {db.cache_version('visits')}
+    for _ in range(5):
+        db.invalidate('visits')
+        seen.add(db.cache_version('visits'))
+    assert len(seen) == 6
+
+
+def test_clear_cache_changes_every_key():
+    db.invalidate('participants', ('session', 9))
+    keys = [db.cache_version('participants'), db.cache_version(('session', 9)), db.cache_version('never-touched')]
+    db.clear_cache()
+    # 범위별 번호는 0 으로 돌아가도 epoch 가 올라가므로 이전 키와 겹치지 않음
+    assert db.cache_version('participants') not in keys
+    assert db.cache_version(('session', 9)) not in keys
+    assert db.cache_version('never-touched') not in keys
+
+
+def test_delete_participant_invalidates_visits_and_session_lists(monkeypatch):
+    conn = ScriptedConn([
+        [{'participant_id': 7}],                      # _participant_id
+        [{'name': "이영희", 'birth_date': "1991"}],   # 만났던 사람
+        [{'session_id': 3}],                          # 참석했던 회차
+    ])
+    use_connection(monkeypatch, conn)
+    scopes = ('participants', 'visits', 'sessions', ('session', 3),
+              ('participant', "김민수", "1990"), ('participant', "이영희", "1991"))
+    untouched = ('session', 4)
+    before = {scope: db.cache_version(scope) for scope in scopes + (untouched,)}
+
+    db.delete_participant("김민수", "1990")
+
+    assert conn.commits == 1
+    for scope in scopes:
+        assert db.cache_version(scope) != before[scope], scope
+    assert db.cache_version(untouched) == before[untouched]
@@ -0,0 +1,140 @@
+"""
+db_migrate 테스트 - 파일 순서 / 번호 중복 / 가짜 커넥션으로 적용 기록
+"""
+import pytest
+
+import db_migrate
+
+
+class FakeDb:
+    """schema_migrations 테이블만 흉내 내는 커넥션 (트랜잭션 단위로 커밋/롤백)"""
+
+    def __init__(self, applied=()):
+        self.table = bool(applied)
+        self.versions = set(applied)
+        self.pending = []   # 커밋 전 INSERT
+        self.scripts = []   # 실행한 마이그레이션 SQL (커밋된 것만)
+        self.running = []
+        self.locks = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.versions.update(self.pending)
+        self.scripts.extend(self.running)
+        self.pending, self.running = [], []
+
+    def rollback(self):
+        self.pending, self.running = [], []
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.row = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        db = self.db
+        if "to_regclass" in sql:
+            self.row = [(db.table,)]
+        elif sql.startswith("SELECT version FROM schema_migrations"):
+            self.row = [(v,) for v in sorted(db.versions)]
+        elif "pg_advisory" in sql:
+            db.locks.append(sql.split("(")[0].split()[-1])
+        elif "CREATE TABLE IF NOT EXISTS schema_migrations" in sql:
+            db.table = True
+        elif sql.startswith("INSERT INTO schema_migrations"):
+            db.pending.append(params[0])
+        elif "FAIL" in sql:
+            raise RuntimeError("syntax error")
+        else:
+            db.running.append(sql)
+
+    def fetchone(self):
+        return self.row[0]
+
+    def fetchall(self):
+        return self.row
+
+
+@pytest.fixture
+def migrations(tmp_path, monkeypatch):
+    """임시 폴더를 마이그레이션 폴더로 사용: write(filename, sql)"""
+    monkeypatch.setattr(db_migrate, "MIGRATIONS_DIR", str(tmp_path))
+
+    def write(filename, sql="SELECT 1;"):
+        (tmp_path / filename).write_text(sql, encoding="utf-8")
+    return write
+
+
+def test_sorted_by_version_not_by_filename(migrations):
+    migrations("0010_later.sql")
+    migrations("0002_second.sql")
+    migrations("0001_first.sql")
+    assert [(v, name) for v, name, _ in db_migrate.available_migrations()] == \
+        [(1, "first"), (2, "second"), (10, "later")]
+
+
+def test_other_files_ignored(migrations):
+    migrations("0001_first.sql")
+    migrations("README.md")
+    migrations("0002_draft.sql.bak")
+    migrations("12_short.sql")
+    assert [v for v, _, _ in db_migrate.available_migrations()] == [1]
+
+
+def test_duplicate_version_rejected(migrations):
+    migrations("0003_a.sql")
+    migrations("0003_b.sql")
+    with pytest.raises(RuntimeError):
+        db_migrate.available_migrations()
+
+
+def test_shipped_migrations_start_with_baseline():
+    found = db_migrate.available_migrations()
+    assert found[0][:2] == (1, "initial")
+    assert [v for v, _, _ in found] == sorted({v for v, _, _ in found})
+
+
+def test_migrate_applies_pending_in_order(migrations):
+    migrations("0002_second.sql", "-- second")
+    migrations("0001_first.sql", "-- first")
+    db = FakeDb()
+    assert db_migrate.migrate(db) == [(1, "first"), (2, "second")]
+    assert db.scripts == ["-- first", "-- second"]
+    assert db.versions == {1, 2}
+    assert db.locks == ["pg_advisory_lock", "pg_advisory_unlock"]
+
+
+def test_migrate_skips_applied_without_locking(migrations):
+    migrations("0001_first.sql", "-- first")
+    migrations("0002_second.sql", "-- second")
+    db = FakeDb(applied={1, 2})
+    assert db_migrate.migrate(db) == []
+    assert db.scripts == []
+    assert db.locks == []
+
+    migrations("0003_third.sql", "-- third")
+    assert db_migrate.migrate(db) == [(3, "third")]
+    assert db.scripts == ["-- third"]
+
+
+def test_failed_migration_rolled_back_earlier_ones_kept(migrations):
+    migrations("0001_first.sql", "-- first")
+    migrations("0002_broken.sql", "FAIL")
+    migrations("0003_third.sql", "-- third")
+    db = FakeDb()
+    with pytest.raises(RuntimeError, match="0002_broken"):
+        db_migrate.migrate(db)
+    assert db.versions == {1}
+    assert db.scripts == ["-- first"]
+    assert db.locks[-1] == "pg_advisory_unlock"
+    assert [(v, name, done) for v, name, done in db_migrate.status(db)] == \
+        [(1, "first", True), (2, "broken", False), (3, "third", False)]
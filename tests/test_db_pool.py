@@ -0,0 +1,274 @@
+"""
+db_pool.ConnectionPool 테스트 - psycopg2.connect 대신 가짜 커넥션, time 대신 수동 시계
+"""
+import threading
+import types
+
+import psycopg2
+import pytest
+from psycopg2 import extensions
+
+import db_pool
+from db_pool import ConnectionPool, PoolTimeout
+
+
+class FakeConn:
+    """풀이 쓰는 만큼만 흉내 낸 psycopg2 커넥션"""
+
+    def __init__(self, dsn):
+        self.dsn = dsn
+        self.closed = 0
+        self.alive = True
+        self.pings = 0
+        self.rollbacks = 0
+        self.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    @property
+    def info(self):
+        return self
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        if not self.alive:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.rollbacks += 1
+        self.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        if not self.conn.alive:
+            raise psycopg2.OperationalError("server closed the connection")
+        self.conn.pings += 1
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """db_pool 이 보는 time.monotonic 을 손으로 돌리는 시계"""
+    now = [1000.0]
+    monkeypatch.setattr(db_pool, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+
+    def advance(seconds):
+        now[0] += seconds
+    return advance
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    """풀이 연 커넥션 목록"""
+    conns = []
+
+    def connect(dsn):
+        conn = FakeConn(dsn)
+        conns.append(conn)
+        return conn
+    monkeypatch.setattr(db_pool.psycopg2, "connect", connect)
+    return conns
+
+
+def test_invalid_sizes_rejected(opened):
+    with pytest.raises(ValueError):
+        ConnectionPool("dsn", min_size=3, max_size=2)
+    with pytest.raises(ValueError):
+        ConnectionPool("dsn", min_size=0, max_size=0)
+
+
+def test_min_size_opened_up_front(opened, clock):
+    pool = ConnectionPool("dsn", min_size=2, max_size=5)
+    assert len(opened) == 2
+    assert pool.stats() == {'size': 2, 'idle': 2, 'in_use': 0, 'min_size': 2, 'max_size': 5}
+
+
+def test_checkout_reuses_returned_connection(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=5)
+    first = pool.getconn()
+    assert pool.stats()['in_use'] == 1
+    pool.putconn(first)
+    assert pool.stats() == {'size': 1, 'idle': 1, 'in_use': 0, 'min_size': 0, 'max_size': 5}
+
+    clock(1)
+    assert pool.getconn() is first
+    assert len(opened) == 1
+
+
+def test_grows_up_to_max_size_then_times_out(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2, timeout=0)
+    a, b = pool.getconn(), pool.getconn()
+    assert a is not b
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+    assert pool.stats()['size'] == 2
+
+
+def test_waiting_checkout_gets_returned_connection(opened):
+    pool = ConnectionPool("dsn", min_size=0, max_size=1, timeout=5)
+    held = pool.getconn()
+    got = []
+    waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+    waiter.start()
+    pool.putconn(held)
+    waiter.join(5)
+    assert got == [held]
+
+
+def test_dead_idle_connection_replaced_on_checkout(opened, clock):
+    pool = ConnectionPool("dsn", min_size=1, max_size=2)
+    dead = opened[0]
+    dead.alive = False
+
+    clock(120)
+    conn = pool.getconn()
+    assert conn is not dead
+    assert dead.closed
+    assert pool.stats()['size'] == 1
+
+
+def test_expired_connection_discarded_on_return(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2, max_lifetime=60)
+    conn = pool.getconn()
+    clock(61)
+    pool.putconn(conn)
+    assert conn.closed
+    assert pool.stats()['size'] == 0
+
+
+def test_open_transaction_rolled_back_on_return(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2)
+    conn = pool.getconn()
+    conn.transaction_status = extensions.TRANSACTION_STATUS_INTRANS
+    pool.putconn(conn)
+    assert conn.rollbacks == 1
+    assert not conn.closed
+    assert pool.stats()['idle'] == 1
+
+
+def test_unknown_transaction_state_discarded(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2)
+    conn = pool.getconn()
+    conn.transaction_status = extensions.TRANSACTION_STATUS_UNKNOWN
+    pool.putconn(conn)
+    assert conn.closed
+    assert pool.stats()['size'] == 0
+
+
+def test_idle_connections_above_min_size_reaped(opened, clock):
+    pool = ConnectionPool("dsn", min_size=1, max_size=5, max_idle=60)
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+    assert pool.stats()['size'] == 3
+
+    clock(61)
+    assert pool.reap() == 2
+    assert pool.stats() == {'size': 1, 'idle': 1, 'in_use': 0, 'min_size': 1, 'max_size': 5}
+    assert sum(1 for conn in conns if conn.closed) == 2
+
+
+def test_connection_context_rolls_back_on_error(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            raise RuntimeError("boom")
+    assert conn.rollbacks >= 1
+    assert pool.stats() == {'size': 1, 'idle': 1, 'in_use': 0, 'min_size': 0, 'max_size': 2}
+
+
+def test_broken_connection_discarded_by_context(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2)
+    with pytest.raises(psycopg2.OperationalError):
+        with pool.connection() as conn:
+            conn.alive = False
+            raise psycopg2.OperationalError("server closed the connection")
+    assert conn.closed
+    assert pool.stats()['size'] == 0
+
+
+def test_foreign_connection_rejected(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2)
+    with pytest.raises(ValueError):
+        pool.putconn(FakeConn("other"))
+
+
+def test_close_closes_idle_and_refuses_checkout(opened, clock):
+    pool = ConnectionPool("dsn", min_size=2, max_size=2)
+    held = pool.getconn()
+    pool.close()
+    assert sum(1 for conn in opened if conn.closed) == 1
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+    pool.putconn(held)
+    assert held.closed
+
+
+def test_recently_used_connection_not_pinged(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2, ping_after=30)
+    conn = pool.getconn()
+    pool.putconn(conn)
+
+    clock(5)
+    assert pool.getconn() is conn
+    assert conn.pings == 0
+    pool.putconn(conn)
+
+    clock(31)
+    assert pool.getconn() is conn
+    assert conn.pings == 1
+
+
+def test_closed_connection_replaced_without_ping(opened, clock):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2, ping_after=30)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    conn.close()
+
+    clock(1)
+    fresh = pool.getconn()
+    assert fresh is not conn
+    assert conn.pings == 0
+
+
+def test_configure_runs_once_per_new_connection(opened, clock):
+    configured = []
+    pool = ConnectionPool("dsn", min_size=1, max_size=3, configure=configured.append)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    pool.getconn()
+    pool.getconn()
+    assert configured == opened
+
+
+def test_failed_configure_closes_connection(opened, clock):
+    def configure(conn):
+        raise RuntimeError("register_type failed")
+    pool = ConnectionPool("dsn", min_size=0, max_size=1, configure=configure, timeout=0)
+    with pytest.raises(RuntimeError):
+        pool.getconn()
+    assert opened[0].closed
+    assert pool.stats()['size'] == 0
+
+
+def test_background_reaper_closes_idle_connections(opened):
+    pool = ConnectionPool("dsn", min_size=0, max_size=2, max_idle=0, reap_interval=0.01)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    for _ in range(500):
+        if conn.closed:
+            break
+        threading.Event().wait(0.01)
+    assert conn.closed
+    assert pool.stats()['size'] == 0
+    pool.close()
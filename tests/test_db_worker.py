@@ -0,0 +1,175 @@
+"""
+ui.db_worker.DbWorker 테스트 - Tk 대신 after 를 손으로 돌리는 가짜 root
+"""
+import importlib.util
+import os
+import threading
+
+import pytest
+
+# ui/__init__ 은 ttkbootstrap 앱을 불러오므로 모듈 파일만 직접 import (db_worker 는 tkinter 만 사용)
+_spec = importlib.util.spec_from_file_location(
+    "ui_db_worker", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui", "db_worker.py"))
+db_worker = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(db_worker)
+
+
+class FakeRoot:
+    """after / after_cancel 만 있는 Tk root - poll() 을 불러야 예약된 콜백이 실행됨"""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.next_id = 0
+
+    def after(self, ms, fn, *args):
+        self.next_id += 1
+        self.scheduled[self.next_id] = (fn, args)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def poll(self):
+        scheduled, self.scheduled = self.scheduled, {}
+        for fn, args in scheduled.values():
+            fn(*args)
+
+
+@pytest.fixture
+def root():
+    return FakeRoot()
+
+
+@pytest.fixture
+def worker(root):
+    worker = db_worker.DbWorker(root, workers=2)
+    yield worker
+    worker.shutdown()
+
+
+def finish(root, *jobs):
+    """작업 스레드가 끝나기를 기다린 뒤 메인 스레드 폴링 한 번"""
+    for job in jobs:
+        if not job.cancelled:
+            job.future.result(timeout=5)
+    root.poll()
+
+
+def test_result_delivered_on_poll_not_on_worker_thread(root, worker):
+    done = []
+    job = worker.submit(lambda a, b: (a + b, threading.current_thread()), 2, 3,
+                        on_done=lambda result: done.append((result[0], result[1], threading.current_thread())))
+    job.future.result(timeout=5)
+    assert done == []
+
+    root.poll()
+    value, ran_on, delivered_on = done[0]
+    assert value == 5
+    assert ran_on is not threading.main_thread()
+    assert delivered_on is threading.main_thread()
+    assert not worker.busy
+
+
+def test_error_goes_to_on_error(root, worker):
+    errors = []
+
+    def fail():
+        raise ValueError("no such session")
+    job = worker.submit(fail, on_done=lambda result: errors.append("done"), on_error=errors.append)
+    finish(root, job)
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+
+def test_error_without_handler_shows_message(root, worker, monkeypatch):
+    shown = []
+    monkeypatch.setattr(db_worker.messagebox, "showerror", lambda title, message: shown.append(message))
+
+    def fail():
+        raise RuntimeError("connection lost")
+    finish(root, worker.submit(fail, label="회차 불러오기"))
+    assert len(shown) == 1
+    assert "회차 불러오기" in shown[0] and "connection lost" in shown[0]
+
+
+def test_same_key_drops_running_job_result(root, worker):
+    release = threading.Event()
+    done = []
+    slow = worker.submit(lambda: release.wait(5) and "old", key='session', on_done=done.append)
+    fast = worker.submit(lambda: "new", key='session', on_done=done.append)
+    assert slow.cancelled
+    release.set()
+    slow.future.result(timeout=5)
+    finish(root, fast)
+    assert done == ["new"]
+
+
+def test_same_key_skips_job_not_started(root):
+    worker = db_worker.DbWorker(root, workers=1)
+    try:
+        release = threading.Event()
+        ran = []
+        blocker = worker.submit(release.wait, 5)
+        queued = worker.submit(ran.append, "first", key='search')
+        latest = worker.submit(ran.append, "second", key='search')
+        release.set()
+        finish(root, blocker, latest)
+        assert queued.cancelled
+        assert ran == ["second"]
+    finally:
+        worker.shutdown()
+
+
+def test_different_keys_do_not_cancel_each_other(root, worker):
+    done = []
+    a = worker.submit(lambda: "a", key='list', on_done=done.append)
+    b = worker.submit(lambda: "b", key='detail', on_done=done.append)
+    finish(root, a, b)
+    assert sorted(done) == ["a", "b"]
+
+
+def test_busy_labels_follow_pending_jobs(root):
+    labels = []
+    worker = db_worker.DbWorker(root, workers=2, on_busy=labels.append)
+    try:
+        release = threading.Event()
+        first = worker.submit(release.wait, 5, label="명단 불러오기")
+        second = worker.submit(lambda: None, label="검색")
+        unlabeled = worker.submit(lambda: None)
+        assert labels[-1] == ["명단 불러오기", "검색"]
+        assert worker.busy
+
+        finish(root, second, unlabeled)
+        assert labels[-1] == ["명단 불러오기"]
+        release.set()
+        finish(root, first)
+        assert labels[-1] == []
+        assert not worker.busy
+    finally:
+        worker.shutdown()
+
+
+def test_cancel_discards_result(root, worker):
+    done = []
+    job = worker.submit(lambda: "value", on_done=done.append)
+    job.future.result(timeout=5)
+    worker.cancel(job)
+    root.poll()
+    assert done == []
+    assert not worker.busy
+
+
+def test_post_runs_on_next_poll(root, worker):
+    progress = []
+    thread = threading.Thread(target=worker.post, args=(progress.append, 3))
+    thread.start()
+    thread.join()
+    assert progress == []
+    root.poll()
+    assert progress == [3]
+
+
+def test_shutdown_stops_polling(root):
+    worker = db_worker.DbWorker(root)
+    assert len(root.scheduled) == 1
+    worker.shutdown()
+    assert root.scheduled == {}
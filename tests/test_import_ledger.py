@@ -0,0 +1,95 @@
+"""
+엑셀 재임포트 장부 테스트 - 시트마다 skip / sync / new 결정 (DB 없이 장부 상태 dict 로)
+"""
+import database as db
+from excel_import import content_hash
+
+KIM = ("김민수", "1990-01-01", "M", "민수", "01012345678", "서울", "교사", "INFP", "", "지인")
+LEE = ("이영희", "1991-01-01", "F", "영희", "01098765432", "부산", "개발자", "ENTJ", "", "검색")
+
+
+def make_sheet(title="20240101", time="19:00", theme="보드게임", host="진행자A", people=(KIM, LEE)):
+    sheet = {'sheet': title, 'session_date': f"{title[:4]}-{title[4:6]}-{title[6:]}",
+             'session_time': time, 'theme': theme, 'host': host, 'people': list(people)}
+    sheet['content_hash'] = content_hash(sheet)
+    return sheet
+
+
+def make_state(ledger=(), unledgered=None):
+    """ledger: [(시트, session_id)] - 시트를 임포트했던 기록"""
+    return {'sheets': {db._ledger_key(sheet): {'session_id': session_id, 'content_hash': sheet['content_hash']}
+                       for sheet, session_id in ledger},
+            'unledgered': dict(unledgered or {})}
+
+
+def test_content_hash_tracks_fields_and_row_order():
+    base = make_sheet()
+    assert make_sheet()['content_hash'] == base['content_hash']
+    assert make_sheet(theme="와인")['content_hash'] != base['content_hash']
+    assert make_sheet(people=(KIM,))['content_hash'] != base['content_hash']
+    assert make_sheet(people=(LEE, KIM))['content_hash'] != base['content_hash']
+
+
+def test_unchanged_sheet_skipped():
+    state = make_state([(make_sheet(), 5)])
+    sheet = make_sheet()
+    assert db._plan_import_sheet(state, sheet) == 'skip'
+    assert 'session_id' not in sheet
+
+
+def test_edited_sheet_synced_into_its_session():
+    state = make_state([(make_sheet(), 5)])
+    sheet = make_sheet(people=(KIM,))
+    assert db._plan_import_sheet(state, sheet) == 'sync'
+    assert sheet['session_id'] == 5
+
+
+def test_unknown_sheet_creates_session():
+    state = make_state([(make_sheet(), 5)])
+    sheet = make_sheet(title="20240108")
+    assert db._plan_import_sheet(state, sheet) == 'new'
+    assert 'session_id' not in sheet
+
+
+def test_session_deleted_in_app_stays_deleted_until_sheet_changes():
+    state = make_state([(make_sheet(), None)])
+    assert db._plan_import_sheet(state, make_sheet()) == 'skip'
+    assert db._plan_import_sheet(state, make_sheet(theme="와인")) == 'new'
+
+
+def test_pre_ledger_session_adopted_once():
+    sheet = make_sheet()
+    key = (sheet['session_date'], sheet['session_time'], sheet['theme'], sheet['host'])
+    state = make_state(unledgered={key: [11, 12]})
+
+    assert db._plan_import_sheet(state, sheet) == 'sync'
+    assert sheet['session_id'] == 11
+    twin = make_sheet()
+    assert db._plan_import_sheet(state, twin) == 'sync'
+    assert twin['session_id'] == 12
+    assert db._plan_import_sheet(state, make_sheet()) == 'new'
+
+
+def test_pre_ledger_session_needs_identical_header():
+    sheet = make_sheet()
+    key = (sheet['session_date'], sheet['session_time'], sheet['theme'], sheet['host'])
+    state = make_state(unledgered={key: [11]})
+    assert db._plan_import_sheet(state, make_sheet(host="진행자B")) == 'new'
+    assert state['unledgered'][key] == [11]
+
+
+def test_same_sheet_title_with_other_header_is_another_session():
+    # 다른 통합 문서의 같은 날짜 시트 (시간 / 진행자가 다름) 는 기존 회차를 덮어쓰지 않음
+    state = make_state([(make_sheet(), 5)])
+    other = make_sheet(time="14:00", host="진행자B", people=(LEE,))
+    assert db._plan_import_sheet(state, other) == 'new'
+    assert 'session_id' not in other
+
+
+def test_ledger_key_covers_title_and_header_not_theme():
+    base = db._ledger_key(make_sheet())
+    assert db._ledger_key(make_sheet(theme="와인", people=(KIM,))) == base
+    assert db._ledger_key(make_sheet(title="20240108")) != base
+    assert db._ledger_key(make_sheet(time="14:00")) != base
+    assert db._ledger_key(make_sheet(host="진행자B")) != base
+    assert db._ledger_key(make_sheet(time=None, host=None)) != base
@@ -0,0 +1,64 @@
+"""
+meeting_audit: 회차마다 명단의 모든 쌍을 앞선 회차 명단 전체와 직접 대조한 결과와 비교
+"""
+import random
+from itertools import combinations
+
+import pytest
+
+from meeting_audit import audit
+
+
+def _history(rng, session_count, population, max_size):
+    """(session_id, participant_id) - 회차 순, 같은 회차 행은 붙어서 (중복 출석 행 포함)"""
+    rows = []
+    for sid in rng.sample(range(1, session_count * 10), session_count):  # 회차 번호 순서 != 시간 순서
+        members = rng.sample(range(population), rng.randint(0, min(max_size, population)))
+        rows += [(sid, p) for p in members]
+        if members and rng.random() < 0.2:
+            rows.append((sid, members[0]))
+    return rows
+
+
+def _naive(rows):
+    rosters = []  # [(session_id, {참가자})] 회차 순
+    for sid, p in rows:
+        if not rosters or rosters[-1][0] != sid:
+            rosters.append((sid, set()))
+        rosters[-1][1].add(p)
+    flagged, seen = [], set()
+    for k, (sid, members) in enumerate(rosters):
+        pairs = []
+        for a, b in combinations(sorted(members), 2):
+            before = [s for s, m in rosters[:k] if a in m and b in m]
+            if before:
+                pairs.append((a, b, before))
+            seen.add((a, b))
+        if pairs:
+            flagged.append({'session_id': sid, 'size': len(members), 'pairs': pairs})
+    return {'sessions': flagged, 'session_count': len(rosters),
+            'row_count': sum(len(m) for _, m in rosters), 'pair_count': len(seen)}
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_audit_matches_naive(seed):
+    rng = random.Random(seed)
+    rows = _history(rng, session_count=rng.randint(0, 25), population=rng.randint(2, 30), max_size=10)
+    assert audit(iter(rows)) == _naive(rows)
+
+
+def test_audit_reports_every_earlier_meeting():
+    rows = [(1, 1), (1, 2), (2, 3), (3, 1), (3, 2), (3, 3), (4, 2), (4, 1)]
+    result = audit(rows)
+    assert result['sessions'] == [
+        {'session_id': 3, 'size': 3, 'pairs': [(1, 2, [1])]},
+        {'session_id': 4, 'size': 2, 'pairs': [(1, 2, [1, 3])]},
+    ]
+    assert (result['session_count'], result['row_count'], result['pair_count']) == (4, 8, 3)
+
+
+def test_audit_large_ids():
+    # 쌍 키는 (작은 번호 << 32 | 큰 번호) - participant_id(SERIAL) 최댓값 근처에서도 쌍이 섞이지 않아야 함
+    top = 2 ** 31 - 1
+    rows = [(1, top), (1, top - 1), (1, 1), (2, top), (2, 1), (3, top - 1), (3, top), (3, 1)]
+    assert audit(rows) == _naive(rows)
@@ -0,0 +1,91 @@
+"""
+met_graph: 무작위 출석 추가/제거, 회차/참가자 삭제를 한 번 할 때마다
+증분 반영한 그래프를 '지금 출석 기록으로 다시 센 만남' 및 새로 만든 MetGraph 와 비교
+"""
+import random
+from itertools import combinations
+
+import pytest
+
+from met_graph import MetGraph, _bits
+
+
+def _naive_met(rows):
+    """사람 -> 같은 회차에 있었던 사람들"""
+    rosters = {}
+    for sid, person in rows:
+        rosters.setdefault(sid, set()).add(person)
+    met = {}
+    for members in rosters.values():
+        for a, b in combinations(members, 2):
+            met.setdefault(a, set()).add(b)
+            met.setdefault(b, set()).add(a)
+    return met
+
+
+def _check(graph, rows, known, everyone, rng):
+    met = _naive_met(rows)
+    fresh = MetGraph(sorted(rows))
+    assert len(graph) == len(known)
+    for sid in {sid for sid, _ in rows} | set(graph.sessions):
+        assert set(graph.roster(sid)) == {p for s, p in rows if s == sid}
+    for person in everyone:
+        expected = met.get(person, set())
+        assert set(graph.met_among(person, everyone)) == expected
+        assert set(fresh.met_among(person, everyone)) == expected
+        group = rng.sample(everyone, rng.randint(0, min(6, len(everyone))))
+        assert graph.has_met_any(person, group) == bool(expected & set(group))
+    candidates = rng.sample(everyone, rng.randint(0, len(everyone)))
+    roster = rng.sample(everyone, rng.randint(0, min(5, len(everyone))))
+    reach = set(roster).union(*(met.get(p, set()) for p in roster))
+    assert graph.clean(candidates, roster) == [p for p in candidates if p not in reach]
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_incremental_matches_rebuild(seed):
+    rng = random.Random(seed)
+    everyone = [f"p{i}" for i in range(rng.randint(3, 25))] + ["외부인"]  # 외부인: 한 번도 출석하지 않음
+    people = everyone[:-1]
+    sessions = list(range(1, rng.randint(2, 8)))
+    rows = {(rng.choice(sessions), rng.choice(people)) for _ in range(rng.randint(0, 40))}
+    graph = MetGraph(sorted(rows))
+    known = {p for _, p in rows}
+    _check(graph, rows, known, everyone, rng)
+
+    for _ in range(60):
+        action = rng.random()
+        if action < 0.5:
+            sid, person = rng.choice(sessions + [max(sessions) + 1]), rng.choice(people)
+            graph.attend(sid, person)
+            rows.add((sid, person))
+            known.add(person)
+        elif action < 0.8:
+            sid, person = rng.choice(sessions), rng.choice(people)  # 없는 출석 제거도 섞임
+            graph.leave(sid, person)
+            rows.discard((sid, person))
+        elif action < 0.9:
+            sid = rng.choice(sessions)
+            graph.drop_session(sid)
+            rows = {(s, p) for s, p in rows if s != sid}
+        else:
+            person = rng.choice(people)
+            graph.drop_person(person)
+            rows = {(s, p) for s, p in rows if p != person}
+            known.discard(person)
+        _check(graph, rows, known, everyone, rng)
+
+
+def test_bits():
+    assert _bits([]) == 0
+    for indices in ([0], [7, 8], [3, 3, 64, 1000], list(range(0, 300, 7))):
+        assert _bits(indices) == sum(1 << i for i in set(indices))
+
+
+def test_tuple_people():
+    a, b, c = ("김민수", "1990-01-01"), ("이서연", "1992-03-04"), ("박지훈", "1988-12-31")
+    graph = MetGraph([(1, a), (1, b), (2, c)])
+    assert graph.met_among(a, [c, b]) == [b]
+    assert graph.clean([c, b, ("새사람", "2000-01-01")], [a]) == [c, ("새사람", "2000-01-01")]
+    assert graph.clean([("새사람", "2000-01-01"), c], [("새사람", "2000-01-01")]) == [c]  # 기록 없는 명단 사람도 제외
+    graph.attend(2, a)
+    assert graph.has_met_any(c, [a]) and graph.roster(2) == [a, c]
@@ -0,0 +1,223 @@
+"""
+participant_index 테스트 - 초성 / 입력 중 글자 / 전화번호 검색을 전체 선형 탐색 결과와 비교
+"""
+import random
+
+import pytest
+
+import database as db
+from participant_index import (CHOSEONG, JUNGSEONG, ParticipantIndex, RANK_JOB, RANK_NAME_EXACT, RANK_NAME_PART,
+                               RANK_NAME_PREFIX, RANK_NICK_PREFIX, choseong, decompose, digits_of, has_jamo,
+                               match_at, normalize)
+
+FAMILY = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN = "민수지현영희서준하은도윤예린주원시우채아건우앉닭"
+JOBS = ["교사", "개발자", "디자이너", "간호사", "회사원", "대학생", "요리사", ""]
+
+
+def person(name, birth="1990-01-01", nickname="", job="", phone=""):
+    return {'name': name, 'birth_date': birth, 'nickname': nickname, 'job': job, 'phone': phone}
+
+
+def make_people(count, seed=7):
+    rng = random.Random(seed)
+    people = []
+    for i in range(count):
+        name = rng.choice(FAMILY) + "".join(rng.choice(GIVEN) for _ in range(rng.choice((1, 2, 2, 3))))
+        nickname = rng.choice(["", name[1:], "별", "Moon", "하늘바다"])
+        phone = "010" + "".join(rng.choice("0123456789") for _ in range(8))
+        people.append(person(name, f"{1970 + i % 30}-01-01", nickname, rng.choice(JOBS),
+                             phone if i % 5 else f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"))
+    return people
+
+
+def linear_search(people, query):
+    """인덱스 없이 모든 참가자를 훑는 기준 구현 -> {(name, birth_date)}"""
+    q = normalize(query)
+    digits = digits_of(q)
+    found = set()
+    for p in people:
+        if digits and len(digits) == len(q.replace("-", "")):
+            hit = digits in digits_of(p['phone'])
+        else:
+            hit = any(match_at(text, q, i)
+                      for text in (normalize(p['name']), normalize(p['nickname']), normalize(p['job']))
+                      for i in range(len(text)))
+        if hit:
+            found.add((p['name'], p['birth_date']))
+    return found
+
+
+def keys(results):
+    return {(r['name'], r['birth_date']) for r in results}
+
+
+def names(results):
+    return [r['name'] for r in results]
+
+
+# -----------------------------------------------------
+# 자모
+# -----------------------------------------------------
+
+def test_decompose_and_choseong():
+    assert decompose("김") == ("ㄱ", "ㅣ", "ㅁ")
+    assert decompose("하") == ("ㅎ", "ㅏ", "")
+    assert decompose("A") == ("A",)
+    assert choseong("김민수 A1") == "ㄱㅁㅅ A1"
+
+
+def test_has_jamo():
+    assert has_jamo("ㄱㅁㅅ")
+    assert has_jamo("김ㅁ")
+    assert not has_jamo("김민수")
+    assert not has_jamo("010-1234")
+    assert not has_jamo("")
+
+
+@pytest.mark.parametrize("query, text, expected", [
+    ("ㄱㅁㅅ", "김민수", True),
+    ("김ㅁ", "김민수", True),
+    ("김미", "김민수", True),     # 받침을 아직 안 친 마지막 글자
+    ("앉", "안지현", True),       # 받침이 다음 글자의 초성
+    ("안ㅈ", "안지현", True),
+    ("김무", "김민수", False),
+    ("ㄱㅅ", "김민수", False),
+    ("앉", "안수진", False),
+])
+def test_match_at_start(query, text, expected):
+    assert match_at(text, query, 0) is expected
+
+
+# -----------------------------------------------------
+# 검색
+# -----------------------------------------------------
+
+@pytest.fixture
+def small():
+    return ParticipantIndex([
+        person("김민수", nickname="민수", job="교사", phone="010-1234-5678"),
+        person("김민지", nickname="지지", job="개발자", phone="01055556666"),
+        person("안지현", nickname="현이", job="간호사", phone="01099990000"),
+        person("박수민", nickname="김민", job="교사", phone="01011112222"),
+        person("최교사", nickname="", job="회사원", phone=""),
+    ])
+
+
+def test_choseong_and_mixed_queries(small):
+    assert names(small.search("ㄱㅁㅅ")) == ["김민수"]
+    assert set(names(small.search("김ㅁ"))) == {"김민수", "김민지", "박수민"}
+    assert names(small.search("김미"))[:2] == ["김민수", "김민지"]
+    assert names(small.search("앉")) == ["안지현"]
+    assert names(small.search("ㅇㅈㅎ")) == ["안지현"]
+
+
+def test_ranking_name_before_nickname_before_job(small):
+    results = small.search("김민")
+    assert names(results) == ["김민수", "김민지", "박수민"]
+    assert [r['rank'] for r in results] == [RANK_NAME_PREFIX, RANK_NAME_PREFIX, RANK_NICK_PREFIX]
+
+    assert small.search("김민수")[0]['rank'] == RANK_NAME_EXACT
+    results = small.search("교사")
+    assert names(results) == ["최교사", "김민수", "박수민"]
+    assert [r['rank'] for r in results] == [RANK_NAME_PART, RANK_JOB, RANK_JOB]
+
+
+def test_phone_prefix_suffix_and_middle(small):
+    assert names(small.search("5678")) == ["김민수"]
+    assert names(small.search("010-1234")) == ["김민수"]
+    assert small.search("1234")[0]['rank'] == RANK_NAME_PART   # 가운데 자리
+    assert small.search("5678")[0]['rank'] == RANK_NAME_PREFIX  # 뒷자리
+    assert names(small.search("9999")) == ["안지현"]
+
+
+def test_empty_and_missing_queries(small):
+    assert small.search("") == []
+    assert small.search("   ") == []
+    assert small.search("ㅋㅋㅋ") == []
+    assert small.search("0000000000000") == []
+
+
+def test_page_returns_total_and_slice(small):
+    total, page = small.page("ㄱ", limit=2, offset=1)
+    assert total == len(small.search("ㄱ"))
+    assert names(page) == names(small.search("ㄱ"))[1:3]
+
+
+def test_matches_linear_scan():
+    people = make_people(400)
+    index = ParticipantIndex(people)
+    rng = random.Random(11)
+    queries = ["ㄱ", "ㄱㅁ", "김ㅁ", "민수", "앉", "닭", "교사", "moon", "Moon", "별", "010", "-", "99"]
+    for p in rng.sample(people, 60):
+        name = p['name']
+        start = rng.randrange(len(name))
+        part = name[start:start + rng.choice((1, 2, 3))]
+        queries += [part, choseong(part), part[:-1] + choseong(part[-1]),
+                    digits_of(p['phone'])[-4:], digits_of(p['phone'])[3:7]]
+        last = decompose(part[-1])
+        if len(last) == 3 and last[2]:
+            # 받침을 아직 안 친 상태 ("민" -> "미")
+            code = 0xAC00 + (CHOSEONG.index(last[0]) * 21 + JUNGSEONG.index(last[1])) * 28
+            queries.append(part[:-1] + chr(code))
+    for query in queries:
+        assert keys(index.search(query)) == linear_search(people, query), query
+
+
+# -----------------------------------------------------
+# 증분 갱신
+# -----------------------------------------------------
+
+def test_incremental_updates_match_rebuilt_index():
+    people = make_people(150, seed=3)
+    index = ParticipantIndex(people[:100])
+    for p in people[100:]:
+        index.add(p)
+    for p in people[:40]:
+        index.remove(p['name'], p['birth_date'])
+    for p in people[40:60]:
+        index.update(p['name'], p['birth_date'], job="요리사", phone="01077778888")
+
+    remaining = [dict(p, job="요리사", phone="01077778888") if 40 <= i < 60 else p
+                 for i, p in enumerate(people) if i >= 40]
+    rebuilt = ParticipantIndex(remaining)
+    assert len(index) == len(rebuilt) == len(remaining)
+    for query in ["ㄱ", "김", "ㅇㄹㅅ", "요리", "7777", "010", "민", "별"]:
+        assert keys(index.search(query)) == keys(rebuilt.search(query)), query
+        assert keys(index.search(query)) == linear_search(remaining, query), query
+
+
+def test_removed_slot_reused_without_stale_hits():
+    index = ParticipantIndex([person("김민수", phone="01012345678")])
+    index.remove("김민수", "1990-01-01")
+    assert "김민수" not in names(index.search("ㄱㅁㅅ"))
+    index.add(person("이영희", phone="01000001111"))
+    assert index.search("ㄱㅁㅅ") == []
+    assert index.search("5678") == []
+    assert names(index.search("1111")) == ["이영희"]
+    assert ("이영희", "1990-01-01") in index
+
+
+def test_add_existing_key_replaces_record():
+    index = ParticipantIndex([person("김민수", job="교사")])
+    index.add(person("김민수", job="개발자"))
+    assert len(index) == 1
+    assert index.search("교사") == []
+    assert index.get("김민수", "1990-01-01")['job'] == "개발자"
+
+
+def test_update_non_search_field_keeps_hits():
+    index = ParticipantIndex([person("김민수")])
+    index.update("김민수", "1990-01-01", memo="단골")
+    assert index.search("ㄱㅁㅅ")[0]['memo'] == "단골"
+
+
+# -----------------------------------------------------
+# DB 검색과의 분담
+# -----------------------------------------------------
+
+def test_jamo_queries_go_to_memory_index(monkeypatch):
+    calls = []
+    monkeypatch.setattr(db, "quick_search_participants", lambda *args: calls.append(args) or [])
+    assert db.search_participants("김ㅁ", 20, 40) == []
+    assert calls == [("김ㅁ", 20, 40)]
@@ -0,0 +1,118 @@
+"""
+recommend_score: 배열 계산 결과를 후보 한 명씩 파이썬으로 계산한 값과 비교
+"""
+import math
+import random
+import statistics
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import recommend_score as rs
+
+TODAY = date(2024, 6, 1)
+MBTIS = ["ENFP", "istj", "INTJ", "ESFP", "", None, "XX"]
+LOCATIONS = ["서울", "경기", "부산", "", None]
+ROUTES = ["인스타그램", "지인", "", None]
+
+
+def _people(rng, n, with_visits=True):
+    rows = []
+    for _ in range(n):
+        row = {
+            'gender': rng.choice("MF"),
+            'birth_date': rng.choice([f"{rng.randint(1980, 2000)}-01-01", "", None, "모름"]),
+            'mbti': rng.choice(MBTIS),
+            'location': rng.choice(LOCATIONS),
+            'signup_route': rng.choice(ROUTES),
+        }
+        if with_visits:
+            row['visit_count'] = rng.randint(0, 20)
+            row['last_visit'] = rng.choice([(TODAY - timedelta(days=rng.randint(0, 400))).isoformat(), None, ""])
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _year(text):
+    head = str(text)[:4]
+    return float(head) if head.isdigit() else None
+
+
+def _axes(text):
+    text = text.upper() if isinstance(text, str) else ""  # 빈 값 (None / NaN) 은 모든 축 0
+    return [1.0 if a in text else -1.0 if b in text else 0.0 for a, b in rs.MBTI_AXES]
+
+
+def _share(value, roster_values):
+    roster = [v for v in roster_values if isinstance(v, str) and v]
+    if not roster or not isinstance(value, str) or not value:
+        return 0.0
+    return roster.count(value) / len(roster)
+
+
+def _naive_score(candidates, roster, gender):
+    """문서의 정의대로 후보마다 한 명씩 계산"""
+    people = roster.to_dict('records')
+    partners = [p for p in people if p['gender'] != gender] or people
+    partner_years = [y for y in (_year(p['birth_date']) for p in partners) if y is not None]
+    partner_axes = [_axes(p['mbti']) for p in partners]
+    top = max(math.log1p(v) for v in candidates['visit_count'])
+    scores = []
+    for c in candidates.to_dict('records'):
+        parts = {}
+        year = _year(c['birth_date'])
+        if not partner_years or year is None:
+            parts['age'] = 0.5
+        else:
+            gap = (year - statistics.median(partner_years)) / rs.AGE_SPREAD
+            parts['age'] = math.exp(-gap * gap)
+        if partner_axes:
+            mean = [sum(axis) / len(partner_axes) for axis in zip(*partner_axes)]
+            parts['mbti'] = 0.5 + sum(a * b for a, b in zip(_axes(c['mbti']), mean)) / 8.0
+        else:
+            parts['mbti'] = 0.5
+        try:
+            days = (TODAY - date.fromisoformat(str(c['last_visit']))).days
+            parts['recency'] = math.exp(-max(days, 0) / rs.RECENCY_DAYS)
+        except ValueError:
+            parts['recency'] = 0.0
+        parts['visits'] = math.log1p(c['visit_count']) / top if top > 0 else 0.0
+        parts['location'] = _share(c['location'], [p['location'] for p in people])
+        parts['route'] = _share(c['signup_route'], [p['signup_route'] for p in people])
+        scores.append(sum(rs.WEIGHTS[k] * parts[k] for k in rs.WEIGHTS) / sum(rs.WEIGHTS.values()) * 100.0)
+    return scores
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_score_matches_naive(seed):
+    rng = random.Random(seed)
+    candidates = _people(rng, rng.randint(1, 40))
+    roster = _people(rng, rng.randint(1, 12), with_visits=False)
+    gender = rng.choice("MF")
+    got = rs.score(candidates, roster, gender, today=TODAY)
+    assert got == pytest.approx(_naive_score(candidates, roster, gender))
+    assert ((0 <= got) & (got <= 100)).all()
+
+
+def test_score_empty_roster_and_candidates():
+    rng = random.Random(0)
+    candidates = _people(rng, 5)
+    roster = pd.DataFrame(columns=['gender', 'birth_date', 'mbti', 'location', 'signup_route'])
+    got = rs.score(candidates, roster, 'M', today=TODAY)
+    assert len(got) == 5 and np.isfinite(got).all()
+    assert len(rs.score(candidates.iloc[:0], roster, 'M', today=TODAY)) == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_top_k_matches_sorted(seed):
+    rng = random.Random(seed)
+    n = rng.randint(0, 60)
+    scores = np.array([rng.choice([rng.random() * 100, 50.0, 10.0]) for _ in range(n)])  # 동점 포함
+    for k in (0, 1, 3, n // 2, n, n + 5):
+        got = rs.top_k(scores, k)
+        expected = sorted(range(n), key=lambda i: -scores[i])[:max(k, 0)]
+        assert len(got) == len(expected)
+        assert list(scores[got]) == [scores[i] for i in expected]  # 점수 순서 (동점끼리 위치는 달라도 됨)
+        assert len(set(got.tolist())) == len(got)
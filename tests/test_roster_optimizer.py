@@ -0,0 +1,123 @@
+"""
+roster_optimizer: 편성 결과의 제약 / 비용을 명단만 보고 직접 센 값과 비교
+작은 문제는 가능한 배정을 모두 따져 본 최적 비용과도 비교
+"""
+import random
+from itertools import combinations, permutations
+
+import pytest
+
+import roster_optimizer as ro
+
+
+def _people(rng, n, start=0):
+    return [{'participant_id': start + i, 'gender': 'M' if i % 2 == 0 else 'F',
+             'birth_date': f"{rng.randint(1980, 2000)}-01-01"} for i in range(n)]
+
+
+def _met_pairs(rng, ids, density):
+    return [(a, b) for a, b in combinations(ids, 2) if rng.random() < density]
+
+
+def _naive_cost(rosters, people, met_pairs):
+    """비용 정의 그대로: 회차마다 이미 만난 쌍 수 x MET_WEIGHT + 출생년도 분산 x AGE_WEIGHT"""
+    year = {p['participant_id']: int(p['birth_date'][:4]) for p in people}
+    met = {frozenset(pair) for pair in met_pairs}
+    cost = 0.0
+    for ids in rosters.values():
+        repeat = sum(frozenset((a, b)) in met for a, b in combinations(ids, 2))
+        years = [year[i] for i in ids]
+        mean = sum(years) / len(years) if years else 0.0
+        variance = sum((y - mean) ** 2 for y in years) / len(years) if years else 0.0
+        cost += ro.MET_WEIGHT * repeat + ro.AGE_WEIGHT * variance
+    return cost
+
+
+def _check_constraints(result, people, sessions, per_gender):
+    gender = {p['participant_id']: p['gender'] for p in people}
+    for s in sessions:
+        gender.update((p['participant_id'], p['gender']) for p in s['members'])
+    placed = [i for ids in result['rosters'].values() for i in ids]
+    assert len(placed) == len(set(placed)), "한 사람이 두 회차에"
+    assert not set(placed) & set(result['unassigned'])
+    assert set(placed) | set(result['unassigned']) == set(gender)
+    for s in sessions:
+        roster = result['rosters'][s['session_id']]
+        fixed = [p['participant_id'] for p in s['members']]
+        assert roster[:len(fixed)] == fixed, "이미 명단에 있던 사람은 그대로"
+        assert sorted(roster) == sorted(fixed + result['added'][s['session_id']])
+        for g in ro.GENDERS:
+            fixed_count = sum(gender[i] == g for i in fixed)
+            count = sum(gender[i] == g for i in roster)
+            assert count == max(fixed_count, per_gender) or not any(gender[i] == g for i in result['unassigned'])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_plan_constraints_and_cost(seed):
+    rng = random.Random(seed)
+    people = _people(rng, rng.randint(10, 60))
+    fixed = _people(rng, 4, start=1000)
+    sessions = [{'session_id': 1, 'members': fixed[:2]}, {'session_id': 2, 'members': fixed[2:]},
+                {'session_id': 3, 'members': []}]
+    everyone = people + fixed
+    met_pairs = _met_pairs(rng, [p['participant_id'] for p in everyone], 0.2)
+
+    greedy = ro.plan_rosters(people, sessions, met_pairs, per_gender=4, local_search=False)
+    searched = ro.plan_rosters(people, sessions, met_pairs, per_gender=4, seed=seed, time_limit=1.0)
+    for result in (greedy, searched):
+        _check_constraints(result, people, sessions, per_gender=4)
+    assert _naive_cost(searched['rosters'], everyone, met_pairs) <= \
+           _naive_cost(greedy['rosters'], everyone, met_pairs) + 1e-9
+
+
+def _optimum(people, session_ids, met_pairs, per_gender):
+    """같은 성별끼리 자리를 모두 바꿔 보며 최소 비용"""
+    men = [p['participant_id'] for p in people if p['gender'] == 'M']
+    women = [p['participant_id'] for p in people if p['gender'] == 'F']
+    seats = per_gender * len(session_ids)
+    best = None
+    for m in permutations(men, seats):
+        for w in permutations(women, seats):
+            rosters = {sid: list(m[k * per_gender:(k + 1) * per_gender]) + list(w[k * per_gender:(k + 1) * per_gender])
+                       for k, sid in enumerate(session_ids)}
+            cost = _naive_cost(rosters, people, met_pairs)
+            best = cost if best is None else min(best, cost)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_local_search_reaches_small_optimum(seed):
+    rng = random.Random(seed)
+    people = _people(rng, 8)  # 남 4 / 여 4, 회차 2개 x 남녀 1명 -> 대기 인원 포함 전수 비교
+    met_pairs = _met_pairs(rng, [p['participant_id'] for p in people], 0.5)
+    sessions = [{'session_id': 1, 'members': []}, {'session_id': 2, 'members': []}]
+    result = ro.plan_rosters(people, sessions, met_pairs, per_gender=1, seed=seed, time_limit=2.0)
+    _check_constraints(result, people, sessions, per_gender=1)
+    assert _naive_cost(result['rosters'], people, met_pairs) == pytest.approx(_optimum(people, [1, 2], met_pairs, 1))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_evaluate_matches_naive(seed):
+    rng = random.Random(seed)
+    people = _people(rng, 30)
+    people[3]['birth_date'] = None  # 출생년도를 모르는 사람은 나이 지표에서 뺌
+    met_pairs = _met_pairs(rng, range(30), 0.3)
+    ids = list(range(30))
+    rng.shuffle(ids)
+    rosters = {1: ids[:8], 2: ids[8:20], 3: ids[20:21], 4: []}
+    metrics = ro.evaluate(rosters, people, met_pairs, per_gender=3)
+
+    met = {frozenset(pair) for pair in met_pairs}
+    by_id = {p['participant_id']: p for p in people}
+    for sid, roster in rosters.items():
+        got = metrics['sessions'][sid]
+        years = [int(by_id[i]['birth_date'][:4]) for i in roster if by_id[i]['birth_date']]
+        assert got['men'] == sum(by_id[i]['gender'] == 'M' for i in roster)
+        assert got['women'] == sum(by_id[i]['gender'] == 'F' for i in roster)
+        assert got['repeat_pairs'] == sum(frozenset(pair) in met for pair in combinations(roster, 2))
+        assert got['age_range'] == (max(years) - min(years) if years else 0)
+        if years:
+            mean = sum(years) / len(years)
+            assert got['age_std'] == pytest.approx((sum((y - mean) ** 2 for y in years) / len(years)) ** 0.5)
+    assert metrics['repeat_pairs'] == sum(s['repeat_pairs'] for s in metrics['sessions'].values())
+    assert metrics['full'] == sum(s['men'] >= 3 and s['women'] >= 3 for s in metrics['sessions'].values())
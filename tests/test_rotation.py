@@ -0,0 +1,107 @@
+"""
+rotation: 편성표를 라운드별로 풀어서 센 만남과 '남녀 모든 쌍 - 이미 만난 쌍' 을 비교
+"""
+import random
+from collections import Counter
+
+import pytest
+
+import rotation
+
+
+def _people(prefix, n):
+    return [(f"{prefix}{i}", f"19{80 + i}-01-01") for i in range(n)]
+
+
+def _random_case(rng, met_density):
+    men, women = _people("남", rng.randint(0, 8)), _people("여", rng.randint(0, 8))
+    met_pairs = [(m, w) for m in men for w in women if rng.random() < met_density]
+    return men, women, met_pairs
+
+
+def _seated(plan, rounds=None):
+    """편성표에서 같은 테이블에 앉은 (손님, 앉아 있는 사람) 쌍 횟수"""
+    return Counter((guest, host) for round_ in plan['rounds'][:rounds]
+                   for host, table in round_['tables'] for guest in table)
+
+
+def _check_rounds(plan):
+    for round_ in plan['rounds']:
+        hosts = [host for host, _ in round_['tables']]
+        assert len(hosts) == len(set(hosts))
+        placed = [guest for _, table in round_['tables'] for guest in table] + round_['resting']
+        assert sorted(placed) == sorted(plan['guests']), "라운드마다 옮기는 사람은 한 자리 또는 휴식"
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_schedule_meets_every_unmet_pair_once(seed):
+    rng = random.Random(seed)
+    men, women, met_pairs = _random_case(rng, rng.choice([0.0, 0.2, 0.5]))
+    plan = rotation.schedule(men, women, met_pairs)
+
+    hosts, guests = (men, women) if len(men) < len(women) else (women, men)
+    assert plan['hosts'] == hosts and plan['guests'] == guests
+    assert plan['host_gender'] == ('M' if hosts is men else 'F')
+    _check_rounds(plan)
+
+    met = {frozenset(pair) for pair in met_pairs}
+    seated = _seated(plan)
+    assert all(count == 1 for count in seated.values()), "같은 쌍이 두 번 앉음"
+    assert not any(frozenset(pair) in met for pair in seated), "이미 만난 쌍을 앉힘"
+    every = {(g, h) for g in guests for h in hosts}
+    assert set(plan['skipped']) == {pair for pair in every if frozenset(pair) in met}
+    assert set(seated) | set(plan['missing']) | set(plan['skipped']) == every
+    assert not set(seated) & set(plan['missing'])
+
+
+@pytest.mark.parametrize("men, women", [(7, 5), (5, 5), (4, 6), (1, 3), (6, 6), (8, 3)])
+def test_schedule_without_history_is_balanced(men, women):
+    plan = rotation.schedule(_people("남", men), _people("여", women))
+    assert plan['missing'] == [] and plan['skipped'] == []
+    assert len(plan['rounds']) == len(plan['hosts']), "라운드 수 = 앉아 있는 쪽 인원"
+    for round_ in plan['rounds']:
+        sizes = [len(table) for _, table in round_['tables']]
+        assert max(sizes) - min(sizes) <= 1
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_reschedule_keeps_played_rounds(seed):
+    rng = random.Random(seed)
+    men, women = _people("남", rng.randint(2, 7)), _people("여", rng.randint(2, 7))
+    met_pairs = [(m, w) for m in men for w in women if rng.random() < 0.2]
+    plan = rotation.schedule(men, women, met_pairs)
+    played = rng.randint(0, len(plan['rounds']))
+
+    # 진행 중에 한 명 빠지고 한 명 새로 옴
+    left = rng.choice(men + women)
+    men = [m for m in men if m != left] + ([("남new", "1990-01-01")] if rng.random() < 0.5 else [])
+    women = [w for w in women if w != left] + ([("여new", "1990-01-01")] if rng.random() < 0.5 else [])
+    again = rotation.reschedule(plan, played, men, women, met_pairs)
+
+    assert again['rounds'][:played] == plan['rounds'][:played]
+    assert again['played'] == played
+    met = {frozenset(pair) for pair in met_pairs}
+    before = _seated(plan, played)
+    after = Counter((g, h) for round_ in again['rounds'][played:] for h, table in round_['tables'] for g in table)
+    for guest, host in after:
+        pair = frozenset((guest, host))
+        assert pair not in met and before[(guest, host)] + before[(host, guest)] == 0
+        assert guest in again['guests'] and host in again['hosts']
+    assert all(count == 1 for count in after.values())
+    assert set(again['skipped']) == {(g, h) for g in again['guests'] for h in again['hosts'] if frozenset((g, h)) in met}
+    kept = [h for h in plan['hosts'] if h in again['hosts']]
+    assert again['hosts'][:len(kept)] == kept, "남아 있는 테이블 순서 유지"
+
+
+@pytest.mark.parametrize("met_pairs", [[], [(("남0", "1980-01-01"), ("여0", "1980-01-01"))]])
+def test_table_rows(met_pairs):
+    plan = rotation.schedule(_people("남", 3), _people("여", 2), met_pairs)
+    rows = rotation.table_rows(plan, name=lambda key: key[0])
+    resting = any(round_['resting'] for round_ in plan['rounds'])
+    assert [label for label, _ in rows] == ["1번 여0", "2번 여1"] + (["휴식"] if resting else [])
+    assert all(len(cells) == len(plan['rounds']) for _, cells in rows)
+    for r, round_ in enumerate(plan['rounds']):
+        for (label, cells), (host, table) in zip(rows, round_['tables']):
+            assert cells[r] == ", ".join(guest[0] for guest in table)
+        if resting:
+            assert rows[-1][1][r] == ", ".join(guest[0] for guest in round_['resting'])
@@ -0,0 +1,187 @@
+"""
+ui.tree_binding.TreeBinding 테스트 - 가짜 Treeview 에 반영된 결과 / 호출 횟수 확인
+"""
+import importlib.util
+import os
+import random
+
+import pytest
+
+# ui/__init__ 은 ttkbootstrap 앱을 불러오므로 모듈 파일만 직접 import (tree_binding 은 Tk 를 import 하지 않음)
+_spec = importlib.util.spec_from_file_location(
+    "ui_tree_binding", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ui", "tree_binding.py"))
+tree_binding = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tree_binding)
+TreeBinding = tree_binding.TreeBinding
+
+
+class FakeTree:
+    """ttk.Treeview 의 평면 목록 부분 + after"""
+
+    def __init__(self):
+        self.order = []
+        self.items = {}
+        self.calls = {'insert': 0, 'delete': 0, 'item': 0, 'move': 0}
+        self.scheduled = {}
+        self.next_id = 0
+
+    def insert(self, parent, index, iid, values, tags):
+        assert iid not in self.items
+        self.calls['insert'] += 1
+        self.order.insert(len(self.order) if index == 'end' else index, iid)
+        self.items[iid] = (tuple(values), tuple(tags))
+
+    def delete(self, *iids):
+        self.calls['delete'] += 1
+        for iid in iids:
+            self.order.remove(iid)
+            del self.items[iid]
+
+    def item(self, iid, values=None, tags=None):
+        self.calls['item'] += 1
+        old_values, old_tags = self.items[iid]
+        self.items[iid] = (old_values if values is None else tuple(values), old_tags if tags is None else tuple(tags))
+
+    def move(self, iid, parent, index):
+        self.calls['move'] += 1
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+    def get_children(self):
+        return tuple(self.order)
+
+    def after(self, ms, fn, *args):
+        self.next_id += 1
+        self.scheduled[self.next_id] = (fn, args)
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        del self.scheduled[after_id]
+
+    def run_pending(self):
+        while self.scheduled:
+            after_id = min(self.scheduled)
+            fn, args = self.scheduled.pop(after_id)
+            fn(*args)
+
+    def rows(self):
+        return [self.items[iid] for iid in self.order]
+
+    def reset_calls(self):
+        self.calls = dict.fromkeys(self.calls, 0)
+
+
+def rows_of(*keys, tag=()):
+    return [(key, (key, f"{key}님"), tag) for key in keys]
+
+
+def shown(rows):
+    return [(tuple(values), tuple(tags)) for _, values, tags in rows]
+
+
+@pytest.fixture
+def tree():
+    return FakeTree()
+
+
+def test_initial_rows_inserted_in_order(tree):
+    binding = TreeBinding(tree)
+    rows = rows_of("a", "b", "c")
+    binding.set_rows(rows)
+    assert tree.rows() == shown(rows)
+    assert len(binding) == 3
+
+
+def test_unchanged_refresh_touches_nothing(tree):
+    binding = TreeBinding(tree)
+    binding.set_rows(rows_of("a", "b", "c"))
+    tree.reset_calls()
+    binding.set_rows(rows_of("a", "b", "c"))
+    assert tree.calls == {'insert': 0, 'delete': 0, 'item': 0, 'move': 0}
+
+
+def test_only_changed_row_updated(tree):
+    binding = TreeBinding(tree)
+    binding.set_rows(rows_of("a", "b", "c"))
+    tree.reset_calls()
+    rows = rows_of("a", "b", "c")
+    rows[1] = ("b", ("b", "바뀐 값"), ("dup",))
+    binding.set_rows(rows)
+    assert tree.calls == {'insert': 0, 'delete': 0, 'item': 1, 'move': 0}
+    assert tree.rows() == shown(rows)
+
+
+def test_removed_and_inserted_rows_keep_final_order(tree):
+    binding = TreeBinding(tree)
+    binding.set_rows(rows_of("a", "b", "c", "d"))
+    tree.reset_calls()
+    rows = rows_of("x", "a", "c", "y", "d", "z")
+    binding.set_rows(rows)
+    assert tree.rows() == shown(rows)
+    assert tree.calls['delete'] == 1  # 없어진 행은 한 번에 삭제
+    assert tree.calls['insert'] == 3
+
+
+def test_reordered_rows_moved(tree):
+    binding = TreeBinding(tree)
+    binding.set_rows(rows_of("a", "b", "c"))
+    rows = rows_of("c", "a", "b")
+    binding.set_rows(rows)
+    assert tree.rows() == shown(rows)
+
+
+def test_large_insert_split_into_chunks(tree):
+    binding = TreeBinding(tree, chunk_rows=2)
+    completed = []
+    rows = rows_of(*"abcde")
+    binding.set_rows(rows, on_complete=lambda: completed.append(True))
+    assert tree.rows() == shown(rows[:2])  # 첫 묶음은 바로
+    assert completed == []
+    tree.run_pending()
+    assert tree.rows() == shown(rows)
+    assert completed == [True]
+
+
+def test_new_rows_cancel_pending_chunks(tree):
+    binding = TreeBinding(tree, chunk_rows=2)
+    binding.set_rows(rows_of(*"abcdef"))
+    rows = rows_of("f", "b", "g")
+    binding.set_rows(rows)
+    tree.run_pending()
+    assert tree.rows() == shown(rows)
+    assert len(binding) == 3
+
+
+def test_added_tag_reset_by_next_refresh(tree):
+    binding = TreeBinding(tree)
+    binding.set_rows(rows_of("a", "b"))
+    iid = tree.order[1]
+    binding.add_tag(iid, "dup")
+    binding.add_tag(iid, "dup")
+    assert tree.items[iid][1] == ("dup",)
+    binding.set_rows(rows_of("a", "b"))
+    assert tree.items[iid][1] == ()
+
+
+def test_clear(tree):
+    binding = TreeBinding(tree)
+    binding.set_rows(rows_of("a", "b"))
+    binding.clear()
+    assert tree.rows() == []
+    assert len(binding) == 0
+
+
+def test_random_refreshes_match_rows():
+    rng = random.Random(5)
+    tree = FakeTree()
+    binding = TreeBinding(tree, chunk_rows=7)
+    pool = [f"p{i}" for i in range(40)]
+    for _ in range(200):
+        keys = rng.sample(pool, rng.randrange(len(pool) + 1))
+        rows = [(key, (key, rng.choice("AB")), rng.choice([(), ("dup",)])) for key in keys]
+        binding.set_rows(rows)
+        if rng.random() < 0.7:  # 가끔은 삽입이 끝나기 전에 다음 새로고침
+            tree.run_pending()
+            assert tree.rows() == shown(rows)
+    tree.run_pending()
+    assert tree.rows() == shown(rows)
@@ -0,0 +1,143 @@
+"""
+백그라운드 DB 워커
+- database.py 호출을 작업 스레드에서 실행 -> 응답을 기다리는 동안에도 Tk 메인 루프가 멈추지 않음
+- 결과/예외는 큐에 담아 두고 root.after 폴링으로 메인 스레드에서 콜백 실행
+  (Tk 위젯은 메인 스레드에서만 건드려야 하므로 콜백 안에서는 마음대로 UI 를 바꿔도 됨)
+- 같은 key 로 새 요청이 들어오면 이전 요청은 취소
+  (아직 시작 전이면 실행하지 않고, 이미 실행 중이면 결과를 버림 - 예: 회차를 빠르게 바꿀 때)
+- 진행 중인 작업 목록이 바뀔 때마다 on_busy 콜백으로 알림 (상태 표시줄)
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+
+POLL_MS = 30
+MAX_WORKERS = 4
+
+
+class Job:
+    """워커에 넘긴 요청 하나"""
+    __slots__ = ('key', 'label', 'on_done', 'on_error', 'future', 'cancelled')
+
+    def __init__(self, key, label, on_done, on_error):
+        self.key = key
+        self.label = label
+        self.on_done = on_done
+        self.on_error = on_error
+        self.future = None
+        self.cancelled = False
+
+    @property
+    def done(self) -> bool:
+        return self.cancelled or (self.future is not None and self.future.done())
+
+
+class DbWorker:
+    """Tk 앱용 DB 작업 실행기 (submit / post / cancel 은 메인 스레드에서, post 는 어느 스레드에서나)"""
+
+    def __init__(self, root, workers: int = MAX_WORKERS, on_busy=None):
+        self.root = root
+        self.on_busy = on_busy  # on_busy(labels): 진행 중인 작업 설명 목록 (비었으면 한가함)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-worker")
+        self._results = queue.SimpleQueue()
+        self._pending = []   # 결과를 기다리는 Job (요청 순서)
+        self._latest = {}    # key -> 가장 최근 Job
+        self._closed = False
+        self._poll_id = self.root.after(POLL_MS, self._poll)
+
+    # -----------------------------------------------------
+    # 요청
+    # -----------------------------------------------------
+
+    def submit(self, fn, *args, key=None, label=None, on_done=None, on_error=None, **kwargs) -> Job:
+        """fn(*args, **kwargs) 를 작업 스레드에서 실행
+
+        on_done(result) / on_error(exc) 는 메인 스레드에서 호출됨 (on_error 가 없으면 오류 메시지 창)
+        key 가 같은 이전 요청은 취소됨
+        """
+        if key is not None and key in self._latest:
+            self.cancel(self._latest[key])
+        job = Job(key, label, on_done, on_error)
+        if key is not None:
+            self._latest[key] = job
+        self._pending.append(job)
+        job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        self._notify_busy()
+        return job
+
+    def post(self, fn, *args):
+        """fn(*args) 를 다음 폴링 때 메인 스레드에서 실행 (작업 스레드 -> UI 전달용, 예: 진행률)"""
+        self._results.put((None, fn, args))
+
+    def cancel(self, job: Job):
+        """요청 취소 (시작 전이면 실행 안 함, 실행 중이면 결과만 버림)"""
+        if job.cancelled:
+            return
+        job.cancelled = True
+        job.future.cancel()
+        if job in self._pending:
+            self._pending.remove(job)
+        if job.key is not None and self._latest.get(job.key) is job:
+            del self._latest[job.key]
+        self._notify_busy()
+
+    def shutdown(self):
+        """앱 종료 시 호출 (대기 중인 요청은 버리고, 실행 중인 작업은 끝날 때까지 기다리지 않음)"""
+        self._closed = True
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def busy(self) -> bool:
+        return bool(self._pending)
+
+    # -----------------------------------------------------
+    # 내부
+    # -----------------------------------------------------
+
+    def _run(self, job, fn, args, kwargs):
+        """작업 스레드: 실행 결과를 큐에 넣기만 함 (UI 접근 금지)"""
+        if job.cancelled:
+            return
+        try:
+            self._results.put((job, fn(*args, **kwargs), None))
+        except Exception as e:
+            self._results.put((job, None, e))
+
+    def _poll(self):
+        """메인 스레드: 쌓인 결과 처리 후 다음 폴링 예약"""
+        try:
+            while True:
+                try:
+                    job, value, extra = self._results.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    value(*extra)  # post() 로 넘어온 호출
+                else:
+                    self._deliver(job, value, extra)
+        finally:
+            if not self._closed:
+                self._poll_id = self.root.after(POLL_MS, self._poll)
+
+    def _deliver(self, job, result, error):
+        if job.cancelled:
+            return
+        self._pending.remove(job)
+        if job.key is not None and self._latest.get(job.key) is job:
+            del self._latest[job.key]
+        self._notify_busy()
+
+        if error is None:
+            if job.on_done:
+                job.on_done(result)
+        elif job.on_error:
+            job.on_error(error)
+        else:
+            messagebox.showerror("오류", f"{job.label or 'DB 작업'} 실패:\n{error}")
+
+    def _notify_busy(self):
+        if self.on_busy:
+            self.on_busy([job.label for job in self._pending if job.label])
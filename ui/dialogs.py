@@ -4,13 +4,16 @@ import tkinter as tk
 from datetime import datetime
 from tkcalendar import DateEntry
 import database as db
+import excel_import
+import rotation
 
 
 class AddParticipantDialog:
     """참가자 추가 다이얼로그"""
     
-    def __init__(self, parent, gender, session_id):
+    def __init__(self, parent, worker, gender, session_id):
         self.parent = parent
+        self.worker = worker  # 백그라운드 DB 워커 (ui.db_worker.DbWorker)
         self.gender = gender
         self.session_id = session_id
         
@@ -57,8 +60,8 @@ class AddParticipantDialog:
         self.signup_route_entry = ttk.Entry(self.window, width=30)
         self.signup_route_entry.grid(row=6, column=1, padx=10, pady=10)
         
-        ttk.Button(self.window, text="추가", command=self.save_participant).grid(row=7, column=0, 
-                                                                    columnspan=2, pady=20)
+        self.save_button = ttk.Button(self.window, text="추가", command=self.save_participant)
+        self.save_button.grid(row=7, column=0, columnspan=2, pady=20)
     
     def save_participant(self):
         """참가자 저장"""
@@ -75,35 +78,50 @@ class AddParticipantDialog:
             return
         
         birth_date = f"{birth_year}-01-01"
+        fields = dict(name=name, birth_date=birth_date, gender=self.gender,
+                      job=self.job_entry.get(), mbti=self.mbti_entry.get(), phone=self.phone_entry.get(),
+                      location=self.location_entry.get(), signup_route=self.signup_route_entry.get(), memo="")
+        
+        # 이미 만난 사람 확인 -> (확인 후) 추가, 둘 다 백그라운드 (처음엔 만남 그래프를 만드느라 오래 걸릴 수 있음)
+        self.save_button.configure(state='disabled')
+        self.worker.submit(db.met_in_session, self.session_id, name, birth_date,
+                           label="이미 만난 사람 확인 중",
+                           on_done=lambda met: self.confirm_and_add(fields, met), on_error=self.on_save_error)
+    
+    def confirm_and_add(self, fields, met):
+        """만난 사람 확인 결과를 받아 (있으면 물어본 뒤) 추가 요청"""
+        if not self.window.winfo_exists():
+            return  # 확인하는 사이 창이 닫힘
+        if met and not messagebox.askyesno(
+                "중복 만남", "이미 만난 사람이 명단에 있습니다:\n"
+                + ", ".join(f"{m['name']}({m['birth_date'][:4]})" for m in met)
+                + "\n\n그래도 추가하시겠습니까?", parent=self.window):
+            self.save_button.configure(state='normal')
+            return
         
-        try:
-            # 참가자 추가
-            db.add_participant(
-                name=name,
-                birth_date=birth_date,
-                gender=self.gender,
-                job=self.job_entry.get(),
-                mbti=self.mbti_entry.get(),
-                phone=self.phone_entry.get(),
-                location=self.location_entry.get(),
-                signup_route=self.signup_route_entry.get(),
-                memo=""
-            )
-            
-            # 회차에 참가자 추가
-            db.add_attendance(self.session_id, name, birth_date)
-            
-            messagebox.showinfo("완료", "참가자가 추가되었습니다!")
+        def add():
+            db.add_participant(**fields)  # 참가자 추가
+            db.add_attendance(self.session_id, fields['name'], fields['birth_date'])  # 회차에 참가자 추가
+        
+        self.worker.submit(add, label="참가자 추가 중", on_done=self.on_saved, on_error=self.on_save_error)
+    
+    def on_saved(self, _):
+        messagebox.showinfo("완료", "참가자가 추가되었습니다!")
+        if self.window.winfo_exists():
             self.window.destroy()
-        except Exception as e:
-            messagebox.showerror("오류", f"추가 실패: {e}")
+    
+    def on_save_error(self, e):
+        if self.window.winfo_exists():
+            self.save_button.configure(state='normal')
+        messagebox.showerror("오류", f"추가 실패: {e}")
 
 
 class ParticipantDetailWindow:
     """참가자 상세 정보 팝업"""
     
-    def __init__(self, parent, name, birth_date):
+    def __init__(self, parent, worker, name, birth_date):
         self.parent = parent
+        self.worker = worker  # 백그라운드 DB 워커 (ui.db_worker.DbWorker)
         self.name = name
         self.birth_date = birth_date
         
@@ -111,11 +129,17 @@ class ParticipantDetailWindow:
         self.window.title(f"{name} 상세 정보")
         self.window.geometry("1000x1200")
         
-        self.setup_ui()
+        # 상세 조회는 백그라운드, 받으면 화면 구성
+        self.loading_label = ttk.Label(self.window, text="불러오는 중...")
+        self.loading_label.pack(pady=20)
+        self.worker.submit(db.get_participant_detail, name, birth_date,
+                           label="참가자 상세 불러오는 중", on_done=self.setup_ui)
     
-    def setup_ui(self):
+    def setup_ui(self, detail):
         """상세정보 윈도우 UI 생성"""
-        detail = db.get_participant_detail(self.name, self.birth_date)
+        if not self.window.winfo_exists():
+            return  # 불러오는 사이 창이 닫힘
+        self.loading_label.destroy()
         
         # 기본 정보
         info_frame = ttk.LabelFrame(self.window, text="기본 정보")
@@ -187,7 +211,8 @@ MBTI: {detail['mbti']}
         self.memo_text.bind('<FocusIn>', self.on_memo_focus_in)
         self.memo_text.bind('<FocusOut>', self.on_memo_focus_out)
         
-        ttk.Button(memo_frame, text="메모 저장", command=self.save_memo).pack(pady=5)
+        self.memo_button = ttk.Button(memo_frame, text="메모 저장", command=self.save_memo)
+        self.memo_button.pack(pady=5)
     
     def save_memo(self):
         """메모 저장"""
@@ -197,9 +222,20 @@ MBTI: {detail['mbti']}
         if new_memo == "이 참가자에 대해 기록할 사항을 여기 메모하세요":
             new_memo = ""
         
-        db.update_participant_memo(self.name, self.birth_date, new_memo)
+        self.memo_button.configure(state='disabled')
+        self.worker.submit(db.update_participant_memo, self.name, self.birth_date, new_memo,
+                           label="메모 저장 중", on_done=self.on_memo_saved, on_error=self.on_memo_error)
+    
+    def on_memo_saved(self, _):
+        if self.window.winfo_exists():
+            self.memo_button.configure(state='normal')
         messagebox.showinfo("저장", "메모가 저장되었습니다!")
     
+    def on_memo_error(self, e):
+        if self.window.winfo_exists():
+            self.memo_button.configure(state='normal')
+        messagebox.showerror("오류", f"메모 저장 실패: {e}")
+    
     def on_memo_focus_in(self, event):
         """메모 입력창 포커스 시"""
         if self.placeholder_active:
@@ -214,3 +250,179 @@ MBTI: {detail['mbti']}
             self.memo_text.insert('1.0', "이 참가자에 대해 기록할 사항을 여기 메모하세요")
             self.memo_text.config(fg='gray')
             self.placeholder_active = True
+
+
+class ImportProgressDialog:
+    """엑셀 임포트 진행률 창 (database.import_excel_file 의 progress 이벤트를 메인 스레드에서 update 로 반영)"""
+    
+    def __init__(self, parent, file_name):
+        self.window = tk.Toplevel(parent)
+        self.window.title("엑셀 임포트")
+        self.window.geometry("460x150")
+        self.window.transient(parent)
+        self.window.protocol("WM_DELETE_WINDOW", lambda: None)  # 임포트 중에는 닫지 않음
+        
+        ttk.Label(self.window, text=file_name).pack(padx=15, pady=(15, 5), anchor='w')
+        self.bar = ttk.Progressbar(self.window, maximum=100, length=430, mode='determinate')
+        self.bar.pack(padx=15, pady=5)
+        self.status_label = ttk.Label(self.window, text="엑셀 데이터 분석 중...")
+        self.status_label.pack(padx=15, pady=5, anchor='w')
+        self.window.update()
+    
+    def update(self, event):
+        """진행률 이벤트 반영"""
+        self.bar['value'] = excel_import.progress_fraction(event) * 100
+        self.status_label.config(text=excel_import.describe_progress(event))
+    
+    def close(self):
+        self.window.destroy()
+
+
+class ExportDialog:
+    """내보내기 다이얼로그 (데이터 종류 / 형식 선택 후 파일로 저장)"""
+    
+    def __init__(self, parent, worker):
+        self.parent = parent
+        self.worker = worker  # 백그라운드 DB 워커 (ui.db_worker.DbWorker)
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("내보내기")
+        self.window.geometry("420x220")
+        self.window.transient(parent)
+        
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """다이얼로그 UI 생성"""
+        self.kinds = list(db.EXPORT_KINDS)
+        ttk.Label(self.window, text="내보낼 데이터:").grid(row=0, column=0, padx=10, pady=10, sticky='w')
+        self.kind_combo = ttk.Combobox(self.window, state='readonly', width=25,
+                                       values=[db.EXPORT_KINDS[k] for k in self.kinds])
+        self.kind_combo.current(1)
+        self.kind_combo.grid(row=0, column=1, padx=10, pady=10)
+        
+        ttk.Label(self.window, text="형식:").grid(row=1, column=0, padx=10, pady=10, sticky='w')
+        self.fmt_var = tk.StringVar(value='xlsx')
+        fmt_frame = ttk.Frame(self.window)
+        fmt_frame.grid(row=1, column=1, padx=10, pady=10, sticky='w')
+        ttk.Radiobutton(fmt_frame, text="엑셀 (.xlsx)", variable=self.fmt_var, value='xlsx').pack(side='left')
+        ttk.Radiobutton(fmt_frame, text="CSV", variable=self.fmt_var, value='csv').pack(side='left', padx=10)
+        
+        ttk.Label(self.window, text="회차 + 명단 엑셀은 그대로 다시 임포트할 수 있습니다.",
+                  foreground='gray').grid(row=2, column=0, columnspan=2, padx=10, sticky='w')
+        
+        self.save_button = ttk.Button(self.window, text="저장", command=self.export)
+        self.save_button.grid(row=3, column=0, columnspan=2, pady=20)
+    
+    def export(self):
+        """파일 위치를 고르고 내보내기"""
+        from tkinter import filedialog
+        
+        kind = self.kinds[self.kind_combo.current()]
+        fmt = self.fmt_var.get()
+        file_path = filedialog.asksaveasfilename(
+            parent=self.window,
+            title="내보낼 파일",
+            defaultextension=f".{fmt}",
+            initialfile=f"maketoast_{kind}_{datetime.now():%Y%m%d}.{fmt}",
+            filetypes=[("Excel files", "*.xlsx")] if fmt == 'xlsx' else [("CSV files", "*.csv")]
+        )
+        if not file_path:
+            return
+        
+        def write():
+            if fmt == 'csv':
+                with open(file_path, 'w', newline='', encoding='utf-8-sig') as f:
+                    return db.export_data(kind, f, 'csv')
+            return db.export_data(kind, file_path)
+        
+        # 큰 표는 오래 걸리므로 백그라운드로 (끝날 때까지 버튼 잠금)
+        self.window.config(cursor='watch')
+        self.save_button.configure(state='disabled')
+        self.worker.submit(write, label="내보내는 중",
+                           on_done=lambda count: self.on_exported(kind, file_path, count), on_error=self.on_export_error)
+    
+    def on_exported(self, kind, file_path, count):
+        messagebox.showinfo("완료", f"{db.EXPORT_KINDS[kind]} {count}건을 내보냈습니다.\n{file_path}",
+                            parent=self.window if self.window.winfo_exists() else None)
+        if self.window.winfo_exists():
+            self.window.destroy()
+    
+    def on_export_error(self, e):
+        if not self.window.winfo_exists():
+            messagebox.showerror("오류", f"내보내기 실패:\n{e}")
+            return
+        self.window.config(cursor='')
+        self.save_button.configure(state='normal')
+        messagebox.showerror("오류", f"내보내기 실패:\n{e}", parent=self.window)
+
+
+class RotationWindow:
+    """회차 로테이션 (라운드별 자리표) 창 - 누가 빠지면 진행한 라운드를 입력하고 다시 만들기"""
+    
+    def __init__(self, parent, worker, session_id, title):
+        self.worker = worker
+        self.session_id = session_id
+        self.plan = None  # 마지막으로 만든 편성 (다시 만들 때 진행한 라운드를 유지하는 기준)
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title(f"로테이션 - {title}")
+        self.window.geometry("900x420")
+        
+        self.setup_ui()
+        self.regenerate()
+    
+    def setup_ui(self):
+        """창 UI 생성"""
+        top_frame = ttk.Frame(self.window)
+        top_frame.pack(fill='x', padx=10, pady=10)
+        ttk.Label(top_frame, text="진행한 라운드:").pack(side='left')
+        self.played_var = tk.IntVar(value=0)
+        ttk.Spinbox(top_frame, from_=0, to=99, width=5, textvariable=self.played_var).pack(side='left', padx=5)
+        ttk.Button(top_frame, text="🔄 다시 만들기", command=self.regenerate).pack(side='left', padx=5)
+        self.summary_label = ttk.Label(top_frame, text="")
+        self.summary_label.pack(side='left', padx=10)
+        
+        self.tree = ttk.Treeview(self.window, show='headings')
+        self.tree.pack(fill='both', expand=True, padx=10)
+        self.note_label = ttk.Label(self.window, text="", foreground='gray', wraplength=860, justify='left')
+        self.note_label.pack(fill='x', padx=10, pady=10)
+    
+    def regenerate(self):
+        """지금 명단으로 다시 편성 (진행한 라운드는 그대로, 백그라운드 계산)"""
+        try:
+            played = max(0, self.played_var.get())
+        except tk.TclError:
+            played = 0
+        self.worker.submit(db.get_session_rotation, self.session_id, self.plan, played,
+                           key='rotation', label="로테이션 만드는 중", on_done=self.show_plan)
+    
+    def show_plan(self, plan):
+        """편성 결과를 테이블 x 라운드 표로 표시"""
+        if not self.window.winfo_exists():
+            return
+        self.plan = plan
+        rounds = len(plan['rounds'])
+        columns = ['table'] + [f"r{i}" for i in range(1, rounds + 1)]
+        self.tree.delete(*self.tree.get_children())
+        self.tree['columns'] = columns
+        self.tree.heading('table', text='테이블')
+        self.tree.column('table', width=110, stretch=False)
+        for i in range(1, rounds + 1):
+            self.tree.heading(f"r{i}", text=f"{i}R{' ✓' if i <= plan['played'] else ''}")
+            self.tree.column(f"r{i}", width=110)
+        for label, cells in rotation.table_rows(plan, name=lambda key: key[0]):
+            self.tree.insert('', 'end', values=[label] + cells)
+        
+        if not rounds:
+            self.summary_label.config(text="남녀가 모두 있어야 로테이션을 만들 수 있습니다.")
+        else:
+            seated = '여자' if plan['host_gender'] == 'F' else '남자'
+            self.summary_label.config(text=f"테이블 {len(plan['hosts'])}개 · {rounds}라운드 ({seated}는 자리 고정)")
+        notes = []
+        if plan['skipped']:
+            notes.append("이미 만난 쌍 (같은 테이블에 앉히지 않음): "
+                         + ", ".join(f"{a[0]} ↔ {b[0]}" for a, b in plan['skipped']))
+        if plan['missing']:
+            notes.append("⚠️ 자리를 만들지 못한 쌍: " + ", ".join(f"{a[0]} ↔ {b[0]}" for a, b in plan['missing']))
+        self.note_label.config(text="\n".join(notes))
@@ -4,6 +4,7 @@ from ttkbootstrap.constants import *
 from .session_tab import SessionTab
 from .participant_tab import ParticipantTab
 from .recommend_tab import RecommendTab
+from .db_worker import DbWorker
 
 
 class MakeToastApp:
@@ -13,6 +14,18 @@ class MakeToastApp:
         self.root = root
         self.root.title("Make a Toast")
         self.root.geometry("1800x1000")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # 하단 상태 표시줄 (DB 작업 중 표시)
+        status_frame = ttk.Frame(root)
+        status_frame.pack(side=BOTTOM, fill=X, padx=10, pady=(0, 5))
+        self.busy_bar = ttk.Progressbar(status_frame, mode='indeterminate', length=120, bootstyle="info-striped")
+        self.busy_bar.pack(side=RIGHT)
+        self.status_label = ttk.Label(status_frame, text="")
+        self.status_label.pack(side=RIGHT, padx=10)
+        
+        # DB 조회는 백그라운드 워커에서 (탭보다 먼저 생성 - 탭이 생성되면서 바로 조회함)
+        self.worker = DbWorker(root, on_busy=self.show_busy)
         
         # 탭 생성
         self.notebook = ttk.Notebook(root)
@@ -20,17 +33,17 @@ class MakeToastApp:
         
         # 탭 2: 참가자 DB (먼저 생성 - 나중에 추가)
         self.participant_frame = ttk.Frame(self.notebook)
-        self.participant_tab = ParticipantTab(self.participant_frame)
+        self.participant_tab = ParticipantTab(self.participant_frame, self.worker)
         
         # 탭 3: 추천 (먼저 생성 - 나중에 추가)
         self.recommend_frame = ttk.Frame(self.notebook)
-        self.recommend_tab = RecommendTab(self.recommend_frame)
+        self.recommend_tab = RecommendTab(self.recommend_frame, self.worker)
         
         # 탭 1: 회차 관리 (첫 번째로 추가)
         self.session_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.session_frame, text="회차 관리")
         self.session_tab = SessionTab(
-            self.session_frame, 
+            self.session_frame, self.worker,
             on_session_changed=self.on_session_changed,
             on_data_changed=self.on_participant_data_changed
         )
@@ -50,3 +63,18 @@ class MakeToastApp:
         self.participant_tab.load_all_participants()
         # 추천 탭 회차 목록 새로고침
         self.recommend_tab.refresh_recommend_sessions()
+    
+    def show_busy(self, labels):
+        """진행 중인 DB 작업 표시 (DbWorker 의 on_busy 콜백)"""
+        if labels:
+            more = f" 외 {len(labels) - 1}건" if len(labels) > 1 else ""
+            self.status_label.config(text=f"⏳ {labels[-1]}...{more}")
+            self.busy_bar.start(15)
+        else:
+            self.status_label.config(text="")
+            self.busy_bar.stop()
+    
+    def on_close(self):
+        """창 닫기"""
+        self.worker.shutdown()
+        self.root.destroy()
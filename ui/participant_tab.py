@@ -1,13 +1,23 @@
 """참가자 DB 탭 관련 기능"""
 from tkinter import ttk, messagebox
 import database as db
+from .tree_binding import TreeBinding
+
+SEARCH_DEBOUNCE_MS = 250  # 입력이 이만큼 멈추면 검색
+SCROLL_LOAD_AT = 0.95     # 목록을 이만큼 내리면 다음 페이지를 미리 불러옴 (무한 스크롤)
 
 
 class ParticipantTab:
     """참가자 DB 탭"""
     
-    def __init__(self, parent):
+    def __init__(self, parent, worker):
         self.parent = parent
+        self.worker = worker  # 백그라운드 DB 워커 (ui.db_worker.DbWorker)
+        self.search_term = ""
+        self.search_results = []  # 지금까지 불러온 검색 결과 / 전체 목록 (페이지 누적)
+        self.list_cursor = None   # 전체 목록의 다음 페이지 커서 (None 이면 끝)
+        self.loading_more = False # 다음 페이지 조회 중 (스크롤할 때마다 다시 요청하지 않도록)
+        self._search_after = None
         
         # UI 컴포넌트
         self.search_entry = None
@@ -22,13 +32,20 @@ class ParticipantTab:
         search_frame = ttk.Frame(self.parent)
         search_frame.pack(fill='x', padx=10, pady=10)
         
-        ttk.Label(search_frame, text="검색:").pack(side='left', padx=5)
+        ttk.Label(search_frame, text="검색 (이름/초성, 닉네임, 직업, 전화번호):").pack(side='left', padx=5)
         self.search_entry = ttk.Entry(search_frame, width=30)
         self.search_entry.pack(side='left', padx=5)
+        self.search_entry.bind('<KeyRelease>', self.on_search_key)
+        self.search_entry.bind('<Return>', lambda e: self.search_participants())
         ttk.Button(search_frame, text="검색", 
                   command=self.search_participants).pack(side='left', padx=5)
         ttk.Button(search_frame, text="전체 보기", bootstyle="primary-outline", 
                   command=self.load_all_participants).pack(side='left', padx=5)
+        self.more_button = ttk.Button(search_frame, text="더 보기", state='disabled',
+                                      command=self.load_more_results)
+        self.more_button.pack(side='left', padx=5)
+        self.result_label = ttk.Label(search_frame, text="")
+        self.result_label.pack(side='left', padx=10)
         
         # 참가자 리스트 (남녀 분리)
         list_container = ttk.Frame(self.parent)
@@ -62,9 +79,11 @@ class ParticipantTab:
         
         male_scrollbar = ttk.Scrollbar(self.male_frame, orient='vertical', 
                                  command=self.participant_male_tree.yview)
-        self.participant_male_tree.configure(yscrollcommand=male_scrollbar.set)
+        self.participant_male_tree.configure(
+            yscrollcommand=lambda first, last: self.on_tree_scroll(male_scrollbar, first, last))
         
         self.participant_male_tree.pack(side='left', fill='both', expand=True)
+        self.male_rows = TreeBinding(self.participant_male_tree)
         male_scrollbar.pack(side='right', fill='y')
         
         self.participant_male_tree.bind('<Double-1>', self.show_participant_detail)
@@ -97,9 +116,11 @@ class ParticipantTab:
         
         female_scrollbar = ttk.Scrollbar(self.female_frame, orient='vertical', 
                                  command=self.participant_female_tree.yview)
-        self.participant_female_tree.configure(yscrollcommand=female_scrollbar.set)
+        self.participant_female_tree.configure(
+            yscrollcommand=lambda first, last: self.on_tree_scroll(female_scrollbar, first, last))
         
         self.participant_female_tree.pack(side='left', fill='both', expand=True)
+        self.female_rows = TreeBinding(self.participant_female_tree)
         female_scrollbar.pack(side='right', fill='y')
         
         self.participant_female_tree.bind('<Double-1>', self.show_participant_detail)
@@ -109,73 +130,114 @@ class ParticipantTab:
         self.load_all_participants()
     
     def load_all_participants(self):
-        """전체 참가자 로드 (남녀 분리)"""
-        for item in self.participant_male_tree.get_children():
-            self.participant_male_tree.delete(item)
-        for item in self.participant_female_tree.get_children():
-            self.participant_female_tree.delete(item)
-        
-        participants = db.get_all_participants()
-        
-        male_count = 0
-        female_count = 0
-        
+        """전체 참가자 로드 (이름순 첫 페이지, 나머지는 스크롤 / 더 보기로 이어서)"""
+        self._cancel_pending_search()
+        self.search_term = ""
+        self.search_results = []
+        self.list_cursor = None
+        self.more_button.config(state='disabled')
+        self.result_label.config(text="")
+        self.request_list_page(None)
+    
+    def request_list_page(self, cursor):
+        """전체 목록 한 페이지 (keyset - 몇 번째 페이지든 한 페이지 분량만 조회)"""
+        # 메모 여부 / 방문 횟수까지 한 번에 조회 (전체 보기 / 검색은 같은 key 라 마지막 요청만 표시)
+        self.loading_more = cursor is not None
+        self.worker.submit(lambda: (db.get_participants_page(cursor, db.LIST_PAGE_SIZE), db.count_participants()),
+                           key='participants', label="참가자 목록 불러오는 중",
+                           on_done=lambda result: self.show_list_page(cursor, *result))
+    
+    def show_list_page(self, cursor, page, total):
+        """전체 목록 페이지 반영 (다음 페이지면 이어 붙임)"""
+        rows, next_cursor = page
+        self.loading_more = False
+        if self.search_term:
+            return
+        self.search_results = (self.search_results if cursor else []) + rows
+        self.list_cursor = next_cursor
+        self.show_participants(self.search_results)
+        self.more_button.config(state='normal' if next_cursor else 'disabled')
+        self.result_label.config(text=f"전체 {total}명" +
+                                 (f" 중 {len(self.search_results)}명 표시" if next_cursor else ""))
+    
+    def on_search_key(self, event=None):
+        """입력 중에는 기다렸다가 멈추면 검색 (키마다 조회하지 않음)"""
+        self._cancel_pending_search()
+        self._search_after = self.parent.after(SEARCH_DEBOUNCE_MS, self.search_participants)
+    
+    def search_participants(self):
+        """참가자 검색 (DB 에서 관련도순 - 초성은 메모리 인덱스, 첫 페이지)"""
+        self._cancel_pending_search()
+        term = self.search_entry.get().strip()
+        if not term:
+            self.load_all_participants()
+            return
+        if term == self.search_term:
+            return  # 방향키 등 검색어가 안 바뀐 입력
+        self.search_term = term
+        self.request_search(term, 0)
+    
+    def load_more_results(self):
+        """검색 결과 / 전체 목록 다음 페이지"""
+        if self.search_term:
+            self.request_search(self.search_term, len(self.search_results))
+        elif self.list_cursor:
+            self.request_list_page(self.list_cursor)
+    
+    def on_tree_scroll(self, scrollbar, first, last):
+        """목록 끝 근처까지 내리면 다음 페이지 자동 로드"""
+        scrollbar.set(first, last)
+        if float(last) < SCROLL_LOAD_AT or float(first) <= 0.0 or self.loading_more:
+            return
+        if str(self.more_button.cget('state')) == 'normal':
+            self.load_more_results()
+    
+    def request_search(self, term, offset):
+        self.loading_more = offset > 0
+        self.worker.submit(db.search_participants, term, db.SEARCH_PAGE_SIZE, offset,
+                           key='participants', label="참가자 검색 중",
+                           on_done=lambda rows: self.show_search_results(term, offset, rows))
+    
+    def show_search_results(self, term, offset, rows):
+        """검색 결과 반영 (다음 페이지면 이어 붙임)"""
+        self.loading_more = False
+        if term != self.search_term:
+            return
+        self.search_results = (self.search_results[:offset] if offset else []) + rows
+        total = rows[0]['total_count'] if rows else len(self.search_results)
+        self.show_participants(self.search_results)
+        
+        more = len(self.search_results) < total
+        self.more_button.config(state='normal' if more else 'disabled')
+        self.result_label.config(text=f"검색 결과 {total}명" +
+                                 (f" 중 {len(self.search_results)}명 표시" if more else ""))
+    
+    def _cancel_pending_search(self):
+        if self._search_after is not None:
+            self.parent.after_cancel(self._search_after)
+            self._search_after = None
+    
+    def show_participants(self, participants):
+        """조회한 참가자 표시 (남녀 분리, 받은 순서 그대로)"""
+        male_rows, female_rows = [], []
         for p in participants:
-            detail = db.get_participant_detail(p['name'], p['birth_date'])
             birth_year = p['birth_date'][:4]
-            memo_indicator = "▲" if detail.get('memo') else ""
+            memo_indicator = "▲" if p['has_memo'] else ""
             name_display = f"{p['name']}{memo_indicator}"
             
             values = (name_display, birth_year, p['job'], p['mbti'], 
-                     p['phone'], p['location'] or '', p['signup_route'] or '', detail['visit_count'])
+                     p['phone'], p['location'] or '', p['signup_route'] or '', p['visit_count'])
             tags = (p['name'], p['birth_date'])
             
-            if p['gender'] == 'M':
-                self.participant_male_tree.insert('', 'end', values=values, tags=tags)
-                male_count += 1
-            else:
-                self.participant_female_tree.insert('', 'end', values=values, tags=tags)
-                female_count += 1
-        
-        # 프레임 제목에 인원 표시
-        self.male_frame.configure(text=f"남자({male_count}명)")
-        self.female_frame.configure(text=f"여자({female_count}명)")
-    
-    def search_participants(self):
-        """참가자 검색 (남녀 분리)"""
-        search_term = self.search_entry.get().lower()
-        
-        for item in self.participant_male_tree.get_children():
-            self.participant_male_tree.delete(item)
-        for item in self.participant_female_tree.get_children():
-            self.participant_female_tree.delete(item)
+            (male_rows if p['gender'] == 'M' else female_rows).append((tags, values, tags))
         
-        participants = db.get_all_participants()
+        # 바뀐 행만 반영, 많으면 나눠서 삽입
+        self.male_rows.set_rows(male_rows)
+        self.female_rows.set_rows(female_rows)
         
-        male_count = 0
-        female_count = 0
-        
-        for p in participants:
-            if search_term in p['name'].lower() or search_term in (p['job'] or '').lower():
-                detail = db.get_participant_detail(p['name'], p['birth_date'])
-                birth_year = p['birth_date'][:4]
-                memo_indicator = "▲" if detail.get('memo') else ""
-                name_display = f"{p['name']}{memo_indicator}"
-                
-                values = (name_display, birth_year, p['job'], p['mbti'],
-                         p['phone'], p['location'] or '', p['signup_route'] or '', detail['visit_count'])
-                tags = (p['name'], p['birth_date'])
-                
-                if p['gender'] == 'M':
-                    self.participant_male_tree.insert('', 'end', values=values, tags=tags)
-                    male_count += 1
-                else:
-                    self.participant_female_tree.insert('', 'end', values=values, tags=tags)
-                    female_count += 1
-        
-        # 프레임 제목에 검색 결과 인원 표시
-        self.male_frame.configure(text=f"남자({male_count}명)")
-        self.female_frame.configure(text=f"여자({female_count}명)")
+        # 프레임 제목에 인원 표시
+        self.male_frame.configure(text=f"남자({len(male_rows)}명)")
+        self.female_frame.configure(text=f"여자({len(female_rows)}명)")
     
     def show_participant_db_context_menu(self, event, gender):
         """참가자 DB 탭 우클릭 메뉴"""
@@ -212,12 +274,13 @@ class ParticipantTab:
                                        f"(참가 기록도 함께 삭제됩니다)")
         
         if response:
-            try:
-                db.delete_participant(name, birth_date)
-                messagebox.showinfo("완료", "참가자가 삭제되었습니다.")
-                self.load_all_participants()
-            except Exception as e:
-                messagebox.showerror("오류", f"삭제 실패: {e}")
+            self.worker.submit(db.delete_participant, name, birth_date,
+                               label="참가자 삭제 중", on_done=self.on_participant_deleted,
+                               on_error=lambda e: messagebox.showerror("오류", f"삭제 실패: {e}"))
+    
+    def on_participant_deleted(self, _):
+        messagebox.showinfo("완료", "참가자가 삭제되었습니다.")
+        self.load_all_participants()
     
     def show_participant_detail_from_tree(self, tree, item):
         """트리 아이템에서 상세 정보 표시"""
@@ -225,7 +288,7 @@ class ParticipantTab:
         
         tags = tree.item(item, 'tags')
         if len(tags) >= 2:
-            ParticipantDetailWindow(self.parent, tags[0], tags[1])
+            ParticipantDetailWindow(self.parent, self.worker, tags[0], tags[1])
     
     def show_participant_detail(self, event):
         """참가자 상세보기 (남녀 트리 모두 지원)"""
@@ -239,4 +302,4 @@ class ParticipantTab:
         
         tags = widget.item(selection[0], 'tags')
         if len(tags) >= 2:
-            ParticipantDetailWindow(self.parent, tags[0], tags[1])
+            ParticipantDetailWindow(self.parent, self.worker, tags[0], tags[1])
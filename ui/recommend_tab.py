@@ -3,15 +3,20 @@ from tkinter import ttk, messagebox
 import tkinter as tk
 from datetime import datetime
 import database as db
+from .tree_binding import TreeBinding
 
 
 class RecommendTab:
     """추천 탭"""
     
-    def __init__(self, parent, get_sessions_callback=None):
+    def __init__(self, parent, worker, get_sessions_callback=None):
         self.parent = parent
+        self.worker = worker  # 백그라운드 DB 워커 (ui.db_worker.DbWorker)
         self.get_sessions_callback = get_sessions_callback
         self.recommendations = []
+        self.rank_job = None         # 진행 중인 점수 계산
+        self.recommend_query = None  # 마지막 검색 조건 (session_id, gender, age_min, age_max, mbti) - 점수순 정렬용
+        self.sessions = []  # 콤보박스 순서와 같은 회차 목록 (마지막 조회 결과)
         
         # UI 컴포넌트
         self.recommend_session_combo = None
@@ -75,10 +80,13 @@ class RecommendTab:
         ttk.Radiobutton(sort_frame, text="방문횟수순", 
                        variable=self.sort_var, value="visit_count",
                        command=self.sort_recommendations).pack(side='left', padx=5)
+        ttk.Radiobutton(sort_frame, text=f"추천 점수순 (상위 {db.RECOMMEND_TOP_K}명)", 
+                       variable=self.sort_var, value="score",
+                       command=self.sort_recommendations).pack(side='left', padx=5)
         
         # 추천 결과 리스트
         columns = ('name', 'birth_date', 'job', 'mbti', 'phone',
-                  'location', 'signup_route', 'last_visit', 'visit_count')
+                  'location', 'signup_route', 'last_visit', 'visit_count', 'score')
         self.recommend_tree = ttk.Treeview(self.parent, 
                                           columns=columns, show='headings', bootstyle="primary")
         
@@ -91,6 +99,7 @@ class RecommendTab:
         self.recommend_tree.heading('signup_route', text='등록경로')
         self.recommend_tree.heading('last_visit', text='최근방문')
         self.recommend_tree.heading('visit_count', text='방문횟수')
+        self.recommend_tree.heading('score', text='점수')
         
         self.recommend_tree.column('name', width=50)
         self.recommend_tree.column('birth_date', width=40)
@@ -101,12 +110,14 @@ class RecommendTab:
         self.recommend_tree.column('signup_route', width=50)
         self.recommend_tree.column('last_visit', width=80)
         self.recommend_tree.column('visit_count', width=70)
+        self.recommend_tree.column('score', width=50)
         
         scrollbar = ttk.Scrollbar(self.parent, orient='vertical', 
                                  command=self.recommend_tree.yview)
         self.recommend_tree.configure(yscrollcommand=scrollbar.set)
         
         self.recommend_tree.pack(side='left', fill='both', expand=True, padx=10, pady=5)
+        self.recommend_rows = TreeBinding(self.recommend_tree)
         scrollbar.pack(side='right', fill='y', pady=5)
         
         # 더블클릭 상세보기
@@ -116,8 +127,13 @@ class RecommendTab:
         self.refresh_recommend_sessions()
     
     def refresh_recommend_sessions(self):
-        """추천 탭 회차 목록 새로고침"""
-        sessions = db.get_all_sessions()
+        """추천 탭 회차 목록 새로고침 (백그라운드 조회)"""
+        self.worker.submit(db.get_all_sessions, key='recommend_sessions', label="회차 목록 불러오는 중",
+                           on_done=self.show_recommend_sessions)
+    
+    def show_recommend_sessions(self, sessions):
+        """조회한 회차 목록 반영"""
+        self.sessions = sessions
         session_list = [f"{s['session_date']} {s['session_time']} - {s['theme']}" 
                     for s in sessions]
         self.recommend_session_combo['values'] = session_list
@@ -133,9 +149,8 @@ class RecommendTab:
             messagebox.showwarning("경고", "회차를 선택해주세요!")
             return
         
-        sessions = db.get_all_sessions()
         selected_idx = self.recommend_session_combo.current()
-        session_id = sessions[selected_idx]['session_id']
+        session_id = self.sessions[selected_idx]['session_id']
         
         gender = self.gender_var.get()
         
@@ -166,43 +181,69 @@ class RecommendTab:
         if birth_year_max:
             age_min = current_year - birth_year_max
 
-        self.recommendations = db.get_recommendations(session_id, gender, age_min, age_max, mbti)
-        
-        self.display_recommendations()
+        # 조건을 바꿔 다시 검색하면 이전 검색 / 점수 계산은 취소
+        self.recommend_query = (session_id, gender, age_min, age_max, mbti)
+        if self.rank_job is not None:
+            self.worker.cancel(self.rank_job)
+            self.rank_job = None
+        self.worker.submit(db.get_recommendations, session_id, gender, age_min, age_max, mbti,
+                           key='recommend', label="추천 대상 검색 중",
+                           on_done=self.show_recommendations)
     
-    def display_recommendations(self):
-        """추천 결과 표시"""
-        for item in self.recommend_tree.get_children():
-            self.recommend_tree.delete(item)
-        
-        for p in self.recommendations:
+    def show_recommendations(self, recommendations):
+        """검색 결과 반영 (지금 선택된 정렬 기준으로)"""
+        self.recommendations = recommendations
+        if not recommendations:
+            self.display_recommendations([])
+            messagebox.showinfo("결과", "조건에 맞는 추천 대상이 없습니다.")
+            return
+        self.sort_recommendations()
+    
+    def display_recommendations(self, recommendations):
+        """추천 결과 표시 (정렬만 바꾸면 행 이동만 일어남)"""
+        rows = []
+        for p in recommendations:
             birth_year = p['birth_date'][:4]
-            detail = db.get_participant_detail(p['name'], p['birth_date'])
-            memo_indicator = "▲" if detail.get('memo') else ""
+            # 추천 결과에 메모가 포함되어 있으므로 상세 조회 불필요
+            memo_indicator = "▲" if p.get('memo') else ""
             name_display = f"{p['name']}{memo_indicator}"
             
-            self.recommend_tree.insert('', 'end',
-                                      values=(name_display, birth_year, p['job'], p['mbti'], p['phone'],
-                                             p['location'] or '', p['signup_route'] or '', 
-                                             p['last_visit'] or '-', p['visit_count']),
-                                      tags=(p['name'], p['birth_date']))
-        
-        if not self.recommendations:
-            messagebox.showinfo("결과", "조건에 맞는 추천 대상이 없습니다.")
+            tags = (p['name'], p['birth_date'])
+            rows.append((tags, (name_display, birth_year, p['job'], p['mbti'], p['phone'],
+                                p['location'] or '', p['signup_route'] or '', 
+                                p['last_visit'] or '-', p['visit_count'], p.get('score', '')), tags))
+        self.recommend_rows.set_rows(rows)
     
     def sort_recommendations(self):
-        """추천 결과 정렬"""
+        """추천 결과 정렬 (점수순은 이번 회차 명단과의 궁합 점수 상위 N명, 백그라운드 계산)"""
         if not self.recommendations:
             return
         
         sort_by = self.sort_var.get()
         
+        if self.rank_job is not None:
+            self.worker.cancel(self.rank_job)  # 점수 계산 중에 다른 정렬로 바꾼 경우
+            self.rank_job = None
+        if sort_by == 'score':
+            query = self.recommend_query
+            self.rank_job = self.worker.submit(
+                lambda: db.frame_records(db.get_recommendation_ranking(*query)),
+                key='recommend_rank', label="추천 점수 계산 중",
+                on_done=lambda ranked: self.show_ranking(query, ranked))
+            return
         if sort_by == 'last_visit':
             self.recommendations.sort(key=lambda x: x['last_visit'] or '', reverse=True)
         else:
             self.recommendations.sort(key=lambda x: x['visit_count'], reverse=True)
         
-        self.display_recommendations()
+        self.display_recommendations(self.recommendations)
+    
+    def show_ranking(self, query, ranked):
+        """점수순 결과 반영 (그 사이 조건을 바꿔 다시 검색했으면 늦게 온 이전 결과는 버림)"""
+        self.rank_job = None
+        if query != self.recommend_query or self.sort_var.get() != 'score':
+            return
+        self.display_recommendations(ranked)
     
     def show_recommend_detail(self, event):
         """추천 목록에서 상세보기"""
@@ -214,4 +255,4 @@ class RecommendTab:
         
         tags = self.recommend_tree.item(selection[0], 'tags')
         if len(tags) >= 2:
-            ParticipantDetailWindow(self.parent, tags[0], tags[1])
+            ParticipantDetailWindow(self.parent, self.worker, tags[0], tags[1])
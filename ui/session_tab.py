@@ -1,19 +1,25 @@
 """세션(회차) 탭 관련 기능"""
+import os
 from tkinter import messagebox
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
 import database as db
+from .tree_binding import TreeBinding
 
 
 class SessionTab:
     """회차 관리 탭"""
     
-    def __init__(self, parent, on_session_changed=None, on_data_changed=None):
+    def __init__(self, parent, worker, on_session_changed=None, on_data_changed=None):
         self.parent = parent
+        self.worker = worker  # 백그라운드 DB 워커 (ui.db_worker.DbWorker)
         self.on_session_changed = on_session_changed
         self.on_data_changed = on_data_changed  # 참가자 추가/삭제 시 호출될 콜백
         self.current_session_id = None
+        self.sessions = []        # 콤보박스 순서와 같은 회차 목록 (불러온 페이지 누적)
+        self.sessions_cursor = None  # 다음(더 오래된) 회차 페이지 커서 (None 이면 끝)
+        self.import_job = None    # 진행 중인 엑셀 임포트
         
         # UI 컴포넌트
         self.session_combo = None
@@ -34,6 +40,9 @@ class SessionTab:
         self.session_combo = ttk.Combobox(top_frame, width=60, state='readonly')
         self.session_combo.pack(side=LEFT, padx=5)
         self.session_combo.bind('<<ComboboxSelected>>', self.on_session_selected)
+        self.more_sessions_button = ttk.Button(top_frame, text="이전 회차 더 보기", state='disabled',
+                                               bootstyle="secondary-outline", command=self.load_more_sessions)
+        self.more_sessions_button.pack(side=LEFT, padx=5)
         
         ttk.Button(top_frame, text="새 회차 생성",
                   command=self.create_new_session).pack(side=LEFT, padx=5)
@@ -41,6 +50,8 @@ class SessionTab:
                   command=self.delete_session).pack(side=LEFT, padx=5)
         ttk.Button(top_frame, text="엑셀 임포트", 
                   command=self.import_excel).pack(side=LEFT, padx=5)
+        ttk.Button(top_frame, text="내보내기",
+                  command=self.export_data).pack(side=LEFT, padx=5)
         ttk.Button(top_frame, text="새로고침",
                   command=self.refresh_sessions).pack(side=LEFT, padx=5)
         
@@ -88,6 +99,7 @@ class SessionTab:
         self.male_tree.column('signup_route', width=80)
         
         self.male_tree.pack(side=LEFT, fill=BOTH, expand=True, padx=0, pady=0)
+        self.male_rows = TreeBinding(self.male_tree)
         
         # Scrollbar는 필요할 때만 표시
         male_scrollbar = ttk.Scrollbar(male_label_frame, orient=VERTICAL, command=self.male_tree.yview)
@@ -126,6 +138,7 @@ class SessionTab:
         self.female_tree.column('signup_route', width=80)
         
         self.female_tree.pack(side=LEFT, fill=BOTH, expand=True, padx=0, pady=0)
+        self.female_rows = TreeBinding(self.female_tree)
         
         # Scrollbar는 필요할 때만 표시
         female_scrollbar = ttk.Scrollbar(female_label_frame, orient=VERTICAL, command=self.female_tree.yview)
@@ -146,33 +159,59 @@ class SessionTab:
         check_frame.pack(side='bottom', pady=10)
         
         ttk.Button(check_frame, text="🔍 중복 체크", bootstyle=WARNING,
-                  command=self.check_duplicates, width=20).pack()
+                  command=self.check_duplicates, width=20).pack(side=LEFT, padx=5)
+        ttk.Button(check_frame, text="🔄 로테이션", bootstyle="info",
+                  command=self.show_rotation, width=20).pack(side=LEFT, padx=5)
         
         # 초기 데이터 로드
         self.refresh_sessions()
     
     def refresh_sessions(self):
-        """회차 목록 새로고침"""
-        sessions = db.get_all_sessions()
+        """회차 목록 새로고침 (최근 회차 첫 페이지, 백그라운드 조회)"""
+        self.worker.submit(db.get_sessions_page, None, db.SESSION_PAGE_SIZE,
+                           key='sessions', label="회차 목록 불러오는 중",
+                           on_done=lambda page: self.show_sessions(*page))
+    
+    def load_more_sessions(self):
+        """더 오래된 회차 한 페이지를 콤보박스 뒤에 이어 붙임 (선택은 그대로)"""
+        if not self.sessions_cursor:
+            return
+        self.more_sessions_button.config(state='disabled')
+        self.worker.submit(db.get_sessions_page, self.sessions_cursor, db.SESSION_PAGE_SIZE,
+                           key='sessions', label="회차 목록 불러오는 중",
+                           on_done=lambda page: self.show_sessions(*page, append=True))
+    
+    def show_sessions(self, sessions, next_cursor=None, append=False):
+        """조회한 회차 목록 반영"""
+        self.sessions_cursor = next_cursor
+        self.more_sessions_button.config(state='normal' if next_cursor else 'disabled')
+        self.sessions = self.sessions + sessions if append else sessions
         session_list = [f"{s['session_date']} {s['session_time']} - {s['theme']}" 
-                       for s in sessions]
+                       for s in self.sessions]
         self.session_combo['values'] = session_list
+        if append:
+            return
    
         if sessions:
             self.session_combo.current(0)
             self.on_session_selected()
+        else:
+            self.session_combo.set('')
+            self.current_session_id = None
+            self.session_info_label.config(text="회차를 선택해주세요")
+            self.load_session_participants()
     
     def on_session_selected(self, event=None):
         """회차 선택 시"""
         if not self.session_combo.get():
             return
             
-        sessions = db.get_all_sessions()
+        # 목록은 refresh_sessions 에서 이미 받아 둠 (선택할 때마다 다시 조회하지 않음)
         selected_idx = self.session_combo.current()
-        if selected_idx < 0 or selected_idx >= len(sessions):
+        if selected_idx < 0 or selected_idx >= len(self.sessions):
             return
             
-        session = sessions[selected_idx]
+        session = self.sessions[selected_idx]
         
         self.current_session_id = session['session_id']
         
@@ -188,32 +227,37 @@ class SessionTab:
             self.on_session_changed(self.current_session_id)
     
     def load_session_participants(self):
-        """현재 회차 참가자 목록 로드 (남녀 분리)"""
-        # 기존 항목 삭제
-        for item in self.male_tree.get_children():
-            self.male_tree.delete(item)
-        for item in self.female_tree.get_children():
-            self.female_tree.delete(item)
-        
-        if not self.current_session_id:
+        """현재 회차 참가자 목록 로드 (백그라운드 조회, 회차를 빠르게 바꾸면 이전 조회는 취소)"""
+        session_id = self.current_session_id
+        if not session_id:
+            self.show_session_participants(session_id, [])
             return
         
-        participants = db.get_session_participants(self.current_session_id)
+        self.worker.submit(db.get_session_participants, session_id,
+                           key='session_participants', label="참가자 명단 불러오는 중",
+                           on_done=lambda participants: self.show_session_participants(session_id, participants))
+    
+    def show_session_participants(self, session_id, participants):
+        """조회한 명단 표시 (남녀 분리)"""
+        if session_id != self.current_session_id:
+            return  # 그 사이 다른 회차가 선택됨
         
+        male_rows, female_rows = [], []
         for p in participants:
             birth_year = p['birth_date'][:4]
-            detail = db.get_participant_detail(p['name'], p['birth_date'])
-            memo_indicator = "▲" if detail.get('memo') else ""
+            # 명단 조회에 메모가 포함되어 있으므로 상세 조회 불필요
+            memo_indicator = "▲" if p.get('memo') else ""
             name_display = f"{p['name']}{memo_indicator}"
             
             values = (name_display, birth_year, p['job'], p['mbti'], p['phone'], 
                      p['location'] or '', p['signup_route'] or '')
             tags = (p['name'], p['birth_date'])
             
-            if p['gender'] == 'M':
-                self.male_tree.insert('', 'end', values=values, tags=tags)
-            else:
-                self.female_tree.insert('', 'end', values=values, tags=tags)
+            (male_rows if p['gender'] == 'M' else female_rows).append((tags, values, tags))
+        
+        # 바뀐 행만 반영 (같은 회차 새로고침은 거의 그대로)
+        self.male_rows.set_rows(male_rows)
+        self.female_rows.set_rows(female_rows)
     
     def check_duplicates(self):
         """중복 체크 및 표시"""
@@ -221,7 +265,15 @@ class SessionTab:
             messagebox.showwarning("경고", "회차를 먼저 선택해주세요!")
             return
         
-        duplicates = db.check_duplicate_meetings(self.current_session_id)
+        session_id = self.current_session_id
+        self.worker.submit(db.check_duplicate_meetings, session_id,
+                           key='duplicates', label="중복 만남 확인 중",
+                           on_done=lambda duplicates: self.show_duplicates(session_id, duplicates))
+    
+    def show_duplicates(self, session_id, duplicates):
+        """중복 체크 결과 표시 (명단에 빨간색 + 내역 메시지)"""
+        if session_id != self.current_session_id:
+            return  # 그 사이 다른 회차가 선택됨
         
         if not duplicates:
             messagebox.showinfo("체크 완료", "중복된 매칭이 없습니다! ✅")
@@ -234,11 +286,11 @@ class SessionTab:
             duplicate_people.add((dup['person2'], dup['person2_birth']))
         
         # 남자/여자 트리 모두 순회
-        for tree in [self.male_tree, self.female_tree]:
+        for tree, rows in [(self.male_tree, self.male_rows), (self.female_tree, self.female_rows)]:
             for item in tree.get_children():
                 tags = tree.item(item, 'tags')
                 if len(tags) >= 2 and (tags[0], tags[1]) in duplicate_people:
-                    tree.item(item, tags=('duplicate',))
+                    rows.add_tag(item, 'duplicate')  # 이름/생년 태그는 유지 (우클릭 메뉴용)
             
             # 빨간색 태그 설정
             tree.tag_configure('duplicate', background='#ffcccc')
@@ -252,6 +304,15 @@ class SessionTab:
         
         messagebox.showwarning("중복 매칭", msg)
     
+    def show_rotation(self):
+        """라운드별 자리표 창"""
+        from .dialogs import RotationWindow
+        
+        if not self.current_session_id:
+            messagebox.showwarning("경고", "회차를 먼저 선택해주세요!")
+            return
+        RotationWindow(self.parent, self.worker, self.current_session_id, self.session_combo.get())
+    
     def create_new_session(self):
         """새 회차 생성 다이얼로그"""
         dialog = tk.Toplevel(self.parent)
@@ -282,21 +343,24 @@ class SessionTab:
         host_entry.grid(row=3, column=1, padx=10, pady=10)
         
         def save_session():
-            try:
-                session_id = db.create_session(
-                    date_entry.get(),
-                    time_entry.get(),
-                    theme_combo.get(),
-                    host_entry.get()
-                )
-                messagebox.showinfo("성공", "회차가 생성되었습니다!")
+            # 저장은 백그라운드 (원격 DB 응답을 기다리는 동안 창이 멈추지 않도록), 끝날 때까지 버튼 잠금
+            save_button.configure(state='disabled')
+            self.worker.submit(db.create_session, date_entry.get(), time_entry.get(), theme_combo.get(), host_entry.get(),
+                               label="회차 생성 중", on_done=on_saved, on_error=on_error)
+        
+        def on_saved(_):
+            messagebox.showinfo("성공", "회차가 생성되었습니다!")
+            if dialog.winfo_exists():
                 dialog.destroy()
-                self.refresh_sessions()
-            except Exception as e:
-                messagebox.showerror("오류", f"회차 생성 실패: {e}")
+            self.refresh_sessions()
+        
+        def on_error(e):
+            if dialog.winfo_exists():
+                save_button.configure(state='normal')
+            messagebox.showerror("오류", f"회차 생성 실패: {e}")
         
-        ttk.Button(dialog, text="생성", command=save_session, bootstyle=SUCCESS).grid(row=4, column=0, 
-                                                                columnspan=2, pady=20)
+        save_button = ttk.Button(dialog, text="생성", command=save_session, bootstyle=SUCCESS)
+        save_button.grid(row=4, column=0, columnspan=2, pady=20)
     
     def add_participant_to_session(self, gender):
         """현재 회차에 참가자 추가"""
@@ -306,7 +370,7 @@ class SessionTab:
             messagebox.showwarning("경고", "회차를 먼저 선택해주세요!")
             return
         
-        dialog = AddParticipantDialog(self.parent, gender, self.current_session_id)
+        dialog = AddParticipantDialog(self.parent, self.worker, gender, self.current_session_id)
         self.parent.wait_window(dialog.window)
         self.load_session_participants()
         
@@ -317,6 +381,11 @@ class SessionTab:
     def import_excel(self):
         """엑셀 파일 임포트"""
         from tkinter import filedialog
+        from .dialogs import ImportProgressDialog
+        
+        if self.import_job is not None:
+            messagebox.showwarning("경고", "이미 엑셀 임포트가 진행 중입니다.")
+            return
         
         file_path = filedialog.askopenfilename(
             title="엑셀 파일 선택",
@@ -328,15 +397,40 @@ class SessionTab:
         
         response = messagebox.askyesno("확인", 
                                     "엑셀 파일을 임포트하시겠습니까?\n"
-                                    "모든 시트가 회차로 변환됩니다.")
+                                    "새 시트는 회차로 추가되고, 이미 임포트한 시트는 바뀐 내용만 반영됩니다.")
         
         if response:
-            try:
-                db.import_excel_file(file_path)
-                messagebox.showinfo("완료", "엑셀 임포트가 완료되었습니다!")
+            progress = ImportProgressDialog(self.parent, os.path.basename(file_path))
+            
+            def on_done(summary):
+                self.import_job = None
+                progress.close()
+                messagebox.showinfo("완료", "엑셀 임포트가 완료되었습니다!\n"
+                                          f"새 회차 {summary['new']}개, 변경 {summary['synced']}개, "
+                                          f"그대로 {summary['skipped']}개")
                 self.refresh_sessions()
-            except Exception as e:
-                messagebox.showerror("오류", f"임포트 실패:\n{e}")
+            
+            def on_error(e):
+                self.import_job = None
+                progress.close()
+                if isinstance(e, db.ImportFailed) and e.last_sheet:
+                    messagebox.showerror("오류", f"임포트 실패:\n{e.error}\n\n"
+                                               f"'{e.last_sheet}' 시트까지 {e.sheets_done}개는 반영되었습니다.\n"
+                                               "같은 파일을 다시 임포트하면 그다음 시트부터 이어서 합니다.")
+                    self.refresh_sessions()  # 반영된 회차는 목록에 보이도록
+                else:
+                    messagebox.showerror("오류", f"임포트 실패:\n{e}")
+            
+            # 진행률 콜백은 작업 스레드에서 불리므로 post 로 메인 스레드에 넘김
+            self.import_job = self.worker.submit(
+                db.import_excel_file, file_path,
+                progress=lambda event: self.worker.post(progress.update, event),
+                label="엑셀 임포트 중", on_done=on_done, on_error=on_error)
+    
+    def export_data(self):
+        """참가자 / 회차 명단 / 방문 이력 내보내기"""
+        from .dialogs import ExportDialog
+        ExportDialog(self.parent, self.worker)
     
     def delete_session(self):
         """현재 선택된 회차 삭제"""
@@ -345,8 +439,7 @@ class SessionTab:
             return
         
         # 확인 메시지
-        sessions = db.get_all_sessions()
-        current_session = next((s for s in sessions if s['session_id'] == self.current_session_id), None)
+        current_session = next((s for s in self.sessions if s['session_id'] == self.current_session_id), None)
         
         if not current_session:
             return
@@ -358,13 +451,14 @@ class SessionTab:
                                        f"⚠️ 이 회차의 참가 기록도 모두 삭제됩니다!")
         
         if response:
-            try:
-                db.delete_session(self.current_session_id)
-                messagebox.showinfo("완료", "회차가 삭제되었습니다.")
-                self.current_session_id = None
-                self.refresh_sessions()
-            except Exception as e:
-                messagebox.showerror("오류", f"회차 삭제 실패: {e}")
+            self.worker.submit(db.delete_session, self.current_session_id,
+                               label="회차 삭제 중", on_done=self.on_session_deleted,
+                               on_error=lambda e: messagebox.showerror("오류", f"회차 삭제 실패: {e}"))
+    
+    def on_session_deleted(self, _):
+        messagebox.showinfo("완료", "회차가 삭제되었습니다.")
+        self.current_session_id = None
+        self.refresh_sessions()
     
     def show_participant_context_menu(self, event, gender):
         """참가자 우클릭 메뉴"""
@@ -401,16 +495,17 @@ class SessionTab:
                                        f"{name}님을 현재 회차에서 제거하시겠습니까?")
         
         if response:
-            try:
-                db.remove_participant_from_session(self.current_session_id, name, birth_date)
-                messagebox.showinfo("완료", "참가자가 제거되었습니다.")
-                self.load_session_participants()
-                
-                # 다른 탭 업데이트
-                if self.on_data_changed:
-                    self.on_data_changed()
-            except Exception as e:
-                messagebox.showerror("오류", f"제거 실패: {e}")
+            self.worker.submit(db.remove_participant_from_session, self.current_session_id, name, birth_date,
+                               label="참가자 제거 중", on_done=self.on_participant_removed,
+                               on_error=lambda e: messagebox.showerror("오류", f"제거 실패: {e}"))
+    
+    def on_participant_removed(self, _):
+        messagebox.showinfo("완료", "참가자가 제거되었습니다.")
+        self.load_session_participants()
+        
+        # 다른 탭 업데이트
+        if self.on_data_changed:
+            self.on_data_changed()
     
     def show_detail_from_item(self, tree, item):
         """트리 아이템에서 상세 정보 표시"""
@@ -418,7 +513,7 @@ class SessionTab:
         
         tags = tree.item(item, 'tags')
         if len(tags) >= 2:
-            ParticipantDetailWindow(self.parent, tags[0], tags[1])
+            ParticipantDetailWindow(self.parent, self.worker, tags[0], tags[1])
     
     def on_male_participant_double_click(self, event):
         """남자 참가자 더블클릭 시 상세보기"""
@@ -0,0 +1,95 @@
+"""
+Treeview 바인딩 - 새 행 목록을 현재 항목과 키로 비교해서 바뀐 부분만 반영
+- 없어진 행 삭제 / 값이 바뀐 행만 수정 / 새 행 삽입 / 순서가 바뀌었으면 이동
+- 새 행이 많으면 CHUNK_ROWS 개씩 나눠서 after() 로 이어서 삽입 (첫 묶음은 바로 삽입)
+  -> 수천 명을 불러와도 창이 멈추지 않고, 한두 명 바뀐 새로고침은 거의 즉시 끝남
+"""
+
+CHUNK_ROWS = 300
+
+
+class TreeBinding:
+    """Treeview 하나를 행 목록에 묶어 둠 (rows: (key, values, tags) 목록, key 는 행마다 고유)"""
+
+    def __init__(self, tree, chunk_rows: int = CHUNK_ROWS):
+        self.tree = tree
+        self.chunk_rows = chunk_rows
+        self._rows = {}      # iid -> (values, tags): 지금 트리에 들어 있는 내용
+        self._iids = {}      # key -> iid
+        self._keys = {}      # iid -> key
+        self._next_iid = 0
+        self._after_id = None
+
+    def set_rows(self, rows, on_complete=None):
+        """트리 내용을 rows 로 맞춤 (삽입이 남으면 after 로 이어서, 끝나면 on_complete())"""
+        self._cancel_pending()
+        tree = self.tree
+        rows = [(key, tuple(values), tuple(tags)) for key, values, tags in rows]
+        wanted = {key for key, _, _ in rows}
+
+        # 1. 없어진 행 삭제 (한 번에)
+        removed = [iid for key, iid in self._iids.items() if key not in wanted]
+        if removed:
+            tree.delete(*removed)
+            for iid in removed:
+                del self._iids[self._keys.pop(iid)]
+                del self._rows[iid]
+
+        # 2. 남은 행은 값이 바뀐 것만 수정, 순서가 다르면 새 순서대로 이동
+        existing = []
+        for key, values, tags in rows:
+            iid = self._iids.get(key)
+            if iid is None:
+                continue
+            existing.append(iid)
+            if self._rows[iid] != (values, tags):
+                tree.item(iid, values=values, tags=tags)
+                self._rows[iid] = (values, tags)
+        if list(tree.get_children()) != existing:
+            for index, iid in enumerate(existing):
+                tree.move(iid, '', index)
+
+        # 3. 새 행은 최종 위치 순서대로 삽입 (앞쪽 위치가 먼저 채워지므로 index 가 그대로 맞음)
+        inserts = [(index, row) for index, row in enumerate(rows) if row[0] not in self._iids]
+        self._insert_chunk(inserts, 0, on_complete)
+
+    def add_tag(self, iid, tag):
+        """항목에 태그 추가 (예: 중복 표시) - 다음 set_rows 때 원래 태그로 돌아감"""
+        values, tags = self._rows[iid]
+        if tag not in tags:
+            tags = tags + (tag,)
+            self.tree.item(iid, tags=tags)
+            self._rows[iid] = (values, tags)
+
+    def clear(self):
+        self.set_rows([])
+
+    def __len__(self):
+        return len(self._rows)
+
+    # -----------------------------------------------------
+    # 내부
+    # -----------------------------------------------------
+
+    def _insert_chunk(self, inserts, start, on_complete):
+        self._after_id = None
+        tree = self.tree
+        end = min(start + self.chunk_rows, len(inserts))
+        for index, (key, values, tags) in inserts[start:end]:
+            self._next_iid += 1
+            iid = f"r{self._next_iid}"
+            tree.insert('', 'end' if index >= len(self._rows) else index, iid=iid, values=values, tags=tags)
+            self._iids[key] = iid
+            self._keys[iid] = key
+            self._rows[iid] = (values, tags)
+
+        if end < len(inserts):
+            self._after_id = tree.after(1, self._insert_chunk, inserts, end, on_complete)
+        elif on_complete:
+            on_complete()
+
+    def _cancel_pending(self):
+        """이어서 삽입하던 묶음 중단 (이미 들어간 행은 다음 비교에 그대로 사용)"""
+        if self._after_id is not None:
+            self.tree.after_cancel(self._after_id)
+            self._after_id = None